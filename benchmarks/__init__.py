@@ -0,0 +1,8 @@
+"""SD WebUI All In One 性能基准测试工具
+
+基准测试脚本不随软件包发布, 在仓库根目录中以模块方式运行, 例如:
+
+```bash
+python -m benchmarks.downloader_benchmark --engines requests,urllib --sizes 1M,64M
+```
+"""
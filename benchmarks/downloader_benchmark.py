@@ -0,0 +1,547 @@
+"""下载器性能基准测试
+
+启动本地 HTTP Range 测试服务器, 使用各个下载引擎下载不同大小的文件, 报告下载速度、CPU 时间、峰值内存和系统调用次数.
+每次下载都在独立的子进程中运行, 以便单独统计资源占用
+
+用法:
+
+```bash
+python -m benchmarks.downloader_benchmark --engines requests,aria2,urllib,multi_thread --sizes 1M,64M,1G,10G
+python -m benchmarks.downloader_benchmark --bandwidth 20M --latency 0.05 --fail-every 10 --json result.json
+python -m benchmarks.downloader_benchmark --strace  # 需要 Linux 和 strace, 统计系统调用次数 (会显著降低速度)
+```
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.range_server import (
+    RangeServer,
+    RangeServerOptions,
+    content_sha256,
+    parse_size,
+)
+
+
+ENGINE_LIST = ["requests", "requests_adaptive", "asyncio", "aria2", "urllib", "multi_thread"]
+"""支持的下载引擎"""
+
+DEFAULT_SIZES = ["1M", "16M", "128M", "1G"]
+"""默认测试的文件大小"""
+
+MULTI_THREAD_PARTS = 4
+"""multi_thread 引擎将文件拆分为多个文件并行下载的数量"""
+
+_RESULT_PREFIX = "BENCHMARK_RESULT "
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class BenchmarkResult:
+    """单次下载的基准测试结果"""
+
+    engine: str
+    """下载引擎"""
+
+    size: int
+    """文件大小"""
+
+    seconds: float | None = None
+    """下载耗时 (秒)"""
+
+    cpu_seconds: float | None = None
+    """下载进程及其子进程的 CPU 时间 (用户态 + 内核态)"""
+
+    max_rss_kb: int | None = None
+    """下载进程及其子进程的峰值常驻内存 (KB)"""
+
+    context_switches: int | None = None
+    """主动与被动上下文切换次数"""
+
+    syscalls: int | None = None
+    """系统调用次数, 仅在使用 strace 时统计"""
+
+    error: str | None = None
+    """下载失败或跳过的原因"""
+
+    extra: dict[str, object] = field(default_factory=dict)
+    """引擎报告的其他信息"""
+
+    @property
+    def mb_per_second(self) -> float | None:
+        if not self.seconds or self.error is not None:
+            return None
+        return self.size / 1024 / 1024 / self.seconds
+
+
+def engine_unavailable_reason(
+    engine: str,
+) -> str | None:
+    """检查下载引擎在当前环境中是否可用
+
+    Args:
+        engine (str):
+            下载引擎
+
+    Returns:
+        (str | None): 不可用时返回原因, 可用时返回 None
+    """
+    if engine not in ENGINE_LIST:
+        return f"未知的下载引擎: {engine}"
+    if engine.startswith("requests"):
+        try:
+            import requests
+
+            _ = requests
+        except ImportError:
+            return "未安装 requests"
+    if engine == "aria2" and shutil.which("aria2c") is None:
+        return "未安装 aria2c"
+    return None
+
+
+def _rusage_snapshot() -> dict[str, float | int] | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    # Linux 上 ru_maxrss 单位为 KB, macOS 上为字节
+    rss_scale = 1024 if sys.platform == "darwin" else 1
+    return {
+        "cpu_seconds": self_usage.ru_utime + self_usage.ru_stime + children_usage.ru_utime + children_usage.ru_stime,
+        "max_rss_kb": max(self_usage.ru_maxrss, children_usage.ru_maxrss) // rss_scale,
+        "context_switches": self_usage.ru_nvcsw + self_usage.ru_nivcsw + children_usage.ru_nvcsw + children_usage.ru_nivcsw,
+    }
+
+
+def _prepare_engine(
+    engine: str,
+    urls: list[str],
+    output: Path,
+    split: int,
+    max_connection_per_server: int,
+    min_split_size: int,
+) -> tuple[Callable[[], None], dict[str, object]]:
+    """导入下载引擎并返回执行下载的函数, 使计时不包含模块导入时间"""
+    extra: dict[str, object] = {}
+    if engine in ("requests", "requests_adaptive"):
+        from sd_webui_all_in_one.downloader.requests_downloader import download_file_from_url
+
+        def _download() -> None:
+            download_file_from_url(
+                urls[0],
+                save_path=output,
+                progress=False,
+                split=split,
+                max_connection_per_server=max_connection_per_server,
+                min_split_size=min_split_size,
+                adaptive=engine == "requests_adaptive",
+                tuning_callback=lambda tuning: extra.update(asdict(tuning)),
+            )
+
+    elif engine == "asyncio":
+        from sd_webui_all_in_one.downloader.asyncio_downloader import download_file_from_url_asyncio
+
+        def _download() -> None:
+            download_file_from_url_asyncio(
+                urls[0],
+                save_path=output,
+                progress=False,
+                split=split,
+                max_connection_per_server=max_connection_per_server,
+                min_split_size=min_split_size,
+                tuning_callback=lambda tuning: extra.update(asdict(tuning)),
+            )
+
+    elif engine == "aria2":
+        from sd_webui_all_in_one.downloader.aria2_downloader import aria2
+
+        def _download() -> None:
+            aria2(
+                urls[0],
+                path=output,
+                progress=False,
+                split=split,
+                max_connection_per_server=max_connection_per_server,
+                min_split_size=min_split_size,
+            )
+
+    elif engine == "urllib":
+        from sd_webui_all_in_one.downloader.urllib_downloader import download_file_from_url_urllib
+
+        def _download() -> None:
+            download_file_from_url_urllib(urls[0], save_path=output, progress=False)
+
+    elif engine == "multi_thread":
+        from sd_webui_all_in_one.downloader.multi_thread import MultiThreadDownloader
+        from sd_webui_all_in_one.downloader.urllib_downloader import download_file_from_url_urllib
+
+        def _download() -> None:
+            downloader = MultiThreadDownloader(
+                download_file_from_url_urllib,
+                download_kwargs_list=[{"url": url, "save_path": output, "progress": False} for url in urls],
+            )
+            downloader.start(num_threads=len(urls), retry_count=1)
+
+    else:
+        raise ValueError(f"未知的下载引擎: {engine}")
+    return _download, extra
+
+
+def _run_worker(
+    args: argparse.Namespace,
+) -> None:
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    download, extra = _prepare_engine(
+        args.engine,
+        args.url,
+        output,
+        split=args.split,
+        max_connection_per_server=args.max_connection_per_server,
+        min_split_size=args.min_split_size,
+    )
+    before = _rusage_snapshot()
+    start = time.perf_counter()
+    download()
+    seconds = time.perf_counter() - start
+    after = _rusage_snapshot()
+    downloaded = sum(path.stat().st_size for path in output.iterdir() if path.is_file() and not path.name.endswith((".tmp", ".state", ".aria2")))
+    result: dict[str, object] = {"seconds": seconds, "downloaded": downloaded, "extra": extra}
+    if before is not None and after is not None:
+        result["cpu_seconds"] = after["cpu_seconds"] - before["cpu_seconds"]
+        result["max_rss_kb"] = after["max_rss_kb"]
+        result["context_switches"] = after["context_switches"] - before["context_switches"]
+    if args.verify:
+        from sd_webui_all_in_one.downloader.hash_utils import compare_sha256
+
+        for path in output.iterdir():
+            if path.is_file() and not compare_sha256(path, content_sha256(path.stat().st_size)):
+                raise ValueError(f"下载内容校验失败: {path}")
+    print(_RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def _parse_strace_summary(
+    path: Path,
+) -> int | None:
+    """读取 `strace -c` 汇总输出中的系统调用总次数"""
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return None
+    for line in reversed(lines):
+        tokens = line.split()
+        if tokens and tokens[-1] == "total" and len(tokens) >= 5:
+            try:
+                return int(tokens[3])
+            except ValueError:
+                return None
+    return None
+
+
+def run_single_benchmark(
+    server: RangeServer,
+    engine: str,
+    size: int,
+    work_dir: Path,
+    split: int = 16,
+    max_connection_per_server: int = 16,
+    min_split_size: int = 1024 * 1024,
+    use_strace: bool = False,
+    verify: bool = False,
+    timeout: float | None = None,
+) -> BenchmarkResult:
+    """在子进程中使用指定下载引擎下载一个测试文件
+
+    Args:
+        server (RangeServer):
+            已启动的本地测试服务器
+        engine (str):
+            下载引擎
+        size (int):
+            文件大小
+        work_dir (Path):
+            下载文件的临时目录, 测试结束后会被删除
+        split (int):
+            分片下载引擎的最大连接数
+        max_connection_per_server (int):
+            分片下载引擎的单服务器最大连接数
+        min_split_size (int):
+            分片下载引擎的最小切分大小
+        use_strace (bool):
+            是否使用 strace 统计系统调用次数
+        verify (bool):
+            是否校验下载内容
+        timeout (float | None):
+            子进程超时时间 (秒)
+
+    Returns:
+        BenchmarkResult: 基准测试结果
+    """
+    result = BenchmarkResult(engine=engine, size=size)
+    reason = engine_unavailable_reason(engine)
+    if reason is not None:
+        result.error = reason
+        return result
+
+    if engine == "multi_thread":
+        part_size = max(1, size // MULTI_THREAD_PARTS)
+        urls = [server.url(part_size if index < MULTI_THREAD_PARTS - 1 else size - part_size * (MULTI_THREAD_PARTS - 1), f"part-{index}.bin") for index in range(MULTI_THREAD_PARTS)]
+    else:
+        urls = [server.url(size, f"{engine}-{size}.bin")]
+
+    output = work_dir / f"{engine}-{size}"
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.downloader_benchmark",
+        "worker",
+        "--engine",
+        engine,
+        "--output",
+        str(output),
+        "--split",
+        str(split),
+        "--max-connection-per-server",
+        str(max_connection_per_server),
+        "--min-split-size",
+        str(min_split_size),
+    ]
+    for url in urls:
+        command += ["--url", url]
+    if verify:
+        command.append("--verify")
+
+    strace_output = work_dir / f"{engine}-{size}.strace"
+    if use_strace:
+        if shutil.which("strace") is None:
+            result.error = "未安装 strace"
+            return result
+        command = ["strace", "-f", "-c", "-o", str(strace_output)] + command
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PROJECT_ROOT), env.get("PYTHONPATH")]))
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=_PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        result.error = f"超时 ({timeout}s)"
+        return result
+    finally:
+        shutil.rmtree(output, ignore_errors=True)
+
+    report = next((line.removeprefix(_RESULT_PREFIX) for line in reversed(completed.stdout.splitlines()) if line.startswith(_RESULT_PREFIX)), None)
+    if completed.returncode != 0 or report is None:
+        output_text = (completed.stderr or completed.stdout).strip().splitlines()
+        result.error = output_text[-1] if output_text else f"退出码 {completed.returncode}"
+        return result
+
+    data = json.loads(report)
+    if data["downloaded"] != size:
+        result.error = f"下载大小不匹配: 期望 {size}, 实际 {data['downloaded']}"
+        return result
+    result.seconds = data["seconds"]
+    result.cpu_seconds = data.get("cpu_seconds")
+    result.max_rss_kb = data.get("max_rss_kb")
+    result.context_switches = data.get("context_switches")
+    result.extra = data.get("extra") or {}
+    if use_strace:
+        result.syscalls = _parse_strace_summary(strace_output)
+        strace_output.unlink(missing_ok=True)
+    return result
+
+
+def run_benchmark(
+    engines: list[str],
+    sizes: list[int],
+    server_options: RangeServerOptions | None = None,
+    repeat: int = 1,
+    split: int = 16,
+    max_connection_per_server: int = 16,
+    min_split_size: int = 1024 * 1024,
+    use_strace: bool = False,
+    verify: bool = False,
+    timeout: float | None = None,
+) -> list[BenchmarkResult]:
+    """启动本地测试服务器并依次运行所有下载引擎和文件大小的组合
+
+    Args:
+        engines (list[str]):
+            下载引擎列表
+        sizes (list[int]):
+            文件大小列表
+        server_options (RangeServerOptions | None):
+            测试服务器行为配置
+        repeat (int):
+            每个组合的重复次数
+        split (int):
+            分片下载引擎的最大连接数
+        max_connection_per_server (int):
+            分片下载引擎的单服务器最大连接数
+        min_split_size (int):
+            分片下载引擎的最小切分大小
+        use_strace (bool):
+            是否使用 strace 统计系统调用次数
+        verify (bool):
+            是否校验下载内容
+        timeout (float | None):
+            单次下载的超时时间 (秒)
+
+    Returns:
+        list[BenchmarkResult]: 基准测试结果列表
+    """
+    results: list[BenchmarkResult] = []
+    with RangeServer(server_options) as server, tempfile.TemporaryDirectory(prefix="sd-webui-all-in-one-bench-") as work_dir:
+        for size in sizes:
+            for engine in engines:
+                for _ in range(max(1, repeat)):
+                    results.append(
+                        run_single_benchmark(
+                            server,
+                            engine,
+                            size,
+                            Path(work_dir),
+                            split=split,
+                            max_connection_per_server=max_connection_per_server,
+                            min_split_size=min_split_size,
+                            use_strace=use_strace,
+                            verify=verify,
+                            timeout=timeout,
+                        )
+                    )
+    return results
+
+
+def _format_size(
+    size: int,
+) -> str:
+    value = float(size)
+    for unit in ("B", "K", "M"):
+        if value < 1024:
+            return f"{value:g}{unit}"
+        value /= 1024
+    return f"{value:g}G"
+
+
+def format_results(
+    results: list[BenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[BenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    header = f"{'engine':<18} {'size':>6} {'MB/s':>9} {'seconds':>9} {'cpu s':>8} {'rss MB':>8} {'ctx sw':>9} {'syscalls':>10}  note"
+    lines = [header, "-" * len(header)]
+
+    def _fmt(value: float | int | None, width: int, precision: int = 0) -> str:
+        return "-".rjust(width) if value is None else f"{value:{width}.{precision}f}"
+
+    for result in results:
+        rss_mb = result.max_rss_kb / 1024 if result.max_rss_kb is not None else None
+        lines.append(
+            f"{result.engine:<18} {_format_size(result.size):>6} {_fmt(result.mb_per_second, 9, 2)} {_fmt(result.seconds, 9, 3)} "
+            f"{_fmt(result.cpu_seconds, 8, 3)} {_fmt(rss_mb, 8, 1)} {_fmt(result.context_switches, 9)} {_fmt(result.syscalls, 10)}  {result.error or ''}"
+        )
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 下载器性能基准测试")
+    subparsers = parser.add_subparsers(dest="command")
+
+    worker = subparsers.add_parser("worker", help="在当前进程中执行一次下载 (由基准测试自动调用)")
+    worker.add_argument("--engine", required=True, choices=ENGINE_LIST)
+    worker.add_argument("--url", action="append", required=True)
+    worker.add_argument("--output", required=True)
+    worker.add_argument("--split", type=int, default=16)
+    worker.add_argument("--max-connection-per-server", type=int, default=16)
+    worker.add_argument("--min-split-size", type=int, default=1024 * 1024)
+    worker.add_argument("--verify", action="store_true")
+
+    parser.add_argument("--engines", default=",".join(ENGINE_LIST), help="使用逗号分隔的下载引擎列表")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES), help="使用逗号分隔的文件大小列表, 例如 1M,64M,10G")
+    parser.add_argument("--repeat", type=int, default=1, help="每个组合的重复次数")
+    parser.add_argument("--bandwidth", default="0", help="服务器每个连接的带宽上限, 例如 20M, 为 0 时不限制")
+    parser.add_argument("--latency", type=float, default=0.0, help="服务器每个请求的响应延迟 (秒)")
+    parser.add_argument("--no-range", action="store_true", help="服务器不支持 Range 请求")
+    parser.add_argument("--fail-every", type=int, default=0, help="服务器每 N 个 GET 请求返回一次 HTTP 503")
+    parser.add_argument("--drop-after", type=parse_size, default=0, help="服务器每个响应发送指定大小后断开连接, 例如 8M")
+    parser.add_argument("--content-disposition", default=None, help="服务器通过 Content-Disposition 返回的文件名")
+    parser.add_argument("--split", type=int, default=16, help="分片下载引擎的最大连接数")
+    parser.add_argument("--max-connection-per-server", type=int, default=16, help="分片下载引擎的单服务器最大连接数")
+    parser.add_argument("--min-split-size", default="1M", help="分片下载引擎的最小切分大小")
+    parser.add_argument("--strace", action="store_true", help="使用 strace 统计系统调用次数")
+    parser.add_argument("--verify", action="store_true", help="校验下载内容的 sha256")
+    parser.add_argument("--timeout", type=float, default=None, help="单次下载的超时时间 (秒)")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "worker":
+        _run_worker(args)
+        return 0
+
+    results = run_benchmark(
+        engines=[engine.strip() for engine in args.engines.split(",") if engine.strip()],
+        sizes=[parse_size(size) for size in args.sizes.split(",") if size.strip()],
+        server_options=RangeServerOptions(
+            bandwidth=parse_size(args.bandwidth),
+            latency=args.latency,
+            range_support=not args.no_range,
+            fail_every=args.fail_every,
+            drop_after=args.drop_after,
+            content_disposition=args.content_disposition,
+        ),
+        repeat=args.repeat,
+        split=args.split,
+        max_connection_per_server=args.max_connection_per_server,
+        min_split_size=parse_size(args.min_split_size),
+        use_strace=args.strace,
+        verify=args.verify,
+        timeout=args.timeout,
+    )
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) | {"mb_per_second": result.mb_per_second} for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if any(result.error is not None and not result.error.startswith("未安装") for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
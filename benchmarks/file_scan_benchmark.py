@@ -0,0 +1,234 @@
+"""文件扫描性能基准测试
+
+生成一个合成目录树 (默认 50 万个文件), 对比基于`os.walk`的旧版`get_file_list`实现和基于`os.scandir`栈的`scan_files`的扫描速度.
+第一次扫描会受到系统目录缓存是否命中的影响, 因此每个实现都会按`--repeat`次数重复运行并取最快的一次
+
+用法:
+
+```bash
+python -m benchmarks.file_scan_benchmark
+python -m benchmarks.file_scan_benchmark --files 500000 --fanout 10 --depth 3 --workers 8
+python -m benchmarks.file_scan_benchmark --root /content/drive/MyDrive/models  # 扫描已有目录 (例如网络文件系统), 不生成文件
+```
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sd_webui_all_in_one.file_manager import get_file_list, scan_files
+
+
+DEFAULT_FILES = 500_000
+"""默认生成的文件数量"""
+
+MODEL_EXTENSION = ".safetensors"
+"""合成目录树中作为模型文件的扩展名, 用于测试按扩展名过滤"""
+
+MODEL_FILE_INTERVAL = 10
+"""合成目录树中每隔多少个文件生成一个模型文件"""
+
+
+@dataclass
+class ScanBenchmarkResult:
+    """单个扫描实现的基准测试结果"""
+
+    name: str
+    """扫描实现名称"""
+
+    count: int
+    """扫描到的条目数量"""
+
+    seconds: float
+    """最快一次扫描的耗时 (秒)"""
+
+    @property
+    def files_per_second(self) -> float:
+        return self.count / self.seconds if self.seconds > 0 else 0.0
+
+
+def create_synthetic_tree(
+    root: Path,
+    files: int,
+    fanout: int = 10,
+    depth: int = 3,
+) -> int:
+    """生成合成目录树
+
+    Args:
+        root (Path):
+            目录树根目录
+        files (int):
+            要生成的文件数量, 平均分布到最深一层的目录中
+        fanout (int):
+            每个目录中的子目录数量
+        depth (int):
+            目录层数
+
+    Returns:
+        int: 实际生成的文件数量
+    """
+    leaf_dirs = [root]
+    for _ in range(depth):
+        leaf_dirs = [parent / f"d{index:03d}" for parent in leaf_dirs for index in range(fanout)]
+
+    created = 0
+    for leaf_index, leaf in enumerate(leaf_dirs):
+        leaf.mkdir(parents=True, exist_ok=True)
+        count = files // len(leaf_dirs) + (1 if leaf_index < files % len(leaf_dirs) else 0)
+        for index in range(count):
+            suffix = MODEL_EXTENSION if (created + index) % MODEL_FILE_INTERVAL == 0 else ".txt"
+            with open(os.path.join(leaf, f"f{index:06d}{suffix}"), "wb"):
+                pass
+        created += count
+    return created
+
+
+def legacy_get_file_list(
+    path: Path,
+    max_depth: int = -1,
+) -> list[Path]:
+    """旧版基于`os.walk`的`get_file_list`实现 (去掉进度条), 作为对比基线"""
+    base_depth = len(path.resolve().parts)
+    file_list: list[Path] = []
+    for root, dirs, files in os.walk(path):
+        root_path = Path(root)
+        current_depth = len(root_path.resolve().parts) - base_depth
+        if max_depth != -1 and current_depth >= max_depth:
+            dirs.clear()
+        for file in files:
+            file_list.append((root_path / file).absolute())
+    return file_list
+
+
+def _build_cases(
+    root: Path,
+    workers: int,
+) -> list[tuple[str, Callable[[], int]]]:
+    def _legacy_with_stat() -> int:
+        return sum(1 for file in legacy_get_file_list(root) if file.stat().st_size >= 0)
+
+    def _scan_with_stat() -> int:
+        return sum(1 for entry in scan_files(root) if entry.stat().st_size >= 0)
+
+    return [
+        ("legacy_os_walk", lambda: len(legacy_get_file_list(root))),
+        ("get_file_list", lambda: len(get_file_list(root, show_progress=False))),
+        ("scan_files", lambda: sum(1 for _ in scan_files(root))),
+        (f"scan_files[{MODEL_EXTENSION}]", lambda: sum(1 for _ in scan_files(root, extensions=[MODEL_EXTENSION]))),
+        ("legacy_filter", lambda: sum(1 for file in legacy_get_file_list(root) if file.name.endswith(MODEL_EXTENSION))),
+        (f"scan_files[workers={workers}]", lambda: sum(1 for _ in scan_files(root, workers=workers))),
+        ("legacy_os_walk+stat", _legacy_with_stat),
+        ("scan_files+stat", _scan_with_stat),
+    ]
+
+
+def run_benchmark(
+    root: Path,
+    repeat: int = 3,
+    workers: int = 8,
+) -> list[ScanBenchmarkResult]:
+    """对目录运行所有扫描实现
+
+    Args:
+        root (Path):
+            要扫描的目录
+        repeat (int):
+            每个实现的重复次数
+        workers (int):
+            并行扫描的线程数
+
+    Returns:
+        list[ScanBenchmarkResult]: 基准测试结果
+    """
+    results: list[ScanBenchmarkResult] = []
+    for name, case in _build_cases(root, workers):
+        best: float | None = None
+        count = 0
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            count = case()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(ScanBenchmarkResult(name=name, count=count, seconds=best or 0.0))
+    return results
+
+
+def format_results(
+    results: list[ScanBenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[ScanBenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    baseline = results[0].seconds if results else 0.0
+    header = f"{'scanner':<28} {'count':>9} {'seconds':>9} {'files/s':>12} {'speedup':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        speedup = baseline / result.seconds if result.seconds > 0 else 0.0
+        lines.append(f"{result.name:<28} {result.count:>9} {result.seconds:>9.3f} {result.files_per_second:>12.0f} {speedup:>7.2f}x")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 文件扫描性能基准测试")
+    parser.add_argument("--root", default=None, help="扫描已有目录, 指定后不生成合成目录树")
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES, help="合成目录树的文件数量")
+    parser.add_argument("--fanout", type=int, default=10, help="合成目录树每个目录的子目录数量")
+    parser.add_argument("--depth", type=int, default=3, help="合成目录树的目录层数")
+    parser.add_argument("--repeat", type=int, default=3, help="每个实现的重复次数")
+    parser.add_argument("--workers", type=int, default=8, help="并行扫描的线程数")
+    parser.add_argument("--keep", action="store_true", help="保留生成的合成目录树")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    tmp_dir: str | None = None
+    if args.root is not None:
+        root = Path(args.root)
+    else:
+        tmp_dir = tempfile.mkdtemp(prefix="sd-webui-all-in-one-scan-")
+        root = Path(tmp_dir)
+        start = time.perf_counter()
+        created = create_synthetic_tree(root, args.files, fanout=args.fanout, depth=args.depth)
+        print(f"生成 {created} 个文件, 用时 {time.perf_counter() - start:.1f} 秒: {root}")
+
+    try:
+        results = run_benchmark(root, repeat=args.repeat, workers=args.workers)
+    finally:
+        if tmp_dir is not None and not args.keep:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) | {"files_per_second": result.files_per_second} for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
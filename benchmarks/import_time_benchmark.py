@@ -0,0 +1,249 @@
+"""命令行启动与内置数据加载性能基准测试
+
+测试两部分:
+
+1. `sd-webui-all-in-one --help`的启动耗时, 以及`-X importtime`统计的模型库 / PyTorch 版本库模块导入耗时
+2. 内置数据的加载耗时: 将 JSON 数据文件还原为旧版的 Python 字面量模块, 对比导入字面量模块 (有 / 无字节码缓存) 和读取 JSON 数据文件构建目录的耗时
+
+每个测试都按`--repeat`次数重复运行并取最快的一次
+
+用法:
+
+```bash
+python -m benchmarks.import_time_benchmark
+python -m benchmarks.import_time_benchmark --repeat 10 --json import_time.json
+```
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sd_webui_all_in_one.model_downloader.model_data import (
+    MODEL_DATA_PATH,
+    ModelCatalog,
+    load_model_data,
+)
+from sd_webui_all_in_one.pytorch_manager.version_data import (
+    PYTORCH_VERSION_DATA_PATH,
+    PyTorchVersionCatalog,
+    load_pytorch_version_data,
+)
+
+
+DATA_MODULES = (
+    "sd_webui_all_in_one.model_downloader.model_data",
+    "sd_webui_all_in_one.pytorch_manager.version_data",
+)
+"""统计导入耗时的内置数据模块"""
+
+_IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+
+@dataclass
+class ImportBenchmarkResult:
+    """单个测试项的基准测试结果"""
+
+    name: str
+    """测试项名称"""
+
+    seconds: float
+    """最快一次运行的耗时 (秒)"""
+
+
+def _best_of(
+    repeat: int,
+    case: Callable[[], float | None],
+) -> float:
+    best: float | None = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        measured = case()
+        elapsed = measured if measured is not None else time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best or 0.0
+
+
+def _cli_command(
+    *options: str,
+) -> list[str]:
+    return [sys.executable, *options, "-c", "import sys; from sd_webui_all_in_one.cli_manager.cli import main; sys.argv[0] = 'sd-webui-all-in-one'; main()", "--help"]
+
+
+def measure_cli_help(
+    repeat: int = 5,
+) -> list[ImportBenchmarkResult]:
+    """测试`sd-webui-all-in-one --help`的启动耗时和内置数据模块的导入耗时
+
+    Args:
+        repeat (int):
+            重复次数
+
+    Returns:
+        list[ImportBenchmarkResult]: 基准测试结果
+    """
+
+    def _run_help() -> None:
+        subprocess.run(_cli_command(), check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def _data_import_time() -> float:
+        output = subprocess.run(_cli_command("-X", "importtime"), check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True).stderr
+        total_us = 0
+        for line in output.splitlines():
+            match = _IMPORTTIME_PATTERN.match(line)
+            if match is not None and match.group(3).strip() in DATA_MODULES:
+                total_us += int(match.group(2))
+        return total_us / 1_000_000
+
+    return [
+        ImportBenchmarkResult(name="cli --help", seconds=_best_of(repeat, _run_help)),
+        ImportBenchmarkResult(name="cli --help data modules", seconds=_best_of(repeat, _data_import_time)),
+    ]
+
+
+def write_literal_module(
+    path: Path,
+    name: str,
+    data: list,
+) -> Path:
+    """将数据写入为旧版的 Python 字面量模块
+
+    Args:
+        path (Path):
+            模块保存目录
+        name (str):
+            模块名称
+        data (list):
+            模块中的数据
+
+    Returns:
+        Path: 模块文件路径
+    """
+    module_path = path / f"{name}.py"
+    module_path.write_text(f"DATA = {data!r}\n", encoding="utf-8")
+    return module_path
+
+
+def _import_literal_module(
+    module_path: Path,
+    use_bytecode: bool,
+) -> float:
+    code = (
+        "import importlib.util, sys, time\n"
+        f"sys.dont_write_bytecode = {not use_bytecode}\n"
+        f"spec = importlib.util.spec_from_file_location('literal_data', {str(module_path)!r})\n"
+        "module = importlib.util.module_from_spec(spec)\n"
+        "start = time.perf_counter()\n"
+        "spec.loader.exec_module(module)\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    env = dict(os.environ)
+    if use_bytecode:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env).stdout
+    return float(output.strip())
+
+
+def measure_data_loading(
+    repeat: int = 5,
+) -> list[ImportBenchmarkResult]:
+    """对比 Python 字面量模块和 JSON 数据文件的加载耗时
+
+    Args:
+        repeat (int):
+            重复次数
+
+    Returns:
+        list[ImportBenchmarkResult]: 基准测试结果
+    """
+    results: list[ImportBenchmarkResult] = []
+    tmp_dir = tempfile.mkdtemp(prefix="sd-webui-all-in-one-import-")
+    try:
+        for name, data_path, load, catalog_type in (
+            ("model_data", MODEL_DATA_PATH, load_model_data, ModelCatalog),
+            ("version_data", PYTORCH_VERSION_DATA_PATH, load_pytorch_version_data, PyTorchVersionCatalog),
+        ):
+            module_path = write_literal_module(Path(tmp_dir), name, load())
+
+            def _no_bytecode(module_path: Path = module_path) -> float:
+                shutil.rmtree(module_path.parent / "__pycache__", ignore_errors=True)
+                return _import_literal_module(module_path, use_bytecode=False)
+
+            def _bytecode(module_path: Path = module_path) -> float:
+                return _import_literal_module(module_path, use_bytecode=True)
+
+            def _json(data_path: Path = data_path, load: Callable[[Path], list] = load) -> None:
+                load(data_path)
+
+            def _catalog(data_path: Path = data_path, load: Callable[[Path], list] = load, catalog_type: type = catalog_type) -> None:
+                catalog_type(load(data_path))
+
+            results.append(ImportBenchmarkResult(name=f"{name} literal (no pyc)", seconds=_best_of(repeat, _no_bytecode)))
+            _bytecode()
+            results.append(ImportBenchmarkResult(name=f"{name} literal (pyc)", seconds=_best_of(repeat, _bytecode)))
+            results.append(ImportBenchmarkResult(name=f"{name} json", seconds=_best_of(repeat, _json)))
+            results.append(ImportBenchmarkResult(name=f"{name} json + catalog", seconds=_best_of(repeat, _catalog)))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return results
+
+
+def format_results(
+    results: list[ImportBenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[ImportBenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    header = f"{'case':<36} {'milliseconds':>12}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(f"{result.name:<36} {result.seconds * 1000:>12.2f}")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 命令行启动与内置数据加载性能基准测试")
+    parser.add_argument("--repeat", type=int, default=5, help="每个测试项的重复次数")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    results = measure_cli_help(repeat=args.repeat) + measure_data_loading(repeat=args.repeat)
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""启动依赖检查性能基准测试
+
+模拟安装了大量扩展的 ComfyUI 启动时的依赖检查: 在临时目录中生成合成的 site-packages (默认 400 个软件包),
+并生成每个扩展一份的 requirements 列表 (默认 60 个扩展, 每个 8 条依赖, 其中一部分未安装). 对比:
+
+- `legacy`: 旧版实现, 每条依赖最多调用三次`importlib.metadata.version()`, 每次都会重新扫描`sys.path`
+- `index cold`: 清除已安装软件包索引后检查, 包含构建索引的耗时 (每次启动的第一次检查)
+- `index warm`: 使用已构建的索引检查 (之后的检查)
+
+每个测试都按`--repeat`次数重复运行并取最快的一次
+
+用法:
+
+```bash
+python -m benchmarks.installed_index_benchmark
+python -m benchmarks.installed_index_benchmark --packages 800 --nodes 60 --requirements 8 --repeat 5
+```
+"""
+
+import argparse
+import importlib.metadata
+import json
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sd_webui_all_in_one.package_analyzer.installation_checker import (
+    check_version_constraint,
+    is_package_installed,
+    parse_package_spec,
+)
+from sd_webui_all_in_one.package_analyzer.installed_index import invalidate_installed_distribution_index
+from sd_webui_all_in_one.package_analyzer.py_ver_cmp import PyWhlVersionComparison
+
+
+MISSING_INTERVAL = 10
+"""每隔多少条依赖生成一条未安装的依赖"""
+
+
+@dataclass
+class IndexBenchmarkResult:
+    """单个测试项的基准测试结果"""
+
+    name: str
+    """测试项名称"""
+
+    checks: int
+    """检查的依赖数量"""
+
+    installed: int
+    """已安装并满足版本约束的依赖数量"""
+
+    seconds: float
+    """最快一次运行的耗时 (秒)"""
+
+
+def create_synthetic_site_packages(
+    root: Path,
+    packages: int,
+) -> list[str]:
+    """生成合成的 site-packages 目录
+
+    Args:
+        root (Path):
+            site-packages 目录
+        packages (int):
+            软件包数量
+
+    Returns:
+        list[str]: 生成的软件包名列表
+    """
+    names: list[str] = []
+    root.mkdir(parents=True, exist_ok=True)
+    for index in range(packages):
+        name = f"Bench_Pkg.{index:04d}"
+        dist_info = root / f"bench_pkg_{index:04d}-1.{index % 20}.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.{index % 20}.0\nRequires-Dist: bench-pkg-{(index + 1) % packages:04d}>=1.0\n",
+            encoding="utf-8",
+        )
+        names.append(name)
+    return names
+
+
+def create_requirements(
+    names: list[str],
+    nodes: int,
+    requirements: int,
+) -> list[str]:
+    """生成所有扩展的依赖声明
+
+    Args:
+        names (list[str]):
+            已安装的软件包名列表
+        nodes (int):
+            扩展数量
+        requirements (int):
+            每个扩展的依赖数量
+
+    Returns:
+        list[str]: 依赖声明列表
+    """
+    result: list[str] = []
+    for node in range(nodes):
+        for index in range(requirements):
+            position = node * requirements + index
+            if position % MISSING_INTERVAL == 0:
+                result.append(f"missing-pkg-{position}>=1.0")
+            else:
+                # 扩展中的依赖名写法不统一, 用小写和连字符形式引用
+                result.append(f"{names[position % len(names)].lower().replace('_', '-').replace('.', '-')}>=1.0")
+    return result
+
+
+def legacy_get_package_version(
+    package_name: str,
+) -> str | None:
+    """旧版依次尝试原始包名, 小写包名, 下划线转连字符包名的版本号查找实现, 作为对比基线"""
+    for name in (package_name, package_name.lower(), package_name.replace("_", "-")):
+        try:
+            return importlib.metadata.version(name)
+        except Exception:
+            continue
+    return None
+
+
+def legacy_is_package_installed(
+    package: str,
+) -> bool:
+    """使用旧版版本号查找的`is_package_installed`实现"""
+    pkg_name, specs, _is_url = parse_package_spec(package)
+    env_pkg_version = legacy_get_package_version(pkg_name)
+    if env_pkg_version is None:
+        return False
+    cmp = PyWhlVersionComparison(env_pkg_version)
+    return all(check_version_constraint(env_pkg_version, op, pkg_version, cmp) for op, pkg_version in specs)
+
+
+def run_benchmark(
+    requires: list[str],
+    repeat: int = 3,
+) -> list[IndexBenchmarkResult]:
+    """对依赖声明列表运行所有检查实现
+
+    Args:
+        requires (list[str]):
+            依赖声明列表, 需要检查的软件包所在目录应已加入`sys.path`
+        repeat (int):
+            每个实现的重复次数
+
+    Returns:
+        list[IndexBenchmarkResult]: 基准测试结果
+    """
+
+    def _legacy() -> int:
+        return sum(1 for package in requires if legacy_is_package_installed(package))
+
+    def _cold() -> int:
+        invalidate_installed_distribution_index()
+        return sum(1 for package in requires if is_package_installed(package))
+
+    def _warm() -> int:
+        return sum(1 for package in requires if is_package_installed(package))
+
+    cases: list[tuple[str, Callable[[], int]]] = [
+        ("legacy", _legacy),
+        ("index cold", _cold),
+        ("index warm", _warm),
+    ]
+    results: list[IndexBenchmarkResult] = []
+    for name, case in cases:
+        best: float | None = None
+        installed = 0
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            installed = case()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(IndexBenchmarkResult(name=name, checks=len(requires), installed=installed, seconds=best or 0.0))
+    return results
+
+
+def format_results(
+    results: list[IndexBenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[IndexBenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    baseline = results[0].seconds if results else 0.0
+    header = f"{'case':<14} {'checks':>7} {'installed':>10} {'milliseconds':>13} {'speedup':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        speedup = baseline / result.seconds if result.seconds > 0 else 0.0
+        lines.append(f"{result.name:<14} {result.checks:>7} {result.installed:>10} {result.seconds * 1000:>13.2f} {speedup:>8.1f}x")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 启动依赖检查性能基准测试")
+    parser.add_argument("--packages", type=int, default=400, help="合成 site-packages 中的软件包数量")
+    parser.add_argument("--nodes", type=int, default=60, help="扩展数量")
+    parser.add_argument("--requirements", type=int, default=8, help="每个扩展的依赖数量")
+    parser.add_argument("--repeat", type=int, default=3, help="每个实现的重复次数")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    tmp_dir = tempfile.mkdtemp(prefix="sd-webui-all-in-one-site-")
+    site = Path(tmp_dir) / "site-packages"
+    sys.path.insert(0, str(site))
+    try:
+        names = create_synthetic_site_packages(site, args.packages)
+        requires = create_requirements(names, args.nodes, args.requirements)
+        results = run_benchmark(requires, repeat=args.repeat)
+    finally:
+        sys.path.remove(str(site))
+        invalidate_installed_distribution_index()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""本地 HTTP Range 测试服务器
+
+按请求路径 `/<大小>/<文件名>` 动态生成指定大小的确定性内容, 不占用磁盘空间, 可以模拟带宽限制、响应延迟、不支持 Range、
+周期性返回 HTTP 503 以及 Content-Disposition 文件名
+"""
+
+import hashlib
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+
+PATTERN_PERIOD = 251
+"""生成内容的重复周期, 使用质数避免错位的 piece 恰好与原内容一致"""
+
+SERVER_CHUNK_SIZE = 64 * 1024
+"""服务器每次写入响应的块大小"""
+
+_PATTERN = bytes(range(PATTERN_PERIOD)) * (SERVER_CHUNK_SIZE // PATTERN_PERIOD + 2)
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*$", flags=re.IGNORECASE)
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(
+    value: str,
+) -> int:
+    """解析 `1M`、`64MiB`、`10G` 形式的大小
+
+    Args:
+        value (str):
+            大小字符串, 单位为 1024 进制
+
+    Returns:
+        int: 字节数
+
+    Raises:
+        ValueError:
+            大小格式无效时
+    """
+    match = _SIZE_RE.match(value)
+    if match is None:
+        raise ValueError(f"无效的大小: '{value}'")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def content_chunk(
+    offset: int,
+    length: int,
+) -> bytes:
+    """获取测试内容中从 `offset` 开始的一段数据, `length` 不超过 `SERVER_CHUNK_SIZE`"""
+    start = offset % PATTERN_PERIOD
+    return _PATTERN[start : start + length]
+
+
+def content_sha256(
+    size: int,
+) -> str:
+    """计算指定大小的测试内容的 sha256
+
+    Args:
+        size (int):
+            内容大小
+
+    Returns:
+        str: sha256 十六进制字符串
+    """
+    hash_sha256 = hashlib.sha256()
+    offset = 0
+    while offset < size:
+        length = min(SERVER_CHUNK_SIZE, size - offset)
+        hash_sha256.update(content_chunk(offset, length))
+        offset += length
+    return hash_sha256.hexdigest()
+
+
+@dataclass
+class RangeServerOptions:
+    """本地 HTTP Range 测试服务器的行为配置"""
+
+    bandwidth: int = 0
+    """每个连接的带宽上限 (字节/秒), 为 0 时不限制"""
+
+    latency: float = 0.0
+    """每个请求返回响应前的延迟 (秒)"""
+
+    range_support: bool = True
+    """是否支持 Range 请求, 为 False 时忽略 Range 请求头并返回完整内容"""
+
+    fail_every: int = 0
+    """每 N 个 GET 请求返回一次 HTTP 503, 为 0 时不注入错误"""
+
+    content_disposition: str | None = None
+    """通过 Content-Disposition 返回的文件名, 为 None 时不返回该响应头"""
+
+    drop_after: int = 0
+    """每个响应发送指定字节数后断开连接, 用于模拟下载中断, 为 0 时不断开"""
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_RangeHTTPServer"
+
+    def log_message(
+        self,
+        format: str,  # pylint: disable=redefined-builtin
+        *args: object,
+    ) -> None:
+        pass
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        self._handle(send_body=False)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self._handle(send_body=True)
+
+    def _handle(
+        self,
+        send_body: bool,
+    ) -> None:
+        options = self.server.options
+        size = self._requested_size()
+        if size is None:
+            self._send_empty(404)
+            return
+        if options.latency > 0:
+            time.sleep(options.latency)
+        if send_body and self.server.count_request():
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        start, end = 0, size - 1
+        status_code = 200
+        range_header = self.headers.get("Range")
+        if options.range_support and range_header is not None:
+            byte_range = self._parse_range(range_header, size)
+            if byte_range is None:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start, end = byte_range
+            status_code = 206
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Last-Modified", "Wed, 27 May 2026 00:00:00 GMT")
+        self.send_header("ETag", f'"{size}"')
+        if options.range_support:
+            self.send_header("Accept-Ranges", "bytes")
+        if status_code == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        if options.content_disposition is not None:
+            self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(options.content_disposition)}")
+        self.end_headers()
+        if send_body:
+            if options.drop_after > 0 and end - start + 1 > options.drop_after:
+                self._send_body(start, start + options.drop_after - 1, options.bandwidth)
+                self.close_connection = True
+                return
+            self._send_body(start, end, options.bandwidth)
+
+    def _requested_size(self) -> int | None:
+        parts = [part for part in unquote(self.path.split("?", maxsplit=1)[0]).split("/") if part]
+        if len(parts) != 2:
+            return None
+        try:
+            return parse_size(parts[0])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_range(
+        value: str,
+        size: int,
+    ) -> tuple[int, int] | None:
+        match = _RANGE_RE.match(value.strip())
+        if match is None or not (match.group(1) or match.group(2)):
+            return None
+        if not match.group(1):
+            suffix = int(match.group(2))
+            return (max(0, size - suffix), size - 1) if suffix > 0 else None
+        start = int(match.group(1))
+        end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+        if start >= size or start > end:
+            return None
+        return start, end
+
+    def _send_body(
+        self,
+        start: int,
+        end: int,
+        bandwidth: int,
+    ) -> None:
+        offset = start
+        begin = time.monotonic()
+        try:
+            while offset <= end:
+                length = min(SERVER_CHUNK_SIZE, end - offset + 1)
+                self.wfile.write(content_chunk(offset, length))
+                offset += length
+                if bandwidth > 0:
+                    # 按已发送的数据量计算应当经过的时间, 发送过快时等待
+                    delay = (offset - start) / bandwidth - (time.monotonic() - begin)
+                    if delay > 0:
+                        time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _send_empty(
+        self,
+        status_code: int,
+    ) -> None:
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _RangeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        options: RangeServerOptions,
+    ) -> None:
+        super().__init__(address, _RangeRequestHandler)
+        self.options = options
+        self.lock = threading.Lock()
+        self.get_count = 0
+        self.failed_count = 0
+
+    def handle_error(
+        self,
+        request: object,
+        client_address: object,
+    ) -> None:
+        # 客户端提前关闭下载流或空闲的 keep-alive 连接属于正常情况
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def count_request(self) -> bool:
+        """记录一个 GET 请求, 返回该请求是否需要注入 503 错误"""
+        with self.lock:
+            self.get_count += 1
+            failed = self.options.fail_every > 0 and self.get_count % self.options.fail_every == 0
+            if failed:
+                self.failed_count += 1
+            return failed
+
+
+class RangeServer:
+    """在后台线程中运行的本地 HTTP Range 测试服务器
+
+    Attributes:
+        options (RangeServerOptions):
+            服务器行为配置
+        host (str):
+            监听地址
+        port (int):
+            监听端口, 为 0 时在启动后由系统分配
+    """
+
+    def __init__(
+        self,
+        options: RangeServerOptions | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """本地 HTTP Range 测试服务器初始化
+
+        Args:
+            options (RangeServerOptions | None):
+                服务器行为配置, 为 None 时使用默认配置
+            host (str):
+                监听地址
+            port (int):
+                监听端口, 为 0 时由系统分配
+        """
+        self.options = options or RangeServerOptions()
+        self.host = host
+        self.port = port
+        self._server: _RangeHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "RangeServer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        *_args: object,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """启动服务器"""
+        if self._server is not None:
+            return
+        self._server = _RangeHTTPServer((self.host, self.port), self.options)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="range-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止服务器"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    @property
+    def get_count(self) -> int:
+        """已收到的 GET 请求数"""
+        return self._server.get_count if self._server is not None else 0
+
+    @property
+    def failed_count(self) -> int:
+        """已注入的 503 错误数"""
+        return self._server.failed_count if self._server is not None else 0
+
+    def url(
+        self,
+        size: int,
+        filename: str = "file.bin",
+    ) -> str:
+        """获取指定大小测试文件的下载链接
+
+        Args:
+            size (int):
+                文件大小
+            filename (str):
+                链接中的文件名
+
+        Returns:
+            str: 下载链接
+        """
+        return f"http://{self.host}:{self.port}/{size}/{quote(filename)}"
@@ -0,0 +1,217 @@
+"""依赖文件解析性能基准测试
+
+模拟安装了大量扩展的 WebUI 启动时的依赖文件解析: 在临时目录中为每个扩展生成一份`requirements.txt` (默认 80 个扩展,
+每个 12 条依赖, 包含 Git 仓库引用, 多约束声明和 marker), 对比:
+
+- `legacy`: 旧版实现, 每次启动都重新读取并解析所有依赖文件 (`read_packages_from_requirements_file()` → `parse_requirement_list()`)
+- `cache cold`: 没有缓存文件时首次解析并保存缓存文件
+- `cache disk`: 新进程读取缓存文件, 依赖文件未修改 (之后的每次启动)
+- `cache memory`: 同一进程中再次获取依赖列表
+
+每次运行前都会清除进程内的依赖声明解析缓存以模拟新启动的进程. 每个测试都按`--repeat`次数重复运行并取最快的一次
+
+用法:
+
+```bash
+python -m benchmarks.requirement_cache_benchmark
+python -m benchmarks.requirement_cache_benchmark --extensions 200 --requirements 20 --repeat 5
+```
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sd_webui_all_in_one.package_analyzer import requirement_parser, version_utils
+from sd_webui_all_in_one.package_analyzer.requirement_cache import RequirementFileCache
+from sd_webui_all_in_one.package_analyzer.requirement_normalizer import parse_requirement_list
+from sd_webui_all_in_one.package_analyzer.requirement_parser import read_packages_from_requirements_file
+
+
+@dataclass
+class RequirementBenchmarkResult:
+    """单个测试项的基准测试结果"""
+
+    name: str
+    """测试项名称"""
+
+    files: int
+    """依赖文件数量"""
+
+    requires: int
+    """解析得到的软件包声明数量"""
+
+    seconds: float
+    """最快一次运行的耗时 (秒)"""
+
+
+def create_requirement_files(
+    root: Path,
+    extensions: int,
+    requirements: int,
+) -> list[Path]:
+    """为每个扩展生成一份依赖文件
+
+    Args:
+        root (Path):
+            扩展目录
+        extensions (int):
+            扩展数量
+        requirements (int):
+            每个扩展的依赖数量
+
+    Returns:
+        list[Path]: 依赖文件路径列表
+    """
+    templates = [
+        "pkg-{index}>={minor}.0",
+        "Pkg_{index}[extra]=={minor}.1.0  # pinned",
+        "pkg-{index}<5,>={minor}.2",
+        "git+https://github.com/example/repo-{index}.git@main",
+        "pkg-{index}; python_version >= '3.8'",
+        "pkg-{index}~={minor}.4",
+    ]
+    paths: list[Path] = []
+    for extension in range(extensions):
+        ext_dir = root / f"extension-{extension:03d}"
+        ext_dir.mkdir(parents=True)
+        lines = ["# synthetic requirements", "--extra-index-url https://example.com/simple"]
+        for index in range(requirements):
+            position = extension * requirements + index
+            lines.append(templates[position % len(templates)].format(index=position % 300, minor=position % 7))
+        path = ext_dir / "requirements.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _clear_parse_caches() -> None:
+    """清除进程内的依赖声明解析缓存, 模拟新启动的进程"""
+    requirement_parser._parse_requirement_to_tuple.cache_clear()  # pylint: disable=protected-access
+    version_utils._try_parse_requirement.cache_clear()  # pylint: disable=protected-access
+
+
+def run_benchmark(
+    paths: list[Path],
+    cache_path: Path,
+    repeat: int = 3,
+) -> list[RequirementBenchmarkResult]:
+    """对依赖文件列表运行所有解析实现
+
+    Args:
+        paths (list[Path]):
+            依赖文件路径列表
+        cache_path (Path):
+            缓存文件路径
+        repeat (int):
+            每个实现的重复次数
+
+    Returns:
+        list[RequirementBenchmarkResult]: 基准测试结果
+    """
+    memory_cache = RequirementFileCache(cache_path)
+
+    def _legacy() -> int:
+        _clear_parse_caches()
+        return sum(len(parse_requirement_list(read_packages_from_requirements_file(path))) for path in paths)
+
+    def _load(cache: RequirementFileCache) -> int:
+        total = sum(len(cache.get_requirements(path)) for path in paths)
+        cache.save()
+        return total
+
+    def _cold() -> int:
+        _clear_parse_caches()
+        cache_path.unlink(missing_ok=True)
+        return _load(RequirementFileCache(cache_path))
+
+    def _disk() -> int:
+        _clear_parse_caches()
+        return _load(RequirementFileCache(cache_path))
+
+    def _memory() -> int:
+        return _load(memory_cache)
+
+    cases: list[tuple[str, Callable[[], int]]] = [
+        ("legacy", _legacy),
+        ("cache cold", _cold),
+        ("cache disk", _disk),
+        ("cache memory", _memory),
+    ]
+    results: list[RequirementBenchmarkResult] = []
+    for name, case in cases:
+        best: float | None = None
+        requires = 0
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            requires = case()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(RequirementBenchmarkResult(name=name, files=len(paths), requires=requires, seconds=best or 0.0))
+    return results
+
+
+def format_results(
+    results: list[RequirementBenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[RequirementBenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    baseline = results[0].seconds if results else 0.0
+    header = f"{'case':<14} {'files':>6} {'requires':>9} {'milliseconds':>13} {'speedup':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        speedup = baseline / result.seconds if result.seconds > 0 else 0.0
+        lines.append(f"{result.name:<14} {result.files:>6} {result.requires:>9} {result.seconds * 1000:>13.2f} {speedup:>8.1f}x")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 依赖文件解析性能基准测试")
+    parser.add_argument("--extensions", type=int, default=80, help="扩展数量")
+    parser.add_argument("--requirements", type=int, default=12, help="每个扩展的依赖数量")
+    parser.add_argument("--repeat", type=int, default=3, help="每个实现的重复次数")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    tmp_dir = Path(tempfile.mkdtemp(prefix="sd-webui-all-in-one-requirements-"))
+    try:
+        paths = create_requirement_files(tmp_dir / "extensions", args.extensions, args.requirements)
+        results = run_benchmark(paths, tmp_dir / "requirement-cache.json", repeat=args.repeat)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
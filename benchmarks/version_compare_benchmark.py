@@ -0,0 +1,244 @@
+"""版本号比较性能基准测试
+
+生成一组合成的版本号 (默认 300 个, 包含 pre / post / dev / local version), 模拟环境检查中大量重复比较同一批版本号
+以及`fetch_pypi_versions`排序版本列表的场景. 对比:
+
+- `legacy compare`: 旧版实现, 每次比较都重新用正则表达式解析两个版本号
+- `cached compare`: `PyWhlVersionComparison.compare_versions()`, 解析结果缓存, 比较预先计算的排序键
+- `packaging compare`: `packaging.version.Version`, 每次比较都创建版本对象 (未安装`packaging`时跳过)
+- `legacy sort`: 旧版`fetch_pypi_versions`使用`CommonVersionComparison`包装对象排序
+- `key sort`: 使用`version_sort_key`排序
+- `packaging sort`: 使用`packaging.version.Version`排序 (未安装`packaging`时跳过)
+
+每个测试都按`--repeat`次数重复运行并取最快的一次, 加速比相对于同组的第一个测试项计算
+
+用法:
+
+```bash
+python -m benchmarks.version_compare_benchmark
+python -m benchmarks.version_compare_benchmark --versions 500 --comparisons 50000 --repeat 5
+```
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from sd_webui_all_in_one.package_analyzer.py_ver_cmp import (
+    PyWhlVersionComparison,
+    parse_pywhl_version,
+    version_sort_key,
+)
+from sd_webui_all_in_one.package_analyzer.ver_cmp import CommonVersionComparison
+
+try:
+    from packaging.version import Version
+except ImportError:
+    Version = None
+
+
+@dataclass
+class VersionBenchmarkResult:
+    """单个测试项的基准测试结果"""
+
+    group: str
+    """测试分组 (compare / sort)"""
+
+    name: str
+    """测试项名称"""
+
+    operations: int
+    """比较次数或排序的版本号数量"""
+
+    seconds: float
+    """最快一次运行的耗时 (秒)"""
+
+
+def create_versions(
+    count: int,
+    seed: int = 0,
+) -> list[str]:
+    """生成合成的版本号列表
+
+    Args:
+        count (int):
+            版本号数量
+        seed (int):
+            随机数种子
+
+    Returns:
+        list[str]: 版本号列表
+    """
+    rng = random.Random(seed)
+    versions: list[str] = []
+    for _ in range(count):
+        version = ".".join(str(rng.randint(0, 12)) for _ in range(rng.randint(1, 3)))
+        if rng.random() < 0.2:
+            version += f"{rng.choice(['a', 'b', 'rc'])}{rng.randint(0, 3)}"
+        if rng.random() < 0.1:
+            version += f".post{rng.randint(0, 3)}"
+        if rng.random() < 0.1:
+            version += f".dev{rng.randint(0, 3)}"
+        if rng.random() < 0.2:
+            version += f"+{rng.choice(['cu118', 'cu121', 'rocm6.1', 'cpu'])}"
+        versions.append(version)
+    return versions
+
+
+def create_pairs(
+    versions: list[str],
+    comparisons: int,
+    seed: int = 0,
+) -> list[tuple[str, str]]:
+    """从版本号列表中随机选择需要比较的版本号对
+
+    Args:
+        versions (list[str]):
+            版本号列表
+        comparisons (int):
+            比较次数
+        seed (int):
+            随机数种子
+
+    Returns:
+        list[tuple[str, str]]: 版本号对列表
+    """
+    rng = random.Random(seed)
+    return [(rng.choice(versions), rng.choice(versions)) for _ in range(comparisons)]
+
+
+def legacy_compare_versions(
+    cmp: PyWhlVersionComparison,
+    version1: str,
+    version2: str,
+) -> int:
+    """旧版每次都重新解析版本号的比较实现, 作为对比基线"""
+    parse = parse_pywhl_version.__wrapped__
+    return cmp.compare_version_objects(parse(version1).components, parse(version2).components)
+
+
+def _sign(
+    value: int,
+) -> int:
+    return (value > 0) - (value < 0)
+
+
+def run_benchmark(
+    versions: list[str],
+    pairs: list[tuple[str, str]],
+    repeat: int = 3,
+) -> list[VersionBenchmarkResult]:
+    """运行所有版本号比较和排序实现
+
+    Args:
+        versions (list[str]):
+            需要排序的版本号列表
+        pairs (list[tuple[str, str]]):
+            需要比较的版本号对
+        repeat (int):
+            每个实现的重复次数
+
+    Returns:
+        list[VersionBenchmarkResult]: 基准测试结果
+    """
+    cmp = PyWhlVersionComparison("0")
+
+    def _legacy_compare() -> int:
+        return sum(_sign(legacy_compare_versions(cmp, left, right)) for left, right in pairs)
+
+    def _cached_compare() -> int:
+        return sum(cmp.compare_versions(left, right) for left, right in pairs)
+
+    def _packaging_compare() -> int:
+        total = 0
+        for left, right in pairs:
+            v1, v2 = Version(left), Version(right)
+            total += (v1 > v2) - (v1 < v2)
+        return total
+
+    cases: list[tuple[str, str, int, Callable[[], object]]] = [
+        ("compare", "legacy compare", len(pairs), _legacy_compare),
+        ("compare", "cached compare", len(pairs), _cached_compare),
+    ]
+    if Version is not None:
+        cases.append(("compare", "packaging compare", len(pairs), _packaging_compare))
+    cases += [
+        ("sort", "legacy sort", len(versions), lambda: sorted(versions, key=CommonVersionComparison)),
+        ("sort", "key sort", len(versions), lambda: sorted(versions, key=version_sort_key)),
+    ]
+    if Version is not None:
+        cases.append(("sort", "packaging sort", len(versions), lambda: sorted(versions, key=Version)))
+
+    results: list[VersionBenchmarkResult] = []
+    for group, name, operations, case in cases:
+        best: float | None = None
+        for _ in range(max(1, repeat)):
+            start = time.perf_counter()
+            case()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(VersionBenchmarkResult(group=group, name=name, operations=operations, seconds=best or 0.0))
+    return results
+
+
+def format_results(
+    results: list[VersionBenchmarkResult],
+) -> str:
+    """将基准测试结果格式化为表格
+
+    Args:
+        results (list[VersionBenchmarkResult]):
+            基准测试结果列表
+
+    Returns:
+        str: 表格文本
+    """
+    baselines: dict[str, float] = {}
+    header = f"{'case':<18} {'operations':>11} {'milliseconds':>13} {'speedup':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        baseline = baselines.setdefault(result.group, result.seconds)
+        speedup = baseline / result.seconds if result.seconds > 0 else 0.0
+        lines.append(f"{result.name:<18} {result.operations:>11} {result.seconds * 1000:>13.2f} {speedup:>8.1f}x")
+    return "\n".join(lines)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="SD WebUI All In One 版本号比较性能基准测试")
+    parser.add_argument("--versions", type=int, default=300, help="合成版本号数量")
+    parser.add_argument("--comparisons", type=int, default=20000, help="版本号比较次数")
+    parser.add_argument("--repeat", type=int, default=3, help="每个实现的重复次数")
+    parser.add_argument("--json", default=None, help="将结果保存为 JSON 文件")
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> int:
+    """基准测试命令行入口
+
+    Args:
+        argv (list[str] | None):
+            命令行参数
+
+    Returns:
+        int: 退出码
+    """
+    args = _build_parser().parse_args(argv)
+    versions = create_versions(args.versions)
+    pairs = create_pairs(versions, args.comparisons)
+    results = run_benchmark(versions, pairs, repeat=args.repeat)
+
+    print(format_results(results))
+    if args.json:
+        Path(args.json).write_text(json.dumps([asdict(result) for result in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
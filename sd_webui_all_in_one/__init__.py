@@ -14,26 +14,20 @@
 禁用彩色日志可设置环境变量`SD_WEBUI_ALL_IN_ONE_LOGGER_COLOR=0`
 
 设置日志器的名称可通过环境变量`SD_WEBUI_ALL_IN_ONE_LOGGER_NAME=<日志器名称>`进行设置
+
+导入该包及其子模块不会修改环境变量或检测系统代理, 需要时调用`sd_webui_all_in_one.bootstrap.bootstrap_environment()`初始化运行环境
 """
 
-import os
+import importlib
+from typing import Any
 
 from sd_webui_all_in_one.logger import get_logger
 from sd_webui_all_in_one.config import (
     LOGGER_NAME,
     LOGGER_LEVEL,
     LOGGER_COLOR,
-    SD_WEBUI_ALL_IN_ONE_PROXY,
-    SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH,
-    SD_WEBUI_ALL_IN_ONE_SET_CONFIG,
-    SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH,
-    DEFAULT_ENV_VARS,
-)
-from sd_webui_all_in_one.proxy import (
-    set_proxy,
-    get_system_proxy_address,
-    test_proxy_connectivity,
 )
+from sd_webui_all_in_one.version import VERSION
 
 logger = get_logger(
     name=LOGGER_NAME,
@@ -42,53 +36,30 @@ logger = get_logger(
 )
 
 
-os.environ["NO_PROXY"] = "localhost,127.0.0.1,::1"
+_LAZY_EXPORTS = {
+    "BaseManager": "sd_webui_all_in_one.notebook_manager",
+    "SDWebUIManager": "sd_webui_all_in_one.notebook_manager",
+    "ComfyUIManager": "sd_webui_all_in_one.notebook_manager",
+    "FooocusManager": "sd_webui_all_in_one.notebook_manager",
+    "InvokeAIManager": "sd_webui_all_in_one.notebook_manager",
+    "SDTrainerManager": "sd_webui_all_in_one.notebook_manager",
+    "SDScriptsManager": "sd_webui_all_in_one.notebook_manager",
+    "SDTrainerScriptsManager": "sd_webui_all_in_one.notebook_manager",
+    "QwenTTSWebUIManager": "sd_webui_all_in_one.notebook_manager",
+}
+"""首次访问时才导入的导出名称和所在模块, 避免导入任意子模块 (例如命令行入口) 时加载全部 Notebook 管理器"""
 
-if SD_WEBUI_ALL_IN_ONE_PROXY:
-    proxy_address = get_system_proxy_address()
-    if proxy_address is not None:
-        logger.debug("检测到系统代理: %s", proxy_address)
-        if test_proxy_connectivity(proxy_address):
-            logger.debug("代理连通性测试成功，配置系统代理: %s", proxy_address)
-            set_proxy(proxy_address)
-        else:
-            logger.debug("代理 %s 连通性测试失败，跳过代理配置", proxy_address)
 
-if SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH:
-    logger.debug("设置缓存路径")
-    os.environ["CACHE_HOME"] = os.getenv("CACHE_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache").as_posix())
-    os.environ["HF_HOME"] = os.getenv("HF_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "huggingface").as_posix())
-    os.environ["MATPLOTLIBRC"] = os.getenv("MATPLOTLIBRC", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache").as_posix())
-    os.environ["MODELSCOPE_CACHE"] = os.getenv("MODELSCOPE_CACHE", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "modelscope" / "hub").as_posix())
-    os.environ["MS_CACHE_HOME"] = os.getenv("MS_CACHE_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "modelscope" / "hub").as_posix())
-    os.environ["SYCL_CACHE_DIR"] = os.getenv("SYCL_CACHE_DIR", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "libsycl_cache").as_posix())
-    os.environ["TORCH_HOME"] = os.getenv("TORCH_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "torch").as_posix())
-    os.environ["U2NET_HOME"] = os.getenv("U2NET_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "u2net").as_posix())
-    os.environ["XDG_CACHE_HOME"] = os.getenv("XDG_CACHE_HOME", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache").as_posix())
-    os.environ["PIP_CACHE_DIR"] = os.getenv("PIP_CACHE_DIR", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "pip").as_posix())
-    os.environ["PYTHONPYCACHEPREFIX"] = os.getenv("PYTHONPYCACHEPREFIX", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "pycache").as_posix())
-    os.environ["TORCHINDUCTOR_CACHE_DIR"] = os.getenv("TORCHINDUCTOR_CACHE_DIR", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "torchinductor").as_posix())
-    os.environ["TRITON_CACHE_DIR"] = os.getenv("TRITON_CACHE_DIR", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "triton").as_posix())
-    os.environ["UV_CACHE_DIR"] = os.getenv("UV_CACHE_DIR", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "uv").as_posix())
+def __getattr__(
+    name: str,
+) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-if SD_WEBUI_ALL_IN_ONE_SET_CONFIG:
-    logger.debug("配置基础环境变量")
-    for k, v in DEFAULT_ENV_VARS:
-        os.environ[k] = v
-
-# pylint: disable=wrong-import-position
-from sd_webui_all_in_one.version import VERSION
-from sd_webui_all_in_one.notebook_manager import (
-    BaseManager,
-    SDWebUIManager,
-    ComfyUIManager,
-    FooocusManager,
-    InvokeAIManager,
-    SDTrainerManager,
-    SDScriptsManager,
-    SDTrainerScriptsManager,
-    QwenTTSWebUIManager,
-)
 
 __all__ = [
     "BaseManager",
@@ -1,12 +1,21 @@
 """压缩 / 解压工具"""
 
+import io
 import os
+import sys
+import bz2
+import gzip
+import heapq
+import zlib
 import zipfile
 import tarfile
 import lzma
 import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterable, Literal
+from typing import Any, BinaryIO, Callable, Iterable, Literal
 
 from sd_webui_all_in_one.config import (
     LOGGER_LEVEL,
@@ -73,6 +82,27 @@ TAR_EXTRACT_MODES: dict[str, TarExtractMode] = {
 }
 """tarfile 支持的解压模式"""
 
+TarStreamExtractMode = Literal["r|", "r|gz", "r|bz2", "r|xz"]
+
+TAR_STREAM_EXTRACT_MODES: dict[str, TarStreamExtractMode] = {
+    ".tar": "r|",
+    ".tar.gz": "r|gz",
+    ".tgz": "r|gz",
+    ".tar.bz2": "r|bz2",
+    ".tbz2": "r|bz2",
+    ".tar.xz": "r|xz",
+    ".txz": "r|xz",
+}
+"""tarfile 支持的流式解压模式"""
+
+SUPPORTED_STREAM_EXTRACT_ARCHIVE_FORMAT = [
+    *TAR_STREAM_EXTRACT_MODES,
+    ".tar.lzma",
+    ".tlz",
+    ".tar.zst",
+]
+"""支持从不可随机访问的数据流中解压的压缩包格式列表, zip / 7z / rar 需要随机访问, 不支持流式解压"""
+
 TAR_CREATE_MODES: dict[str, TarCreateMode] = {
     ".tar": "w",
     ".tar.gz": "w:gz",
@@ -87,6 +117,24 @@ TAR_CREATE_MODES: dict[str, TarCreateMode] = {
 ARCHIVE_COPY_CHUNK_SIZE = 1024 * 1024
 """压缩 / 解压进度更新分块大小"""
 
+ARCHIVE_EXTRACT_MAX_WORKERS = 8
+"""并行解压时默认使用的最大线程数"""
+
+ARCHIVE_MEMBER_COST_OVERHEAD = 64 * 1024
+"""分配并行解压任务时每个成员的固定开销估计 (字节), 用于平衡大量小文件的创建开销"""
+
+ARCHIVE_COMPRESS_BLOCK_SIZE = 8 * 1024 * 1024
+"""gzip / bz2 并行分块压缩时每个块的大小"""
+
+XZ_COMPRESS_BLOCK_SIZE = 24 * 1024 * 1024
+"""xz 并行分块压缩时每个块的大小, 与 xz 多线程模式默认块大小 (3 倍字典大小) 一致"""
+
+ZIP_PARALLEL_MEMBER_MAX_SIZE = 8 * 1024 * 1024
+"""zip 并行压缩时在工作线程中整体压缩的成员大小上限, 更大的成员按顺序流式压缩"""
+
+TarCompressorFactory = Callable[[BinaryIO, int | None, int], Any]
+"""tar 压缩器工厂, 参数为目标文件, 压缩等级和线程数, 返回可写入的压缩流, 返回`None`时使用默认实现"""
+
 
 def _get_archive_format(
     archive_path: Path,
@@ -162,31 +210,112 @@ def _copy_stream_with_progress(
         progress_bar.update(len(chunk))
 
 
-class _ProgressReader:
-    """读取文件时同步更新进度条"""
+class _LockedProgressBar:
+    """供多个解压线程共享的进度条包装"""
+
+    def __init__(
+        self,
+        progress_bar: Any,
+    ) -> None:
+        self.progress_bar = progress_bar
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        n: int,
+    ) -> None:
+        with self._lock:
+            self.progress_bar.update(n)
+
+
+def _get_extract_workers(
+    workers: int | None,
+) -> int:
+    """获取并行解压线程数"""
+    if workers is None:
+        return min(ARCHIVE_EXTRACT_MAX_WORKERS, os.cpu_count() or 1)
+    return max(1, workers)
+
+
+def _shard_by_cost(
+    items: list[Any],
+    cost: Any,
+    shard_count: int,
+) -> list[list[Any]]:
+    """按开销将任务均衡分配到多个分片 (开销最大的任务优先分配到当前负载最小的分片)"""
+    shards: list[list[Any]] = [[] for _ in range(shard_count)]
+    heap = [(0, index) for index in range(shard_count)]
+    for item in sorted(items, key=cost, reverse=True):
+        load, index = heapq.heappop(heap)
+        shards[index].append(item)
+        heapq.heappush(heap, (load + cost(item), index))
+    return [shard for shard in shards if shard]
+
+
+def _run_extract_shards(
+    shards: list[list[Any]],
+    extract_shard: Any,
+) -> None:
+    """使用线程池并行解压各个分片, 任一分片失败时通知其他分片停止并抛出第一个错误
+
+    Args:
+        shards (list[list[Any]]):
+            解压任务分片
+        extract_shard (Any):
+            解压单个分片的函数, 参数为分片和停止事件
+    """
+    stop_event = threading.Event()
+
+    def _run(
+        shard: list[Any],
+    ) -> None:
+        try:
+            extract_shard(shard, stop_event)
+        except BaseException:
+            stop_event.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="archive-extract") as executor:
+        futures = [executor.submit(_run, shard) for shard in shards]
+
+    for future in futures:
+        future.result()
+
+
+class _ProgressReader(io.RawIOBase):
+    """读取文件时同步更新进度条的只读数据流"""
 
     def __init__(
         self,
         file_obj: Any,
         progress_bar: Any,
     ) -> None:
+        super().__init__()
         self.file_obj = file_obj
         self.progress_bar = progress_bar
 
+    def readable(self) -> bool:
+        return True
+
     def read(
         self,
         size: int = -1,
+        /,
     ) -> bytes:
         chunk = self.file_obj.read(size)
         if chunk:
             self.progress_bar.update(len(chunk))
         return chunk
 
-    def __getattr__(
+    def readinto(
         self,
-        name: str,
-    ) -> Any:
-        return getattr(self.file_obj, name)
+        buffer: Any,
+        /,
+    ) -> int:
+        view = memoryview(buffer).cast("B")
+        chunk = self.read(len(view))
+        view[: len(chunk)] = chunk
+        return len(chunk)
 
 
 def _is_path_in_directory(
@@ -228,30 +357,71 @@ def _check_tar_member(
             raise ValueError(f"压缩包包含不安全的链接: {member.name}")
 
 
+def _extract_zip_member(
+    zip_ref: zipfile.ZipFile,
+    member: zipfile.ZipInfo,
+    extract_to: Path,
+    progress_bar: Any,
+) -> None:
+    """解压单个 zip 文件成员并恢复属性"""
+    target_path = extract_to / member.filename
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    with zip_ref.open(member, "r") as source, target_path.open("wb") as target:
+        _copy_stream_with_progress(source, target, progress_bar)
+    _set_zip_member_attrs(member, target_path)
+
+
 def _extract_zip(
     archive_path: Path,
     extract_to: Path,
     progress: bool = True,
+    workers: int = 1,
 ) -> None:
-    """安全解压 zip 压缩包"""
+    """安全解压 zip 压缩包
+
+    `workers`大于 1 时将文件成员按大小分配到多个线程, 每个线程使用独立的`ZipFile`句柄解压
+    """
     with zipfile.ZipFile(archive_path, "r") as zip_ref:
         members = zip_ref.infolist()
         for member in members:
             _check_archive_member_path(member.filename, extract_to)
 
         total_size = sum(member.file_size for member in members if not member.is_dir())
+        file_members = [member for member in members if not member.is_dir()]
+        shards = _shard_by_cost(file_members, lambda member: member.file_size + ARCHIVE_MEMBER_COST_OVERHEAD, workers)
         with _progress_bar(total=total_size, desc=archive_path.name, progress=progress) as pbar:
-            for member in members:
-                target_path = extract_to / member.filename
-                if member.is_dir():
-                    target_path.mkdir(parents=True, exist_ok=True)
-                    _set_zip_member_attrs(member, target_path)
-                    continue
-
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                with zip_ref.open(member, "r") as source, target_path.open("wb") as target:
-                    _copy_stream_with_progress(source, target, pbar)
-                _set_zip_member_attrs(member, target_path)
+            if len(shards) <= 1:
+                for member in members:
+                    if member.is_dir():
+                        target_path = extract_to / member.filename
+                        target_path.mkdir(parents=True, exist_ok=True)
+                        _set_zip_member_attrs(member, target_path)
+                        continue
+
+                    _extract_zip_member(zip_ref, member, extract_to, pbar)
+                return
+
+            dir_members = [member for member in members if member.is_dir()]
+            for member in dir_members:
+                (extract_to / member.filename).mkdir(parents=True, exist_ok=True)
+
+            shared_pbar = _LockedProgressBar(pbar)
+
+            def _extract_shard(
+                shard: list[zipfile.ZipInfo],
+                stop_event: threading.Event,
+            ) -> None:
+                with zipfile.ZipFile(archive_path, "r") as shard_zip_ref:
+                    for member in shard:
+                        if stop_event.is_set():
+                            return
+                        _extract_zip_member(shard_zip_ref, member, extract_to, shared_pbar)
+
+            _run_extract_shards(shards, _extract_shard)
+
+            # 目录中的文件全部写入后再恢复目录属性, 避免目录修改时间被覆盖
+            for member in dir_members:
+                _set_zip_member_attrs(member, extract_to / member.filename)
 
 
 def _set_zip_member_attrs(
@@ -360,12 +530,8 @@ def _extract_tar_lzma(
             _extract_tar_members(tar_ref, members, extract_to, archive_path.name, progress)
 
 
-def _extract_tar_zst(
-    archive_path: Path,
-    extract_to: Path,
-    progress: bool = True,
-) -> None:
-    """安全解压 zstd 压缩的 tar 包"""
+def _import_zstandard() -> Any:
+    """导入 zstandard 模块, 未安装时尝试自动安装"""
     try:
         import zstandard as zstd
     except ImportError:
@@ -376,6 +542,46 @@ def _extract_tar_zst(
             logger.error("安装 zstandard 模块失败: %s", e)
             raise RuntimeError(f"安装 zstandard 模块失败: {e}") from e
 
+    return zstd
+
+
+def _extract_tar_stream_members(
+    tar_ref: tarfile.TarFile,
+    extract_to: Path,
+) -> None:
+    """按顺序解压流式 tar 成员
+
+    流式模式无法预先读取全部成员, 因此每个成员在写入前单独进行安全检查
+    """
+    for member in tar_ref:
+        _check_tar_member(member, extract_to)
+        if not member.isfile():
+            tar_ref.extract(member, path=extract_to)
+            continue
+
+        target_path = extract_to / member.name
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        source = tar_ref.extractfile(member)
+        if source is None:
+            continue
+
+        with source, target_path.open("wb") as target:
+            while True:
+                chunk = source.read(ARCHIVE_COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                target.write(chunk)
+        _set_tar_member_attrs(tar_ref, member, target_path)
+
+
+def _extract_tar_zst(
+    archive_path: Path,
+    extract_to: Path,
+    progress: bool = True,
+) -> None:
+    """安全解压 zstd 压缩的 tar 包"""
+    zstd = _import_zstandard()
+
     with open(archive_path, "rb") as fh:
         dctx = zstd.ZstdDecompressor()
         with dctx.stream_reader(fh) as reader:
@@ -439,13 +645,92 @@ def _create_py7zr_extract_callback(
     return _ExtractProgressCallback()
 
 
-def _add_sources_to_zip(
-    zip_ref: zipfile.ZipFile,
-    sources: list[Path],
+def _group_7z_members_by_folder(
+    archive: Any,
+) -> list[list[Any]] | None:
+    """按 solid 块 (folder) 对 7z 成员分组
+
+    同一个 folder 中的数据只能从头顺序解压, 因此 folder 是并行解压的最小单位;
+    无数据流的成员 (目录和空文件) 归入第一组; 无法获取 folder 信息时返回`None`
+    """
+    groups: dict[int, list[Any]] = {}
+    empty_entries: list[Any] = []
+    for entry in getattr(archive, "files", None) or []:
+        if getattr(entry, "emptystream", False) or getattr(entry, "is_directory", False):
+            empty_entries.append(entry)
+            continue
+        folder = getattr(entry, "folder", None)
+        if folder is None:
+            return None
+        groups.setdefault(id(folder), []).append(entry)
+
+    result = list(groups.values())
+    if not result:
+        return None
+    result[0].extend(empty_entries)
+    return result
+
+
+def _extract_7z(
+    py7zr_module: Any,
+    archive_path: Path,
+    extract_to: Path,
     progress: bool = True,
-    desc: str = "archive",
+    workers: int = 1,
 ) -> None:
-    """将文件或目录列表添加到 zip 压缩包"""
+    """解压 7z 压缩包
+
+    `workers`大于 1 且压缩包包含多个 solid 块时, 将 solid 块按解压后大小分配到多个线程,
+    每个线程只打开一次独立的`SevenZipFile`句柄 (只解析一次文件头), 逐个 solid 块解压分配给自己的成员, 每次解压后调用`reset()`
+    """
+    with py7zr_module.SevenZipFile(archive_path, mode="r") as archive:
+        total_size = _get_archive_members_size(archive)
+        groups = _group_7z_members_by_folder(archive) if workers > 1 else None
+        shards = (
+            _shard_by_cost(
+                groups,
+                lambda group: sum(_member_size(entry) + ARCHIVE_MEMBER_COST_OVERHEAD for entry in group),
+                workers,
+            )
+            if groups is not None
+            else []
+        )
+        if len(shards) <= 1:
+            with _progress_bar(total=total_size, desc=archive_path.name, progress=progress) as pbar:
+                archive.extractall(
+                    path=extract_to,
+                    callback=_create_py7zr_extract_callback(py7zr_module, pbar) if progress else None,
+                )
+            return
+
+    for shard in shards:
+        for group in shard:
+            for entry in group:
+                _check_archive_member_path(entry.filename, extract_to)
+
+    with _progress_bar(total=total_size, desc=archive_path.name, progress=progress) as pbar:
+        shared_pbar = _LockedProgressBar(pbar)
+
+        def _extract_shard(
+            shard: list[list[Any]],
+            stop_event: threading.Event,
+        ) -> None:
+            with py7zr_module.SevenZipFile(archive_path, mode="r") as shard_archive:
+                for group in shard:
+                    if stop_event.is_set():
+                        return
+                    shard_archive.extract(path=extract_to, targets=[entry.filename for entry in group])
+                    # extract() 之后需要 reset() 才能在同一个句柄上再次解压
+                    shard_archive.reset()
+                    shared_pbar.update(sum(_member_size(entry) for entry in group))
+
+        _run_extract_shards(shards, _extract_shard)
+
+
+def _collect_zip_entries(
+    sources: list[Path],
+) -> list[tuple[Path, str]]:
+    """收集 zip 压缩包条目"""
     entries: list[tuple[Path, str]] = []
     for src in sources:
         if not src.is_dir():
@@ -458,6 +743,17 @@ def _add_sources_to_zip(
                 fp = root_p / f
                 entries.append((fp, str(fp.relative_to(src.parent))))
 
+    return entries
+
+
+def _add_sources_to_zip(
+    zip_ref: zipfile.ZipFile,
+    sources: list[Path],
+    progress: bool = True,
+    desc: str = "archive",
+) -> None:
+    """将文件或目录列表添加到 zip 压缩包"""
+    entries = _collect_zip_entries(sources)
     total_size = sum(fp.stat().st_size for fp, _ in entries)
     with _progress_bar(total=total_size, desc=desc, progress=progress) as pbar:
         for fp, arcname in entries:
@@ -536,15 +832,7 @@ def _create_tar_zst(
     progress: bool = True,
 ) -> None:
     """创建 zstd 压缩的 tar 包"""
-    try:
-        import zstandard as zstd
-    except ImportError:
-        try:
-            install_optional_dependency("zstandard")
-            import zstandard as zstd
-        except (RuntimeError, ImportError) as e:
-            logger.error("安装 zstandard 模块失败: %s", e)
-            raise RuntimeError(f"安装 zstandard 模块失败: {e}") from e
+    zstd = _import_zstandard()
 
     with open(archive_path, "wb") as fh:
         cctx = zstd.ZstdCompressor()
@@ -553,6 +841,333 @@ def _create_tar_zst(
                 _add_sources_to_tar(tar_ref, sources, progress=progress, desc=archive_path.name)
 
 
+class _ParallelBlockWriter:
+    """将写入的数据切分成固定大小的块, 在线程池中独立压缩后按顺序写入目标文件
+
+    每个块被压缩为一个完整的 gzip / bz2 / xz 流, 多个流拼接后仍可被标准解压工具和`tarfile`直接读取
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryIO,
+        compress_block: Callable[[bytes], bytes],
+        block_size: int,
+        threads: int,
+    ) -> None:
+        self.fileobj = fileobj
+        self.compress_block = compress_block
+        self.block_size = block_size
+        self.threads = threads
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="archive-compress")
+        self._position = 0
+        self._closed = False
+
+    def write(
+        self,
+        data: bytes,
+    ) -> int:
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[: self.block_size])
+            del self._buffer[: self.block_size]
+            self._submit(block)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def _submit(
+        self,
+        block: bytes,
+    ) -> None:
+        self._pending.append(self._executor.submit(self.compress_block, block))
+        # 限制等待写入的块数量, 避免压缩速度跟不上读取速度时占用过多内存
+        while len(self._pending) > self.threads:
+            self.fileobj.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self.fileobj.write(self._pending.popleft().result())
+        finally:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "_ParallelBlockWriter":
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+
+def _open_parallel_gzip_compressor(
+    fileobj: BinaryIO,
+    level: int | None,
+    threads: int,
+) -> _ParallelBlockWriter | None:
+    """创建并行分块 gzip 压缩流"""
+    if threads <= 1:
+        return None
+    compresslevel = 9 if level is None else level
+    return _ParallelBlockWriter(
+        fileobj,
+        lambda block: gzip.compress(block, compresslevel=compresslevel, mtime=0),
+        ARCHIVE_COMPRESS_BLOCK_SIZE,
+        threads,
+    )
+
+
+def _open_parallel_bz2_compressor(
+    fileobj: BinaryIO,
+    level: int | None,
+    threads: int,
+) -> _ParallelBlockWriter | None:
+    """创建并行分块 bz2 压缩流"""
+    if threads <= 1:
+        return None
+    compresslevel = 9 if level is None else level
+    return _ParallelBlockWriter(
+        fileobj,
+        lambda block: bz2.compress(block, compresslevel=compresslevel),
+        ARCHIVE_COMPRESS_BLOCK_SIZE,
+        threads,
+    )
+
+
+def _open_parallel_xz_compressor(
+    fileobj: BinaryIO,
+    level: int | None,
+    threads: int,
+) -> _ParallelBlockWriter | None:
+    """创建并行分块 xz 压缩流"""
+    if threads <= 1:
+        return None
+    preset = lzma.PRESET_DEFAULT if level is None else level
+    return _ParallelBlockWriter(
+        fileobj,
+        lambda block: lzma.compress(block, format=lzma.FORMAT_XZ, preset=preset),
+        XZ_COMPRESS_BLOCK_SIZE,
+        threads,
+    )
+
+
+def _open_zstd_compressor(
+    fileobj: BinaryIO,
+    level: int | None,
+    threads: int,
+) -> Any:
+    """创建 zstd 压缩流, 多线程时使用 zstd 内置的多线程压缩"""
+    zstd = _import_zstandard()
+    cctx = zstd.ZstdCompressor(level=3 if level is None else level, threads=threads if threads > 1 else 0)
+    return cctx.stream_writer(fileobj)
+
+
+_TAR_COMPRESSORS: dict[str, TarCompressorFactory] = {
+    ".tar.gz": _open_parallel_gzip_compressor,
+    ".tgz": _open_parallel_gzip_compressor,
+    ".tar.bz2": _open_parallel_bz2_compressor,
+    ".tbz2": _open_parallel_bz2_compressor,
+    ".tar.xz": _open_parallel_xz_compressor,
+    ".txz": _open_parallel_xz_compressor,
+    ".tar.zst": _open_zstd_compressor,
+}
+"""tar 压缩器, 未注册或压缩器返回`None`时使用默认的单线程实现"""
+
+
+def register_tar_compressor(
+    archive_format: str,
+    factory: TarCompressorFactory,
+) -> None:
+    """注册 tar 系列压缩包的压缩器
+
+    Args:
+        archive_format (str):
+            压缩包扩展名, 如`.tar.zst`
+        factory (TarCompressorFactory):
+            压缩器工厂, 参数为目标文件, 压缩等级和线程数, 返回可写入的压缩流, 返回`None`时使用默认实现
+    Raises:
+        ValueError: 扩展名不是支持创建的 tar 系列格式时
+    """
+    archive_format = archive_format.lower()
+    if archive_format == ".tar" or archive_format not in SUPPORTED_CREATE_ARCHIVE_FORMAT or archive_format in [".zip", ".7z"]:
+        raise ValueError(f"不支持注册压缩器的格式: {archive_format}")
+    _TAR_COMPRESSORS[archive_format] = factory
+
+
+def _create_tar_with_compressor(
+    sources: list[Path],
+    archive_path: Path,
+    factory: TarCompressorFactory,
+    level: int | None,
+    threads: int,
+    progress: bool = True,
+) -> bool:
+    """使用注册的压缩器创建 tar 压缩包, 压缩器不可用时返回`False`"""
+    with open(archive_path, "wb") as fh:
+        compressor = factory(fh, level, threads)
+        if compressor is None:
+            return False
+        with compressor:
+            with tarfile.open(fileobj=compressor, mode="w") as tar_ref:
+                _add_sources_to_tar(tar_ref, sources, progress=progress, desc=archive_path.name)
+    return True
+
+
+def _deflate_file(
+    path: Path,
+    level: int,
+) -> tuple[bytes, int, int]:
+    """在工作线程中读取并压缩文件, 返回压缩数据, CRC32 和原始大小"""
+    data = path.read_bytes()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+
+_PRECOMPRESSED_ZIP_PYTHON_VERSIONS = ((3, 10), (3, 14))
+"""已核对过`ZipFile`内部实现的 Python 版本范围 (包含两端), 其他版本不在工作线程中预压缩 zip 成员"""
+
+
+def _can_write_precompressed_zip_member(
+    zip_ref: zipfile.ZipFile,
+) -> bool:
+    """检查是否可以使用`_write_precompressed_zip_member()`写入 zip 成员
+
+    Args:
+        zip_ref (zipfile.ZipFile):
+            以写入模式打开的 zip 压缩包
+    Returns:
+        bool:
+            当前 Python 版本在`_PRECOMPRESSED_ZIP_PYTHON_VERSIONS`范围内且压缩包可随机访问时返回`True`
+    """
+    min_version, max_version = _PRECOMPRESSED_ZIP_PYTHON_VERSIONS
+    if not min_version <= sys.version_info[:2] <= max_version:
+        return False
+    return zip_ref.fp is not None and zip_ref.fp.seekable()
+
+
+def _write_precompressed_zip_member(
+    zip_ref: zipfile.ZipFile,
+    zip_info: zipfile.ZipInfo,
+    data: bytes,
+    crc: int,
+    file_size: int,
+) -> None:
+    """将已压缩好的 deflate 数据作为成员写入 zip 压缩包
+
+    `ZipFile`的公开接口只能写入未压缩的数据, 这里按照`ZipFile.open(mode="w")`写入可随机访问文件时的流程写入本地文件头和数据,
+    文件头中直接写入最终的 CRC 和大小. 这是唯一使用`ZipFile`内部实现的地方, 调用前需要`_can_write_precompressed_zip_member()`返回`True`
+
+    Raises:
+        ValueError: 压缩包已关闭时
+    """
+    fp = zip_ref.fp
+    if fp is None:
+        raise ValueError("无法写入已关闭的 zip 压缩包")
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    zip_info.flag_bits = 0
+    zip_info.CRC = crc
+    zip_info.compress_size = len(data)
+    zip_info.file_size = file_size
+    # _lock, _writecheck 和 _didModify 没有类型声明, 在 _PRECOMPRESSED_ZIP_PYTHON_VERSIONS 范围内的 CPython 中行为一致
+    with zip_ref._lock:  # ty: ignore[unresolved-attribute]  # pylint: disable=protected-access
+        fp.seek(zip_ref.start_dir)
+        zip_info.header_offset = fp.tell()
+        zip_ref._writecheck(zip_info)  # ty: ignore[unresolved-attribute]  # pylint: disable=protected-access
+        zip_ref._didModify = True  # ty: ignore[unresolved-attribute]  # pylint: disable=protected-access
+        fp.write(zip_info.FileHeader(False))
+        fp.write(data)
+        zip_ref.filelist.append(zip_info)
+        zip_ref.NameToInfo[zip_info.filename] = zip_info
+        zip_ref.start_dir = fp.tell()
+
+
+def _add_sources_to_zip_parallel(
+    zip_ref: zipfile.ZipFile,
+    sources: list[Path],
+    level: int | None,
+    threads: int,
+    progress: bool = True,
+    desc: str = "archive",
+) -> None:
+    """并行压缩文件并按原顺序写入 zip 压缩包
+
+    不超过`ZIP_PARALLEL_MEMBER_MAX_SIZE`的成员在工作线程中整体压缩, 更大的成员在主线程中流式压缩;
+    `_can_write_precompressed_zip_member()`不满足时所有成员都通过`ZipFile.open()`流式压缩
+    """
+    entries = _collect_zip_entries(sources)
+    precompress = _can_write_precompressed_zip_member(zip_ref)
+    compresslevel = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+    total_size = sum(fp.stat().st_size for fp, _ in entries)
+    pending: deque[tuple[Path, str, Future[tuple[bytes, int, int]] | None]] = deque()
+
+    with _progress_bar(total=total_size, desc=desc, progress=progress) as pbar:
+
+        def _write_next() -> None:
+            fp, arcname, future = pending.popleft()
+            zip_info = zipfile.ZipInfo.from_file(fp, arcname=arcname)
+            if future is None:
+                zip_info.compress_type = zip_ref.compression
+                with fp.open("rb") as source, zip_ref.open(zip_info, "w") as target:
+                    _copy_stream_with_progress(source, target, pbar)
+                return
+
+            data, crc, file_size = future.result()
+            _write_precompressed_zip_member(zip_ref, zip_info, data, crc, file_size)
+            pbar.update(file_size)
+
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="archive-compress") as executor:
+            try:
+                for fp, arcname in entries:
+                    future = executor.submit(_deflate_file, fp, compresslevel) if precompress and fp.stat().st_size <= ZIP_PARALLEL_MEMBER_MAX_SIZE else None
+                    pending.append((fp, arcname, future))
+                    # 限制已提交但未写入的成员数量, 控制内存占用
+                    while len(pending) > threads * 2:
+                        _write_next()
+                while pending:
+                    _write_next()
+            finally:
+                for _, _, future in pending:
+                    if future is not None:
+                        future.cancel()
+
+
+def _get_compress_threads(
+    threads: int | None,
+) -> int:
+    """获取压缩线程数"""
+    if threads is None:
+        return os.cpu_count() or 1
+    return max(1, threads)
+
+
+def _get_sources_size(
+    sources: list[Path],
+) -> int:
+    """统计待压缩文件的总大小"""
+    total_size = 0
+    for src in sources:
+        if not src.is_dir():
+            total_size += src.stat().st_size
+            continue
+        for root, _, files in os.walk(src):
+            for filename in files:
+                try:
+                    total_size += os.lstat(os.path.join(root, filename)).st_size
+                except OSError:
+                    pass
+    return total_size
+
+
 def is_supported_archive_format(
     archive_path: Path,
 ) -> bool:
@@ -566,10 +1181,76 @@ def is_supported_archive_format(
     return _get_archive_format(archive_path, SUPPORTED_ARCHIVE_FORMAT) is not None
 
 
+def is_stream_extract_supported(
+    archive_path: Path,
+) -> bool:
+    """查看压缩包格式是否支持边读取边解压
+
+    Args:
+        archive_path (Path): 压缩包路径
+    Returns:
+        bool: 支持结果
+    """
+    return _get_archive_format(archive_path, SUPPORTED_STREAM_EXTRACT_ARCHIVE_FORMAT) is not None
+
+
+def extract_archive_stream(
+    file_obj: Any,
+    archive_name: str,
+    extract_to: Path,
+    total_size: int | None = None,
+    progress: bool = True,
+) -> None:
+    """从只能顺序读取的数据流中解压 tar 系列压缩包
+
+    Args:
+        file_obj (Any):
+            提供`read()`方法的数据流, 例如 HTTP 响应体
+        archive_name (str):
+            压缩包文件名, 用于判断压缩格式和显示进度条
+        extract_to (Path):
+            解压到的路径
+        total_size (int | None):
+            数据流的总字节数, 用于显示进度条
+        progress (bool):
+            是否显示解压进度条
+    Raises:
+        ValueError: 不支持流式解压或压缩包包含不安全的成员时
+        RuntimeError: 安装解压所需的可选依赖失败时
+    """
+    archive_format = _get_archive_format(Path(archive_name), SUPPORTED_STREAM_EXTRACT_ARCHIVE_FORMAT)
+    if archive_format is None:
+        raise ValueError(f"不支持流式解压的压缩格式: {archive_name}")
+
+    extract_to.mkdir(parents=True, exist_ok=True)
+
+    logger.info("将 '%s' 流式解压到 '%s' 中", archive_name, extract_to)
+
+    with _progress_bar(total=total_size, desc=archive_name, progress=progress) as pbar:
+        reader = io.BufferedReader(_ProgressReader(file_obj, pbar))
+        if archive_format in TAR_STREAM_EXTRACT_MODES:
+            with tarfile.open(fileobj=reader, mode=TAR_STREAM_EXTRACT_MODES[archive_format]) as tar_ref:
+                _extract_tar_stream_members(tar_ref, extract_to)
+            return
+
+        if archive_format in [".tar.lzma", ".tlz"]:
+            with lzma.open(reader, "rb") as f:
+                with tarfile.open(fileobj=f, mode="r|") as tar_ref:
+                    _extract_tar_stream_members(tar_ref, extract_to)
+            return
+
+        zstd = _import_zstandard()
+        dctx = zstd.ZstdDecompressor()
+        with dctx.stream_reader(reader) as zstd_reader:
+            with tarfile.open(fileobj=zstd_reader, mode="r|") as tar_ref:
+                _extract_tar_stream_members(tar_ref, extract_to)
+
+
 def extract_archive(
     archive_path: Path,
     extract_to: Path,
     progress: bool = True,
+    workers: int | None = None,
 ) -> None:
     """解压支持的压缩包
 
@@ -577,6 +1258,7 @@ def extract_archive(
         archive_path (Path): 压缩包路径
         extract_to (Path): 解压到的路径
         progress (bool): 是否显示解压进度条
+        workers (int | None): zip / 7z 并行解压的线程数, 为`None`时根据 CPU 核心数自动选择, 为 1 时单线程解压
     Raises:
         ValueError: 不支持解压时
         RuntimeError: 安装解压所需的可选依赖失败时
@@ -589,8 +1271,10 @@ def extract_archive(
 
     logger.info("将 '%s' 解压到 '%s' 中", archive_path, extract_to)
 
+    extract_workers = _get_extract_workers(workers)
+
     if archive_format == ".zip":
-        _extract_zip(archive_path, extract_to, progress=progress)
+        _extract_zip(archive_path, extract_to, progress=progress, workers=extract_workers)
         return
 
     if archive_format in TAR_EXTRACT_MODES:
@@ -616,12 +1300,7 @@ def extract_archive(
                 logger.error("安装 py7zr 模块失败: %s", e)
                 raise RuntimeError(f"安装 py7zr 模块失败: {e}") from e
 
-        with py7zr.SevenZipFile(archive_path, mode="r") as archive:
-            with _progress_bar(total=_get_archive_members_size(archive), desc=archive_path.name, progress=progress) as pbar:
-                archive.extractall(
-                    path=extract_to,
-                    callback=_create_py7zr_extract_callback(py7zr, pbar) if progress else None,
-                )
+        _extract_7z(py7zr, archive_path, extract_to, progress=progress, workers=extract_workers)
         return
 
     if archive_format == ".rar":
@@ -660,6 +1339,8 @@ def create_archive(
     sources: Path | Iterable[Path],
     archive_path: Path,
     progress: bool = True,
+    level: int | None = None,
+    threads: int | None = None,
 ) -> None:
     """根据扩展名创建压缩包
 
@@ -667,6 +1348,8 @@ def create_archive(
         sources (Path | Iterable[Path]): 要打包的单个文件、目录或路径列表
         archive_path (Path): 压缩文件保存路径
         progress (bool): 是否显示压缩进度条
+        level (int | None): 压缩等级, 为`None`时使用各格式的默认等级, 对 .zip / .tar.gz / .tar.bz2 / .tar.xz / .tar.zst 生效
+        threads (int | None): 压缩线程数, 为`None`时使用 CPU 核心数, 为 1 时单线程压缩
     Raises:
         ValueError: 不支持的压缩或不能写入的格式
         RuntimeError: 安装压缩所需的可选依赖失败时
@@ -679,13 +1362,49 @@ def create_archive(
 
     sources = [sources] if isinstance(sources, Path) else list(sources)
     archive_path.parent.mkdir(parents=True, exist_ok=True)
+    compress_threads = _get_compress_threads(threads)
 
     logger.info("将 '%s' 压缩并保存到 '%s' 中", sources, archive_path)
-    logger.debug("创建压缩包: sources=%s, count=%s, archive='%s', format='%s'", sources, len(sources), archive_path, archive_format)
+    logger.debug(
+        "创建压缩包: sources=%s, count=%s, archive='%s', format='%s', level=%s, threads=%s",
+        sources,
+        len(sources),
+        archive_path,
+        archive_format,
+        level,
+        compress_threads,
+    )
+
+    start_time = time.perf_counter()
+    _create_archive_with_format(sources, archive_path, archive_format, progress, level, compress_threads)
+    elapsed = max(time.perf_counter() - start_time, 1e-6)
+
+    source_size = _get_sources_size(sources)
+    archive_size = archive_path.stat().st_size if archive_path.exists() else 0
+    logger.info(
+        "压缩完成, 用时 %.2f 秒, 原始大小 %.2f MB, 压缩后大小 %.2f MB, 压缩吞吐量 %.2f MB/s",
+        elapsed,
+        source_size / 1024 / 1024,
+        archive_size / 1024 / 1024,
+        source_size / 1024 / 1024 / elapsed,
+    )
 
+
+def _create_archive_with_format(
+    sources: list[Path],
+    archive_path: Path,
+    archive_format: str,
+    progress: bool,
+    level: int | None,
+    threads: int,
+) -> None:
+    """根据压缩格式创建压缩包, 优先使用注册的多线程压缩器"""
     if archive_format == ".zip":
-        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            _add_sources_to_zip(zf, sources, progress=progress, desc=archive_path.name)
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+            if threads > 1:
+                _add_sources_to_zip_parallel(zf, sources, level, threads, progress=progress, desc=archive_path.name)
+            else:
+                _add_sources_to_zip(zf, sources, progress=progress, desc=archive_path.name)
         return
 
     if archive_format == ".7z":
@@ -709,6 +1428,10 @@ def create_archive(
                     pbar.update(1)
         return
 
+    factory = _TAR_COMPRESSORS.get(archive_format)
+    if factory is not None and _create_tar_with_compressor(sources, archive_path, factory, level, threads, progress=progress):
+        return
+
     if archive_format in TAR_CREATE_MODES:
         _create_tar(sources, archive_path, TAR_CREATE_MODES[archive_format], progress=progress)
         return
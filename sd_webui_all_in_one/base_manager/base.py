@@ -40,12 +40,15 @@ from sd_webui_all_in_one.file_manager import (
     is_folder_empty,
     copy_files,
     remove_files,
+    get_file_list,
+    scan_files,
 )
 from sd_webui_all_in_one.config import (
     LOGGER_LEVEL,
     LOGGER_COLOR,
     LOGGER_NAME,
     SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH,
+    SD_WEBUI_ALL_IN_ONE_DEDUPLICATE_DOWNLOADED_MODELS,
 )
 from sd_webui_all_in_one.logger import get_logger
 from sd_webui_all_in_one.pkg_manager import install_pytorch
@@ -56,6 +59,10 @@ from sd_webui_all_in_one.model_downloader import (
     search_models_from_library,
     SupportedWebUiType,
     ModelDownloadUrlType,
+    ModelInventory,
+    ModelInventoryEntry,
+    fingerprint_model,
+    suggest_model_save_dir,
 )
 from sd_webui_all_in_one.cmd import run_cmd
 from sd_webui_all_in_one.utils import (
@@ -652,6 +659,206 @@ def install_webui_model_from_library(
         )
 
 
+def _format_model_size(
+    size: int,
+) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}" if unit != "B" else f"{size} B"
+        value /= 1024
+    return f"{value:.1f} TB"
+
+
+def _format_inventory_entry(
+    entry: ModelInventoryEntry,
+) -> str:
+    line = f"- `{entry['relpath']}` ({_format_model_size(entry['size'])})"
+    if entry["model_name"] is not None:
+        line += f" [模型库: {entry['model_name']} ({entry['model_dtype']})]"
+    return line
+
+
+def check_downloaded_model(
+    webui_path: Path,
+    dtype: SupportedWebUiType,
+    models_path: Path,
+    model_file: Path,
+    deduplicate: bool | None = None,
+) -> Path:
+    """识别下载得到的模型, 检查保存路径并对本地已有的相同模型去重
+
+    模型保存路径与识别到的模型组件类型不一致时给出提示; 启用去重且模型清单中已有指纹和 sha256 都相同的模型时, 将下载得到的文件替换为指向已有模型的硬链接以节省空间
+
+    Args:
+        webui_path (Path):
+            WebUI 根目录
+        dtype (SupportedWebUiType):
+            WebUI 的类型
+        models_path (Path):
+            WebUI 的模型根目录
+        model_file (Path):
+            下载得到的模型文件
+        deduplicate (bool | None):
+            是否对本地已有的相同模型去重 (需要计算两个模型文件的 sha256), 为 None 时使用 `SD_WEBUI_ALL_IN_ONE_DEDUPLICATE_DOWNLOADED_MODELS` 的配置
+
+    Returns:
+        Path: 模型文件路径
+    """
+    try:
+        fingerprint = fingerprint_model(model_file)
+    except OSError as e:
+        logger.debug("识别模型文件 '%s' 失败: %s", model_file, e)
+        return model_file
+
+    save_dir = suggest_model_save_dir(dtype, fingerprint)
+    if save_dir is not None and model_file.parent.absolute() != (webui_path / save_dir).absolute():
+        logger.warning(
+            "模型 '%s' 识别为 %s (%s), 该类模型通常保存在 '%s' 中",
+            model_file.name,
+            fingerprint.component,
+            fingerprint.architecture,
+            save_dir,
+        )
+
+    if deduplicate is None:
+        deduplicate = SD_WEBUI_ALL_IN_ONE_DEDUPLICATE_DOWNLOADED_MODELS
+    if not deduplicate or fingerprint.fingerprint is None:
+        return model_file
+
+    with ModelInventory(models_path) as inventory:
+        try:
+            inventory.refresh_dir(model_file.parent)
+        except ValueError:
+            return model_file
+        current = inventory.get(model_file)
+        for entry in inventory.find_by_fingerprint(fingerprint.fingerprint):
+            if current is None or entry["path"] == current["path"] or entry["size"] != fingerprint.size:
+                continue
+            try:
+                same_file = os.path.samefile(entry["path"], model_file)
+                if same_file:
+                    return model_file
+                logger.info("模型 '%s' 与已有模型 '%s' 的指纹相同, 计算 sha256 确认中", model_file, entry["path"])
+                if inventory.sha256(entry) != inventory.sha256(current):
+                    continue
+            except OSError:
+                continue
+            logger.info("模型 '%s' 与已有模型 '%s' 相同", model_file, entry["path"])
+            tmp_file = model_file.with_name(f"{model_file.name}.link.tmp")
+            try:
+                os.link(entry["path"], tmp_file)
+                tmp_file.replace(model_file)
+                logger.info("已将 '%s' 替换为指向 '%s' 的硬链接", model_file, entry["path"])
+            except OSError as e:
+                tmp_file.unlink(missing_ok=True)
+                logger.debug("创建硬链接失败, 保留下载的模型文件: %s", e)
+            break
+    return model_file
+
+
+def list_webui_models(
+    models_path: Path,
+    webui_name: str,
+) -> None:
+    """使用模型清单索引列出 WebUI 模型目录中的模型
+
+    Args:
+        models_path (Path):
+            WebUI 的模型根目录
+        webui_name (str):
+            WebUI 名称, 用于显示
+    """
+    logger.info("%s 模型列表", webui_name)
+    with ModelInventory(models_path) as inventory:
+        inventory.refresh()
+        entries = inventory.list_models()
+
+    groups: dict[str, list[ModelInventoryEntry]] = {}
+    for entry in entries:
+        groups.setdefault(entry["model_type"], []).append(entry)
+    for model_type, group in groups.items():
+        logger.info("%s 的模型列表", model_type or models_path.name)
+        for entry in group:
+            print(_format_inventory_entry(entry))
+        print("\n\n")
+    logger.info("共 %d 个模型, 总大小: %s", len(entries), _format_model_size(sum(x["size"] for x in entries)))
+
+
+def _find_files_by_name(
+    models_path: Path,
+    model_name: str,
+    model_type: str | None = None,
+) -> list[Path]:
+    """查找文件名包含模型名称的文件
+
+    优先查询模型清单索引, 并在匹配到的模型所在目录中查找同名的配置文件等索引之外的文件;
+    索引不存在、已过期或没有匹配的模型时遍历模型目录中的所有文件
+    """
+    keyword = model_name.lower()
+    with ModelInventory(models_path) as inventory:
+        if inventory.is_up_to_date(model_type):
+            matched = [entry["path"] for entry in inventory.find_by_name(model_name, model_type)]
+            if matched:
+                found = set(matched)
+                for directory in dict.fromkeys(path.parent for path in matched):
+                    found.update(Path(entry.path) for entry in scan_files(directory, max_depth=0) if keyword in entry.name.lower())
+                return sorted(found)
+
+    model_path = models_path if model_type is None else models_path / model_type
+    return [x for x in get_file_list(model_path) if keyword in x.name.lower()]
+
+
+def uninstall_webui_model(
+    models_path: Path,
+    model_name: str,
+    model_type: str | None = None,
+    interactive_mode: bool = False,
+) -> None:
+    """查找并卸载 WebUI 中的模型, 卸载后从模型清单索引中移除对应记录
+
+    只按文件名匹配, 并且匹配所有文件 (包括配置文件等不在模型清单中的文件), 避免通过模型库名称误删文件名不包含关键字的模型.
+    模型清单索引与模型目录一致时直接查询索引, 否则遍历模型目录
+
+    Args:
+        models_path (Path):
+            WebUI 的模型根目录
+        model_name (str):
+            模型名称, 匹配模型文件名
+        model_type (str | None):
+            模型的类型, 即模型根目录下的目录名
+        interactive_mode (bool):
+            是否启用交互模式
+
+    Raises:
+        FileNotFoundError:
+            未找到要删除的模型时
+    """
+    delete_list = _find_files_by_name(models_path, model_name, model_type)
+
+    if not delete_list:
+        raise FileNotFoundError(f"模型 '{model_name}' 不存在")
+
+    logger.info("根据 '%s' 模型名找到的已有模型列表:\n", model_name)
+    for d in delete_list:
+        print(f"- `{d}`")
+
+    print()
+    if interactive_mode:
+        logger.info("是否删除以上模型?")
+        if input("[y/N]").strip().lower() not in ["yes", "y"]:
+            logger.info("取消模型删除操作")
+            return
+
+    for i in delete_list:
+        logger.info("删除模型: %s", i)
+        remove_files(i)
+    with ModelInventory(models_path) as inventory:
+        inventory.forget(delete_list)
+
+    logger.info("模型删除完成")
+
+
 def apply_git_base_config_and_github_mirror(
     git_config_path: Path | None = None,
     use_github_mirror: bool = False,
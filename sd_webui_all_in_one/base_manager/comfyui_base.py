@@ -24,6 +24,9 @@ from sd_webui_all_in_one.base_manager.base import (
     launch_webui,
     pre_download_model_for_webui,
     prepare_pytorch_install_info,
+    list_webui_models,
+    uninstall_webui_model,
+    check_downloaded_model,
 )
 from sd_webui_all_in_one.base_manager.hotpatcher_manager import apply_hotpatcher_launch_env
 from sd_webui_all_in_one.base_manager.repository_inspector import inspect_repository
@@ -47,8 +50,6 @@ from sd_webui_all_in_one.downloader import (
 )
 from sd_webui_all_in_one.file_manager import (
     copy_files,
-    generate_dir_tree,
-    get_file_list,
     move_files,
     remove_files,
 )
@@ -1353,11 +1354,13 @@ def install_comfyui_model_from_url(
             下载模型使用的工具
     """
     model_path = comfyui_path / "models" / model_type
-    download_file(
+    model_file = download_file(
         url=model_url,
         path=model_path,
         tool=downloader,
     )
+    if model_file is not None:
+        check_downloaded_model(comfyui_path, "comfyui", comfyui_path / "models", model_file)
 
 
 def list_comfyui_models(
@@ -1369,12 +1372,7 @@ def list_comfyui_models(
         comfyui_path (Path):
             ComfyUI 根目录
     """
-    models_path = comfyui_path / "models"
-    logger.info("ComfyUI 模型列表")
-    for m in models_path.iterdir():
-        logger.info("%s 的模型列表", m.name)
-        generate_dir_tree(m)
-        print("\n\n")
+    list_webui_models(comfyui_path / "models", "ComfyUI")
 
 
 def uninstall_comfyui_model(
@@ -1399,33 +1397,12 @@ def uninstall_comfyui_model(
         FileNotFoundError:
             未找到要删除的模型时
     """
-    if model_type is None:
-        model_path = comfyui_path / "models"
-    else:
-        model_path = comfyui_path / "models" / model_type
-
-    model_list = get_file_list(model_path)
-    delete_list = [x for x in model_list if model_name.lower() in x.name.lower()]
-
-    if not delete_list:
-        raise FileNotFoundError(f"模型 '{model_name}' 不存在")
-
-    logger.info("根据 '%s' 模型名找到的已有模型列表:\n", model_name)
-    for d in delete_list:
-        print(f"- `{d}`")
-
-    print()
-    if interactive_mode:
-        logger.info("是否删除以上模型?")
-        if input("[y/N]").strip().lower() not in ["yes", "y"]:
-            logger.info("取消模型删除操作")
-            return
-
-    for i in delete_list:
-        logger.info("删除模型: %s", i)
-        remove_files(i)
-
-    logger.info("模型删除完成")
+    uninstall_webui_model(
+        models_path=comfyui_path / "models",
+        model_name=model_name,
+        model_type=model_type,
+        interactive_mode=interactive_mode,
+    )
 
 
 def launch_comfyui_version_gui(
@@ -23,6 +23,9 @@ from sd_webui_all_in_one.base_manager.base import (
     pre_download_model_for_webui,
     prepare_pytorch_install_info,
     print_divider,
+    list_webui_models,
+    uninstall_webui_model,
+    check_downloaded_model,
 )
 from sd_webui_all_in_one.base_manager.snapshot import WebUiSnapshot, build_webui_snapshot
 from sd_webui_all_in_one.custom_exceptions import AggregateError
@@ -37,11 +40,6 @@ from sd_webui_all_in_one.env_check import (
     fix_torch_libomp,
     check_onnxruntime_gpu,
 )
-from sd_webui_all_in_one.file_manager import (
-    generate_dir_tree,
-    get_file_list,
-    remove_files,
-)
 from sd_webui_all_in_one.mirror_manager import (
     GITHUB_MIRROR_LIST,
     get_pypi_mirror_config,
@@ -648,11 +646,13 @@ def install_sd_scripts_model_from_url(
             下载模型使用的工具
     """
     model_path = sd_scripts_path / "sd-models" / model_type
-    download_file(
+    model_file = download_file(
         url=model_url,
         path=model_path,
         tool=downloader,
     )
+    if model_file is not None:
+        check_downloaded_model(sd_scripts_path, "sd_scripts", sd_scripts_path / "sd-models", model_file)
 
 
 def list_sd_scripts_models(
@@ -664,12 +664,7 @@ def list_sd_scripts_models(
         sd_scripts_path (Path):
             SD Scripts 根目录
     """
-    models_path = sd_scripts_path / "sd-models"
-    logger.info("SD Scripts 模型列表")
-    for m in models_path.iterdir():
-        logger.info("%s 的模型列表", m.name)
-        generate_dir_tree(m)
-        print("\n\n")
+    list_webui_models(sd_scripts_path / "sd-models", "SD Scripts")
 
 
 def uninstall_sd_scripts_model(
@@ -694,33 +689,12 @@ def uninstall_sd_scripts_model(
         FileNotFoundError:
             未找到要删除的模型时
     """
-    if model_type is None:
-        model_path = sd_scripts_path / "sd-models"
-    else:
-        model_path = sd_scripts_path / "sd-models" / model_type
-
-    model_list = get_file_list(model_path)
-    delete_list = [x for x in model_list if model_name.lower() in x.name.lower()]
-
-    if not delete_list:
-        raise FileNotFoundError(f"模型 '{model_name}' 不存在")
-
-    logger.info("根据 '%s' 模型名找到的已有模型列表:\n", model_name)
-    for d in delete_list:
-        print(f"- `{d}`")
-
-    print()
-    if interactive_mode:
-        logger.info("是否删除以上模型?")
-        if input("[y/N]").strip().lower() not in ["yes", "y"]:
-            logger.info("取消模型删除操作")
-            return
-
-    for i in delete_list:
-        logger.info("删除模型: %s", i)
-        remove_files(i)
-
-    logger.info("模型删除完成")
+    uninstall_webui_model(
+        models_path=sd_scripts_path / "sd-models",
+        model_name=model_name,
+        model_type=model_type,
+        interactive_mode=interactive_mode,
+    )
 
 
 def launch_sd_scripts_version_gui(
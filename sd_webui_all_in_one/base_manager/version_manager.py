@@ -28,7 +28,7 @@ from sd_webui_all_in_one.base_manager.repository_inspector import (
 from sd_webui_all_in_one.custom_exceptions import AggregateError
 from sd_webui_all_in_one.file_manager import remove_files
 from sd_webui_all_in_one.mirror_manager import GITHUB_MIRROR_LIST
-from sd_webui_all_in_one.package_analyzer import CommonVersionComparison
+from sd_webui_all_in_one.package_analyzer import version_sort_key
 
 
 DEFAULT_EXTENSION_INDEX_URL = "https://raw.githubusercontent.com/AUTOMATIC1111/stable-diffusion-webui-extensions/master/index.json"
@@ -850,7 +850,7 @@ def fetch_pypi_versions(
             )
         )
 
-    return sorted(versions, key=lambda item: CommonVersionComparison(item.version), reverse=True)
+    return sorted(versions, key=lambda item: version_sort_key(item.version), reverse=True)
 
 
 def filter_extension_index(
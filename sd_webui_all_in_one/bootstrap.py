@@ -0,0 +1,287 @@
+"""运行环境初始化
+
+导入`sd_webui_all_in_one`及其子模块不会修改环境变量, 也不会检测系统代理. 命令行入口和 Notebook 管理器在启动时调用`start_environment_bootstrap()`
+或`bootstrap_environment()`完成初始化, 同一进程中只会初始化一次:
+
+- 设置`NO_PROXY`
+- `SD_WEBUI_ALL_IN_ONE_PROXY`启用时在后台线程中检测系统代理并测试连通性, 与其他启动工作并行进行, 检测结果按`SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL`缓存到磁盘中, 子进程在有效期内直接使用缓存结果
+- `SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH`启用时设置缓存路径
+- `SD_WEBUI_ALL_IN_ONE_SET_CONFIG`启用时设置默认环境变量
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_NAME,
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    SD_WEBUI_ALL_IN_ONE_PROXY,
+    SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL,
+    SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_PATH,
+    SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH,
+    SD_WEBUI_ALL_IN_ONE_SET_CONFIG,
+    SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH,
+    DEFAULT_ENV_VARS,
+)
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+PROXY_CACHE_VERSION = 1
+"""系统代理检测结果缓存文件的格式版本"""
+
+
+@dataclass
+class ProxyProbeResult:
+    """系统代理检测结果"""
+
+    address: str | None
+    """系统代理地址, 未配置系统代理时为 None"""
+
+    reachable: bool
+    """代理是否可以连通"""
+
+    checked_at: float
+    """检测时间 (Unix 时间戳)"""
+
+    cached: bool = False
+    """是否为缓存的检测结果"""
+
+
+def _read_proxy_cache(
+    cache_path: Path,
+    ttl: float,
+) -> ProxyProbeResult | None:
+    from sd_webui_all_in_one.utils import is_owned_by_current_user
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            if not is_owned_by_current_user(os.fstat(f.fileno())):
+                # 其他用户放置的缓存文件可能把流量指向任意代理地址
+                logger.warning("系统代理检测结果缓存文件 '%s' 不属于当前用户, 忽略该缓存", cache_path)
+                return None
+            data = json.load(f)
+        if data.get("version") != PROXY_CACHE_VERSION:
+            return None
+        checked_at = float(data["checked_at"])
+        address = data["address"]
+        reachable = bool(data["reachable"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    if not 0 <= time.time() - checked_at <= ttl:
+        return None
+    if address is not None and not isinstance(address, str):
+        return None
+    return ProxyProbeResult(address=address, reachable=reachable, checked_at=checked_at, cached=True)
+
+
+def _write_proxy_cache(
+    cache_path: Path,
+    result: ProxyProbeResult,
+) -> None:
+    data = asdict(result)
+    data.pop("cached")
+    data["version"] = PROXY_CACHE_VERSION
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("保存系统代理检测结果缓存失败: %s", e)
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def probe_system_proxy(
+    cache_path: Path | None = None,
+    ttl: float | None = None,
+) -> ProxyProbeResult:
+    """检测系统代理地址并测试连通性, 检测结果在有效期内缓存到磁盘中
+
+    Args:
+        cache_path (Path | None):
+            缓存文件路径, 为 None 时使用`SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_PATH`
+        ttl (float | None):
+            缓存有效期 (秒), 为 None 时使用`SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL`, 小于等于 0 时不使用缓存
+
+    Returns:
+        ProxyProbeResult: 系统代理检测结果
+    """
+    from sd_webui_all_in_one.proxy import (
+        get_system_proxy_address,
+        test_proxy_connectivity,
+    )
+
+    if cache_path is None:
+        cache_path = SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_PATH
+    if ttl is None:
+        ttl = SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL
+
+    if ttl > 0:
+        cached = _read_proxy_cache(cache_path, ttl)
+        if cached is not None:
+            logger.debug("使用缓存的系统代理检测结果: %s", cached)
+            return cached
+
+    address = get_system_proxy_address()
+    reachable = False
+    if address is not None:
+        logger.debug("检测到系统代理: %s", address)
+        reachable = test_proxy_connectivity(address)
+    result = ProxyProbeResult(address=address, reachable=reachable, checked_at=time.time())
+    if ttl > 0:
+        _write_proxy_cache(cache_path, result)
+    return result
+
+
+def apply_cache_path_env() -> None:
+    """设置缓存路径相关的环境变量, 已设置的环境变量保持不变"""
+    cache_dir = SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache"
+    for key, path in (
+        ("CACHE_HOME", cache_dir),
+        ("HF_HOME", cache_dir / "huggingface"),
+        ("MATPLOTLIBRC", cache_dir),
+        ("MODELSCOPE_CACHE", cache_dir / "modelscope" / "hub"),
+        ("MS_CACHE_HOME", cache_dir / "modelscope" / "hub"),
+        ("SYCL_CACHE_DIR", cache_dir / "libsycl_cache"),
+        ("TORCH_HOME", cache_dir / "torch"),
+        ("U2NET_HOME", cache_dir / "u2net"),
+        ("XDG_CACHE_HOME", cache_dir),
+        ("PIP_CACHE_DIR", cache_dir / "pip"),
+        ("PYTHONPYCACHEPREFIX", cache_dir / "pycache"),
+        ("TORCHINDUCTOR_CACHE_DIR", cache_dir / "torchinductor"),
+        ("TRITON_CACHE_DIR", cache_dir / "triton"),
+        ("UV_CACHE_DIR", cache_dir / "uv"),
+    ):
+        os.environ[key] = os.getenv(key, path.as_posix())
+
+
+class EnvironmentBootstrap:
+    """一次运行环境初始化过程
+
+    `start()`立即设置环境变量并在后台线程中检测系统代理, `wait()`等待代理检测完成并应用代理
+    """
+
+    def __init__(
+        self,
+        proxy: bool | None = None,
+        set_cache_path: bool | None = None,
+        set_config: bool | None = None,
+    ) -> None:
+        """运行环境初始化过程初始化
+
+        Args:
+            proxy (bool | None):
+                是否检测并应用系统代理, 为 None 时使用`SD_WEBUI_ALL_IN_ONE_PROXY`
+            set_cache_path (bool | None):
+                是否设置缓存路径, 为 None 时使用`SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH`
+            set_config (bool | None):
+                是否设置默认环境变量, 为 None 时使用`SD_WEBUI_ALL_IN_ONE_SET_CONFIG`
+        """
+        self.proxy = SD_WEBUI_ALL_IN_ONE_PROXY if proxy is None else proxy
+        self.set_cache_path = SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH if set_cache_path is None else set_cache_path
+        self.set_config = SD_WEBUI_ALL_IN_ONE_SET_CONFIG if set_config is None else set_config
+        self.proxy_result: ProxyProbeResult | None = None
+        """系统代理检测结果"""
+
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._done = False
+
+    def _probe(self) -> None:
+        try:
+            self.proxy_result = probe_system_proxy()
+        except Exception as e:
+            logger.debug("检测系统代理时出现错误: %s", e)
+
+    def start(self) -> "EnvironmentBootstrap":
+        """开始初始化运行环境
+
+        Returns:
+            EnvironmentBootstrap: 当前初始化过程
+        """
+        if self.proxy and self._thread is None:
+            self._thread = threading.Thread(target=self._probe, name="sd-webui-all-in-one-proxy-probe", daemon=True)
+            self._thread.start()
+
+        os.environ["NO_PROXY"] = "localhost,127.0.0.1,::1"
+
+        if self.set_cache_path:
+            logger.debug("设置缓存路径")
+            apply_cache_path_env()
+
+        if self.set_config:
+            logger.debug("配置基础环境变量")
+            for k, v in DEFAULT_ENV_VARS:
+                os.environ[k] = v
+
+        return self
+
+    def wait(self) -> ProxyProbeResult | None:
+        """等待系统代理检测完成并应用代理, 多次调用时只应用一次
+
+        Returns:
+            (ProxyProbeResult | None): 系统代理检测结果, 未启用代理检测时返回 None
+        """
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            if not self._done:
+                self._done = True
+                result = self.proxy_result
+                if result is not None and result.address is not None:
+                    if result.reachable:
+                        from sd_webui_all_in_one.proxy import set_proxy
+
+                        logger.debug("代理连通性测试成功，配置系统代理: %s", result.address)
+                        set_proxy(result.address)
+                    else:
+                        logger.debug("代理 %s 连通性测试失败，跳过代理配置", result.address)
+
+        return self.proxy_result
+
+
+_bootstrap: EnvironmentBootstrap | None = None
+"""当前进程的运行环境初始化过程"""
+
+_bootstrap_lock = threading.Lock()
+
+
+def start_environment_bootstrap() -> EnvironmentBootstrap:
+    """开始初始化当前进程的运行环境, 同一进程中多次调用时返回同一个初始化过程
+
+    代理检测在后台进行, 需要使用网络前调用返回值的`wait()`方法
+
+    Returns:
+        EnvironmentBootstrap: 当前进程的运行环境初始化过程
+    """
+    global _bootstrap
+    with _bootstrap_lock:
+        if _bootstrap is None:
+            _bootstrap = EnvironmentBootstrap().start()
+        return _bootstrap
+
+
+def bootstrap_environment() -> ProxyProbeResult | None:
+    """初始化当前进程的运行环境并等待代理检测完成, 同一进程中只会初始化一次
+
+    Returns:
+        (ProxyProbeResult | None): 系统代理检测结果, 未启用代理检测时返回 None
+    """
+    return start_environment_bootstrap().wait()
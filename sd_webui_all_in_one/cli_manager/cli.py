@@ -1,20 +1,90 @@
-"""SD WebUI All In One 命令行入口。"""
+"""SD WebUI All In One 命令行入口。
+
+根解析器只根据`CLI_COMMANDS`中的声明注册各模块的子命令名称和帮助信息, 只有命令行中选择的模块才会导入对应的命令行模块并注册完整的子命令,
+因此`--help`, `--version`和单个模块的命令不会导入其他模块的管理器代码
+"""
 
 import argparse
+import importlib
+import sys
+from dataclasses import dataclass
+from typing import Callable
 
 from sd_webui_all_in_one.version import VERSION
-from sd_webui_all_in_one.cli_manager.sd_webui_cli import register_sd_webui
-from sd_webui_all_in_one.cli_manager.sd_trainer_cli import register_sd_trainer
-from sd_webui_all_in_one.cli_manager.sd_scripts_cli import register_sd_scripts
-from sd_webui_all_in_one.cli_manager.invokeai_cli import register_invokeai
-from sd_webui_all_in_one.cli_manager.fooocus_cli import register_fooocus
-from sd_webui_all_in_one.cli_manager.comfyui_cli import register_comfyui
-from sd_webui_all_in_one.cli_manager.qwen_tts_webui_cli import register_qwen_tts_webui
-from sd_webui_all_in_one.cli_manager.utils import register_manager
-
-
-def main() -> None:
-    """主函数"""
+from sd_webui_all_in_one.bootstrap import start_environment_bootstrap
+
+
+@dataclass(frozen=True)
+class CliCommandSpec:
+    """根层级子命令声明"""
+
+    name: str
+    """子命令名称"""
+
+    help: str
+    """子命令帮助信息, 需要和注册函数中使用的帮助信息一致"""
+
+    module: str
+    """注册子命令的模块"""
+
+    register: str
+    """模块中注册子命令的函数名称"""
+
+
+CLI_COMMANDS: tuple[CliCommandSpec, ...] = (
+    CliCommandSpec("sd-webui", "Stable Diffusion WebUI 相关命令", "sd_webui_all_in_one.cli_manager.sd_webui_cli", "register_sd_webui"),
+    CliCommandSpec("sd-trainer", "SD Trainer 相关命令", "sd_webui_all_in_one.cli_manager.sd_trainer_cli", "register_sd_trainer"),
+    CliCommandSpec("sd-scripts", "SD Scripts 相关命令", "sd_webui_all_in_one.cli_manager.sd_scripts_cli", "register_sd_scripts"),
+    CliCommandSpec("invokeai", "InvokeAI 相关命令", "sd_webui_all_in_one.cli_manager.invokeai_cli", "register_invokeai"),
+    CliCommandSpec("fooocus", "Fooocus 相关命令", "sd_webui_all_in_one.cli_manager.fooocus_cli", "register_fooocus"),
+    CliCommandSpec("comfyui", "ComfyUI 相关命令", "sd_webui_all_in_one.cli_manager.comfyui_cli", "register_comfyui"),
+    CliCommandSpec("qwen-tts-webui", "Qwen TTS WebUI 相关命令", "sd_webui_all_in_one.cli_manager.qwen_tts_webui_cli", "register_qwen_tts_webui"),
+    CliCommandSpec("self-manager", "SD WebUI All In One 相关命令", "sd_webui_all_in_one.cli_manager.utils", "register_manager"),
+)
+"""根层级子命令列表, 按帮助信息中的显示顺序排列"""
+
+
+def load_command_register(
+    spec: CliCommandSpec,
+) -> Callable[["argparse._SubParsersAction"], None]:
+    """导入子命令所在的模块并返回注册函数
+
+    Args:
+        spec (CliCommandSpec):
+            子命令声明
+
+    Returns:
+        (Callable[[argparse._SubParsersAction], None]): 注册子命令的函数
+    """
+    return getattr(importlib.import_module(spec.module), spec.register)
+
+
+def _find_selected_command(
+    argv: list[str],
+    commands: tuple[CliCommandSpec, ...],
+) -> CliCommandSpec | None:
+    """查找命令行参数中选择的根层级子命令, 根解析器只有选项参数, 第一个非选项参数即为子命令"""
+    for arg in argv:
+        if arg == "--":
+            return None
+        if arg.startswith("-"):
+            continue
+        return next((spec for spec in commands if spec.name == arg), None)
+    return None
+
+
+def build_parser(
+    argv: list[str],
+) -> argparse.ArgumentParser:
+    """创建根解析器, 只完整注册命令行参数中选择的子命令
+
+    Args:
+        argv (list[str]):
+            命令行参数 (不包含程序名称)
+
+    Returns:
+        argparse.ArgumentParser: 根解析器
+    """
     # 根解析器
     parser = argparse.ArgumentParser(prog="sd-webui-all-in-one", description="SD WebUI All in One CLI 管理器")
     parser.add_argument("--version", action="version", version=VERSION, help="显示 SD WebUI All In One 版本号")
@@ -22,21 +92,41 @@ def main() -> None:
     # 根层级的子命令容器
     subparsers = parser.add_subparsers(dest="main_command", help="选择要操作的模块", required=False)
 
-    # 注册各模块的子命令
-    register_sd_webui(subparsers)
-    register_sd_trainer(subparsers)
-    register_sd_scripts(subparsers)
-    register_invokeai(subparsers)
-    register_fooocus(subparsers)
-    register_comfyui(subparsers)
-    register_qwen_tts_webui(subparsers)
-    register_manager(subparsers)
+    # 注册各模块的子命令, 未选择的模块只注册名称和帮助信息
+    selected = _find_selected_command(argv, CLI_COMMANDS)
+    for spec in CLI_COMMANDS:
+        if spec is selected:
+            load_command_register(spec)(subparsers)
+        else:
+            subparsers.add_parser(spec.name, help=spec.help)
+
+    return parser
+
+
+def main(
+    argv: list[str] | None = None,
+) -> None:
+    """主函数
+
+    Args:
+        argv (list[str] | None):
+            命令行参数, 为 None 时使用`sys.argv[1:]`
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # 选择了子命令时初始化运行环境, 系统代理检测和导入子命令模块同时进行
+    bootstrap = start_environment_bootstrap() if _find_selected_command(argv, CLI_COMMANDS) is not None else None
+
+    parser = build_parser(argv)
 
     # 执行解析
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # 执行绑定的函数
     if hasattr(args, "func") and args.func:
+        if bootstrap is not None:
+            bootstrap.wait()
         args.func(args)
     else:
         print(f"SD WebUI All In One {VERSION}\n")
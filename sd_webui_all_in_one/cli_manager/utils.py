@@ -290,6 +290,8 @@ def compress_archive_cli(
     sources: list[Path],
     output: Path,
     progress: bool = True,
+    level: int | None = None,
+    threads: int | None = None,
 ) -> None:
     """创建压缩包
 
@@ -300,11 +302,17 @@ def compress_archive_cli(
             压缩包保存路径
         progress (bool):
             是否启用压缩进度条
+        level (int | None):
+            压缩等级, 为`None`时使用各格式的默认等级
+        threads (int | None):
+            压缩线程数, 为`None`时使用 CPU 核心数
     """
     create_archive(
         sources=sources,
         archive_path=output,
         progress=progress,
+        level=level,
+        threads=threads,
     )
 
 
@@ -1373,11 +1381,15 @@ def register_manager(
     archive_compress_p.add_argument("sources", type=normalized_filepath, nargs="+", help="要压缩的文件或目录路径")
     archive_compress_p.add_argument("--output", type=normalized_filepath, required=True, help="压缩包保存路径，文件扩展名决定实际使用的压缩格式")
     archive_compress_p.add_argument("--no-progress", action="store_false", dest="progress", default=True, help="禁用压缩进度条")
+    archive_compress_p.add_argument("--level", type=int, default=None, help="压缩等级，不指定时使用各格式的默认等级")
+    archive_compress_p.add_argument("--threads", type=int, default=None, help="压缩线程数，不指定时使用 CPU 核心数，为 1 时单线程压缩")
     archive_compress_p.set_defaults(
         func=lambda args: compress_archive_cli(
             sources=args.sources,
             output=args.output,
             progress=args.progress,
+            level=args.level,
+            threads=args.threads,
         )
     )
 
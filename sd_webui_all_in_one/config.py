@@ -69,6 +69,12 @@ SD_WEBUI_ALL_IN_ONE_SNAPSHOT_DIR = Path(os.getenv("SD_WEBUI_ALL_IN_ONE_SNAPSHOT_
 SD_WEBUI_ALL_IN_ONE_HOTPATCHER_CONFIG_PATH = Path(os.getenv("SD_WEBUI_ALL_IN_ONE_HOTPATCHER_CONFIG_PATH", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "patcher_config.json").as_posix()))
 """SD WebUI All In One Hotpatcher 配置文件路径"""
 
+SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH = Path(os.environ["SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH"]) if os.getenv("SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH") else None
+"""跨 WebUI 共享的模型存储目录, 未设置时不启用模型存储"""
+
+SD_WEBUI_ALL_IN_ONE_DEDUPLICATE_DOWNLOADED_MODELS = os.getenv("SD_WEBUI_ALL_IN_ONE_DEDUPLICATE_DOWNLOADED_MODELS") in ["1", "True", "true"]
+"""是否在从链接下载模型后计算 sha256, 将与本地已有模型相同的文件替换为硬链接"""
+
 SD_WEBUI_ROOT_PATH = Path(os.getenv("SD_WEBUI_ROOT", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "stable-diffusion-webui").as_posix()))
 """Stable Diffusion WebUI 根目录"""
 
@@ -96,6 +102,18 @@ SD_WEBUI_ALL_IN_ONE_EXTRA_PYPI_MIRROR = os.getenv("SD_WEBUI_ALL_IN_ONE_EXTRA_PYP
 SD_WEBUI_ALL_IN_ONE_PROXY = os.getenv("SD_WEBUI_ALL_IN_ONE_PROXY") in ["1", "True", "true"]
 """是否自动读取系统代理配置并应用代理"""
 
+SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL = float(os.getenv("SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_TTL", str(600)))
+"""系统代理检测结果的缓存有效期 (秒), 为 0 时每次启动都重新检测"""
+
+SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_PATH = Path(os.getenv("SD_WEBUI_ALL_IN_ONE_PROXY_CACHE_PATH", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "sd-webui-all-in-one-proxy-cache.json").as_posix()))
+"""系统代理检测结果的缓存文件路径, 默认保存在运行目录的缓存目录中, 避免其他用户在共享的临时目录中放置缓存文件"""
+
+SD_WEBUI_ALL_IN_ONE_REQUIREMENT_CACHE_PATH = Path(os.getenv("SD_WEBUI_ALL_IN_ONE_REQUIREMENT_CACHE_PATH", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "sd-webui-all-in-one-requirement-cache.json").as_posix()))
+"""依赖文件解析结果的缓存文件路径, 默认保存在运行目录的缓存目录中"""
+
+SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH = Path(os.getenv("SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH", (SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH / "cache" / "model-inventory").as_posix()))
+"""模型清单索引的保存目录, 每个模型根目录对应一个索引文件, 默认保存在运行目录的缓存目录中, 不会出现在模型目录的扫描和同步结果中"""
+
 SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH = os.getenv("SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH") in ["1", "True", "true"]
 """是否设置缓存路径"""
 
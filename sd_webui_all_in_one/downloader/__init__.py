@@ -8,7 +8,11 @@ from sd_webui_all_in_one.downloader.types import (
 from sd_webui_all_in_one.downloader.multi_thread import MultiThreadDownloader
 from sd_webui_all_in_one.downloader.aria2_server import Aria2RpcServer
 from sd_webui_all_in_one.downloader.aria2_downloader import aria2
-from sd_webui_all_in_one.downloader.requests_downloader import download_file_from_url
+from sd_webui_all_in_one.downloader.requests_downloader import (
+    download_file_from_url,
+    RangeDownloadTuning,
+)
+from sd_webui_all_in_one.downloader.asyncio_downloader import download_file_from_url_asyncio
 from sd_webui_all_in_one.downloader.urllib_downloader import download_file_from_url_urllib
 from sd_webui_all_in_one.downloader.hash_utils import compare_sha256
 from sd_webui_all_in_one.downloader.downloader import (
@@ -16,18 +20,32 @@ from sd_webui_all_in_one.downloader.downloader import (
     download_executer,
 )
 from sd_webui_all_in_one.downloader.archive_downloader import download_archive_and_unpack
+from sd_webui_all_in_one.downloader.download_scheduler import (
+    DownloadScheduler,
+    DownloadSchedulerError,
+    DownloadTask,
+    DownloadFailurePolicy,
+    DOWNLOAD_FAILURE_POLICY_LIST,
+)
 
 __all__ = [
     # 类型和常量
     "DownloadToolType",
     "DOWNLOAD_TOOL_TYPE_LIST",
     "DEFAULT_USER_AGENT",
+    "DownloadFailurePolicy",
+    "DOWNLOAD_FAILURE_POLICY_LIST",
     # 类
     "MultiThreadDownloader",
     "Aria2RpcServer",
+    "DownloadScheduler",
+    "DownloadSchedulerError",
+    "DownloadTask",
+    "RangeDownloadTuning",
     # 下载函数
     "aria2",
     "download_file_from_url",
+    "download_file_from_url_asyncio",
     "download_file_from_url_urllib",
     "download_file",
     "download_executer",
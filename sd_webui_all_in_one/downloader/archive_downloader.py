@@ -1,12 +1,24 @@
 """压缩包下载工具"""
 
 import os
+import sys
+import lzma
+import zlib
+import tarfile
+import http.client
+import urllib.request
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from urllib.parse import urlparse
 
-from sd_webui_all_in_one.archive_manager import extract_archive
+from sd_webui_all_in_one.archive_manager import (
+    extract_archive,
+    extract_archive_stream,
+    is_stream_extract_supported,
+)
 from sd_webui_all_in_one.downloader.downloader import download_file
+from sd_webui_all_in_one.file_manager import move_files_merge
+from sd_webui_all_in_one.downloader.types import DEFAULT_USER_AGENT
 from sd_webui_all_in_one.logger import get_logger
 from sd_webui_all_in_one.config import (
     LOGGER_LEVEL,
@@ -20,11 +32,64 @@ logger = get_logger(
     color=LOGGER_COLOR,
 )
 
+STREAM_REQUEST_TIMEOUT = 60
+"""流式下载压缩包时的连接和读取超时时间 (秒)"""
+
+STREAM_STAGING_PREFIX = ".sd-webui-all-in-one-stream-"
+"""流式解压时临时目录的名称前缀, 临时目录位于解压路径中, 解压完成后再把内容移动到解压路径"""
+
+
+def _stream_fallback_errors() -> tuple[type[BaseException], ...]:
+    """流式下载中断时可能出现的异常, 出现这些异常时回退到先下载再解压
+
+    连接在压缩数据流中途断开时, 通常表现为解压器的数据截断错误而不是网络错误
+    """
+    errors: list[type[BaseException]] = [
+        OSError,
+        EOFError,
+        http.client.HTTPException,
+        tarfile.ReadError,
+        zlib.error,
+        lzma.LZMAError,
+    ]
+    zstd = sys.modules.get("zstandard")
+    zstd_error = getattr(zstd, "ZstdError", None)
+    if isinstance(zstd_error, type) and issubclass(zstd_error, BaseException):
+        errors.append(zstd_error)
+    return tuple(errors)
+
+
+def _download_and_unpack_stream(
+    url: str,
+    local_dir: Path,
+    name: str,
+) -> None:
+    """边下载边解压 tar 系列压缩包, 压缩包不落盘
+
+    先解压到解压路径中的临时目录, 完整解压后再合并到解压路径, 下载中断时不会在解压路径中留下不完整的文件
+    """
+    local_dir.mkdir(parents=True, exist_ok=True)
+    with TemporaryDirectory(prefix=STREAM_STAGING_PREFIX, dir=local_dir) as staging_dir:
+        staging_path = Path(staging_dir)
+        req = urllib.request.Request(url, headers={"User-Agent": DEFAULT_USER_AGENT})
+        with urllib.request.urlopen(req, timeout=STREAM_REQUEST_TIMEOUT) as response:
+            content_length = response.headers.get("Content-Length")
+            total_size = int(content_length) if content_length and content_length.isdigit() else None
+            extract_archive_stream(
+                file_obj=response,
+                archive_name=name,
+                extract_to=staging_path,
+                total_size=total_size,
+            )
+        for item in staging_path.iterdir():
+            move_files_merge(item, local_dir / item.name)
+
 
 def download_archive_and_unpack(
     url: str,
     local_dir: Path,
     name: str | None = None,
+    stream: bool = True,
 ) -> None:
     """下载压缩包并解压到指定路径
 
@@ -35,17 +100,32 @@ def download_archive_and_unpack(
             下载路径
         name (str | None):
             下载文件保存的名称, 为`None`时从`url`解析文件名
+        stream (bool):
+            是否对 tar 系列压缩包边下载边解压, 流式下载因网络问题或数据截断失败时回退到使用`download_file()` (带重试) 先下载再解压;
+            zip / 7z / rar 需要随机访问, 始终先下载再解压
 
     Raises:
         RuntimeError:
             下载并解压压缩包时发生错误时
     """
+    if name is None:
+        parts = urlparse(url)
+        name = os.path.basename(parts.path)
+
+    if stream and is_stream_extract_supported(Path(name)):
+        try:
+            logger.info("流式下载并解压 %s 到 %s 中", name, local_dir)
+            _download_and_unpack_stream(url=url, local_dir=local_dir, name=name)
+            logger.info("%s 解压完成, 路径: %s", name, local_dir)
+            return
+        except _stream_fallback_errors() as e:
+            logger.warning("流式下载 %s 失败: %s, 尝试先下载再解压", name, e)
+        except Exception as e:
+            logger.error("解压 %s 时发生错误: %s", name, e)
+            raise RuntimeError(f"下载 {name} 并解压压缩包时发生错误: {e}") from e
+
     with TemporaryDirectory() as tmp_dir:
         path = Path(tmp_dir)
-        if name is None:
-            parts = urlparse(url)
-            name = os.path.basename(parts.path)
-
         try:
             origin_file_path = download_file(
                 url=url,
@@ -0,0 +1,1228 @@
+"""Asyncio 下载器
+
+使用标准库 asyncio 流实现的 HTTP/1.1 客户端进行 HTTP Range 分片下载, 不依赖第三方库.
+断点续传状态格式、piece 分配和完成校验与 requests 下载器共用, 两个下载器可以互相继续对方未完成的下载.
+所有下载共用一个后台事件循环线程, 同时下载多个文件时每个连接只占用一个协程而不是一个线程
+"""
+
+import asyncio
+import base64
+import concurrent.futures
+import itertools
+import socket
+import ssl
+import threading
+import time
+import zlib
+from collections.abc import Coroutine
+from email.utils import formatdate
+from http.client import HTTPMessage
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import TypeVar
+from urllib.parse import unquote
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.request import getproxies
+from urllib.request import proxy_bypass
+
+from sd_webui_all_in_one.downloader.requests_downloader import (
+    DEFAULT_MAX_CONNECTION_PER_SERVER,
+    DEFAULT_MIN_SPLIT_SIZE,
+    DEFAULT_PIECE_LENGTH,
+    DEFAULT_SPLIT,
+    STATE_SAVE_COMPLETED_PIECE_INTERVAL,
+    STREAM_CHUNK_SIZE,
+    RangeDownloadTuning,
+    _AdaptiveConnectionController,
+    _content_encoding_requires_single_stream,
+    _DownloadBackend,
+    _DownloadOptions,
+    _download_file_with_backend,
+    _filename_from_content_disposition,
+    _get_header,
+    _parse_content_range,
+    _parse_int_header,
+    _PieceFileWriter,
+    _PieceStorage,
+    _RangeDownloadNotSupported,
+    _RangeDownloadTemporaryError,
+    _RangeRequestIgnored,
+    _RemoteFileInfo,
+    _request_headers,
+    _ResumeStateFile,
+    _Segment,
+    _SegmentDownloadError,
+    _SegmentManager,
+    _SegmentOwnershipLost,
+    _sha256_from_digest_header,
+    _stream_request_headers,
+    _StreamThroughputMeter,
+    _StreamingSha256,
+    _UriPool,
+    _UrlInput,
+    _validate_range_response,
+)
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_COLOR,
+    LOGGER_LEVEL,
+    LOGGER_NAME,
+)
+
+
+MAX_REDIRECTS = 10
+"""单个请求最多跟随的重定向次数"""
+
+RESPONSE_DRAIN_LIMIT = 64 * 1024
+"""提前结束的响应剩余内容不超过该大小时读完剩余内容以复用连接, 否则直接关闭连接"""
+
+URI_POOL_POLL_INTERVAL = 0.1
+"""所有服务器的连接数都达到上限时, 重新尝试获取链接的间隔 (秒)"""
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+_T = TypeVar("_T")
+
+_REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+
+_ConnectionKey = tuple[str, str, int, str | None]
+
+
+class _HttpConnection:
+    """一个 HTTP/1.1 连接"""
+
+    def __init__(
+        self,
+        key: _ConnectionKey,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _HttpResponse:
+    """HTTP/1.1 响应, 提供与 requests 响应相同的 `status_code` 和 `headers` 属性"""
+
+    def __init__(
+        self,
+        client: "_AsyncHttpClient",
+        connection: _HttpConnection,
+        *,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: HTTPMessage,
+        keep_alive: bool,
+        timeout: float,
+    ) -> None:
+        self.client = client
+        self.connection: _HttpConnection | None = connection
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.chunked = "chunked" in (_get_header(headers, "Transfer-Encoding") or "").lower()
+        self.chunk_remaining = 0
+        self.remaining: int | None = None
+        if method == "HEAD" or status_code in {204, 304} or 100 <= status_code < 200:
+            self.remaining = 0
+            self.chunked = False
+        elif not self.chunked:
+            content_length = _get_header(headers, "Content-Length")
+            if content_length is not None and content_length.strip().isdigit():
+                self.remaining = int(content_length)
+            else:
+                # 没有长度信息时读取到连接关闭为止, 连接无法复用
+                self.keep_alive = False
+        self.finished = self.remaining == 0
+
+    async def read_chunk(
+        self,
+        size: int = STREAM_CHUNK_SIZE,
+    ) -> bytes:
+        """读取最多 `size` 字节的响应内容, 内容读取完毕时返回空字节串"""
+        if self.finished or self.connection is None:
+            return b""
+        reader = self.connection.reader
+        if self.chunked:
+            if self.chunk_remaining == 0:
+                line = await self._wait(reader.readline())
+                try:
+                    self.chunk_remaining = int(line.split(b";", maxsplit=1)[0].strip(), 16)
+                except ValueError as e:
+                    raise IOError(f"无效的 chunked 响应: {line!r}") from e
+                if self.chunk_remaining == 0:
+                    while (await self._wait(reader.readline())).strip():
+                        pass
+                    self.finished = True
+                    return b""
+            data = await self._wait(reader.read(min(size, self.chunk_remaining)))
+            if not data:
+                raise IOError("连接在 chunked 响应结束前被关闭")
+            self.chunk_remaining -= len(data)
+            if self.chunk_remaining == 0:
+                await self._wait(reader.readexactly(2))
+            return data
+
+        if self.remaining is None:
+            data = await self._wait(reader.read(size))
+            if not data:
+                self.finished = True
+            return data
+
+        data = await self._wait(reader.read(min(size, self.remaining)))
+        if not data:
+            raise IOError(f"连接在响应结束前被关闭, 剩余 {self.remaining} 字节")
+        self.remaining -= len(data)
+        self.finished = self.remaining == 0
+        return data
+
+    async def read(self) -> bytes:
+        """读取全部响应内容"""
+        chunks: list[bytes] = []
+        while chunk := await self.read_chunk():
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def aclose(self) -> None:
+        """结束响应, 内容已读完且服务器允许时把连接放回连接池"""
+        connection = self.connection
+        if connection is None:
+            return
+        self.connection = None
+        if not self.finished and self.keep_alive and self.remaining is not None and self.remaining <= RESPONSE_DRAIN_LIMIT:
+            self.connection = connection
+            try:
+                await self.read()
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                self.finished = False
+            self.connection = None
+        if self.finished and self.keep_alive:
+            self.client.put_connection(connection)
+        else:
+            connection.close()
+
+    async def _wait(
+        self,
+        awaitable: Coroutine[Any, Any, _T],
+    ) -> _T:
+        return await asyncio.wait_for(awaitable, timeout=self.timeout)
+
+
+class _AsyncHttpClient:
+    """基于 asyncio 流的 HTTP/1.1 客户端, 按服务器复用 keep-alive 连接
+
+    与 requests 相同, 从环境变量读取 HTTP 代理配置, HTTPS 请求通过 CONNECT 隧道访问代理
+    """
+
+    def __init__(self) -> None:
+        self.idle_connections: dict[_ConnectionKey, list[_HttpConnection]] = {}
+        self.proxies = getproxies()
+        self.ssl_context: ssl.SSLContext | None = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        *,
+        timeout: float = 60,
+        allow_redirects: bool = True,
+    ) -> _HttpResponse:
+        """发送请求并返回已读取响应头的响应
+
+        Args:
+            method (str):
+                请求方法
+            url (str):
+                请求链接
+            headers (dict[str, str] | None):
+                请求头
+            timeout (float):
+                连接和每次读取的超时时间 (秒)
+            allow_redirects (bool):
+                是否跟随重定向
+
+        Returns:
+            _HttpResponse: 响应, 使用后需要调用 `aclose()`
+
+        Raises:
+            IOError:
+                重定向次数过多时
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._send(method, url, headers or {}, timeout)
+            location = _get_header(response.headers, "Location")
+            if not allow_redirects or response.status_code not in _REDIRECT_STATUS_CODES or not location:
+                return response
+            await response.aclose()
+            url = urljoin(url, location)
+            if response.status_code == 303 and method != "HEAD":
+                method = "GET"
+        raise IOError(f"重定向次数超过 {MAX_REDIRECTS} 次: {url}")
+
+    def put_connection(
+        self,
+        connection: _HttpConnection,
+    ) -> None:
+        self.idle_connections.setdefault(connection.key, []).append(connection)
+
+    async def aclose(self) -> None:
+        """关闭连接池中的所有空闲连接"""
+        connections = [connection for items in self.idle_connections.values() for connection in items]
+        self.idle_connections.clear()
+        for connection in connections:
+            connection.close()
+        for connection in connections:
+            try:
+                await connection.writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> _HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"不支持的链接: {url}")
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = self._proxy_for(scheme, host)
+        key: _ConnectionKey = (scheme, host, port, proxy)
+
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_headers = {"Host": parts.netloc.rpartition("@")[2]}
+        if proxy is not None and scheme == "http":
+            # 通过 HTTP 代理访问 HTTP 链接时请求行使用完整链接
+            target = f"http://{request_headers['Host']}{target}"
+            request_headers.update(self._proxy_headers(proxy))
+        request_headers.update(headers)
+        request = f"{method} {target} HTTP/1.1\r\n" + "".join(f"{name}: {value}\r\n" for name, value in request_headers.items()) + "\r\n"
+        payload = request.encode("latin-1")
+
+        while True:
+            connection, reused = self._pop_idle_connection(key), True
+            if connection is None:
+                connection, reused = await self._open_connection(key, timeout), False
+            try:
+                connection.writer.write(payload)
+                await asyncio.wait_for(connection.writer.drain(), timeout=timeout)
+                return await self._read_response(connection, method=method, url=url, timeout=timeout)
+            except (OSError, asyncio.IncompleteReadError, ConnectionError) as e:
+                connection.close()
+                if not reused:
+                    raise
+                # 服务器可能已关闭空闲的 keep-alive 连接, 使用新连接重试
+                logger.debug("复用的连接已失效, 使用新连接重试: %s", e)
+            except BaseException:
+                connection.close()
+                raise
+
+    async def _read_response(
+        self,
+        connection: _HttpConnection,
+        *,
+        method: str,
+        url: str,
+        timeout: float,
+    ) -> _HttpResponse:
+        reader = connection.reader
+        while True:
+            status_line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+            if not status_line:
+                raise ConnectionError("服务器关闭了连接")
+            version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+            try:
+                status_code = int(rest.split(" ", maxsplit=1)[0])
+            except ValueError as e:
+                raise IOError(f"无效的 HTTP 状态行: {status_line!r}") from e
+            headers = await self._read_headers(reader, timeout)
+            if status_code != 100:
+                break
+
+        connection_header = (_get_header(headers, "Connection") or "").lower()
+        keep_alive = version.upper() == "HTTP/1.1" and "close" not in connection_header
+        return _HttpResponse(
+            self,
+            connection,
+            method=method,
+            url=url,
+            status_code=status_code,
+            headers=headers,
+            keep_alive=keep_alive,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    async def _read_headers(
+        reader: asyncio.StreamReader,
+        timeout: float,
+    ) -> HTTPMessage:
+        headers = HTTPMessage()
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout=timeout)
+            if line in {b"\r\n", b"\n", b""}:
+                return headers
+            name, separator, value = line.decode("latin-1").partition(":")
+            if separator:
+                headers[name.strip()] = value.strip()
+
+    def _pop_idle_connection(
+        self,
+        key: _ConnectionKey,
+    ) -> _HttpConnection | None:
+        connections = self.idle_connections.get(key)
+        while connections:
+            connection = connections.pop()
+            if not connection.reader.at_eof() and not connection.writer.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    async def _open_connection(
+        self,
+        key: _ConnectionKey,
+        timeout: float,
+    ) -> _HttpConnection:
+        scheme, host, port, proxy = key
+        ssl_context = self._get_ssl_context() if scheme == "https" else None
+        if proxy is None:
+            connect = asyncio.open_connection(host, port, ssl=ssl_context, limit=STREAM_CHUNK_SIZE)
+        elif scheme == "http":
+            proxy_parts = urlsplit(proxy)
+            connect = asyncio.open_connection(proxy_parts.hostname, proxy_parts.port or 80, limit=STREAM_CHUNK_SIZE)
+        else:
+            sock = await self._open_tunnel(proxy, host, port, timeout)
+            connect = asyncio.open_connection(sock=sock, ssl=ssl_context, server_hostname=host, limit=STREAM_CHUNK_SIZE)
+        reader, writer = await asyncio.wait_for(connect, timeout=timeout)
+        return _HttpConnection(key, reader, writer)
+
+    async def _open_tunnel(
+        self,
+        proxy: str,
+        host: str,
+        port: int,
+        timeout: float,
+    ) -> socket.socket:
+        """通过代理的 CONNECT 方法建立到目标服务器的隧道"""
+        loop = asyncio.get_running_loop()
+        proxy_parts = urlsplit(proxy)
+        sock = await asyncio.wait_for(
+            loop.run_in_executor(None, socket.create_connection, (proxy_parts.hostname, proxy_parts.port or 80), timeout),
+            timeout=timeout,
+        )
+        try:
+            sock.setblocking(False)
+            target = f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+            headers = {"Host": target, **self._proxy_headers(proxy)}
+            request = f"CONNECT {target} HTTP/1.1\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+            await asyncio.wait_for(loop.sock_sendall(sock, request.encode("latin-1")), timeout=timeout)
+            response = b""
+            while b"\r\n\r\n" not in response:
+                data = await asyncio.wait_for(loop.sock_recv(sock, 4096), timeout=timeout)
+                if not data or len(response) > RESPONSE_DRAIN_LIMIT:
+                    raise ConnectionError(f"代理 {proxy_parts.hostname} 未返回有效的 CONNECT 响应")
+                response += data
+            status_line = response.split(b"\r\n", maxsplit=1)[0].decode("latin-1")
+            if status_line.split(" ")[1:2] != ["200"]:
+                raise ConnectionError(f"代理 CONNECT {target} 失败: {status_line}")
+            return sock
+        except BaseException:
+            sock.close()
+            raise
+
+    def _proxy_for(
+        self,
+        scheme: str,
+        host: str,
+    ) -> str | None:
+        proxy = self.proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        if urlsplit(proxy).scheme.lower() != "http":
+            logger.debug("asyncio 下载器仅支持 HTTP 代理, 忽略代理 %s", proxy)
+            return None
+        return proxy
+
+    @staticmethod
+    def _proxy_headers(
+        proxy: str,
+    ) -> dict[str, str]:
+        proxy_parts = urlsplit(proxy)
+        if proxy_parts.username is None:
+            return {}
+        credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+        return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials.encode('utf-8')).decode('ascii')}"}
+
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        if self.ssl_context is None:
+            self.ssl_context = ssl.create_default_context()
+        return self.ssl_context
+
+
+class _EventLoopThread:
+    """在后台守护线程中运行的事件循环, 所有 asyncio 下载共用"""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_forever, name="asyncio-downloader", daemon=True)
+        self.thread.start()
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def is_alive(self) -> bool:
+        return self.thread.is_alive() and not self.loop.is_closed()
+
+    def run(
+        self,
+        coroutine: Coroutine[Any, Any, _T],
+    ) -> _T:
+        """在事件循环中运行协程并等待结果, 调用线程被中断时取消协程并等待其完成清理"""
+        result: concurrent.futures.Future[_T] = concurrent.futures.Future()
+        tasks: list[asyncio.Task[_T]] = []
+
+        def _copy_result(task: asyncio.Task[_T]) -> None:
+            if task.cancelled():
+                result.cancel()
+            elif task.exception() is not None:
+                result.set_exception(task.exception())
+            else:
+                result.set_result(task.result())
+
+        def _start() -> None:
+            task = self.loop.create_task(coroutine)
+            task.add_done_callback(_copy_result)
+            tasks.append(task)
+
+        def _cancel() -> None:
+            for task in tasks:
+                task.cancel()
+
+        self.loop.call_soon_threadsafe(_start)
+        try:
+            return result.result()
+        except concurrent.futures.CancelledError:
+            raise
+        except BaseException:
+            if not result.done():
+                # 调用线程被中断 (例如 KeyboardInterrupt), 取消下载并等待断点续传状态写入完成
+                self.loop.call_soon_threadsafe(_cancel)
+                concurrent.futures.wait([result])
+            raise
+
+
+_event_loop_thread: _EventLoopThread | None = None
+_event_loop_thread_lock = threading.Lock()
+
+
+def _get_event_loop_thread() -> _EventLoopThread:
+    global _event_loop_thread
+    with _event_loop_thread_lock:
+        if _event_loop_thread is None or not _event_loop_thread.is_alive():
+            _event_loop_thread = _EventLoopThread()
+        return _event_loop_thread
+
+
+async def _probe_remote_file_async(
+    client: _AsyncHttpClient,
+    url: str,
+    timeout: int = 60,
+) -> _RemoteFileInfo:
+    """探测远端是否支持可靠的 HTTP Range 下载"""
+    total_size = 0
+    etag: str | None = None
+    last_modified: str | None = None
+    digest_sha256: str | None = None
+    content_disposition_filename: str | None = None
+    content_encoding: str | None = None
+    supports_range = False
+
+    try:
+        response = await client.request("HEAD", url, _request_headers(), timeout=timeout)
+        try:
+            if 200 <= response.status_code < 400:
+                headers = response.headers
+                total_size = _parse_int_header(headers, "Content-Length")
+                etag = _get_header(headers, "ETag")
+                last_modified = _get_header(headers, "Last-Modified")
+                digest_sha256 = _sha256_from_digest_header(_get_header(headers, "Digest"))
+                content_disposition_filename = _filename_from_content_disposition(_get_header(headers, "Content-Disposition"))
+                content_encoding = _get_header(headers, "Content-Encoding")
+                supports_range = (_get_header(headers, "Accept-Ranges") or "").lower() == "bytes"
+        finally:
+            await response.aclose()
+    except Exception as e:
+        logger.debug("HEAD 探测失败, 尝试使用 Range 请求探测: %s", e)
+
+    if not supports_range or total_size <= 0:
+        try:
+            response = await client.request("GET", url, _request_headers({"Range": "bytes=0-0"}), timeout=timeout)
+            try:
+                headers = response.headers
+                if response.status_code == 206:
+                    parsed = _parse_content_range(_get_header(headers, "Content-Range"))
+                    if parsed is not None:
+                        start, end, content_total = parsed
+                        if start == 0 and end == 0 and content_total:
+                            total_size = content_total
+                            etag = etag or _get_header(headers, "ETag")
+                            last_modified = last_modified or _get_header(headers, "Last-Modified")
+                            digest_sha256 = digest_sha256 or _sha256_from_digest_header(_get_header(headers, "Digest"))
+                            content_disposition_filename = content_disposition_filename or _filename_from_content_disposition(_get_header(headers, "Content-Disposition"))
+                            content_encoding = content_encoding or _get_header(headers, "Content-Encoding")
+                            supports_range = True
+            finally:
+                await response.aclose()
+        except Exception as e:
+            logger.debug("Range 探测失败, 将使用单连接下载: %s", e)
+
+    if _content_encoding_requires_single_stream(content_encoding):
+        total_size = 0
+        supports_range = False
+
+    return _RemoteFileInfo(
+        total_size=total_size,
+        supports_range=supports_range and total_size > 0,
+        etag=etag,
+        last_modified=last_modified,
+        digest_sha256=digest_sha256,
+        content_disposition_filename=content_disposition_filename,
+        content_encoding=content_encoding,
+    )
+
+
+async def _probe_remote_files_async(
+    client: _AsyncHttpClient,
+    urls: list[str],
+    timeout: int = 60,
+) -> tuple[str, _RemoteFileInfo]:
+    first_result: tuple[str, _RemoteFileInfo] | None = None
+    for url in urls:
+        remote_info = await _probe_remote_file_async(client, url, timeout=timeout)
+        if first_result is None:
+            first_result = (url, remote_info)
+        if remote_info.total_size > 0:
+            return url, remote_info
+    if first_result is None:
+        raise ValueError("url 序列不能为空")
+    return first_result
+
+
+async def _cached_file_not_modified_async(
+    client: _AsyncHttpClient,
+    urls: list[str],
+    cached_file: Path,
+    timeout: int = 60,
+) -> bool:
+    modified_since = formatdate(cached_file.stat().st_mtime, usegmt=True)
+    headers = _request_headers({"If-Modified-Since": modified_since})
+    for url in urls:
+        try:
+            response = await client.request("HEAD", url, headers, timeout=timeout)
+            try:
+                if response.status_code == 304:
+                    return True
+                if 200 <= response.status_code < 300:
+                    return False
+            finally:
+                await response.aclose()
+        except Exception as e:
+            logger.debug("conditional-get HEAD 请求失败, 将重新下载: %s", e)
+            return False
+    return False
+
+
+async def _download_stream_once_async(
+    client: _AsyncHttpClient,
+    *,
+    url: str,
+    file_writer: _PieceFileWriter,
+    segment: _Segment,
+    total_size: int,
+    timeout: int,
+    attempt: int,
+    retry_wait: int,
+    segment_manager: _SegmentManager,
+    mark_complete_callback: Callable[[_Segment], None],
+    progress_callback: Callable[[int], None] | None = None,
+) -> None:
+    response: _HttpResponse | None = None
+    current_segment: _Segment | None = segment
+    last_complete_segment: _Segment | None = None
+    partial_reported_size = 0
+    try:
+        response = await client.request("GET", url, _stream_request_headers(segment), timeout=timeout)
+        if not segment_manager.owns_segment(segment):
+            raise _SegmentOwnershipLost()
+        _validate_range_response(response, segment=segment, total_size=total_size, attempt=attempt, retry_wait=retry_wait)
+
+        offset = segment.start
+        while data := await response.read_chunk(STREAM_CHUNK_SIZE):
+            # 切片 memoryview 写入时不复制数据
+            chunk = memoryview(data)
+            chunk_offset = 0
+            while chunk_offset < len(chunk):
+                if current_segment is None:
+                    if last_complete_segment is None:
+                        return
+                    current_segment = segment_manager.get_next_segment(last_complete_segment)
+                    if current_segment is None:
+                        return
+                    offset = current_segment.start
+                    partial_reported_size = 0
+
+                writable_size = min(len(chunk) - chunk_offset, current_segment.end - offset + 1)
+                if writable_size <= 0:
+                    mark_complete_callback(current_segment)
+                    last_complete_segment = current_segment
+                    current_segment = None
+                    partial_reported_size = 0
+                    continue
+
+                if not segment_manager.owns_segment(current_segment):
+                    raise _SegmentOwnershipLost()
+                file_writer.write_at(offset, chunk[chunk_offset : chunk_offset + writable_size])
+                offset += writable_size
+                chunk_offset += writable_size
+                partial_reported_size += writable_size
+                segment_manager.record_progress(current_segment, offset)
+                if progress_callback is not None:
+                    progress_callback(writable_size)
+
+                if offset > current_segment.end:
+                    mark_complete_callback(current_segment)
+                    last_complete_segment = current_segment
+                    current_segment = None
+                    partial_reported_size = 0
+
+        if current_segment is not None:
+            raise IOError(f"分片大小不匹配: 期望 {current_segment.size}, 实际 {partial_reported_size}")
+    except _RangeDownloadNotSupported:
+        raise
+    except _SegmentOwnershipLost:
+        raise
+    except Exception as e:
+        raise _SegmentDownloadError(current_segment or segment, e) from e
+    finally:
+        if response is not None:
+            await response.aclose()
+
+
+async def _acquire_url(
+    uri_pool: _UriPool,
+    stop_event: asyncio.Event,
+) -> str | None:
+    while True:
+        url = uri_pool.try_acquire()
+        if url is not None:
+            return url
+        if stop_event.is_set():
+            return None
+        await asyncio.sleep(URI_POOL_POLL_INTERVAL)
+
+
+async def _download_stream_with_retries_async(
+    client: _AsyncHttpClient,
+    *,
+    uri_pool: _UriPool,
+    file_writer: _PieceFileWriter,
+    segment: _Segment,
+    total_size: int,
+    timeout: int,
+    max_tries: int,
+    retry_wait: int,
+    stop_event: asyncio.Event,
+    segment_manager: _SegmentManager,
+    mark_complete_callback: Callable[[_Segment], None],
+    progress_callback: Callable[[int], None] | None = None,
+) -> None:
+    last_error: Exception | None = None
+    attempt = 0
+    while max_tries == 0 or attempt < max_tries:
+        attempt += 1
+        url = await _acquire_url(uri_pool, stop_event)
+        if url is None:
+            segment_manager.release(segment)
+            return
+        meter = _StreamThroughputMeter(uri_pool, url, progress_callback) if uri_pool.racing else None
+        try:
+            return await _download_stream_once_async(
+                client,
+                url=url,
+                file_writer=file_writer,
+                segment=segment,
+                total_size=total_size,
+                timeout=timeout,
+                attempt=attempt,
+                retry_wait=retry_wait,
+                segment_manager=segment_manager,
+                mark_complete_callback=mark_complete_callback,
+                progress_callback=meter.update if meter is not None else progress_callback,
+            )
+        except _RangeDownloadNotSupported:
+            raise
+        except _SegmentOwnershipLost:
+            return
+        except _SegmentDownloadError as e:
+            if isinstance(e.error, _RangeDownloadTemporaryError):
+                uri_pool.record_failure(url)
+            failed_range = e.segment.byte_range
+            segment_manager.release(e.segment)
+            new_segment = segment_manager.get_segment(e.segment.owner_id)
+            if new_segment is None:
+                return
+            segment = new_segment
+            last_error = e.error
+            if max_tries != 0 and attempt >= max_tries:
+                break
+            delay = e.error.retry_delay if isinstance(e.error, _RangeDownloadTemporaryError) and e.error.retry_delay is not None else min(0.5 * attempt, 5.0)
+            logger.warning(
+                "分片 %s 从 %s 下载失败 [%s/%s]: %s, %.1fs 后重试",
+                failed_range,
+                url,
+                attempt,
+                max_tries,
+                e.error,
+                delay,
+            )
+            await asyncio.sleep(delay)
+        finally:
+            if meter is not None:
+                meter.flush()
+            uri_pool.release(url)
+    segment_manager.release(segment)
+    raise IOError(f"分片 {segment.byte_range} 下载失败: {last_error}") from last_error
+
+
+async def _download_pieces_async(
+    client: _AsyncHttpClient,
+    urls: list[str],
+    *,
+    temp_file: Path,
+    remote_info: _RemoteFileInfo,
+    progress: bool,
+    options: _DownloadOptions,
+    timeout: int,
+    piece_storage: _PieceStorage,
+    resume_state: _ResumeStateFile,
+    resumed_piece_hashes: list[str] | None,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+) -> str | None:
+    """使用多个协程下载 `piece_storage` 中尚未完成的 piece, 行为与 `_download_pieces` 相同"""
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
+
+    loop = asyncio.get_running_loop()
+    # 读取已完成的 piece 计算哈希会阻塞事件循环, 放到单独的线程中按顺序执行
+    hash_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="asyncio-downloader-hash")
+    hasher: _StreamingSha256 | None = None
+    if resumed_piece_hashes is not None:
+        hasher = _StreamingSha256(temp_file, piece_storage, resumed_piece_hashes)
+        hasher.state_sink = resume_state
+        if await loop.run_in_executor(hash_executor, hasher.verify_resumed_pieces) > 0:
+            logger.warning("'%s' 中部分已下载的 piece 校验失败, 将重新下载这些 piece", temp_file)
+
+        def _hash_completed_pieces() -> None:
+            loop.run_in_executor(hash_executor, hasher.advance)
+
+        piece_storage.completion_listener = _hash_completed_pieces
+
+    completed_size = piece_storage.completed_size()
+    stop_event = asyncio.Event()
+    range_ignored = False
+    completed_since_state_save = 0
+    uri_pool = _UriPool(urls, options.max_connection_per_server, racing=options.mirror_racing)
+    worker_count = max(1, min(options.split, piece_storage.piece_count, uri_pool.capacity))
+    controller = _AdaptiveConnectionController(worker_count) if options.adaptive else None
+    segment_manager = _SegmentManager(piece_storage, options.min_split_size, controller)
+    owner_ids = itertools.count(1)
+    file_writer = _PieceFileWriter(temp_file)
+
+    def _mark_segment_complete(segment: _Segment) -> None:
+        nonlocal completed_since_state_save
+        completed_since_state_save += segment_manager.mark_complete(segment)
+        if completed_since_state_save >= STATE_SAVE_COMPLETED_PIECE_INTERVAL or piece_storage.is_complete():
+            resume_state.flush()
+            completed_since_state_save = 0
+
+    async def _worker() -> None:
+        owner_id = next(owner_ids)
+
+        def _update_progress(delta: int) -> None:
+            if controller is not None:
+                controller.record(owner_id, delta)
+            progress_bar.update(delta)
+            if progress_callback is not None:
+                progress_callback(delta)
+
+        if controller is None:
+            await _download_segments(owner_id, _update_progress)
+            return
+
+        controller.worker_started(owner_id)
+        try:
+            await _download_segments(owner_id, _update_progress)
+        finally:
+            controller.worker_finished(owner_id)
+
+    async def _download_segments(
+        owner_id: int,
+        progress_callback: Callable[[int], None],
+    ) -> None:
+        nonlocal range_ignored
+        while not stop_event.is_set():
+            if controller is not None and controller.try_retire(owner_id):
+                return
+            segment = segment_manager.get_segment(owner_id)
+            if segment is None:
+                return
+            try:
+                await _download_stream_with_retries_async(
+                    client,
+                    uri_pool=uri_pool,
+                    file_writer=file_writer,
+                    segment=segment,
+                    total_size=remote_info.total_size,
+                    timeout=timeout,
+                    max_tries=options.max_tries,
+                    retry_wait=options.retry_wait,
+                    stop_event=stop_event,
+                    segment_manager=segment_manager,
+                    mark_complete_callback=_mark_segment_complete,
+                    progress_callback=progress_callback,
+                )
+            except _RangeRequestIgnored:
+                range_ignored = True
+                segment_manager.release(segment)
+                return
+            except BaseException:
+                segment_manager.release(segment)
+                raise
+
+    start_time = time.monotonic()
+    try:
+        with tqdm(
+            total=remote_info.total_size,
+            initial=completed_size,
+            unit="B",
+            unit_scale=True,
+            desc=temp_file.name.removesuffix(".tmp"),
+            disable=not progress,
+        ) as progress_bar:
+            running: set[asyncio.Task[None]] = set()
+            try:
+                if not piece_storage.is_complete():
+                    running = {asyncio.create_task(_worker()) for _ in range(controller.target if controller is not None else worker_count)}
+                    while running:
+                        done, running = await asyncio.wait(
+                            running,
+                            timeout=controller.sample_interval if controller is not None else None,
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        for task in done:
+                            task.result()
+                        if controller is None or not controller.sample() or range_ignored or piece_storage.is_complete():
+                            continue
+                        # 目标连接数增加或已有 worker 因暂时没有任务退出时补充 worker
+                        for _ in range(min(controller.missing_workers(), worker_count - len(running))):
+                            running.add(asyncio.create_task(_worker()))
+            except BaseException:
+                stop_event.set()
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                resume_state.flush()
+                raise
+
+        if not piece_storage.is_complete():
+            resume_state.flush()
+            if range_ignored:
+                raise _RangeDownloadNotSupported("远端忽略 Range 请求")
+            raise IOError("分片下载未完成")
+        if temp_file.stat().st_size != remote_info.total_size:
+            raise IOError(f"下载文件大小不匹配: 期望 {remote_info.total_size}, 实际 {temp_file.stat().st_size}")
+        if tuning_callback is not None:
+            tuning = RangeDownloadTuning(
+                split=worker_count,
+                connections=controller.target if controller is not None else worker_count,
+                peak_connections=controller.peak_workers if controller is not None else worker_count,
+                max_connection_per_server=options.max_connection_per_server,
+                min_split_size=options.min_split_size,
+                piece_length=options.piece_length,
+                throughput=(remote_info.total_size - completed_size) / max(time.monotonic() - start_time, 1e-6),
+                stolen_pieces=controller.stolen_pieces if controller is not None else 0,
+            )
+            logger.debug("'%s' 分片下载参数: %s", temp_file, tuning)
+            tuning_callback(tuning)
+        return await loop.run_in_executor(hash_executor, hasher.hexdigest) if hasher is not None else None
+    finally:
+        piece_storage.completion_listener = None
+        try:
+            # 等待哈希线程中剩余的任务时不阻塞事件循环
+            await loop.run_in_executor(None, hash_executor.shutdown)
+        finally:
+            file_writer.close()
+
+
+async def _download_file_single_stream_once_async(
+    client: _AsyncHttpClient,
+    url: str,
+    temp_file: Path,
+    file_name: str,
+    progress: bool,
+    progress_callback: Callable[[int], None] | None = None,
+) -> int:
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
+
+    response = await client.request("GET", url, _request_headers(), timeout=60)
+    try:
+        if response.status_code >= 400:
+            raise IOError(f"HTTP {response.status_code}")
+        content_encoding = _get_header(response.headers, "Content-Encoding")
+        decoder = None
+        if _content_encoding_requires_single_stream(content_encoding):
+            if (content_encoding or "").strip().lower() not in {"gzip", "x-gzip", "deflate"}:
+                raise IOError(f"不支持的 Content-Encoding: {content_encoding}")
+            # 与 requests 相同, 自动解压 gzip / deflate 编码的响应
+            decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        if response.chunked or decoder is not None:
+            total_size = 0
+        else:
+            total_size = _parse_int_header(response.headers, "Content-Length")
+        with tqdm(
+            total=total_size,
+            unit="B",
+            unit_scale=True,
+            desc=file_name,
+            disable=not progress,
+        ) as progress_bar:
+            with open(temp_file, "wb") as file:
+                while chunk := await response.read_chunk(STREAM_CHUNK_SIZE):
+                    if decoder is not None:
+                        chunk = decoder.decompress(chunk)
+                    file.write(chunk)
+                    progress_bar.update(len(chunk))
+                    if progress_callback is not None:
+                        progress_callback(len(chunk))
+                if decoder is not None:
+                    file.write(decoder.flush())
+        return total_size
+    finally:
+        await response.aclose()
+
+
+async def _download_file_single_stream_async(
+    client: _AsyncHttpClient,
+    urls: list[str],
+    temp_file: Path,
+    file_name: str,
+    progress: bool,
+    max_tries: int,
+    retry_wait: int,
+    progress_callback: Callable[[int], None] | None = None,
+) -> int:
+    attempt = 0
+    last_error: Exception | None = None
+    while max_tries == 0 or attempt < max_tries:
+        url = urls[attempt % len(urls)]
+        attempt += 1
+        try:
+            return await _download_file_single_stream_once_async(
+                client,
+                url=url,
+                temp_file=temp_file,
+                file_name=file_name,
+                progress=progress,
+                progress_callback=progress_callback,
+            )
+        except Exception as e:
+            last_error = e
+            if max_tries != 0 and attempt >= max_tries:
+                break
+            delay = float(retry_wait) if retry_wait > 0 else min(0.5 * attempt, 5.0)
+            logger.warning("从 %s 单流下载失败 [%s/%s]: %s, %.1fs 后重试", url, attempt, max_tries, e, delay)
+            await asyncio.sleep(delay)
+
+    raise IOError(f"单流下载失败: {last_error}") from last_error
+
+
+class _AsyncioDownloadSession:
+    """一次 asyncio 下载使用的 HTTP 客户端, 探测和分片下载复用同一个连接池"""
+
+    def __init__(self) -> None:
+        self.event_loop_thread = _get_event_loop_thread()
+        self.client = _AsyncHttpClient()
+
+    def __enter__(self) -> "_AsyncioDownloadSession":
+        return self
+
+    def __exit__(
+        self,
+        *_args: object,
+    ) -> None:
+        self.event_loop_thread.run(self.client.aclose())
+
+    def backend(self) -> _DownloadBackend:
+        return _DownloadBackend(
+            probe_remote_files=self.probe_remote_files,
+            cached_file_not_modified=self.cached_file_not_modified,
+            download_pieces=self.download_pieces,
+            download_file_single_stream=self.download_file_single_stream,
+        )
+
+    def probe_remote_files(
+        self,
+        urls: list[str],
+        timeout: int = 60,
+    ) -> tuple[str, _RemoteFileInfo]:
+        return self.event_loop_thread.run(_probe_remote_files_async(self.client, urls, timeout=timeout))
+
+    def cached_file_not_modified(
+        self,
+        urls: list[str],
+        cached_file: Path,
+        timeout: int = 60,
+    ) -> bool:
+        return self.event_loop_thread.run(_cached_file_not_modified_async(self.client, urls, cached_file, timeout=timeout))
+
+    def download_pieces(
+        self,
+        urls: list[str],
+        **kwargs: Any,
+    ) -> str | None:
+        return self.event_loop_thread.run(_download_pieces_async(self.client, urls, **kwargs))
+
+    def download_file_single_stream(
+        self,
+        **kwargs: Any,
+    ) -> int:
+        return self.event_loop_thread.run(_download_file_single_stream_async(self.client, **kwargs))
+
+
+def download_file_from_url_asyncio(
+    url: _UrlInput,
+    save_path: Path | None = None,
+    file_name: str | None = None,
+    progress: bool = True,
+    hash_prefix: str | None = None,
+    re_download: bool = False,
+    split: int = DEFAULT_SPLIT,
+    max_connection_per_server: int = DEFAULT_MAX_CONNECTION_PER_SERVER,
+    min_split_size: int = DEFAULT_MIN_SPLIT_SIZE,
+    piece_length: int = DEFAULT_PIECE_LENGTH,
+    allow_piece_length_change: bool = False,
+    continue_download: bool = False,
+    max_tries: int = 5,
+    retry_wait: int = 0,
+    conditional_get: bool = False,
+    remote_time: bool = True,
+    adaptive: bool = False,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None = None,
+    mirror_racing: bool = False,
+    progress_callback: Callable[[int], None] | None = None,
+) -> Path:
+    """使用标准库 asyncio 下载文件
+
+    参数和断点续传状态文件与 `download_file_from_url` 相同, 不依赖 requests, 每个连接使用一个协程而不是一个线程
+
+    Args:
+        url (_UrlInput):
+            下载链接或同一文件的镜像链接列表
+        save_path (Path | None):
+            下载路径
+        file_name (str | None):
+            保存的文件名, 如果为`None`则从`url`中提取文件
+        progress (bool):
+            是否启用下载进度条
+        hash_prefix (str | None):
+            sha256 十六进制字符串, 如果提供, 将检查下载文件的哈希值是否与此前缀匹配, 当不匹配时引发`ValueError`
+        re_download (bool):
+            强制重新下载文件
+        split (int):
+            aria2 风格的单文件最大分割数
+        max_connection_per_server (int):
+            aria2 风格的单服务器最大连接数
+        min_split_size (int):
+            aria2 风格的最小切分大小
+        piece_length (int):
+            aria2 风格的 piece 大小
+        allow_piece_length_change (bool):
+            piece_length 与已有控制文件不一致时, 是否允许转换已完成 bitfield 并丢弃 in-flight 进度
+        continue_download (bool):
+            没有匹配 state 文件时, 是否从已有临时文件推断断点续传进度
+        max_tries (int):
+            单个分片的最大尝试次数
+        retry_wait (int):
+            HTTP 503 重试前等待秒数, 取值范围 0..600
+        conditional_get (bool):
+            已有本地文件时是否发送 If-Modified-Since, 远端返回 304 时复用本地文件
+        remote_time (bool):
+            下载完成后是否把本地文件 mtime 设置为远端 Last-Modified
+        adaptive (bool):
+            是否根据实测吞吐量自动调节连接数, 启用后 `split` 作为连接数上限, 空闲连接会接管慢速连接的剩余 piece
+        tuning_callback (Callable[[RangeDownloadTuning], None] | None):
+            分片下载完成后接收实际使用的连接参数的回调函数
+        mirror_racing (bool):
+            提供多个镜像链接时, 是否按各镜像服务器的实测吞吐量优先使用更快的镜像, 并停止使用连续返回可重试状态码的镜像
+        progress_callback (Callable[[int], None] | None):
+            下载过程中接收新写入字节数的回调函数, 分片下载时在事件循环线程中调用
+
+    Returns:
+        Path: 下载的文件路径
+
+    Raises:
+        ValueError: 当提供了 hash_prefix 但文件哈希值不匹配时
+        IOError: 下载过程中发生 IO 异常
+    """
+    with _AsyncioDownloadSession() as session:
+        return _download_file_with_backend(
+            session.backend(),
+            url=url,
+            save_path=save_path,
+            file_name=file_name,
+            progress=progress,
+            hash_prefix=hash_prefix,
+            re_download=re_download,
+            split=split,
+            max_connection_per_server=max_connection_per_server,
+            min_split_size=min_split_size,
+            piece_length=piece_length,
+            allow_piece_length_change=allow_piece_length_change,
+            continue_download=continue_download,
+            max_tries=max_tries,
+            retry_wait=retry_wait,
+            conditional_get=conditional_get,
+            remote_time=remote_time,
+            adaptive=adaptive,
+            tuning_callback=tuning_callback,
+            mirror_racing=mirror_racing,
+            progress_callback=progress_callback,
+        )
@@ -0,0 +1,382 @@
+"""多文件并行下载调度器"""
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Literal,
+    TypeAlias,
+    get_args,
+)
+
+from sd_webui_all_in_one.custom_exceptions import AggregateError
+from sd_webui_all_in_one.downloader.downloader import download_file
+from sd_webui_all_in_one.downloader.requests_downloader import (
+    DEFAULT_MAX_CONNECTION_PER_SERVER,
+    DEFAULT_SPLIT,
+    MAX_CONNECTION_PER_SERVER_MAX,
+    _url_host_key,
+)
+from sd_webui_all_in_one.downloader.types import DownloadToolType
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+DownloadFailurePolicy: TypeAlias = Literal["fail_fast", "continue"]
+"""并行下载任务失败时的处理策略"""
+
+DOWNLOAD_FAILURE_POLICY_LIST: list[str] = list(get_args(DownloadFailurePolicy))
+"""并行下载任务失败处理策略列表"""
+
+DEFAULT_MAX_CONNECTIONS = 64
+"""并行下载调度器默认的全局连接数预算"""
+
+DEFAULT_MAX_PARALLEL_FILES = 4
+"""并行下载调度器默认同时下载的文件数"""
+
+PROGRESS_REFRESH_INTERVAL = 0.5
+"""汇总进度条刷新已下载大小和速度的最小间隔 (秒)"""
+
+
+@dataclass(frozen=True)
+class DownloadTask:
+    """并行下载任务"""
+
+    url: str | Sequence[str]
+    """下载链接或同一文件的镜像链接列表"""
+
+    path: Path
+    """保存路径"""
+
+    save_name: str | None = None
+    """保存名称"""
+
+
+class DownloadSchedulerError(AggregateError):
+    """并行下载任务失败时抛出的异常, 同时携带已完成任务的保存路径
+
+    Attributes:
+        results (list[Path | None]):
+            与任务列表顺序一致的文件保存路径, 失败或未执行的任务为 None
+    """
+
+    def __init__(
+        self,
+        message: str,
+        exceptions: list[Exception],
+        results: list[Path | None],
+    ) -> None:
+        """初始化并行下载异常
+
+        Args:
+            message (str):
+                异常的总体描述信息
+            exceptions (list[Exception]):
+                下载失败的任务抛出的异常列表
+            results (list[Path | None]):
+                与任务列表顺序一致的文件保存路径, 失败或未执行的任务为 None
+        """
+        super().__init__(message, exceptions)
+        self.results = results
+
+
+class _ConnectionBudget:
+    """全局连接数预算与单服务器连接数限制
+
+    与 `_UriPool` 一样按 `_url_host_key` 统计每个服务器的连接数, 但在多个文件之间共享.
+    通过 `register()` 登记的待下载文件会平分连接数, 避免第一个文件占满同一服务器的所有连接,
+    使其他文件只能等待它下载完成
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_connection_per_server: int,
+        max_parallel_files: int = 1,
+    ) -> None:
+        self.max_connections = max(1, max_connections)
+        self.max_connection_per_server = max(1, max_connection_per_server)
+        self.max_parallel_files = max(1, max_parallel_files)
+        self.in_use = 0
+        self.in_flight: Counter[tuple[str, str, int | None]] = Counter()
+        self.pending_files: Counter[tuple[str, str, int | None]] = Counter()
+        self.condition = threading.Condition()
+
+    def register(
+        self,
+        url: str,
+    ) -> None:
+        """登记一个等待下载的文件"""
+        with self.condition:
+            self.pending_files[_url_host_key(url)] += 1
+
+    def unregister(
+        self,
+        url: str,
+    ) -> None:
+        """文件下载结束后取消登记"""
+        key = _url_host_key(url)
+        with self.condition:
+            self.pending_files[key] -= 1
+            if self.pending_files[key] <= 0:
+                del self.pending_files[key]
+            self.condition.notify_all()
+
+    def _fair_share(
+        self,
+        key: tuple[str, str, int | None],
+    ) -> int:
+        """按同时下载的文件数平分全局和单服务器连接数"""
+        total_files = min(max(1, self.pending_files.total()), self.max_parallel_files)
+        host_files = min(max(1, self.pending_files[key]), self.max_parallel_files)
+        return max(1, min(self.max_connections // total_files, self.max_connection_per_server // host_files))
+
+    def acquire(
+        self,
+        url: str,
+        wanted: int,
+        stop_event: threading.Event | None = None,
+    ) -> int:
+        """为一个文件申请连接, 返回实际分配到的连接数, 调度器停止时返回 0"""
+        key = _url_host_key(url)
+        wanted = max(1, wanted)
+        with self.condition:
+            while True:
+                if stop_event is not None and stop_event.is_set():
+                    return 0
+                granted = min(
+                    wanted,
+                    self._fair_share(key),
+                    self.max_connections - self.in_use,
+                    self.max_connection_per_server - self.in_flight[key],
+                )
+                if granted > 0:
+                    self.in_use += granted
+                    self.in_flight[key] += granted
+                    return granted
+                self.condition.wait(timeout=0.1)
+
+    def release(
+        self,
+        url: str,
+        count: int,
+    ) -> None:
+        if count <= 0:
+            return
+        key = _url_host_key(url)
+        with self.condition:
+            self.in_use = max(0, self.in_use - count)
+            self.in_flight[key] -= count
+            if self.in_flight[key] <= 0:
+                del self.in_flight[key]
+            self.condition.notify_all()
+
+
+def _primary_url(
+    url: str | Sequence[str],
+) -> str:
+    return url if isinstance(url, str) else url[0]
+
+
+class DownloadScheduler:
+    """多文件并行下载调度器
+
+    多个文件同时下载, 所有文件共享全局连接数预算, 同一服务器的连接数之和不超过单服务器连接数限制,
+    同时下载的文件平分连接数
+
+    Attributes:
+        tool (DownloadToolType):
+            下载工具
+        split (int):
+            单个文件最多使用的连接数
+        max_connections (int):
+            全局连接数预算
+        max_connection_per_server (int):
+            所有文件对同一服务器的连接数之和上限
+        max_parallel_files (int):
+            同时下载的文件数
+        failure_policy (DownloadFailurePolicy):
+            任务失败时的处理策略, `fail_fast` 时停止调度剩余任务, `continue` 时继续下载其他文件
+        progress (bool):
+            是否显示汇总进度条
+    """
+
+    def __init__(
+        self,
+        tool: DownloadToolType | None = "requests",
+        split: int = DEFAULT_SPLIT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connection_per_server: int = DEFAULT_MAX_CONNECTION_PER_SERVER,
+        max_parallel_files: int = DEFAULT_MAX_PARALLEL_FILES,
+        failure_policy: DownloadFailurePolicy = "fail_fast",
+        progress: bool = True,
+    ) -> None:
+        """并行下载调度器初始化
+
+        Args:
+            tool (DownloadToolType | None):
+                下载工具
+            split (int):
+                单个文件最多使用的连接数
+            max_connections (int):
+                全局连接数预算
+            max_connection_per_server (int):
+                所有文件对同一服务器的连接数之和上限
+            max_parallel_files (int):
+                同时下载的文件数
+            failure_policy (DownloadFailurePolicy):
+                任务失败时的处理策略
+            progress (bool):
+                是否显示汇总进度条
+
+        Raises:
+            ValueError:
+                失败处理策略不受支持时
+        """
+        if failure_policy not in DOWNLOAD_FAILURE_POLICY_LIST:
+            raise ValueError(f"不支持的失败处理策略: '{failure_policy}'")
+        self.tool: DownloadToolType = tool or "requests"
+        self.split = max(1, split)
+        self.max_connections = max(1, max_connections)
+        self.max_connection_per_server = max(1, max_connection_per_server)
+        self.max_parallel_files = max(1, max_parallel_files)
+        self.failure_policy: DownloadFailurePolicy = failure_policy
+        self.progress = progress
+
+    def run(
+        self,
+        tasks: Sequence[DownloadTask],
+    ) -> list[Path | None]:
+        """执行并行下载任务
+
+        Args:
+            tasks (Sequence[DownloadTask]):
+                下载任务列表
+
+        Returns:
+            list[Path | None]: 与任务列表顺序一致的文件保存路径, 未执行的任务为 None
+
+        Raises:
+            DownloadSchedulerError:
+                存在下载失败的任务时, 已完成任务的保存路径保存在异常的 `results` 中
+        """
+        try:
+            from tqdm import tqdm
+        except ImportError:
+            from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
+
+        results: list[Path | None] = [None] * len(tasks)
+        if not tasks:
+            return results
+
+        budget = _ConnectionBudget(self.max_connections, self.max_connection_per_server, self.max_parallel_files)
+        for task in tasks:
+            budget.register(_primary_url(task.url))
+        stop_event = threading.Event()
+        progress_lock = threading.Lock()
+        errors: list[Exception] = []
+        file_sizes = [0] * len(tasks)
+        downloaded_size = 0
+        last_refresh = 0.0
+        start_time = time.monotonic()
+
+        def _refresh_progress() -> None:
+            nonlocal last_refresh
+            last_refresh = time.monotonic()
+            elapsed = max(last_refresh - start_time, 1e-6)
+            progress_bar.set_postfix_str(f"{downloaded_size / 1024 / 1024:.1f} MB, {downloaded_size / 1024 / 1024 / elapsed:.2f} MB/s")
+
+        def _update_progress(index: int, delta: int) -> None:
+            nonlocal downloaded_size
+            with progress_lock:
+                file_sizes[index] += delta
+                downloaded_size += delta
+                if time.monotonic() - last_refresh >= PROGRESS_REFRESH_INTERVAL:
+                    _refresh_progress()
+
+        def _run_task(index: int) -> None:
+            try:
+                _download_task(index)
+            finally:
+                budget.unregister(_primary_url(tasks[index].url))
+
+        def _download_task(index: int) -> None:
+            nonlocal downloaded_size
+            task = tasks[index]
+            url = _primary_url(task.url)
+            connections = budget.acquire(url, self.split, stop_event)
+            if connections <= 0:
+                return
+            try:
+                logger.debug("调度下载 '%s', 分配连接数: %s", url, connections)
+                path = download_file(
+                    url=task.url,
+                    path=task.path,
+                    save_name=task.save_name,
+                    tool=self.tool,
+                    progress=False,
+                    split=connections,
+                    max_connection_per_server=min(connections, MAX_CONNECTION_PER_SERVER_MAX),
+                    progress_callback=lambda delta: _update_progress(index, delta),
+                )
+            except Exception:
+                if self.failure_policy == "fail_fast":
+                    stop_event.set()
+                raise
+            finally:
+                budget.release(url, connections)
+            results[index] = path
+            size = path.stat().st_size if path.is_file() else 0
+            with progress_lock:
+                # 不支持进度回调的下载工具或断点续传时, 以文件实际大小为准
+                downloaded_size += size - file_sizes[index]
+                file_sizes[index] = size
+                _refresh_progress()
+                progress_bar.update(1)
+
+        with tqdm(
+            total=len(tasks),
+            unit="file",
+            desc="并行下载",
+            disable=not self.progress,
+        ) as progress_bar:
+            with ThreadPoolExecutor(max_workers=min(self.max_parallel_files, len(tasks))) as executor:
+                futures = {executor.submit(_run_task, index): index for index in range(len(tasks))}
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    try:
+                        future.result()
+                    except Exception as e:
+                        index = futures[future]
+                        logger.error("下载 '%s' 时发生错误: %s", _primary_url(tasks[index].url), e)
+                        errors.append(e)
+                        if self.failure_policy == "fail_fast":
+                            for pending in futures:
+                                pending.cancel()
+
+        logger.info(
+            "并行下载结束: 成功 %s 个, 失败 %s 个, 共 %.1f MB, 用时 %.1fs",
+            sum(1 for result in results if result is not None),
+            len(errors),
+            downloaded_size / 1024 / 1024,
+            time.monotonic() - start_time,
+        )
+        if errors:
+            raise DownloadSchedulerError("执行并行下载任务时发生了错误", errors, results)
+        return results
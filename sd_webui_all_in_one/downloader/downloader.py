@@ -1,10 +1,11 @@
 """下载器"""
 
 import shutil
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from sd_webui_all_in_one.downloader.aria2_downloader import aria2
+from sd_webui_all_in_one.downloader.asyncio_downloader import download_file_from_url_asyncio
 from sd_webui_all_in_one.downloader.requests_downloader import (
     DEFAULT_MAX_CONNECTION_PER_SERVER,
     DEFAULT_MIN_SPLIT_SIZE,
@@ -78,6 +79,7 @@ def download_executer(
     retry_wait: int = 0,
     conditional_get: bool = False,
     remote_time: bool = True,
+    progress_callback: Callable[[int], None] | None = None,
 ) -> Path:
     """底层下载执行器
 
@@ -105,13 +107,15 @@ def download_executer(
         continue_download (bool):
             没有匹配控制文件时, 是否从已有文件推断断点续传进度
         max_tries (int):
-            requests 下载器单个分片的最大尝试次数
+            requests / asyncio 下载器单个分片的最大尝试次数
         retry_wait (int):
             HTTP 503 重试前等待秒数
         conditional_get (bool):
             已有本地文件时是否发送 If-Modified-Since, 远端返回 304 时复用本地文件
         remote_time (bool):
             下载完成后是否把本地文件 mtime 设置为远端 Last-Modified
+        progress_callback (Callable[[int], None] | None):
+            下载过程中接收新写入字节数的回调函数, 仅 requests / asyncio 下载器支持
 
     Returns:
         Path:
@@ -150,6 +154,25 @@ def download_executer(
             retry_wait=retry_wait,
             conditional_get=conditional_get,
             remote_time=remote_time,
+            progress_callback=progress_callback,
+        )
+    elif tool == "asyncio":
+        return download_file_from_url_asyncio(
+            url=url,
+            save_path=path,
+            file_name=save_name,
+            progress=progress,
+            split=split,
+            max_connection_per_server=max_connection_per_server,
+            min_split_size=min_split_size,
+            piece_length=piece_length,
+            allow_piece_length_change=allow_piece_length_change,
+            continue_download=continue_download,
+            max_tries=max_tries,
+            retry_wait=retry_wait,
+            conditional_get=conditional_get,
+            remote_time=remote_time,
+            progress_callback=progress_callback,
         )
     elif tool == "urllib":
         urllib_url = url if isinstance(url, str) else url[0]
@@ -173,6 +196,7 @@ def download_file(
     retry_wait: int = 0,
     conditional_get: bool = False,
     remote_time: bool = True,
+    progress_callback: Callable[[int], None] | None = None,
 ) -> Path:
     """下载文件工具
 
@@ -200,13 +224,15 @@ def download_file(
         continue_download (bool):
             没有匹配控制文件时, 是否从已有文件推断断点续传进度
         max_tries (int):
-            requests 下载器单个分片的最大尝试次数
+            requests / asyncio 下载器单个分片的最大尝试次数
         retry_wait (int):
             HTTP 503 重试前等待秒数
         conditional_get (bool):
             已有本地文件时是否发送 If-Modified-Since, 远端返回 304 时复用本地文件
         remote_time (bool):
             下载完成后是否把本地文件 mtime 设置为远端 Last-Modified
+        progress_callback (Callable[[int], None] | None):
+            下载过程中接收新写入字节数的回调函数, 仅 requests / asyncio 下载器支持
 
     Returns:
         Path: 保存的文件路径
@@ -242,4 +268,5 @@ def download_file(
         retry_wait=retry_wait,
         conditional_get=conditional_get,
         remote_time=remote_time,
+        progress_callback=progress_callback,
     )
@@ -5,17 +5,22 @@ import binascii
 import hashlib
 import json
 import math
+import mmap
+import os
 import re
+import struct
 import threading
 import time
 from collections import Counter
+from collections.abc import Iterator
 from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from email.utils import formatdate
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import cast
 from urllib.parse import unquote
 from urllib.parse import unquote_to_bytes
@@ -58,8 +63,11 @@ STREAM_CHUNK_SIZE = 1024 * 1024
 STATE_SAVE_COMPLETED_PIECE_INTERVAL = 8
 """断点续传状态写入间隔"""
 
-STATE_VERSION = 4
-"""HTTP Range 断点续传 JSON 状态版本"""
+STATE_VERSION = 5
+"""HTTP Range 断点续传二进制状态版本"""
+
+LEGACY_JSON_STATE_VERSION = 4
+"""可迁移到二进制状态的旧版 JSON 断点续传状态版本"""
 
 IN_FLIGHT_BLOCK_LENGTH = 16 * 1024
 """aria2 Piece 默认 block 大小"""
@@ -67,6 +75,30 @@ IN_FLIGHT_BLOCK_LENGTH = 16 * 1024
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 """分片下载时可重试的 HTTP 状态码"""
 
+ADAPTIVE_SAMPLE_INTERVAL = 1.0
+"""自适应连接数调节的吞吐量采样间隔 (秒)"""
+
+ADAPTIVE_INITIAL_CONNECTIONS = 4
+"""自适应连接数调节的初始连接数"""
+
+ADAPTIVE_GAIN_THRESHOLD = 0.1
+"""增加连接数后总吞吐量至少需要提升的比例, 否则回退到之前的连接数"""
+
+ADAPTIVE_REPROBE_THRESHOLD = 0.5
+"""总吞吐量低于最佳吞吐量的该比例时重新探测连接数"""
+
+SLOW_CONNECTION_RATIO = 0.5
+"""连接速度低于其他连接平均速度的该比例时, 空闲连接可以接管它的剩余 piece"""
+
+MIRROR_SAMPLE_INTERVAL = 0.5
+"""镜像竞速模式下记录单个连接吞吐量的间隔 (秒)"""
+
+MIRROR_THROUGHPUT_SMOOTHING = 0.3
+"""镜像竞速模式下服务器吞吐量指数滑动平均的平滑系数"""
+
+MIRROR_MAX_RETRYABLE_FAILURES = 3
+"""镜像竞速模式下服务器连续返回可重试状态码的次数达到该值时停止使用该服务器"""
+
 
 logger = get_logger(
     name=LOGGER_NAME,
@@ -76,9 +108,14 @@ logger = get_logger(
 
 _CONTENT_RANGE_RE = re.compile(r"(?:bytes\s+|bytes=)?(\d+)-(\d+)/(\d+|\*)", flags=re.IGNORECASE)
 _UNSATISFIED_CONTENT_RANGE_RE = re.compile(r"(?:bytes\s+|bytes=)?\*/(\d+|\*)", flags=re.IGNORECASE)
+_SHA256_HEX_RE = re.compile(r"[0-9a-fA-F]{64}")
 
-_STATE_FILE_DIGESTS: dict[Path, str] = {}
-_STATE_FILE_DIGEST_LOCK = threading.Lock()
+_STATE_MAGIC = b"SDAIORS\x00"
+_STATE_HEADER = struct.Struct("<8sIIQQQQ")
+_STATE_HASHED_PIECE_COUNT = struct.Struct("<Q")
+_STATE_HASHED_PIECE_COUNT_OFFSET = 40
+_STATE_IN_FLIGHT_LENGTH = struct.Struct("<I")
+_STATE_PIECE_HASH_SIZE = 32
 
 
 class _RangeDownloadNotSupported(RuntimeError):
@@ -156,6 +193,54 @@ class _DownloadOptions:
     continue_download: bool
     conditional_get: bool
     remote_time: bool
+    adaptive: bool = False
+    mirror_racing: bool = False
+
+
+@dataclass(frozen=True)
+class _DownloadBackend:
+    """下载流程中依赖具体 HTTP 客户端的实现, 断点续传状态、piece 分配和完成校验由所有后端共用"""
+
+    probe_remote_files: Callable[[list[str]], tuple[str, _RemoteFileInfo]]
+    """探测远端文件, 参数与 `_probe_remote_files` 相同"""
+
+    cached_file_not_modified: Callable[[list[str], Path], bool]
+    """检查本地文件是否未修改, 参数与 `_cached_file_not_modified` 相同"""
+
+    download_pieces: Callable[..., str | None]
+    """下载尚未完成的 piece, 参数与 `_download_pieces` 相同"""
+
+    download_file_single_stream: Callable[..., int]
+    """单连接下载整个文件, 参数与 `_download_file_single_stream` 相同"""
+
+
+@dataclass(frozen=True)
+class RangeDownloadTuning:
+    """HTTP Range 分片下载实际使用的连接参数"""
+
+    split: int
+    """允许使用的最大连接数"""
+
+    connections: int
+    """下载结束时选择的连接数"""
+
+    peak_connections: int
+    """下载过程中同时活动的最大连接数"""
+
+    max_connection_per_server: int
+    """单服务器最大连接数"""
+
+    min_split_size: int
+    """最小切分大小"""
+
+    piece_length: int
+    """piece 大小"""
+
+    throughput: float
+    """平均下载速度 (字节/秒)"""
+
+    stolen_pieces: int
+    """从慢速连接接管的 piece 数量"""
 
 
 @dataclass(frozen=True)
@@ -557,7 +642,13 @@ def _cached_file_not_modified(
 def _state_path_for(
     temp_file: Path,
 ) -> Path:
-    return temp_file.with_name(f"{temp_file.name}.state.json")
+    return temp_file.with_name(f"{temp_file.name}.state")
+
+
+def _legacy_state_path_for(
+    state_file: Path,
+) -> Path:
+    return state_file.with_name(f"{state_file.name}.json")
 
 
 def _state_temp_path_for(
@@ -571,14 +662,14 @@ def _cleanup_resume_files(
     state_file: Path,
 ) -> None:
     temp_file.unlink(missing_ok=True)
-    state_file.unlink(missing_ok=True)
-    _state_temp_path_for(state_file).unlink(missing_ok=True)
-    state_file.with_name(f"{state_file.name}.tmp").unlink(missing_ok=True)
-    with _STATE_FILE_DIGEST_LOCK:
-        _STATE_FILE_DIGESTS.pop(state_file, None)
+    legacy_state_file = _legacy_state_path_for(state_file)
+    for path in (state_file, legacy_state_file):
+        path.unlink(missing_ok=True)
+        _state_temp_path_for(path).unlink(missing_ok=True)
+        path.with_name(f"{path.name}.tmp").unlink(missing_ok=True)
 
 
-def _load_resume_state(
+def _load_legacy_resume_state(
     state_file: Path,
 ) -> dict[str, object]:
     try:
@@ -590,8 +681,6 @@ def _load_resume_state(
         raise _ResumeStateError(f"断点续传状态文件不是有效 JSON: {state_file}") from e
     if not isinstance(state, dict):
         raise _ResumeStateError("断点续传状态文件根节点必须是对象")
-    with _STATE_FILE_DIGEST_LOCK:
-        _STATE_FILE_DIGESTS[state_file] = hashlib.sha1(raw_state.encode("utf-8")).hexdigest()
     return state
 
 
@@ -787,16 +876,38 @@ def _in_flight_lengths_from_state(
     return lengths
 
 
-def _parse_resume_state(
+def _convert_resume_progress(
+    completed: list[bool],
+    in_flight_lengths: list[int],
+    *,
+    total_size: int,
+    saved_piece_length: int,
+    piece_length: int,
+    allow_piece_length_change: bool,
+) -> tuple[list[bool], list[int]]:
+    if saved_piece_length == piece_length:
+        return completed, in_flight_lengths
+    if (any(completed) or any(in_flight_lengths)) and not allow_piece_length_change:
+        raise _PieceLengthChangedError(f"检测到 piece_length 变化: 状态文件 {saved_piece_length}, 当前配置 {piece_length}")
+    converted_completed = _convert_completed_bitfield(
+        completed,
+        total_size=total_size,
+        source_piece_length=saved_piece_length,
+        target_piece_length=piece_length,
+    )
+    return converted_completed, [0] * len(converted_completed)
+
+
+def _parse_legacy_resume_state(
     state: dict[str, object],
     *,
     remote_info: _RemoteFileInfo,
     piece_length: int,
     allow_piece_length_change: bool,
-) -> tuple[list[bool], list[int]] | None:
+) -> tuple[list[bool], list[int]]:
     version = _require_state_int(state, "version")
-    if version != STATE_VERSION:
-        raise _ResumeStateError(f"断点续传状态版本不匹配: 期望 {STATE_VERSION}, 实际 {version}")
+    if version != LEGACY_JSON_STATE_VERSION:
+        raise _ResumeStateError(f"断点续传状态版本不匹配: 期望 {LEGACY_JSON_STATE_VERSION}, 实际 {version}")
     total_size = _require_state_int(state, "total_size")
     if total_size != remote_info.total_size:
         raise _ResumeStateError(f"断点续传状态文件大小不匹配: 期望 {remote_info.total_size}, 实际 {total_size}")
@@ -817,55 +928,343 @@ def _parse_resume_state(
         total_size=remote_info.total_size,
         completed=completed,
     )
-    if saved_piece_length != piece_length:
-        if (any(completed) or any(in_flight_lengths)) and not allow_piece_length_change:
-            raise _PieceLengthChangedError(f"检测到 piece_length 变化: 状态文件 {saved_piece_length}, 当前配置 {piece_length}")
-        converted_completed = _convert_completed_bitfield(
-            completed,
-            total_size=remote_info.total_size,
-            source_piece_length=saved_piece_length,
-            target_piece_length=piece_length,
-        )
-        return converted_completed, [0] * len(converted_completed)
-    return completed, in_flight_lengths
+    return _convert_resume_progress(
+        completed,
+        in_flight_lengths,
+        total_size=remote_info.total_size,
+        saved_piece_length=saved_piece_length,
+        piece_length=piece_length,
+        allow_piece_length_change=allow_piece_length_change,
+    )
 
 
-def _save_resume_state(
-    state_file: Path,
+def _piece_hashes_from_state(
+    state: dict[str, object],
     *,
+    piece_length: int,
+    completed: list[bool],
+) -> list[str]:
+    """读取状态文件中连续已完成 piece 前缀的 sha256, piece_length 变化或字段无效时返回空列表"""
+    piece_hashes = state.get("piece_sha256")
+    if state.get("piece_length") != piece_length or not isinstance(piece_hashes, list):
+        return []
+    result: list[str] = []
+    for index, digest in enumerate(piece_hashes):
+        if index >= len(completed) or not completed[index] or not isinstance(digest, str) or not _SHA256_HEX_RE.fullmatch(digest):
+            return []
+        result.append(digest.lower())
+    return result
+
+
+def _align8(
+    value: int,
+) -> int:
+    return (value + 7) & ~7
+
+
+@dataclass(frozen=True)
+class _ResumeStateLayout:
+    """二进制断点续传状态文件布局
+
+    固定文件头之后依次为元数据 JSON、completed bitfield、in-flight 长度数组 (uint32) 和连续已完成前缀的 piece sha256 数组
+    """
+
+    piece_count: int
+    metadata_length: int
+
+    @property
+    def metadata_offset(self) -> int:
+        return _STATE_HEADER.size
+
+    @property
+    def bitfield_offset(self) -> int:
+        return _align8(self.metadata_offset + self.metadata_length)
+
+    @property
+    def bitfield_length(self) -> int:
+        return math.ceil(self.piece_count / 8)
+
+    @property
+    def in_flight_offset(self) -> int:
+        return _align8(self.bitfield_offset + self.bitfield_length)
+
+    @property
+    def piece_hash_offset(self) -> int:
+        return _align8(self.in_flight_offset + self.piece_count * _STATE_IN_FLIGHT_LENGTH.size)
+
+    @property
+    def file_size(self) -> int:
+        return self.piece_hash_offset + self.piece_count * _STATE_PIECE_HASH_SIZE
+
+
+def _resume_state_metadata(
     urls: list[str],
     remote_info: _RemoteFileInfo,
-    options: _DownloadOptions,
-    piece_storage: "_PieceStorage",
-) -> None:
-    completed = piece_storage.snapshot_completed()
-    in_flight_pieces = piece_storage.snapshot_in_flight_pieces()
-    state = {
-        "version": STATE_VERSION,
+) -> dict[str, object]:
+    return {
         "url": urls[0],
         "uris": urls,
-        "total_size": remote_info.total_size,
         "etag": remote_info.etag,
         "last_modified": remote_info.last_modified,
         "digest_sha256": remote_info.digest_sha256,
         "content_disposition_filename": remote_info.content_disposition_filename,
         "content_encoding": remote_info.content_encoding,
-        "piece_length": options.piece_length,
-        "piece_count": len(completed),
-        "completed_bitfield": _bitfield_to_hex(completed),
-        "in_flight_pieces": in_flight_pieces,
     }
-    payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True)
-    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
-    with _STATE_FILE_DIGEST_LOCK:
-        if state_file.exists() and _STATE_FILE_DIGESTS.get(state_file) == digest:
+
+
+def _read_binary_resume_state(
+    state_file: Path,
+    *,
+    remote_info: _RemoteFileInfo,
+    piece_length: int,
+    allow_piece_length_change: bool,
+) -> tuple[list[bool], list[int], list[str]]:
+    try:
+        data = state_file.read_bytes()
+    except OSError as e:
+        raise _ResumeStateError(f"无法读取断点续传状态文件: {state_file}") from e
+    if len(data) < _STATE_HEADER.size:
+        raise _ResumeStateError(f"断点续传状态文件已损坏: {state_file}")
+    magic, version, metadata_length, total_size, saved_piece_length, saved_piece_count, hashed_piece_count = _STATE_HEADER.unpack_from(data)
+    if magic != _STATE_MAGIC:
+        raise _ResumeStateError(f"不是有效的断点续传状态文件: {state_file}")
+    if version != STATE_VERSION:
+        raise _ResumeStateError(f"断点续传状态版本不匹配: 期望 {STATE_VERSION}, 实际 {version}")
+    if total_size != remote_info.total_size:
+        raise _ResumeStateError(f"断点续传状态文件大小不匹配: 期望 {remote_info.total_size}, 实际 {total_size}")
+    if saved_piece_length <= 0:
+        raise _ResumeStateError("断点续传状态 piece_length 必须大于 0")
+    expected_saved_piece_count = _piece_count_for(total_size, saved_piece_length)
+    if saved_piece_count != expected_saved_piece_count:
+        raise _ResumeStateError(f"断点续传状态 piece_count 不匹配: 期望 {expected_saved_piece_count}, 实际 {saved_piece_count}")
+    layout = _ResumeStateLayout(piece_count=saved_piece_count, metadata_length=metadata_length)
+    if len(data) != layout.file_size:
+        raise _ResumeStateError(f"断点续传状态文件长度不匹配: 期望 {layout.file_size}, 实际 {len(data)}")
+    if hashed_piece_count > saved_piece_count:
+        raise _ResumeStateError(f"断点续传状态已校验 piece 数量越界: {hashed_piece_count}")
+
+    bitfield = data[layout.bitfield_offset : layout.bitfield_offset + layout.bitfield_length]
+    completed = _bitfield_from_hex(bitfield.hex(), saved_piece_count)
+    in_flight_lengths: list[int] = []
+    for index, (completed_length,) in enumerate(_STATE_IN_FLIGHT_LENGTH.iter_unpack(data[layout.in_flight_offset : layout.in_flight_offset + saved_piece_count * _STATE_IN_FLIGHT_LENGTH.size])):
+        piece_size = _piece_size_for(total_size=total_size, piece_length=saved_piece_length, index=index)
+        if completed_length and (completed[index] or completed_length >= piece_size):
+            raise _ResumeStateError(f"in-flight piece {index} completed_length 越界: {completed_length}")
+        in_flight_lengths.append(completed_length)
+
+    piece_hashes: list[str] = []
+    if saved_piece_length == piece_length:
+        for index in range(hashed_piece_count):
+            if not completed[index]:
+                piece_hashes = []
+                break
+            offset = layout.piece_hash_offset + index * _STATE_PIECE_HASH_SIZE
+            piece_hashes.append(data[offset : offset + _STATE_PIECE_HASH_SIZE].hex())
+
+    completed, in_flight_lengths = _convert_resume_progress(
+        completed,
+        in_flight_lengths,
+        total_size=total_size,
+        saved_piece_length=saved_piece_length,
+        piece_length=piece_length,
+        allow_piece_length_change=allow_piece_length_change,
+    )
+    return completed, in_flight_lengths, piece_hashes
+
+
+def _read_resume_state(
+    state_file: Path,
+    *,
+    remote_info: _RemoteFileInfo,
+    piece_length: int,
+    allow_piece_length_change: bool,
+) -> tuple[list[bool], list[int], list[str]]:
+    """读取断点续传状态, 二进制状态不存在时从旧版 JSON 状态迁移"""
+    if state_file.exists():
+        return _read_binary_resume_state(
+            state_file,
+            remote_info=remote_info,
+            piece_length=piece_length,
+            allow_piece_length_change=allow_piece_length_change,
+        )
+
+    legacy_state_file = _legacy_state_path_for(state_file)
+    state = _load_legacy_resume_state(legacy_state_file)
+    completed, in_flight_lengths = _parse_legacy_resume_state(
+        state,
+        remote_info=remote_info,
+        piece_length=piece_length,
+        allow_piece_length_change=allow_piece_length_change,
+    )
+    logger.debug("迁移旧版 JSON 断点续传状态: %s", legacy_state_file)
+    return completed, in_flight_lengths, _piece_hashes_from_state(state, piece_length=piece_length, completed=completed)
+
+
+class _ResumeStateFile:
+    """基于 mmap 的二进制断点续传状态文件
+
+    piece 状态变化时直接修改映射内存中的对应字节, 定期通过 `flush()` 执行 msync, 不再重复序列化整个状态
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        layout: _ResumeStateLayout,
+    ) -> None:
+        self.path = path
+        self.layout = layout
+        self.file = path.open("r+b")
+        self.mm: mmap.mmap | None = mmap.mmap(self.file.fileno(), layout.file_size)
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        *,
+        total_size: int,
+        piece_length: int,
+        metadata: dict[str, object],
+        completed: list[bool],
+        in_flight_lengths: list[int],
+    ) -> "_ResumeStateFile":
+        metadata_bytes = json.dumps(metadata, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        layout = _ResumeStateLayout(piece_count=len(completed), metadata_length=len(metadata_bytes))
+        tmp_path = _state_temp_path_for(path)
+        with tmp_path.open("wb") as file:
+            file.truncate(layout.file_size)
+            file.write(_STATE_HEADER.pack(_STATE_MAGIC, STATE_VERSION, len(metadata_bytes), total_size, piece_length, len(completed), 0))
+            file.write(metadata_bytes)
+            file.seek(layout.bitfield_offset)
+            file.write(bytes.fromhex(_bitfield_to_hex(completed)))
+            file.seek(layout.in_flight_offset)
+            file.write(b"".join(_STATE_IN_FLIGHT_LENGTH.pack(0 if done else length) for done, length in zip(completed, in_flight_lengths)))
+        tmp_path.replace(path)
+        return cls(path, layout)
+
+    def set_completed(
+        self,
+        index: int,
+        done: bool,
+    ) -> None:
+        if self.mm is None:
+            return
+        position = self.layout.bitfield_offset + index // 8
+        mask = 1 << (7 - index % 8)
+        self.mm[position] = self.mm[position] | mask if done else self.mm[position] & ~mask & 0xFF
+
+    def set_in_flight_length(
+        self,
+        index: int,
+        length: int,
+    ) -> None:
+        if self.mm is None:
+            return
+        _STATE_IN_FLIGHT_LENGTH.pack_into(self.mm, self.layout.in_flight_offset + index * _STATE_IN_FLIGHT_LENGTH.size, length)
+
+    def set_piece_hash(
+        self,
+        index: int,
+        digest: str,
+    ) -> None:
+        if self.mm is None:
+            return
+        offset = self.layout.piece_hash_offset + index * _STATE_PIECE_HASH_SIZE
+        self.mm[offset : offset + _STATE_PIECE_HASH_SIZE] = bytes.fromhex(digest)
+
+    def set_hashed_piece_count(
+        self,
+        count: int,
+    ) -> None:
+        if self.mm is None:
+            return
+        _STATE_HASHED_PIECE_COUNT.pack_into(self.mm, _STATE_HASHED_PIECE_COUNT_OFFSET, count)
+
+    def flush(self) -> None:
+        if self.mm is not None:
+            self.mm.flush()
+
+    def close(self) -> None:
+        if self.mm is not None:
+            self.mm.flush()
+            self.mm.close()
+            self.mm = None
+        self.file.close()
+
+
+def _preallocate_file(
+    path: Path,
+    size: int,
+) -> None:
+    """把文件扩展到 `size` 字节, 支持 `posix_fallocate` 时预先分配磁盘空间, 避免稀疏文件在分片乱序写入时产生碎片"""
+    with path.open("r+b") as file:
+        fallocate = getattr(os, "posix_fallocate", None)
+        if fallocate is not None and size > 0:
+            try:
+                fallocate(file.fileno(), 0, size)
+            except OSError as e:
+                logger.debug("无法为 '%s' 预分配磁盘空间, 将使用稀疏文件: %s", path, e)
+        file.truncate(size)
+
+
+class _PieceFileWriter:
+    """所有下载流共用的临时文件写入器
+
+    支持 `os.pwrite` 时各线程直接按偏移写入同一个文件描述符, 否则 (Windows) 在锁内定位后写入
+    """
+
+    def __init__(
+        self,
+        path: Path,
+    ) -> None:
+        self.fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+        self.lock = threading.Lock()
+
+    def write_at(
+        self,
+        offset: int,
+        data: memoryview,
+    ) -> None:
+        """把 `data` 写入文件的 `offset` 处, 写入的数据对其他文件描述符立即可见"""
+        if hasattr(os, "pwrite"):
+            while data:
+                written = os.pwrite(self.fd, data, offset)
+                data = data[written:]
+                offset += written
             return
+        with self.lock:
+            os.lseek(self.fd, offset, os.SEEK_SET)
+            while data:
+                written = os.write(self.fd, data)
+                data = data[written:]
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
 
-    tmp_state_file = _state_temp_path_for(state_file)
-    tmp_state_file.write_text(payload, encoding="utf-8")
-    tmp_state_file.replace(state_file)
-    with _STATE_FILE_DIGEST_LOCK:
-        _STATE_FILE_DIGESTS[state_file] = digest
+def _iter_response_chunks(
+    response: Any,
+    buffer: bytearray,
+) -> Iterator[memoryview]:
+    """依次返回响应内容, 底层流支持 `readinto` 时读入可复用的 `buffer` 以避免每个块分配新的 bytes
+
+    返回的 memoryview 在读取下一个块时会被覆盖, 使用方需要在迭代前处理完毕
+    """
+    raw = getattr(response, "raw", None)
+    readinto = getattr(raw, "readinto", None)
+    # raw 流不会解码 Content-Encoding, 有编码时交给 iter_content 处理
+    if callable(readinto) and not _content_encoding_requires_single_stream(_get_header(getattr(response, "headers", None), "Content-Encoding")):
+        view = memoryview(buffer)
+        while True:
+            size = readinto(view)
+            if not size:
+                return
+            yield view[:size]
+
+    for chunk in response.iter_content(chunk_size=len(buffer)):
+        if chunk:
+            yield memoryview(chunk)
 
 
 class _ThreadLocalSessionPool:
@@ -918,12 +1317,17 @@ class _ThreadLocalSessionPool:
 
 
 class _UriPool:
-    """aria2 FileEntry URI 池的简化实现"""
+    """aria2 FileEntry URI 池的简化实现
+
+    启用镜像竞速时按 `_url_host_key` 记录每个服务器的单连接吞吐量, 新的下载流优先分配给尚未测速或速度更快的服务器,
+    连续返回可重试状态码的服务器会被停止使用 (至少保留一个服务器)
+    """
 
     def __init__(
         self,
         urls: list[str],
         max_connection_per_server: int,
+        racing: bool = False,
     ) -> None:
         self.urls = list(urls)
         self.max_connection_per_server = max(1, max_connection_per_server)
@@ -931,6 +1335,10 @@ class _UriPool:
         self.in_flight: Counter[tuple[str, str, int | None]] = Counter()
         self.next_index = 0
         self.condition = threading.Condition()
+        self.racing = racing
+        self.host_rates: dict[tuple[str, str, int | None], float] = {}
+        self.host_failures: Counter[tuple[str, str, int | None]] = Counter()
+        self.dropped_hosts: set[tuple[str, str, int | None]] = set()
 
     @property
     def capacity(self) -> int:
@@ -942,19 +1350,18 @@ class _UriPool:
     ) -> str | None:
         with self.condition:
             while True:
-                for offset in range(len(self.urls)):
-                    index = (self.next_index + offset) % len(self.urls)
-                    key = self.keys[index]
-                    if self.in_flight[key] >= self.max_connection_per_server:
-                        continue
-                    self.in_flight[key] += 1
-                    self.next_index = (index + 1) % len(self.urls)
-                    return self.urls[index]
-
+                url = self._try_acquire_unlocked()
+                if url is not None:
+                    return url
                 if stop_event is not None and stop_event.is_set():
                     return None
                 self.condition.wait(timeout=0.1)
 
+    def try_acquire(self) -> str | None:
+        """不等待地获取一个可用的链接, 所有服务器的连接数都已达到上限时返回 None"""
+        with self.condition:
+            return self._try_acquire_unlocked()
+
     def release(
         self,
         url: str | None,
@@ -969,6 +1376,58 @@ class _UriPool:
                     del self.in_flight[key]
             self.condition.notify_all()
 
+    def record_throughput(
+        self,
+        url: str,
+        size: int,
+        elapsed: float,
+    ) -> None:
+        """记录一个连接在一段时间内的下载量, 更新服务器的吞吐量统计"""
+        if not self.racing or size <= 0 or elapsed <= 0:
+            return
+        key = _url_host_key(url)
+        rate = size / elapsed
+        with self.condition:
+            previous = self.host_rates.get(key)
+            self.host_rates[key] = rate if previous is None else MIRROR_THROUGHPUT_SMOOTHING * rate + (1 - MIRROR_THROUGHPUT_SMOOTHING) * previous
+            self.host_failures.pop(key, None)
+
+    def record_failure(
+        self,
+        url: str,
+    ) -> None:
+        """记录服务器返回可重试状态码, 连续失败次数过多时停止使用该服务器"""
+        if not self.racing:
+            return
+        key = _url_host_key(url)
+        with self.condition:
+            self.host_failures[key] += 1
+            if self.host_failures[key] < MIRROR_MAX_RETRYABLE_FAILURES or key in self.dropped_hosts:
+                return
+            if all(other == key or other in self.dropped_hosts for other in self.keys):
+                return
+            self.dropped_hosts.add(key)
+            self.condition.notify_all()
+        logger.warning("镜像 %s 连续 %s 次返回可重试状态码, 停止使用该镜像", url, MIRROR_MAX_RETRYABLE_FAILURES)
+
+    def _try_acquire_unlocked(self) -> str | None:
+        for index in self._candidate_order_unlocked():
+            key = self.keys[index]
+            if self.in_flight[key] >= self.max_connection_per_server:
+                continue
+            self.in_flight[key] += 1
+            self.next_index = (index + 1) % len(self.urls)
+            return self.urls[index]
+        return None
+
+    def _candidate_order_unlocked(self) -> list[int]:
+        order = [(self.next_index + offset) % len(self.urls) for offset in range(len(self.urls))]
+        if not self.racing:
+            return order
+        order = [index for index in order if self.keys[index] not in self.dropped_hosts]
+        # 尚未测速的服务器排在最前面以获得测速机会, 其余按吞吐量从高到低排列, 速度相同时保持轮询顺序
+        return sorted(order, key=lambda index: -self.host_rates.get(self.keys[index], math.inf))
+
 
 class _PieceStorage:
     """aria2 PieceStorage 的轻量 Python 实现"""
@@ -1001,30 +1460,16 @@ class _PieceStorage:
         self.in_use = [False] * self.piece_count
         self.in_use_owner: list[int | None] = [None] * self.piece_count
         self.owner_idle: dict[int, bool] = {}
+        self.completion_listener: Callable[[], None] | None = None
+        self.state_sink: _ResumeStateFile | None = None
 
     def snapshot_completed(self) -> list[bool]:
         with self.lock:
             return list(self.completed)
 
-    def snapshot_in_flight_pieces(self) -> list[dict[str, object]]:
+    def snapshot_in_flight_lengths(self) -> list[int]:
         with self.lock:
-            pieces: list[dict[str, object]] = []
-            for index, completed_length in enumerate(self.in_flight_lengths):
-                if completed_length <= 0 or self.completed[index]:
-                    continue
-                piece_size = self._piece_size_unlocked(index)
-                pieces.append(
-                    {
-                        "index": index,
-                        "length": piece_size,
-                        "completed_length": completed_length,
-                        "bitfield": _in_flight_bitfield_to_hex(
-                            piece_size=piece_size,
-                            completed_length=completed_length,
-                        ),
-                    }
-                )
-            return pieces
+            return list(self.in_flight_lengths)
 
     def completed_piece_count(self) -> int:
         with self.lock:
@@ -1089,6 +1534,47 @@ class _PieceStorage:
             self.owner_idle[owner_id] = True
             return self._segment_for_piece_unlocked(index, owner_id)
 
+    def find_steal_candidate(
+        self,
+        victim_owner_id: int,
+    ) -> int | None:
+        """查找可以从慢速连接接管的 piece
+
+        慢速连接尚未收到数据时直接接管它当前的 piece, 否则从它之后连续未分配的 piece 的中间开始接管, 慢速连接继续下载前半部分
+        """
+        with self.lock:
+            try:
+                index = self.in_use_owner.index(victim_owner_id)
+            except ValueError:
+                return None
+            if self.in_flight_lengths[index] == 0 and self.owner_idle.get(victim_owner_id, False):
+                return index
+            end = index + 1
+            while end < self.piece_count and not self.completed[end] and not self.in_use[end] and self.in_flight_lengths[end] == 0:
+                end += 1
+            if end == index + 1:
+                return None
+            return (index + 1 + end) // 2
+
+    def is_piece_complete(
+        self,
+        index: int,
+    ) -> bool:
+        with self.lock:
+            return 0 <= index < self.piece_count and self.completed[index]
+
+    def reset_piece(
+        self,
+        index: int,
+    ) -> None:
+        with self.lock:
+            if 0 <= index < self.piece_count:
+                self.completed[index] = False
+                self.in_flight_lengths[index] = 0
+                if self.state_sink is not None:
+                    self.state_sink.set_completed(index, False)
+                    self.state_sink.set_in_flight_length(index, 0)
+
     def mark_complete(
         self,
         segment: _Segment,
@@ -1100,10 +1586,15 @@ class _PieceStorage:
                     self.completed[index] = True
                     self.in_flight_lengths[index] = 0
                     newly_completed += 1
+                    if self.state_sink is not None:
+                        self.state_sink.set_completed(index, True)
+                        self.state_sink.set_in_flight_length(index, 0)
                 if self.in_use_owner[index] == segment.owner_id:
                     self.in_use[index] = False
                     self.in_use_owner[index] = None
-            return newly_completed
+        if newly_completed and self.completion_listener is not None:
+            self.completion_listener()
+        return newly_completed
 
     def record_progress(
         self,
@@ -1120,6 +1611,8 @@ class _PieceStorage:
             in_flight_length = max(0, min(next_offset - piece_start, piece_size))
             if in_flight_length > self.in_flight_lengths[index]:
                 self.in_flight_lengths[index] = in_flight_length
+                if self.state_sink is not None and in_flight_length < piece_size:
+                    self.state_sink.set_in_flight_length(index, in_flight_length)
 
     def refresh_segment(
         self,
@@ -1250,49 +1743,296 @@ class _PieceStorage:
         return current_previous_completed and not best_previous_completed
 
 
-class _SegmentManager:
-    """aria2 SegmentMan 的轻量 Python 实现"""
+class _StreamingSha256:
+    """下载过程中按 piece 顺序增量计算整个文件的 sha256
+
+    每当连续已完成的前缀增长时立即读取新完成的 piece (此时数据仍在页缓存中) 并更新哈希, 同时记录每个 piece 的 sha256 写入断点续传状态.
+    恢复下载时, 已记录哈希的 piece 在重建整体哈希的同时完成校验, 校验失败的 piece 会被重新下载
+    """
 
     def __init__(
         self,
-        piece_storage: _PieceStorage,
-        min_split_size: int,
+        temp_file: Path,
+        piece_storage: "_PieceStorage",
+        piece_hashes: list[str] | None = None,
     ) -> None:
+        self.temp_file = temp_file
         self.piece_storage = piece_storage
-        self.min_split_size = min_split_size
-
-    def get_segment(
-        self,
-        owner_id: int = 0,
-    ) -> _Segment | None:
-        return self.piece_storage.check_out_segment(self.min_split_size, owner_id)
+        self.expected_piece_hashes = list(piece_hashes or [])
+        self.piece_hashes: list[str] = []
+        self.hash = hashlib.sha256()
+        self.lock = threading.Lock()
+        self.state_sink: _ResumeStateFile | None = None
 
-    def get_next_segment(
-        self,
-        segment: _Segment,
-    ) -> _Segment | None:
-        next_index = segment.end_piece + 1
-        next_segment = self.piece_storage.check_out_clean_piece(next_index, segment.owner_id)
-        if next_segment is not None:
-            return next_segment
-        return self.piece_storage.check_out_clean_idle_piece(next_index, segment.owner_id)
+    @property
+    def next_index(self) -> int:
+        return len(self.piece_hashes)
 
-    def mark_complete(
+    def _append_piece_hash(
         self,
-        segment: _Segment,
-    ) -> int:
-        return self.piece_storage.mark_complete(segment)
+        digest: str,
+    ) -> None:
+        index = len(self.piece_hashes)
+        self.piece_hashes.append(digest)
+        if self.state_sink is not None:
+            self.state_sink.set_piece_hash(index, digest)
+            self.state_sink.set_hashed_piece_count(index + 1)
 
-    def record_progress(
+    def advance(
         self,
-        segment: _Segment,
-        next_offset: int,
+        blocking: bool = False,
     ) -> None:
-        self.piece_storage.record_progress(segment, next_offset)
+        """哈希连续已完成前缀中尚未处理的 piece, 非阻塞模式下已有线程在处理时直接返回"""
+        if not self.lock.acquire(blocking=blocking):
+            return
+        try:
+            self._advance_unlocked()
+        finally:
+            self.lock.release()
 
-    def refresh_segment(
+    def verify_resumed_pieces(self) -> int:
+        """校验断点续传状态中记录了哈希的 piece, 返回校验失败并重置的 piece 数量"""
+        with self.lock:
+            piece_storage = self.piece_storage
+            expected_piece_hashes = self.expected_piece_hashes
+            self.expected_piece_hashes = []
+            corrupted = 0
+            with self.temp_file.open("rb") as file:
+                for index, expected in enumerate(expected_piece_hashes):
+                    data = self._read_piece(file, index)
+                    digest = hashlib.sha256(data).hexdigest()
+                    if digest != expected:
+                        logger.warning("piece %s 的 sha256 与断点续传状态不一致, 将重新下载", index)
+                        piece_storage.reset_piece(index)
+                        corrupted += 1
+                    elif corrupted == 0:
+                        self.hash.update(data)
+                        self._append_piece_hash(digest)
+            return corrupted
+
+    def hexdigest(self) -> str | None:
+        """完成剩余 piece 的哈希并返回整个文件的 sha256, 文件未完整时返回 None"""
+        with self.lock:
+            self._advance_unlocked()
+            if self.next_index < self.piece_storage.piece_count:
+                return None
+            return self.hash.hexdigest()
+
+    def _read_piece(
         self,
-        segment: _Segment,
+        file: Any,
+        index: int,
+    ) -> bytes:
+        piece_storage = self.piece_storage
+        file.seek(index * piece_storage.piece_length)
+        return file.read(_piece_size_for(total_size=piece_storage.total_size, piece_length=piece_storage.piece_length, index=index))
+
+    def _advance_unlocked(self) -> None:
+        piece_storage = self.piece_storage
+        if self.next_index >= piece_storage.piece_count or not piece_storage.is_piece_complete(self.next_index):
+            return
+        with self.temp_file.open("rb") as file:
+            while self.next_index < piece_storage.piece_count and piece_storage.is_piece_complete(self.next_index):
+                data = self._read_piece(file, self.next_index)
+                self.hash.update(data)
+                self._append_piece_hash(hashlib.sha256(data).hexdigest())
+
+
+class _AdaptiveConnectionController:
+    """根据实测吞吐量调节活动连接数
+
+    从较少的连接开始, 每个采样周期统计各连接的下载速度: 总吞吐量随连接数增加而明显提升时继续翻倍, 否则回退到吞吐量最佳的连接数.
+    网络状况明显变化导致吞吐量大幅下降时重新开始探测
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        initial_workers: int | None = None,
+        sample_interval: float | None = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.target = max(1, min(self.max_workers, initial_workers or ADAPTIVE_INITIAL_CONNECTIONS))
+        self.sample_interval = ADAPTIVE_SAMPLE_INTERVAL if sample_interval is None else sample_interval
+        self.lock = threading.Lock()
+        self.active_owners: set[int] = set()
+        self.peak_workers = 0
+        self.sample_bytes: Counter[int] = Counter()
+        self.owner_rates: dict[int, float] = {}
+        self.best_rate = 0.0
+        self.best_target = self.target
+        self.saturated = self.target >= self.max_workers
+        self.stolen_pieces = 0
+        self.last_sample_time = time.monotonic()
+
+    def worker_started(
+        self,
+        owner_id: int,
+    ) -> None:
+        with self.lock:
+            self.active_owners.add(owner_id)
+            self.peak_workers = max(self.peak_workers, len(self.active_owners))
+
+    def worker_finished(
+        self,
+        owner_id: int,
+    ) -> None:
+        with self.lock:
+            self.active_owners.discard(owner_id)
+            self.owner_rates.pop(owner_id, None)
+
+    def record(
+        self,
+        owner_id: int,
+        size: int,
+    ) -> None:
+        with self.lock:
+            self.sample_bytes[owner_id] += size
+
+    def record_steal(self) -> None:
+        with self.lock:
+            self.stolen_pieces += 1
+
+    def over_target(self) -> bool:
+        with self.lock:
+            return len(self.active_owners) > self.target
+
+    def try_retire(
+        self,
+        owner_id: int,
+    ) -> bool:
+        """活动连接数超过目标值时让该 worker 退出"""
+        with self.lock:
+            if len(self.active_owners) <= self.target:
+                return False
+            self.active_owners.discard(owner_id)
+            self.owner_rates.pop(owner_id, None)
+            return True
+
+    def missing_workers(self) -> int:
+        with self.lock:
+            return max(0, self.target - len(self.active_owners))
+
+    def slowest_owner(
+        self,
+        exclude: int,
+    ) -> int | None:
+        """返回速度明显低于其他连接的最慢连接, 不存在时返回 None"""
+        with self.lock:
+            rates = {owner: rate for owner, rate in self.owner_rates.items() if owner != exclude and owner in self.active_owners}
+        if len(rates) < 2:
+            return None
+        slowest = min(rates, key=lambda owner: rates[owner])
+        others = [rate for owner, rate in rates.items() if owner != slowest]
+        if rates[slowest] < SLOW_CONNECTION_RATIO * (sum(others) / len(others)):
+            return slowest
+        return None
+
+    def sample(
+        self,
+        now: float | None = None,
+    ) -> bool:
+        """到达采样间隔时统计各连接速度并调整目标连接数, 返回是否进行了采样"""
+        now = time.monotonic() if now is None else now
+        with self.lock:
+            elapsed = now - self.last_sample_time
+            if elapsed < self.sample_interval:
+                return False
+            self.last_sample_time = now
+            self.owner_rates = {owner: self.sample_bytes.get(owner, 0) / elapsed for owner in self.active_owners}
+            self.sample_bytes.clear()
+            if len(self.active_owners) < self.target:
+                # worker 尚未全部启动或剩余任务不足, 此时的吞吐量不能反映目标连接数
+                return True
+            rate = sum(self.owner_rates.values())
+            if not self.saturated:
+                if rate > self.best_rate * (1 + ADAPTIVE_GAIN_THRESHOLD):
+                    self.best_rate = rate
+                    self.best_target = self.target
+                    self.target = min(self.max_workers, self.target * 2)
+                    self.saturated = self.target == self.best_target
+                else:
+                    self.target = self.best_target
+                    self.saturated = True
+                logger.debug("自适应连接数调整为 %s, 总吞吐量 %.2f MB/s", self.target, rate / 1024 / 1024)
+            elif rate < self.best_rate * ADAPTIVE_REPROBE_THRESHOLD and self.target < self.max_workers:
+                self.best_rate = rate
+                self.best_target = self.target
+                self.saturated = False
+            return True
+
+
+class _SegmentManager:
+    """aria2 SegmentMan 的轻量 Python 实现"""
+
+    def __init__(
+        self,
+        piece_storage: _PieceStorage,
+        min_split_size: int,
+        controller: "_AdaptiveConnectionController | None" = None,
+    ) -> None:
+        self.piece_storage = piece_storage
+        self.min_split_size = min_split_size
+        self.controller = controller
+
+    def get_segment(
+        self,
+        owner_id: int = 0,
+    ) -> _Segment | None:
+        segment = self.piece_storage.check_out_segment(self.min_split_size, owner_id)
+        if segment is None and self.controller is not None:
+            segment = self.steal_segment(owner_id)
+        return segment
+
+    def steal_segment(
+        self,
+        owner_id: int,
+    ) -> _Segment | None:
+        """与 aria2 替换最慢连接类似, 没有可分配的 piece 时接管最慢连接的剩余 piece"""
+        if self.controller is None:
+            return None
+        victim_owner_id = self.controller.slowest_owner(exclude=owner_id)
+        if victim_owner_id is None:
+            return None
+        index = self.piece_storage.find_steal_candidate(victim_owner_id)
+        if index is None:
+            return None
+        segment = self.piece_storage.check_out_clean_idle_piece(index, owner_id)
+        if segment is not None:
+            self.controller.record_steal()
+            logger.debug("连接 %s 接管了慢速连接 %s 的 piece %s", owner_id, victim_owner_id, index)
+        return segment
+
+    def get_next_segment(
+        self,
+        segment: _Segment,
+    ) -> _Segment | None:
+        if self.controller is not None and self.controller.over_target():
+            # 连接数需要减少, 结束当前下载流以便 worker 退出
+            return None
+        next_index = segment.end_piece + 1
+        next_segment = self.piece_storage.check_out_clean_piece(next_index, segment.owner_id)
+        if next_segment is not None:
+            return next_segment
+        return self.piece_storage.check_out_clean_idle_piece(next_index, segment.owner_id)
+
+    def mark_complete(
+        self,
+        segment: _Segment,
+    ) -> int:
+        return self.piece_storage.mark_complete(segment)
+
+    def record_progress(
+        self,
+        segment: _Segment,
+        next_offset: int,
+    ) -> None:
+        self.piece_storage.record_progress(segment, next_offset)
+
+    def refresh_segment(
+        self,
+        segment: _Segment,
     ) -> _Segment | None:
         return self.piece_storage.refresh_segment(segment)
 
@@ -1377,7 +2117,8 @@ def _download_stream_once(
     request_client: Any,
     *,
     url: str,
-    temp_file: Path,
+    file_writer: _PieceFileWriter,
+    read_buffer: bytearray,
     segment: _Segment,
     total_size: int,
     timeout: int,
@@ -1398,45 +2139,41 @@ def _download_stream_once(
         _validate_range_response(response, segment=segment, total_size=total_size, attempt=attempt, retry_wait=retry_wait)
 
         offset = segment.start
-        with temp_file.open("r+b") as file:
-            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
-                if not chunk:
-                    continue
-                chunk_offset = 0
-                while chunk_offset < len(chunk):
+        for chunk in _iter_response_chunks(response, read_buffer):
+            chunk_offset = 0
+            while chunk_offset < len(chunk):
+                if current_segment is None:
+                    if last_complete_segment is None:
+                        return
+                    current_segment = segment_manager.get_next_segment(last_complete_segment)
                     if current_segment is None:
-                        if last_complete_segment is None:
-                            return
-                        current_segment = segment_manager.get_next_segment(last_complete_segment)
-                        if current_segment is None:
-                            return
-                        offset = current_segment.start
-                        partial_reported_size = 0
-
-                    writable_size = min(len(chunk) - chunk_offset, current_segment.end - offset + 1)
-                    if writable_size <= 0:
-                        mark_complete_callback(current_segment)
-                        last_complete_segment = current_segment
-                        current_segment = None
-                        partial_reported_size = 0
-                        continue
-
-                    if not segment_manager.owns_segment(current_segment):
-                        raise _SegmentOwnershipLost()
-                    file.seek(offset)
-                    file.write(chunk[chunk_offset : chunk_offset + writable_size])
-                    offset += writable_size
-                    chunk_offset += writable_size
-                    partial_reported_size += writable_size
-                    segment_manager.record_progress(current_segment, offset)
-                    if progress_callback is not None:
-                        progress_callback(writable_size)
-
-                    if offset > current_segment.end:
-                        mark_complete_callback(current_segment)
-                        last_complete_segment = current_segment
-                        current_segment = None
-                        partial_reported_size = 0
+                        return
+                    offset = current_segment.start
+                    partial_reported_size = 0
+
+                writable_size = min(len(chunk) - chunk_offset, current_segment.end - offset + 1)
+                if writable_size <= 0:
+                    mark_complete_callback(current_segment)
+                    last_complete_segment = current_segment
+                    current_segment = None
+                    partial_reported_size = 0
+                    continue
+
+                if not segment_manager.owns_segment(current_segment):
+                    raise _SegmentOwnershipLost()
+                file_writer.write_at(offset, chunk[chunk_offset : chunk_offset + writable_size])
+                offset += writable_size
+                chunk_offset += writable_size
+                partial_reported_size += writable_size
+                segment_manager.record_progress(current_segment, offset)
+                if progress_callback is not None:
+                    progress_callback(writable_size)
+
+                if offset > current_segment.end:
+                    mark_complete_callback(current_segment)
+                    last_complete_segment = current_segment
+                    current_segment = None
+                    partial_reported_size = 0
 
         if current_segment is not None:
             raise IOError(f"分片大小不匹配: 期望 {current_segment.size}, 实际 {partial_reported_size}")
@@ -1450,11 +2187,46 @@ def _download_stream_once(
         _close_response(response)
 
 
+class _StreamThroughputMeter:
+    """统计单个下载流的吞吐量并定期写入 `_UriPool` 的服务器统计"""
+
+    def __init__(
+        self,
+        uri_pool: _UriPool,
+        url: str,
+        progress_callback: Any | None = None,
+    ) -> None:
+        self.uri_pool = uri_pool
+        self.url = url
+        self.progress_callback = progress_callback
+        self.sample_start = time.monotonic()
+        self.sample_size = 0
+
+    def update(
+        self,
+        size: int,
+    ) -> None:
+        self.sample_size += size
+        now = time.monotonic()
+        if now - self.sample_start >= MIRROR_SAMPLE_INTERVAL:
+            self.uri_pool.record_throughput(self.url, self.sample_size, now - self.sample_start)
+            self.sample_start = now
+            self.sample_size = 0
+        if self.progress_callback is not None:
+            self.progress_callback(size)
+
+    def flush(self) -> None:
+        if self.sample_size > 0:
+            self.uri_pool.record_throughput(self.url, self.sample_size, time.monotonic() - self.sample_start)
+            self.sample_size = 0
+
+
 def _download_stream_with_retries(
     session_pool: _ThreadLocalSessionPool,
     *,
     uri_pool: _UriPool,
-    temp_file: Path,
+    file_writer: _PieceFileWriter,
+    read_buffer: bytearray,
     segment: _Segment,
     total_size: int,
     timeout: int,
@@ -1473,11 +2245,13 @@ def _download_stream_with_retries(
         if url is None:
             segment_manager.release(segment)
             return
+        meter = _StreamThroughputMeter(uri_pool, url, progress_callback) if uri_pool.racing else None
         try:
             return _download_stream_once(
                 session_pool.get(),
                 url=url,
-                temp_file=temp_file,
+                file_writer=file_writer,
+                read_buffer=read_buffer,
                 segment=segment,
                 total_size=total_size,
                 timeout=timeout,
@@ -1485,13 +2259,15 @@ def _download_stream_with_retries(
                 retry_wait=retry_wait,
                 segment_manager=segment_manager,
                 mark_complete_callback=mark_complete_callback,
-                progress_callback=progress_callback,
+                progress_callback=meter.update if meter is not None else progress_callback,
             )
         except _RangeDownloadNotSupported:
             raise
         except _SegmentOwnershipLost:
             return
         except _SegmentDownloadError as e:
+            if isinstance(e.error, _RangeDownloadTemporaryError):
+                uri_pool.record_failure(url)
             failed_range = e.segment.byte_range
             segment_manager.release(e.segment)
             new_segment = segment_manager.get_segment(e.segment.owner_id)
@@ -1513,6 +2289,8 @@ def _download_stream_with_retries(
             )
             time.sleep(delay)
         finally:
+            if meter is not None:
+                meter.flush()
             uri_pool.release(url)
     segment_manager.release(segment)
     raise IOError(f"分片 {segment.byte_range} 下载失败: {last_error}") from last_error
@@ -1526,46 +2304,47 @@ def _download_file_with_ranges(
     progress: bool,
     options: _DownloadOptions,
     timeout: int = 60,
-) -> None:
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
+    verify_sha256: bool = False,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None = None,
+    pieces_downloader: Callable[..., str | None] | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+) -> str | None:
+    """使用 HTTP Range 分片下载文件
+
+    `pieces_downloader` 为实际下载 piece 的函数, 参数与 `_download_pieces` 相同, 为 None 时使用基于线程的 `_download_pieces`
 
+    Returns:
+        (str | None): `verify_sha256` 为 True 时返回下载过程中增量计算的整个文件 sha256, 否则返回 None
+    """
     if remote_info.total_size <= 0:
         raise _RangeDownloadNotSupported("远端未提供可分片下载的文件大小")
 
     seed_storage = _PieceStorage(total_size=remote_info.total_size, piece_length=options.piece_length)
-    state_exists = state_file.exists()
+    legacy_state_file = _legacy_state_path_for(state_file)
+    state_exists = state_file.exists() or legacy_state_file.exists()
     temp_exists = temp_file.exists()
     temp_size = temp_file.stat().st_size if temp_exists else 0
     if state_exists and not temp_exists:
         state_file.unlink(missing_ok=True)
+        legacy_state_file.unlink(missing_ok=True)
         state_exists = False
-    state = _load_resume_state(state_file) if state_exists else None
 
+    resumed_piece_hashes: list[str] = []
     if state_exists and temp_exists:
         if temp_size != remote_info.total_size:
             raise _ResumeStateError(f"临时文件大小与断点续传状态不匹配: 期望 {remote_info.total_size}, 实际 {temp_size}")
-        parsed_state = _parse_resume_state(
-            state or {},
+        completed, in_flight_lengths, resumed_piece_hashes = _read_resume_state(
+            state_file,
             remote_info=remote_info,
             piece_length=options.piece_length,
             allow_piece_length_change=options.allow_piece_length_change,
         )
-        if parsed_state is None:
-            _cleanup_resume_files(temp_file, state_file)
-            with temp_file.open("wb") as file:
-                file.truncate(remote_info.total_size)
-            piece_storage = seed_storage
-        else:
-            completed, in_flight_lengths = parsed_state
-            piece_storage = _PieceStorage(
-                total_size=remote_info.total_size,
-                piece_length=options.piece_length,
-                completed=completed,
-                in_flight_lengths=in_flight_lengths,
-            )
+        piece_storage = _PieceStorage(
+            total_size=remote_info.total_size,
+            piece_length=options.piece_length,
+            completed=completed,
+            in_flight_lengths=in_flight_lengths,
+        )
     elif options.continue_download and not state_exists and temp_exists and 0 < temp_size <= remote_info.total_size:
         completed_piece_count = temp_size // options.piece_length
         partial_piece_length = temp_size % options.piece_length
@@ -1573,8 +2352,7 @@ def _download_file_with_ranges(
         in_flight_lengths = [0] * seed_storage.piece_count
         if completed_piece_count < seed_storage.piece_count:
             in_flight_lengths[completed_piece_count] = partial_piece_length
-        with temp_file.open("r+b") as file:
-            file.truncate(remote_info.total_size)
+        _preallocate_file(temp_file, remote_info.total_size)
         piece_storage = _PieceStorage(
             total_size=remote_info.total_size,
             piece_length=options.piece_length,
@@ -1583,33 +2361,94 @@ def _download_file_with_ranges(
         )
     else:
         _cleanup_resume_files(temp_file, state_file)
-        with temp_file.open("wb") as file:
-            file.truncate(remote_info.total_size)
+        temp_file.touch()
+        _preallocate_file(temp_file, remote_info.total_size)
         piece_storage = seed_storage
 
-    segment_manager = _SegmentManager(piece_storage, options.min_split_size)
+    # 每次都按当前 piece_length 重建二进制状态文件, 旧版 JSON 状态在此完成迁移
+    resume_state = _ResumeStateFile.create(
+        state_file,
+        total_size=remote_info.total_size,
+        piece_length=piece_storage.piece_length,
+        metadata=_resume_state_metadata(urls, remote_info),
+        completed=piece_storage.snapshot_completed(),
+        in_flight_lengths=piece_storage.snapshot_in_flight_lengths(),
+    )
+    legacy_state_file.unlink(missing_ok=True)
+    piece_storage.state_sink = resume_state
+    try:
+        return (pieces_downloader or _download_pieces)(
+            urls,
+            temp_file=temp_file,
+            remote_info=remote_info,
+            progress=progress,
+            options=options,
+            timeout=timeout,
+            piece_storage=piece_storage,
+            resume_state=resume_state,
+            resumed_piece_hashes=resumed_piece_hashes if verify_sha256 else None,
+            tuning_callback=tuning_callback,
+            progress_callback=progress_callback,
+        )
+    finally:
+        piece_storage.state_sink = None
+        resume_state.close()
+
+
+def _download_pieces(
+    urls: list[str],
+    *,
+    temp_file: Path,
+    remote_info: _RemoteFileInfo,
+    progress: bool,
+    options: _DownloadOptions,
+    timeout: int,
+    piece_storage: _PieceStorage,
+    resume_state: _ResumeStateFile,
+    resumed_piece_hashes: list[str] | None,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+) -> str | None:
+    """使用多个连接下载 `piece_storage` 中尚未完成的 piece, `resumed_piece_hashes` 为 None 时不计算 sha256
+
+    `progress_callback` 在每次写入数据后以新写入的字节数调用
+    """
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
+
+    hasher: _StreamingSha256 | None = None
+    if resumed_piece_hashes is not None:
+        hasher = _StreamingSha256(temp_file, piece_storage, resumed_piece_hashes)
+        hasher.state_sink = resume_state
+        if hasher.verify_resumed_pieces() > 0:
+            logger.warning("'%s' 中部分已下载的 piece 校验失败, 将重新下载这些 piece", temp_file)
+        piece_storage.completion_listener = hasher.advance
+
     completed_size = piece_storage.completed_size()
     progress_lock = threading.Lock()
     state_lock = threading.Lock()
     stop_event = threading.Event()
     range_ignored_event = threading.Event()
     completed_since_state_save = 0
-    uri_pool = _UriPool(urls, options.max_connection_per_server)
+    uri_pool = _UriPool(urls, options.max_connection_per_server, racing=options.mirror_racing)
     worker_count = max(1, min(options.split, piece_storage.piece_count, uri_pool.capacity))
+    controller = _AdaptiveConnectionController(worker_count) if options.adaptive else None
+    segment_manager = _SegmentManager(piece_storage, options.min_split_size, controller)
     session_pool = _ThreadLocalSessionPool(pool_size=worker_count)
+    file_writer = _PieceFileWriter(temp_file)
 
     def _update_progress(delta: int) -> None:
+        if controller is not None:
+            controller.record(threading.get_ident(), delta)
         with progress_lock:
             progress_bar.update(delta)
+        if progress_callback is not None:
+            progress_callback(delta)
 
     def _flush_state() -> None:
-        _save_resume_state(
-            state_file,
-            urls=urls,
-            remote_info=remote_info,
-            options=options,
-            piece_storage=piece_storage,
-        )
+        resume_state.flush()
 
     def _mark_segment_complete(segment: _Segment) -> None:
         nonlocal completed_since_state_save
@@ -1622,7 +2461,20 @@ def _download_file_with_ranges(
 
     def _worker() -> None:
         owner_id = threading.get_ident()
+        if controller is None:
+            _download_segments(owner_id)
+            return
+        controller.worker_started(owner_id)
+        try:
+            _download_segments(owner_id)
+        finally:
+            controller.worker_finished(owner_id)
+
+    def _download_segments(owner_id: int) -> None:
+        read_buffer = bytearray(STREAM_CHUNK_SIZE)
         while not stop_event.is_set():
+            if controller is not None and controller.try_retire(owner_id):
+                return
             segment = segment_manager.get_segment(owner_id)
             if segment is None:
                 return
@@ -1630,7 +2482,8 @@ def _download_file_with_ranges(
                 _download_stream_with_retries(
                     session_pool,
                     uri_pool=uri_pool,
-                    temp_file=temp_file,
+                    file_writer=file_writer,
+                    read_buffer=read_buffer,
                     segment=segment,
                     total_size=remote_info.total_size,
                     timeout=timeout,
@@ -1649,6 +2502,7 @@ def _download_file_with_ranges(
                 segment_manager.release(segment)
                 raise
 
+    start_time = time.monotonic()
     with tqdm(
         total=remote_info.total_size,
         initial=completed_size,
@@ -1660,21 +2514,36 @@ def _download_file_with_ranges(
         try:
             if not piece_storage.is_complete():
                 with ThreadPoolExecutor(max_workers=worker_count) as executor:
-                    futures = [executor.submit(_worker) for _ in range(worker_count)]
-                    for future in as_completed(futures):
-                        try:
-                            future.result()
-                        except Exception:
-                            stop_event.set()
-                            for pending in futures:
-                                pending.cancel()
-                            raise
+                    futures: list[Future[None]] = [executor.submit(_worker) for _ in range(controller.target if controller is not None else worker_count)]
+                    running = set(futures)
+                    while running:
+                        done, running = wait(
+                            running,
+                            timeout=controller.sample_interval if controller is not None else None,
+                            return_when=FIRST_COMPLETED,
+                        )
+                        for future in done:
+                            try:
+                                future.result()
+                            except Exception:
+                                stop_event.set()
+                                for pending in futures:
+                                    pending.cancel()
+                                raise
+                        if controller is None or not controller.sample() or range_ignored_event.is_set() or piece_storage.is_complete():
+                            continue
+                        # 目标连接数增加或已有 worker 因暂时没有任务退出时补充 worker
+                        for _ in range(min(controller.missing_workers(), worker_count - len(running))):
+                            future = executor.submit(_worker)
+                            futures.append(future)
+                            running.add(future)
         except Exception:
             with state_lock:
                 _flush_state()
             raise
         finally:
             session_pool.close_all()
+            file_writer.close()
 
     if not piece_storage.is_complete():
         with state_lock:
@@ -1684,6 +2553,20 @@ def _download_file_with_ranges(
         raise IOError("分片下载未完成")
     if temp_file.stat().st_size != remote_info.total_size:
         raise IOError(f"下载文件大小不匹配: 期望 {remote_info.total_size}, 实际 {temp_file.stat().st_size}")
+    if tuning_callback is not None:
+        tuning = RangeDownloadTuning(
+            split=worker_count,
+            connections=controller.target if controller is not None else worker_count,
+            peak_connections=controller.peak_workers if controller is not None else worker_count,
+            max_connection_per_server=options.max_connection_per_server,
+            min_split_size=options.min_split_size,
+            piece_length=options.piece_length,
+            throughput=(remote_info.total_size - completed_size) / max(time.monotonic() - start_time, 1e-6),
+            stolen_pieces=controller.stolen_pieces if controller is not None else 0,
+        )
+        logger.debug("'%s' 分片下载参数: %s", temp_file, tuning)
+        tuning_callback(tuning)
+    return hasher.hexdigest() if hasher is not None else None
 
 
 def _download_file_single_stream_once(
@@ -1691,6 +2574,7 @@ def _download_file_single_stream_once(
     temp_file: Path,
     file_name: str,
     progress: bool,
+    progress_callback: Callable[[int], None] | None = None,
 ) -> int:
     import requests
 
@@ -1718,6 +2602,8 @@ def _download_file_single_stream_once(
                     if chunk:
                         file.write(chunk)
                         progress_bar.update(len(chunk))
+                        if progress_callback is not None:
+                            progress_callback(len(chunk))
         return total_size
     finally:
         _close_response(response)
@@ -1730,6 +2616,7 @@ def _download_file_single_stream(
     progress: bool,
     max_tries: int,
     retry_wait: int,
+    progress_callback: Callable[[int], None] | None = None,
 ) -> int:
     attempt = 0
     last_error: Exception | None = None
@@ -1742,6 +2629,7 @@ def _download_file_single_stream(
                 temp_file=temp_file,
                 file_name=file_name,
                 progress=progress,
+                progress_callback=progress_callback,
             )
         except Exception as e:
             last_error = e
@@ -1784,6 +2672,7 @@ def _finalize_download(
     remote_time: bool,
     last_modified: str | None,
     expected_size: int = 0,
+    computed_sha256: str | None = None,
 ) -> None:
     if expected_size > 0:
         actual_size = temp_file.stat().st_size
@@ -1796,7 +2685,11 @@ def _finalize_download(
             with temp_file.open("r+b") as file:
                 file.truncate(expected_size)
 
-    if hash_prefix and not compare_sha256(temp_file, hash_prefix):
+    if computed_sha256 is not None and temp_file.stat().st_size == expected_size:
+        hash_matched = computed_sha256.startswith(hash_prefix.strip().lower()) if hash_prefix else True
+    else:
+        hash_matched = not hash_prefix or compare_sha256(temp_file, hash_prefix)
+    if not hash_matched:
         logger.error("'%s' 的哈希值不匹配, 正在删除临时文件", temp_file)
         _cleanup_resume_files(temp_file, state_file)
         raise ValueError(f"文件哈希值与预期的哈希前缀不匹配: {hash_prefix}")
@@ -1820,6 +2713,8 @@ def _normalize_options(
     continue_download: bool,
     conditional_get: bool,
     remote_time: bool,
+    adaptive: bool = False,
+    mirror_racing: bool = False,
 ) -> _DownloadOptions:
     def _normalize_int_option(
         name: str,
@@ -1864,70 +2759,45 @@ def _normalize_options(
         continue_download=bool(continue_download),
         conditional_get=bool(conditional_get),
         remote_time=bool(remote_time),
+        adaptive=bool(adaptive),
+        mirror_racing=bool(mirror_racing),
     )
 
 
-def download_file_from_url(
-    url: _UrlInput,
-    save_path: Path | None = None,
-    file_name: str | None = None,
-    progress: bool = True,
-    hash_prefix: str | None = None,
-    re_download: bool = False,
-    split: int = DEFAULT_SPLIT,
-    max_connection_per_server: int = DEFAULT_MAX_CONNECTION_PER_SERVER,
-    min_split_size: int = DEFAULT_MIN_SPLIT_SIZE,
-    piece_length: int = DEFAULT_PIECE_LENGTH,
-    allow_piece_length_change: bool = False,
-    continue_download: bool = False,
-    max_tries: int = 5,
-    retry_wait: int = 0,
-    conditional_get: bool = False,
-    remote_time: bool = True,
-) -> Path:
-    """使用 requests 库下载文件
-
-    Args:
-        url (_UrlInput):
-            下载链接或同一文件的镜像链接列表
-        save_path (Path | None):
-            下载路径
-        file_name (str | None):
-            保存的文件名, 如果为`None`则从`url`中提取文件
-        progress (bool):
-            是否启用下载进度条
-        hash_prefix (str | None):
-            sha256 十六进制字符串, 如果提供, 将检查下载文件的哈希值是否与此前缀匹配, 当不匹配时引发`ValueError`
-        re_download (bool):
-            强制重新下载文件
-        split (int):
-            aria2 风格的单文件最大分割数
-        max_connection_per_server (int):
-            aria2 风格的单服务器最大连接数
-        min_split_size (int):
-            aria2 风格的最小切分大小
-        piece_length (int):
-            aria2 风格的 piece 大小
-        allow_piece_length_change (bool):
-            piece_length 与已有控制文件不一致时, 是否允许转换已完成 bitfield 并丢弃 in-flight 进度
-        continue_download (bool):
-            没有匹配 state 文件时, 是否从已有临时文件推断断点续传进度
-        max_tries (int):
-            单个分片的最大尝试次数
-        retry_wait (int):
-            HTTP 503 重试前等待秒数, 取值范围 0..600
-        conditional_get (bool):
-            已有本地文件时是否发送 If-Modified-Since, 远端返回 304 时复用本地文件
-        remote_time (bool):
-            下载完成后是否把本地文件 mtime 设置为远端 Last-Modified
+def _requests_backend() -> _DownloadBackend:
+    return _DownloadBackend(
+        probe_remote_files=_probe_remote_files,
+        cached_file_not_modified=_cached_file_not_modified,
+        download_pieces=_download_pieces,
+        download_file_single_stream=_download_file_single_stream,
+    )
 
-    Returns:
-        Path: 下载的文件路径
 
-    Raises:
-        ValueError: 当提供了 hash_prefix 但文件哈希值不匹配时
-        IOError: 下载过程中发生 IO 异常
-    """
+def _download_file_with_backend(
+    backend: _DownloadBackend,
+    *,
+    url: _UrlInput,
+    save_path: Path | None,
+    file_name: str | None,
+    progress: bool,
+    hash_prefix: str | None,
+    re_download: bool,
+    split: int,
+    max_connection_per_server: int,
+    min_split_size: int,
+    piece_length: int,
+    allow_piece_length_change: bool,
+    continue_download: bool,
+    max_tries: int,
+    retry_wait: int,
+    conditional_get: bool,
+    remote_time: bool,
+    adaptive: bool,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None,
+    mirror_racing: bool,
+    progress_callback: Callable[[int], None] | None = None,
+) -> Path:
+    """使用指定的下载后端执行 `download_file_from_url` 的下载流程"""
 
     if save_path is None:
         save_path = Path.cwd()
@@ -1943,7 +2813,7 @@ def download_file_from_url(
         logger.info("'%s' 已存在于 '%s' 中", file_name, cached_file)
         return cached_file
 
-    if cached_file_exists and not re_download and conditional_get and _cached_file_not_modified(urls, cached_file):
+    if cached_file_exists and not re_download and conditional_get and backend.cached_file_not_modified(urls, cached_file):
         logger.info("'%s' 未修改, 复用 '%s'", file_name, cached_file)
         return cached_file
 
@@ -1961,8 +2831,10 @@ def download_file_from_url(
             continue_download=continue_download,
             conditional_get=conditional_get,
             remote_time=remote_time,
+            adaptive=adaptive,
+            mirror_racing=mirror_racing,
         )
-        primary_url, remote_info = _probe_remote_files(urls)
+        primary_url, remote_info = backend.probe_remote_files(urls)
         ordered_urls = [primary_url] + [candidate for candidate in urls if candidate != primary_url]
         if not explicit_file_name and remote_info.content_disposition_filename:
             file_name = remote_info.content_disposition_filename
@@ -1978,29 +2850,36 @@ def download_file_from_url(
 
         logger.info("下载 '%s' 到 '%s' 中", file_name, cached_file)
         expected_size = remote_info.total_size
+        expected_sha256 = hash_prefix or remote_info.digest_sha256
+        computed_sha256: str | None = None
 
         if remote_info.total_size > 0:
             try:
-                _download_file_with_ranges(
+                computed_sha256 = _download_file_with_ranges(
                     urls=ordered_urls,
                     temp_file=temp_file,
                     state_file=state_file,
                     remote_info=remote_info,
                     progress=bool(progress),
                     options=options,
+                    verify_sha256=bool(expected_sha256),
+                    tuning_callback=tuning_callback,
+                    pieces_downloader=backend.download_pieces,
+                    progress_callback=progress_callback,
                 )
             except _RangeDownloadNotSupported as e:
                 logger.error("无法使用 HTTP Range 继续下载 '%s': %s, 已保留临时文件和断点状态", file_name, e)
                 raise IOError(f"无法使用 HTTP Range 继续下载 '{file_name}': {e}") from e
         else:
             _cleanup_resume_files(temp_file, state_file)
-            expected_size = _download_file_single_stream(
+            expected_size = backend.download_file_single_stream(
                 urls=ordered_urls,
                 temp_file=temp_file,
                 file_name=file_name,
                 progress=bool(progress),
                 max_tries=options.max_tries,
                 retry_wait=options.retry_wait,
+                progress_callback=progress_callback,
             )
 
         _finalize_download(
@@ -2008,9 +2887,108 @@ def download_file_from_url(
             state_file=state_file,
             cached_file=cached_file,
             file_name=file_name,
-            hash_prefix=hash_prefix or remote_info.digest_sha256,
+            hash_prefix=expected_sha256,
             remote_time=options.remote_time,
             last_modified=remote_info.last_modified,
             expected_size=expected_size,
+            computed_sha256=computed_sha256,
         )
     return cached_file
+
+
+def download_file_from_url(
+    url: _UrlInput,
+    save_path: Path | None = None,
+    file_name: str | None = None,
+    progress: bool = True,
+    hash_prefix: str | None = None,
+    re_download: bool = False,
+    split: int = DEFAULT_SPLIT,
+    max_connection_per_server: int = DEFAULT_MAX_CONNECTION_PER_SERVER,
+    min_split_size: int = DEFAULT_MIN_SPLIT_SIZE,
+    piece_length: int = DEFAULT_PIECE_LENGTH,
+    allow_piece_length_change: bool = False,
+    continue_download: bool = False,
+    max_tries: int = 5,
+    retry_wait: int = 0,
+    conditional_get: bool = False,
+    remote_time: bool = True,
+    adaptive: bool = False,
+    tuning_callback: Callable[[RangeDownloadTuning], None] | None = None,
+    mirror_racing: bool = False,
+    progress_callback: Callable[[int], None] | None = None,
+) -> Path:
+    """使用 requests 库下载文件
+
+    Args:
+        url (_UrlInput):
+            下载链接或同一文件的镜像链接列表
+        save_path (Path | None):
+            下载路径
+        file_name (str | None):
+            保存的文件名, 如果为`None`则从`url`中提取文件
+        progress (bool):
+            是否启用下载进度条
+        hash_prefix (str | None):
+            sha256 十六进制字符串, 如果提供, 将检查下载文件的哈希值是否与此前缀匹配, 当不匹配时引发`ValueError`
+        re_download (bool):
+            强制重新下载文件
+        split (int):
+            aria2 风格的单文件最大分割数
+        max_connection_per_server (int):
+            aria2 风格的单服务器最大连接数
+        min_split_size (int):
+            aria2 风格的最小切分大小
+        piece_length (int):
+            aria2 风格的 piece 大小
+        allow_piece_length_change (bool):
+            piece_length 与已有控制文件不一致时, 是否允许转换已完成 bitfield 并丢弃 in-flight 进度
+        continue_download (bool):
+            没有匹配 state 文件时, 是否从已有临时文件推断断点续传进度
+        max_tries (int):
+            单个分片的最大尝试次数
+        retry_wait (int):
+            HTTP 503 重试前等待秒数, 取值范围 0..600
+        conditional_get (bool):
+            已有本地文件时是否发送 If-Modified-Since, 远端返回 304 时复用本地文件
+        remote_time (bool):
+            下载完成后是否把本地文件 mtime 设置为远端 Last-Modified
+        adaptive (bool):
+            是否根据实测吞吐量自动调节连接数, 启用后 `split` 作为连接数上限, 空闲连接会接管慢速连接的剩余 piece
+        tuning_callback (Callable[[RangeDownloadTuning], None] | None):
+            分片下载完成后接收实际使用的连接参数的回调函数
+        mirror_racing (bool):
+            提供多个镜像链接时, 是否按各镜像服务器的实测吞吐量优先使用更快的镜像, 并停止使用连续返回可重试状态码的镜像
+        progress_callback (Callable[[int], None] | None):
+            下载过程中接收新写入字节数的回调函数, 分片下载时会在多个线程中调用
+
+    Returns:
+        Path: 下载的文件路径
+
+    Raises:
+        ValueError: 当提供了 hash_prefix 但文件哈希值不匹配时
+        IOError: 下载过程中发生 IO 异常
+    """
+    return _download_file_with_backend(
+        _requests_backend(),
+        url=url,
+        save_path=save_path,
+        file_name=file_name,
+        progress=progress,
+        hash_prefix=hash_prefix,
+        re_download=re_download,
+        split=split,
+        max_connection_per_server=max_connection_per_server,
+        min_split_size=min_split_size,
+        piece_length=piece_length,
+        allow_piece_length_change=allow_piece_length_change,
+        continue_download=continue_download,
+        max_tries=max_tries,
+        retry_wait=retry_wait,
+        conditional_get=conditional_get,
+        remote_time=remote_time,
+        adaptive=adaptive,
+        tuning_callback=tuning_callback,
+        mirror_racing=mirror_racing,
+        progress_callback=progress_callback,
+    )
@@ -6,7 +6,7 @@ from typing import (
     get_args,
 )
 
-DownloadToolType: TypeAlias = Literal["aria2", "requests", "urllib"]
+DownloadToolType: TypeAlias = Literal["aria2", "requests", "asyncio", "urllib"]
 """可用的下载器类型"""
 
 DOWNLOAD_TOOL_TYPE_LIST: list[str] = list(get_args(DownloadToolType))
@@ -7,7 +7,10 @@ from typing import TypedDict
 
 from sd_webui_all_in_one.cmd import run_cmd
 from sd_webui_all_in_one.logger import get_logger
-from sd_webui_all_in_one.pkg_manager import install_requirements
+from sd_webui_all_in_one.pkg_manager import (
+    install_requirements,
+    pip_install,
+)
 from sd_webui_all_in_one.config import (
     LOGGER_LEVEL,
     LOGGER_COLOR,
@@ -19,18 +22,24 @@ from sd_webui_all_in_one.utils import (
     append_python_path,
 )
 from sd_webui_all_in_one.package_analyzer import (
-    PyWhlVersionComparison,
-    check_version_constraint,
+    PackageConflict,
+    RequirementSolver,
     get_package_name,
+    get_requirement_file_cache,
     is_package_has_version,
     is_package_installed,
     normalize_package_name,
     parse_package_spec,
-    parse_requirement_list,
-    read_packages_from_requirements_file,
     validate_requirements,
+    version_set_from_specs,
 )
 from sd_webui_all_in_one.custom_exceptions import AggregateError
+from sd_webui_all_in_one.env_check.requirement_install_planner import (
+    RequirementInstallUnit,
+    build_requirement_install_unit,
+    install_with_bisection,
+    merge_install_args,
+)
 
 
 logger = get_logger(
@@ -193,10 +202,13 @@ def update_comfyui_component_requires_list(
 ) -> None:
     """更新 ComfyUI 环境组件表字典, 根据字典中的 requirement_path 确定 Python 软件包版本声明文件, 并解析后写入 requires 字段
 
+    依赖文件的解析结果会被缓存, 未修改的依赖文件不会重新解析
+
     Args:
         env_data (ComfyUIEnvironmentComponent):
             ComfyUI 环境组件表字典
     """
+    cache = get_requirement_file_cache()
     for component_name, details in env_data.items():
         if details.get("is_disabled"):
             continue
@@ -205,13 +217,13 @@ def update_comfyui_component_requires_list(
         if requirement_path is None:
             continue
 
-        origin_requires = read_packages_from_requirements_file(requirement_path)
-        requires = parse_requirement_list(origin_requires)
+        requires = cache.get_requirements(requirement_path)
         update_comfyui_environment_dict(
             env_data=env_data,
             component_name=component_name,
             requires=requires,
         )
+    cache.save()
 
 
 def update_comfyui_component_missing_requires_list(
@@ -247,33 +259,43 @@ def update_comfyui_component_missing_requires_list(
 def update_comfyui_component_conflict_requires_list(
     env_data: ComfyUIEnvironmentComponent,
     conflict_package_list: list[str],
+    conflicts: list[PackageConflict] | None = None,
 ) -> None:
-    """更新 ComfyUI 环境组件表字典, 根据 conflicconflict_package_listt_package 检查 ComfyUI 组件冲突的 Python 软件包, 并保存到 conflict_requires 字段和设置 has_conflict_requires 状态
+    """更新 ComfyUI 环境组件表字典, 根据 conflict_package_list 检查 ComfyUI 组件冲突的 Python 软件包, 并保存到 conflict_requires 字段和设置 has_conflict_requires 状态
 
     Args:
         env_data (ComfyUIEnvironmentComponent):
             ComfyUI 环境组件表字典
         conflict_package_list (list[str]):
             冲突的 Python 软件包列表
+        conflicts (list[PackageConflict] | None):
+            依赖约束求解器找出的冲突, 提供时只标记造成冲突的依赖声明, 不再按软件包名匹配组件的依赖
     """
+    contributors: dict[str | None, list[str]] | None = None
+    if conflicts is not None:
+        contributors = {}
+        for conflict in conflicts:
+            for item in conflict.requirements:
+                contributors.setdefault(item.source, []).append(item.requirement)
+
     for component_name, details in env_data.items():
         if details.get("is_disabled"):
             continue
 
-        requires = details.get("requires")
-        has_conflict_requires = False
-        conflict_requires: list[str] = []
-
-        for conflict_package in conflict_package_list:
-            for package in requires:
-                if is_package_has_version(package) and get_package_name(conflict_package) == get_package_name(package):
-                    has_conflict_requires = True
-                    conflict_requires.append(package)
+        if contributors is not None:
+            conflict_requires = contributors.get(component_name, [])
+        else:
+            requires = details.get("requires")
+            conflict_requires = []
+            for conflict_package in conflict_package_list:
+                for package in requires:
+                    if is_package_has_version(package) and get_package_name(conflict_package) == get_package_name(package):
+                        conflict_requires.append(package)
 
         update_comfyui_environment_dict(
             env_data=env_data,
             component_name=component_name,
-            has_conflict_requires=has_conflict_requires,
+            has_conflict_requires=len(conflict_requires) > 0,
             conflict_requires=conflict_requires,
         )
 
@@ -326,6 +348,7 @@ def statistical_need_install_require_component(
 def statistical_has_conflict_component(
     env_data: ComfyUIEnvironmentComponent,
     conflict_package_list: list[str],
+    conflicts: list[PackageConflict] | None = None,
 ) -> str:
     """根据 ComfyUI 环境组件表字典中的 conflict_requires 字段统计冲突的组件信息
 
@@ -334,12 +357,22 @@ def statistical_has_conflict_component(
             ComfyUI 环境组件表字典
         conflict_package_list (list[str]):
             冲突的软件包名称列表
+        conflicts (list[PackageConflict] | None):
+            依赖约束求解器找出的冲突, 提供时直接使用其中记录的冲突来源, 不再扫描组件表
 
     Returns:
         str:
             ComfyUI 环境冲突的组件信息列表
     """
     content = []
+    if conflicts is not None:
+        for conflict in conflicts:
+            content.append(f"{conflict.name}:")
+            for item in conflict.requirements:
+                content.append(f" - {item.source}: {item.requirement}")
+            content.append("")
+        return "\n".join(content[:-1])
+
     conflict_package_list = remove_duplicate_object_from_list([normalize_package_name(x) for x in conflict_package_list])
     for conflict_package in conflict_package_list:
         content.append(get_package_name(f"{conflict_package}:"))
@@ -375,8 +408,7 @@ def _is_constraint_pair_conflicting(
 ) -> bool:
     """检测两个单独的版本约束条件是否不可同时满足
 
-    通过检查两个约束定义的版本区间是否存在交集来判断冲突.
-    复用 :func:`check_version_constraint` 进行 PEP 440 合规的版本比较.
+    将两个约束分别转换为版本区间集合, 交集为空时说明两个约束冲突.
 
     Args:
         op1 (str):
@@ -391,85 +423,7 @@ def _is_constraint_pair_conflicting(
     Returns:
         bool: 如果两个约束不可同时满足则返回 ``True``
     """
-    cmp = PyWhlVersionComparison(ver1)
-
-    # == 或 === 是精确约束, 检查该精确版本是否满足另一个约束
-    if op1 in ("==", "==="):
-        cmp2 = PyWhlVersionComparison(ver1)
-        if not check_version_constraint(ver1, op2, ver2, cmp2):
-            logger.debug("冲突约束: %s%s vs %s%s (精确版本 %s 不满足 %s%s)", op1, ver1, op2, ver2, ver1, op2, ver2)
-            return True
-        return False
-
-    if op2 in ("==", "==="):
-        cmp2 = PyWhlVersionComparison(ver2)
-        if not check_version_constraint(ver2, op1, ver1, cmp2):
-            logger.debug("冲突约束: %s%s vs %s%s (精确版本 %s 不满足 %s%s)", op1, ver1, op2, ver2, ver2, op1, ver1)
-            return True
-        return False
-
-    # != 约束几乎不会与范围约束产生冲突 (除非范围只包含被排除的版本, 这种情况极为罕见)
-    if op1 == "!=" or op2 == "!=":
-        return False
-
-    # ~= 展开为 >= ver, == ver_prefix.* 后检测
-    # ~= X.Y.Z 等价于 >= X.Y.Z, == X.Y.*
-    if op1 == "~=":
-        # ~= ver1 等价于 >= ver1 (下界), 检测下界是否与 op2 冲突
-        if _is_constraint_pair_conflicting(">=", ver1, op2, ver2):
-            return True
-        # 还需检测 ~= 的上界 (== prefix.*) 是否与 op2 冲突
-        # ~= X.Y.Z 的上界约束等价于 < X.(Y+1).0
-        # 但精确计算上界较复杂, 这里用 compatible_version_matcher 来验证
-        # 如果 op2 是下界约束 (>, >=), 检查 ver2 是否超出 ~= 的兼容范围
-        if op2 in (">", ">="):
-            matcher = cmp.compatible_version_matcher(ver1)
-            # 如果 ver2 本身不在兼容范围内, 且 ver2 >= ver1, 则存在冲突
-            # 因为 op2 要求 > ver2 或 >= ver2, 而 ~= ver1 的上界低于 ver2
-            if not matcher(ver2) and PyWhlVersionComparison(ver2) >= PyWhlVersionComparison(ver1):
-                logger.debug("冲突约束: ~=%s vs %s%s (兼容范围不包含 %s)", ver1, op2, ver2, ver2)
-                return True
-        return False
-
-    if op2 == "~=":
-        return _is_constraint_pair_conflicting(op2, ver2, op1, ver1)  # pylint: disable=arguments-out-of-order
-
-    # 范围约束之间的冲突检测: >, >=, <, <=
-    # 下界 vs 上界: 检查下界是否超过上界
-    lower_ops = {">", ">="}
-    upper_ops = {"<", "<="}
-
-    if op1 in lower_ops and op2 in upper_ops:
-        # op1 是下界, op2 是上界
-        cmp_result = PyWhlVersionComparison(ver1).compare_versions(ver1, ver2, ignore_local=True)
-        if op1 == ">=" and op2 == "<=":
-            # >= ver1, <= ver2: 冲突当 ver1 > ver2
-            if cmp_result > 0:
-                logger.debug("冲突约束: >=%s vs <=%s (%s > %s)", ver1, ver2, ver1, ver2)
-                return True
-        elif op1 == ">=" and op2 == "<":
-            # >= ver1, < ver2: 冲突当 ver1 >= ver2
-            if cmp_result >= 0:
-                logger.debug("冲突约束: >=%s vs <%s (%s >= %s)", ver1, ver2, ver1, ver2)
-                return True
-        elif op1 == ">" and op2 == "<=":
-            # > ver1, <= ver2: 冲突当 ver1 >= ver2
-            if cmp_result >= 0:
-                logger.debug("冲突约束: >%s vs <=%s (%s >= %s)", ver1, ver2, ver1, ver2)
-                return True
-        elif op1 == ">" and op2 == "<":
-            # > ver1, < ver2: 冲突当 ver1 >= ver2
-            if cmp_result >= 0:
-                logger.debug("冲突约束: >%s vs <%s (%s >= %s)", ver1, ver2, ver1, ver2)
-                return True
-        return False
-
-    if op1 in upper_ops and op2 in lower_ops:
-        # 交换后递归检测
-        return _is_constraint_pair_conflicting(op2, ver2, op1, ver1)  # pylint: disable=arguments-out-of-order
-
-    # 同方向的范围约束 (如 > 和 >=, 或 < 和 <=) 不会互相冲突
-    return False
+    return version_set_from_specs([(op1, ver1), (op2, ver2)]).is_empty
 
 
 def detect_conflict_package(
@@ -478,9 +432,7 @@ def detect_conflict_package(
 ) -> bool:
     """检测两个 Python 软件包版本声明是否存在冲突
 
-    使用 PEP 508 解析器解析版本约束, 然后对每对约束条件进行可满足性检测.
-    复用 :func:`parse_package_spec` 和 :func:`check_version_constraint` 实现
-    完整的 PEP 440 操作符支持.
+    使用 PEP 508 解析器解析版本约束, 然后检测两组约束的版本区间集合是否有交集.
 
     Args:
         pkg1 (str):
@@ -499,19 +451,7 @@ def detect_conflict_package(
         return False
 
     logger.debug("冲突依赖检测: pkg1: %s, specs1: %s, pkg2: %s, specs2: %s", pkg1, specs1, pkg2, specs2)
-
-    # 对两组约束中的每对条件进行冲突检测
-    for op1, ver1 in specs1:
-        for op2, ver2 in specs2:
-            try:
-                if _is_constraint_pair_conflicting(op1, ver1, op2, ver2):
-                    logger.debug("冲突依赖: %s vs %s (约束 %s%s 与 %s%s 冲突)", pkg1, pkg2, op1, ver1, op2, ver2)
-                    return True
-            except (ValueError, TypeError) as e:
-                logger.debug("冲突检测异常: %s%s vs %s%s: %s", op1, ver1, op2, ver2, e)
-                continue
-
-    return False
+    return version_set_from_specs(specs1).intersect(version_set_from_specs(specs2)).is_empty
 
 
 def detect_conflict_package_from_list(
@@ -519,8 +459,7 @@ def detect_conflict_package_from_list(
 ) -> list[str]:
     """检测 Python 软件包版本声明列表中存在冲突的软件包
 
-    先按规范化包名分组, 再仅对同名包组内的约束进行冲突检测.
-    相比全量 O(n²) 比较, 大幅减少无效比较次数.
+    使用 :class:`RequirementSolver` 将同名软件包的所有约束折叠为一个版本区间集合, 每个软件包只需要一次遍历.
 
     Args:
         package_list (list[str]):
@@ -530,24 +469,30 @@ def detect_conflict_package_from_list(
         list[str]:
             冲突的 Python 软件包名列表
     """
-    # 1. 一次性解析所有包, 按规范化包名分组
-    groups: dict[str, list[str]] = {}
-    for pkg in package_list:
-        name = normalize_package_name(get_package_name(pkg))
-        groups.setdefault(name, []).append(pkg)
-
-    # 2. 只对同名包组内的约束进行冲突检测
-    conflict_packages: list[str] = []
-    for _norm_name, entries in groups.items():
-        if len(entries) < 2:
-            continue
+    solver = RequirementSolver()
+    solver.add_requirements(package_list)
+    return [conflict.display_name for conflict in solver.find_conflicts()]
 
-        for i in range(len(entries)):
-            for j in range(i + 1, len(entries)):
-                if detect_conflict_package(entries[i], entries[j]):
-                    conflict_packages.append(get_package_name(entries[i]))
 
-    return remove_duplicate_object_from_list(conflict_packages)
+def detect_comfyui_requirement_conflicts(
+    env_data: ComfyUIEnvironmentComponent,
+) -> list[PackageConflict]:
+    """使用依赖约束求解器检测 ComfyUI 环境中未禁用组件之间的依赖冲突
+
+    Args:
+        env_data (ComfyUIEnvironmentComponent):
+            ComfyUI 环境组件表字典
+
+    Returns:
+        list[PackageConflict]:
+            冲突的软件包列表, 包含造成冲突的依赖声明及其所属组件
+    """
+    solver = RequirementSolver()
+    for component_name, details in env_data.items():
+        if details.get("is_disabled"):
+            continue
+        solver.add_requirements(details.get("requires"), source=component_name)
+    return solver.find_conflicts()
 
 
 def display_comfyui_environment_dict(
@@ -622,12 +567,11 @@ def process_comfyui_env_analysis(
     env_data = create_comfyui_environment_dict(comfyui_root_path)
     update_comfyui_component_requires_list(env_data)
     update_comfyui_component_missing_requires_list(env_data)
-    pkg_list = get_comfyui_component_requires_list(env_data)
-    has_version_pkg = fitter_has_version_package(pkg_list)
-    conflict_pkg = detect_conflict_package_from_list(has_version_pkg)
-    update_comfyui_component_conflict_requires_list(env_data, conflict_pkg)
+    conflicts = detect_comfyui_requirement_conflicts(env_data)
+    conflict_pkg = [conflict.name for conflict in conflicts]
+    update_comfyui_component_conflict_requires_list(env_data, conflict_pkg, conflicts=conflicts)
     req_list = statistical_need_install_require_component(env_data)
-    conflict_info = statistical_has_conflict_component(env_data, conflict_pkg)
+    conflict_info = statistical_has_conflict_component(env_data, conflict_pkg, conflicts=conflicts)
     return env_data, req_list, conflict_info
 
 
@@ -694,22 +638,41 @@ def comfyui_conflict_analyzer(
 
     err: list[Exception] = []
 
-    def install_one_requirement(
-        req_path: Path,
-        count: int,
-    ) -> None:
-        name = req_path.parent.name
-        logger.info("[%s/%s] 安装 %s 的依赖中", count, task_sum, name)
-        try:
-            install_requirements(
-                path=req_path,
-                use_uv=use_uv,
-                cwd=req_path.parent,
-                custom_env=custom_env,
-            )
-        except RuntimeError as e:
-            err.append(e)
-            logger.error("[%s/%s] 安装 %s 的依赖失败: %s", count, task_sum, name, e)
+    # 按依赖文件查找组件的缺失依赖和冲突状态, 只安装依赖文件中未满足的依赖声明
+    component_details: dict[Path, ComponentEnvironmentDetails] = {}
+    for details in env_data.values():
+        requirement_path = details.get("requirement_path")
+        if requirement_path is None:
+            continue
+        component_details[Path(requirement_path).resolve()] = details
+    units: list[RequirementInstallUnit] = []
+    for req_path in req_paths:
+        details = component_details.get(req_path)
+        missing_requires = details.get("missing_requires") if details is not None else None
+        units.append(build_requirement_install_unit(req_path.parent.name, req_path, missing_requires or None))
+    unit_index = {unit.requirement_path: count for count, unit in enumerate(units, start=1)}
+
+    def install_units(batch: list[RequirementInstallUnit]) -> None:
+        if len(batch) == 1:
+            unit = batch[0]
+            logger.info("[%s/%s] 安装 %s 的依赖中", unit_index[unit.requirement_path], task_sum, unit.name)
+            if unit.packages:
+                pip_install(*unit.install_args(), use_uv=use_uv, custom_env=custom_env, cwd=unit.cwd)
+            else:
+                install_requirements(path=unit.requirement_path, use_uv=use_uv, cwd=unit.cwd, custom_env=custom_env)
+            return
+
+        batch_requirement_names = ", ".join(unit.name for unit in batch)
+        logger.info("批量安装以下 ComfyUI 组件的依赖中: %s", batch_requirement_names)
+        if any(unit.packages for unit in batch):
+            pip_install(*merge_install_args(batch), use_uv=use_uv, custom_env=custom_env, cwd=comfyui_root_path)
+        else:
+            install_requirements(path=[unit.requirement_path for unit in batch], use_uv=use_uv, cwd=comfyui_root_path, custom_env=custom_env)
+        logger.info("批量安装以下 ComfyUI 组件的依赖完成: %s", batch_requirement_names)
+
+    def on_install_failure(unit: RequirementInstallUnit, e: Exception) -> None:
+        err.append(e)
+        logger.error("[%s/%s] 安装 %s 的依赖失败: %s", unit_index[unit.requirement_path], task_sum, unit.name, e)
 
     def run_one_install_script(
         req_path: Path,
@@ -728,40 +691,27 @@ def comfyui_conflict_analyzer(
             err.append(e)
             logger.info("[%s/%s] 执行 %s 的安装脚本时发生错误: %s", count, install_script_sum, name, e)
 
-    def run_install_script_for_requirement(req_path: Path) -> None:
-        install_script_count = install_script_index.get(req_path)
-        if install_script_count is not None:
-            run_one_install_script(req_path, install_script_count)
-
-    def install_requirements_sequentially() -> None:
-        for count, req_path in enumerate(req_paths, start=1):
-            install_one_requirement(req_path, count)
-            run_install_script_for_requirement(req_path)
-
-    def run_install_scripts_sequentially() -> None:
-        install_script_names = ", ".join(req_path.parent.name for req_path in install_script_paths)
-        if len(install_script_paths) > 0:
+    def run_install_scripts(script_paths: list[Path]) -> None:
+        install_script_names = ", ".join(req_path.parent.name for req_path in script_paths)
+        if len(script_paths) > 0:
             logger.info("执行以下 ComfyUI 组件的安装脚本中: %s", install_script_names)
-        for count, req_path in enumerate(install_script_paths, start=1):
-            run_one_install_script(req_path, count)
+        for req_path in script_paths:
+            run_one_install_script(req_path, install_script_index[req_path])
 
-    batch_requirement_names = ", ".join(req_path.parent.name for req_path in req_paths)
     if has_conflict:
-        install_requirements_sequentially()
-    elif req_paths:
-        try:
-            logger.info("批量安装以下 ComfyUI 组件的依赖中: %s", batch_requirement_names)
-            install_requirements(
-                path=req_paths,
-                use_uv=use_uv,
-                cwd=comfyui_root_path,
-                custom_env=custom_env,
-            )
-            logger.info("批量安装以下 ComfyUI 组件的依赖完成: %s", batch_requirement_names)
-            run_install_scripts_sequentially()
-        except RuntimeError as e:
-            logger.warning("批量安装以下 ComfyUI 组件的依赖失败, 回退到按顺序安装: %s, 错误: %s", batch_requirement_names, e)
-            install_requirements_sequentially()
+        # 存在冲突时, 没有冲突的组件合并安装, 存在冲突 (或冲突状态未知) 的组件按顺序单独安装, 后安装的组件依赖版本优先
+        batch_units = [unit for unit in units if (details := component_details.get(unit.requirement_path)) is not None and not details.get("has_conflict_requires")]
+    else:
+        batch_units = units
+    batch_paths = {unit.requirement_path for unit in batch_units}
+    isolated_units = [unit for unit in units if unit.requirement_path not in batch_paths]
+
+    install_with_bisection(batch_units, install_units, on_install_failure)
+    run_install_scripts([req_path for req_path in install_script_paths if req_path in batch_paths])
+    for unit in isolated_units:
+        install_with_bisection([unit], install_units, on_install_failure)
+        if unit.requirement_path in install_script_index:
+            run_one_install_script(unit.requirement_path, install_script_index[unit.requirement_path])
 
     if err:
         raise AggregateError("安装 ComfyUI 依赖时出现错误", err)
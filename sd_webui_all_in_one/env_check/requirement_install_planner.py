@@ -0,0 +1,199 @@
+"""批量依赖安装计划
+
+逐个组件调用`uv pip install`时, 每次调用都需要重新启动 uv / Pip, 重新解析索引并下载软件包元数据. 该模块把多个组件缺失的依赖合并为一个安装计划:
+
+- 只安装依赖文件中未满足的依赖声明行 (保留原始写法, 包括 extras 和 marker), 无法单独安装的依赖文件 (包含 Pip 选项 / 行内选项, URL 依赖或无法解析的行) 整个安装
+- 所有组件的依赖合并后只调用一次依赖解析器, 相同的依赖声明只传入一次, 同名软件包的不同版本约束由依赖解析器合并
+- 批量安装失败时把组件分成两半分别重试, 只有确实无法安装的组件会被单独安装 (只安装部分依赖声明失败时改为安装整个依赖文件), 不需要回退到逐个组件安装
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+from sd_webui_all_in_one.package_analyzer import (
+    parse_requirement_list,
+    read_packages_from_requirements_file,
+)
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+_COMMENT_PATTERN = re.compile(r"\s*#.*$")
+"""行尾注释"""
+
+_OPTION_PATTERN = re.compile(r"(?:^|\s)-")
+"""Pip 选项, 包括整行选项 (``--index-url``) 和依赖声明后的行内选项 (``--hash=sha256:...``)"""
+
+
+@dataclass
+class RequirementInstallUnit:
+    """一个组件的待安装依赖"""
+
+    name: str
+    """组件名称"""
+
+    requirement_path: Path
+    """依赖文件路径"""
+
+    packages: list[str] = field(default_factory=list)
+    """需要安装的依赖声明, 为空时安装整个依赖文件"""
+
+    @property
+    def cwd(self) -> Path:
+        """单独安装该组件依赖时的起始路径"""
+        return self.requirement_path.parent
+
+    def install_args(self) -> list[str]:
+        """单独安装该组件依赖时传给 Pip / uv 的参数
+
+        Returns:
+            list[str]: 安装参数
+        """
+        if self.packages:
+            return list(self.packages)
+        return ["-r", self.requirement_path.as_posix()]
+
+
+def select_missing_requirement_lines(
+    requirement_path: Path,
+    missing_requires: Iterable[str],
+) -> list[str] | None:
+    """从依赖文件中选出未满足的依赖声明行
+
+    Args:
+        requirement_path (Path):
+            依赖文件路径
+        missing_requires (Iterable[str]):
+            缺失的依赖 (``parse_requirement_list()`` 标准化后的格式)
+
+    Returns:
+        (list[str] | None): 未满足的原始依赖声明行, 依赖文件需要整个安装时返回 ``None``
+    """
+    missing = set(missing_requires)
+    if not missing:
+        return None
+
+    selected: list[str] = []
+    covered: set[str] = set()
+    for line in read_packages_from_requirements_file(requirement_path):
+        text = _COMMENT_PATTERN.sub("", line).strip()
+        if not text:
+            continue
+        if _OPTION_PATTERN.search(text) or "://" in text:
+            # Pip 选项 (索引地址, 引用其他文件, 行内的 --hash 等) 和 URL 依赖无法作为单独的安装参数传入, 需要整个安装依赖文件
+            return None
+        specs = parse_requirement_list([text])
+        if missing.intersection(specs):
+            selected.append(text)
+            covered.update(specs)
+
+    if not missing.issubset(covered):
+        # 部分缺失的依赖无法对应到依赖声明行 (如本地路径), 需要整个安装依赖文件
+        return None
+    return selected
+
+
+def build_requirement_install_unit(
+    name: str,
+    requirement_path: Path,
+    missing_requires: Iterable[str] | None = None,
+) -> RequirementInstallUnit:
+    """创建一个组件的待安装依赖
+
+    Args:
+        name (str):
+            组件名称
+        requirement_path (Path):
+            依赖文件路径
+        missing_requires (Iterable[str] | None):
+            缺失的依赖, 为 ``None`` 时安装整个依赖文件
+
+    Returns:
+        RequirementInstallUnit: 组件的待安装依赖
+    """
+    packages = None if missing_requires is None else select_missing_requirement_lines(requirement_path, missing_requires)
+    return RequirementInstallUnit(name=name, requirement_path=requirement_path, packages=packages or [])
+
+
+def merge_install_args(
+    units: Iterable[RequirementInstallUnit],
+) -> list[str]:
+    """合并多个组件的安装参数, 相同的依赖声明和依赖文件只传入一次
+
+    Args:
+        units (Iterable[RequirementInstallUnit]):
+            组件的待安装依赖列表
+
+    Returns:
+        list[str]: 安装参数
+    """
+    packages: dict[str, None] = {}
+    requirement_files: dict[str, None] = {}
+    for unit in units:
+        if unit.packages:
+            packages.update(dict.fromkeys(unit.packages))
+        else:
+            requirement_files[unit.requirement_path.as_posix()] = None
+
+    args: list[str] = []
+    for requirement_file in requirement_files:
+        args.extend(["-r", requirement_file])
+    args.extend(packages)
+    return args
+
+
+def install_with_bisection(
+    units: list[RequirementInstallUnit],
+    install: Callable[[list[RequirementInstallUnit]], None],
+    on_failure: Callable[[RequirementInstallUnit, Exception], None],
+) -> None:
+    """调用一次依赖解析器安装所有组件的依赖, 失败时二分组件列表分别重试, 直到找出无法安装的组件
+
+    只安装部分依赖声明的组件单独安装失败时, 改为安装整个依赖文件再重试一次
+
+    Args:
+        units (list[RequirementInstallUnit]):
+            组件的待安装依赖列表, 按安装顺序排列
+        install (Callable[[list[RequirementInstallUnit]], None]):
+            安装一组组件依赖的函数, 安装失败时抛出 ``RuntimeError``
+        on_failure (Callable[[RequirementInstallUnit, Exception], None]):
+            单个组件依赖安装失败时调用的函数
+    """
+    if not units:
+        return
+    try:
+        install(units)
+        return
+    except RuntimeError as e:
+        if len(units) == 1:
+            unit = units[0]
+            if unit.packages:
+                logger.warning("安装 %s 缺失的依赖失败, 改为安装整个依赖文件: %s", unit.name, e)
+                try:
+                    install([replace(unit, packages=[])])
+                    return
+                except RuntimeError as file_error:
+                    e = file_error
+            on_failure(unit, e)
+            return
+        logger.warning("安装以下组件的依赖失败, 拆分后重试: %s, 错误: %s", ", ".join(unit.name for unit in units), e)
+
+    middle = len(units) // 2
+    install_with_bisection(units[:middle], install, on_failure)
+    install_with_bisection(units[middle:], install, on_failure)
@@ -1,10 +1,18 @@
 """文件操作工具"""
 
 import os
+import json
 import uuid
 import stat
+import errno
 import shutil
+import fnmatch
+import hashlib
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 from sd_webui_all_in_one.logger import get_logger
 from sd_webui_all_in_one.config import (
@@ -19,6 +27,29 @@ logger = get_logger(
     color=LOGGER_COLOR,
 )
 
+SYNC_MANIFEST_NAME = ".sd-webui-all-in-one-sync.json"
+"""增量同步清单文件名, 保存在同步目标目录中"""
+
+SYNC_MANIFEST_VERSION = 1
+"""增量同步清单格式版本"""
+
+SYNC_COPY_WORKERS = 8
+"""增量同步时默认的并行复制线程数"""
+
+SYNC_COPY_CHUNK_SIZE = 8 * 1024 * 1024
+"""增量同步时每次复制的数据块大小"""
+
+_FAST_COPY_FALLBACK_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+"""`copy_file_range` / `sendfile` 不可用时需要回退到普通复制的错误码"""
+
 
 def remove_files(
     path: Path,
@@ -387,6 +418,139 @@ def move_files_merge(
         raise e
 
 
+def _list_dir_entries(
+    path: str,
+) -> list[os.DirEntry[str]]:
+    """列出目录中的条目, 无法读取的目录返回空列表 (与`os.walk`的默认行为一致)"""
+    try:
+        with os.scandir(path) as iterator:
+            return list(iterator)
+    except OSError as e:
+        logger.debug("扫描目录 %s 时发生错误: %s", path, e)
+        return []
+
+
+def _scan_dir_batches(
+    path: Path,
+    patterns: Iterable[str] | None = None,
+    extensions: Iterable[str] | None = None,
+    max_depth: int | None = -1,
+    include_dirs: bool = False,
+    follow_symlinks: bool = False,
+    workers: int = 1,
+) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    """按目录扫描, 每次返回目录路径和该目录中符合条件的条目, 参数含义与`scan_files()`相同"""
+    if not path.is_dir():
+        return
+
+    pattern_list = list(patterns) if patterns is not None else None
+    extension_list = tuple(ext.lower() for ext in extensions) if extensions is not None else None
+    # -1 表示不限制深度
+    limit = -1 if max_depth is None else max_depth
+
+    def _match(
+        name: str,
+    ) -> bool:
+        if extension_list is not None and not name.lower().endswith(extension_list):
+            return False
+        if pattern_list is not None and not any(fnmatch.fnmatch(name, pattern) for pattern in pattern_list):
+            return False
+        return True
+
+    def _classify(
+        entries: list[os.DirEntry[str]],
+        depth: int,
+    ) -> tuple[list[os.DirEntry[str]], list[str]]:
+        """返回需要输出的条目和需要继续扫描的子目录"""
+        results: list[os.DirEntry[str]] = []
+        subdirs: list[str] = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if include_dirs:
+                    results.append(entry)
+                if (limit == -1 or depth < limit) and (follow_symlinks or not entry.is_symlink()):
+                    subdirs.append(entry.path)
+            elif _match(entry.name):
+                results.append(entry)
+        return results, subdirs
+
+    root = str(path.absolute())
+    if workers <= 1:
+        stack = [(root, 0)]
+        while stack:
+            current, depth = stack.pop()
+            results, subdirs = _classify(_list_dir_entries(current), depth)
+            if results:
+                yield current, results
+            stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-scan")
+    pending: dict[Future[list[os.DirEntry[str]]], tuple[str, int]] = {executor.submit(_list_dir_entries, root): (root, 0)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current, depth = pending.pop(future)
+                results, subdirs = _classify(future.result(), depth)
+                for subdir in subdirs:
+                    pending[executor.submit(_list_dir_entries, subdir)] = (subdir, depth + 1)
+                if results:
+                    yield current, results
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scan_files(
+    path: Path,
+    patterns: Iterable[str] | None = None,
+    extensions: Iterable[str] | None = None,
+    max_depth: int | None = -1,
+    include_dirs: bool = False,
+    follow_symlinks: bool = False,
+    workers: int = 1,
+) -> Iterator[os.DirEntry[str]]:
+    """使用`os.scandir`扫描目录并按需逐个返回条目
+
+    返回的`os.DirEntry`会缓存文件类型, 在 Windows 上还会缓存`stat()`结果, 调用方可以直接使用`entry.stat()`获取文件信息
+
+    Args:
+        path (Path):
+            要扫描的目录, 不是目录时不返回任何条目
+        patterns (Iterable[str] | None):
+            文件名的 glob 匹配规则, 例如`*.safetensors`, 匹配任意一个规则的文件才会返回, 为`None`时不过滤
+        extensions (Iterable[str] | None):
+            文件扩展名列表 (不区分大小写), 例如`.ckpt`, 为`None`时不过滤
+        max_depth (int | None):
+            最大遍历深度, -1 或`None`表示不限制深度, 0 表示只遍历当前目录
+        include_dirs (bool):
+            是否返回目录条目, 目录不受`patterns`和`extensions`过滤
+        follow_symlinks (bool):
+            是否进入目录软链接
+        workers (int):
+            并行扫描目录的线程数, 大于 1 时适用于网络文件系统等单次读取目录延迟较高的场景, 此时返回顺序不固定
+
+    Yields:
+        os.DirEntry[str]: 扫描到的文件 (和可选的目录) 条目
+    """
+    for _, entries in _scan_dir_batches(
+        path,
+        patterns=patterns,
+        extensions=extensions,
+        max_depth=max_depth,
+        include_dirs=include_dirs,
+        follow_symlinks=follow_symlinks,
+        workers=workers,
+    ):
+        yield from entries
+
+
 def get_file_list(
     path: Path,
     resolve: bool = False,
@@ -416,38 +580,16 @@ def get_file_list(
     if path.is_file():
         return [path.resolve() if resolve else path.absolute()]
 
-    base_depth = len(path.resolve().parts)
-
     file_list: list[Path] = []
-    with tqdm(desc=f"扫描目录 {path}", position=0, leave=True, disable=not show_progress) as dir_pbar:
-        with tqdm(desc="发现条目数", position=1, leave=True, disable=not show_progress) as file_pbar:
-            for root, dirs, files in os.walk(path):
-                root_path = Path(root)
-                current_depth = len(root_path.resolve().parts) - base_depth
-
-                # 超过最大深度则阻止继续向下遍历
-                if max_depth is not None and max_depth != -1 and current_depth >= max_depth:
-                    # 如果需要包含目录, 虽然停止深挖, 但当前层的目录仍可加入
-                    if include_dirs:
-                        for d in dirs:
-                            dir_path = root_path / d
-                            file_list.append(dir_path.resolve() if resolve else dir_path.absolute())
-                            file_pbar.update(1)
-                    dirs.clear()
-                else:
-                    # 如果启用，将当前层级的目录加入列表
-                    if include_dirs:
-                        for d in dirs:
-                            dir_path = root_path / d
-                            file_list.append(dir_path.resolve() if resolve else dir_path.absolute())
-                            file_pbar.update(1)
-
-                for file in files:
-                    file_path = root_path / file
-                    file_list.append(file_path.resolve() if resolve else file_path.absolute())
-                    file_pbar.update(1)
-
-                dir_pbar.update(1)
+    with tqdm(desc=f"扫描目录 {path}", unit="个", leave=True, disable=not show_progress) as pbar:
+        for directory, entries in _scan_dir_batches(path, max_depth=max_depth, include_dirs=include_dirs):
+            # 每个目录只构造一次 Path, 子路径通过拼接生成, 比逐个解析完整路径字符串更快
+            parent = Path(directory)
+            if resolve:
+                file_list.extend(parent.joinpath(entry.name).resolve() for entry in entries)
+            else:
+                file_list.extend(parent.joinpath(entry.name) for entry in entries)
+            pbar.update(len(entries))
 
     return file_list
 
@@ -536,6 +678,350 @@ def recursive_tree_builder(
             counts[1] += 1
 
 
+@dataclass(frozen=True)
+class _SyncFileStat:
+    """增量同步时使用的文件状态"""
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class FileSyncReport:
+    """增量同步结果, 文件路径均为相对于同步根目录的 POSIX 路径"""
+
+    src_path: Path
+    """同步文件的源路径"""
+
+    dst_path: Path
+    """同步文件到的路径"""
+
+    added: list[str] = field(default_factory=list)
+    """目标路径中不存在的文件"""
+
+    updated: list[str] = field(default_factory=list)
+    """内容发生变化的文件"""
+
+    deleted: list[str] = field(default_factory=list)
+    """源路径中已不存在, 需要从目标路径删除的文件"""
+
+    unchanged: int = 0
+    """无需同步的文件数量"""
+
+    copied_bytes: int = 0
+    """已复制的字节数"""
+
+    dry_run: bool = False
+    """是否只计算差异而不修改文件"""
+
+    @property
+    def files_to_copy(self) -> list[str]:
+        """需要复制的文件列表"""
+        return self.added + self.updated
+
+    def format_diff(
+        self,
+        max_lines: int | None = 100,
+    ) -> str:
+        """生成差异报告
+
+        Args:
+            max_lines (int | None):
+                最多显示的文件行数, 为`None`时显示全部
+
+        Returns:
+            str: 差异报告, 新增文件以`+`开头, 变化的文件以`~`开头, 删除的文件以`-`开头
+        """
+        lines = [f"+ {path}" for path in self.added] + [f"~ {path}" for path in self.updated] + [f"- {path}" for path in self.deleted]
+        if max_lines is not None and len(lines) > max_lines:
+            lines = lines[:max_lines] + [f"... 还有 {len(lines) - max_lines} 项"]
+        lines.append(f"新增: {len(self.added)}, 变化: {len(self.updated)}, 删除: {len(self.deleted)}, 未变化: {self.unchanged}")
+        return "\n".join(lines)
+
+
+def _scan_sync_tree(
+    root: Path,
+    only_name: str | None = None,
+) -> tuple[dict[str, _SyncFileStat], set[str]]:
+    """使用`os.scandir`扫描同步目录, 返回文件状态表和目录集合
+
+    不进入目录软链接, 文件软链接按链接目标的状态统计; 同步清单文件会被忽略
+
+    Args:
+        root (Path):
+            要扫描的根目录
+        only_name (str | None):
+            只扫描根目录中指定名称的文件, 用于同步单个文件
+
+    Returns:
+        tuple[dict[str, _SyncFileStat], set[str]]: 相对路径到文件状态的映射和相对目录路径集合
+    """
+    files: dict[str, _SyncFileStat] = {}
+    dirs: set[str] = set()
+    stack = [("", str(root))]
+    while stack:
+        prefix, current = stack.pop()
+        try:
+            iterator = os.scandir(current)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError as e:
+            logger.warning("扫描目录 %s 时发生错误: %s", current, e)
+            continue
+
+        with iterator:
+            for entry in iterator:
+                if entry.name == SYNC_MANIFEST_NAME or (only_name is not None and entry.name != only_name):
+                    continue
+                rel_path = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if only_name is None:
+                            dirs.add(rel_path)
+                            stack.append((rel_path + "/", entry.path))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files[rel_path] = _SyncFileStat(size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+    return files, dirs
+
+
+def _load_sync_manifest(
+    manifest_path: Path,
+) -> dict[str, dict[str, Any]]:
+    """读取增量同步清单, 清单不存在或格式无效时返回空清单"""
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != SYNC_MANIFEST_VERSION or not isinstance(data.get("files"), dict):
+        return {}
+    return {rel_path: record for rel_path, record in data["files"].items() if isinstance(record, dict)}
+
+
+def _save_sync_manifest(
+    manifest_path: Path,
+    records: dict[str, dict[str, Any]],
+) -> None:
+    """原子写入增量同步清单, 写入失败时只记录警告"""
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({"version": SYNC_MANIFEST_VERSION, "files": records}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+    except OSError as e:
+        logger.warning("保存同步清单 %s 失败: %s", manifest_path, e)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _sync_record(
+    src_stat: _SyncFileStat,
+    dst_stat: _SyncFileStat,
+    sha256: str | None = None,
+) -> dict[str, Any]:
+    """生成同步清单记录"""
+    return {
+        "size": dst_stat.size,
+        "mtime_ns": dst_stat.mtime_ns,
+        "src_size": src_stat.size,
+        "src_mtime_ns": src_stat.mtime_ns,
+        "sha256": sha256,
+    }
+
+
+def _file_sha256(
+    path: Path,
+) -> str:
+    """计算文件的 sha256"""
+    hash_sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
+
+
+def _copy_file_content(
+    fsrc: BinaryIO,
+    fdst: BinaryIO,
+    progress_callback: Callable[[int], None],
+) -> None:
+    """复制文件内容, 优先使用内核态的`copy_file_range`和`sendfile`, 不可用时回退到普通读写"""
+    infd = fsrc.fileno()
+    outfd = fdst.fileno()
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        copied = 0
+        try:
+            while True:
+                n = copy_file_range(infd, outfd, SYNC_COPY_CHUNK_SIZE)
+                if n == 0:
+                    return
+                copied += n
+                progress_callback(n)
+        except OSError as e:
+            if copied or e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        offset = 0
+        try:
+            while True:
+                n = sendfile(outfd, infd, offset, SYNC_COPY_CHUNK_SIZE)
+                if n == 0:
+                    return
+                offset += n
+                progress_callback(n)
+        except OSError as e:
+            if offset or e.errno not in _FAST_COPY_FALLBACK_ERRNOS:
+                raise
+
+    while True:
+        chunk = fsrc.read(SYNC_COPY_CHUNK_SIZE)
+        if not chunk:
+            return
+        fdst.write(chunk)
+        progress_callback(len(chunk))
+
+
+def _copy_sync_file(
+    src: Path,
+    dst: Path,
+    progress_callback: Callable[[int], None],
+) -> None:
+    """复制单个文件到临时文件后原子替换目标文件, 并保留权限和修改时间
+
+    目标文件为软链接时写入软链接指向的文件, 保留软链接本身 (例如指向网盘的软链接)
+    """
+    if dst.is_symlink():
+        dst = dst.resolve()
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(src, "rb") as fsrc, open(tmp_path, "wb") as fdst:
+            _copy_file_content(fsrc, fdst, progress_callback)
+        try:
+            shutil.copystat(src, tmp_path)
+        except OSError as e:
+            logger.debug("复制 %s 的文件属性失败: %s", src, e)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if tmp_path.exists():
+            logger.warning("删除未复制完成的文件: %s", tmp_path)
+            try:
+                tmp_path.unlink()
+            except OSError as e:
+                logger.error("删除未复制完成的文件失败: %s", e)
+        raise
+
+
+def _get_sync_roots(
+    src_path: Path,
+    dst_path: Path,
+) -> tuple[Path, Path, str | None]:
+    """获取同步的源根目录, 目标根目录和单文件同步时的文件名"""
+    if src_path.is_file():
+        return src_path.parent, dst_path, src_path.name
+    return src_path, dst_path, None
+
+
+def _plan_file_sync(
+    src_path: Path,
+    dst_path: Path,
+    delete: bool,
+    checksum: bool,
+    skip_newer_dst: bool,
+    workers: int,
+) -> tuple[FileSyncReport, dict[str, _SyncFileStat], set[str], set[str], dict[str, dict[str, Any]]]:
+    """计算增量同步差异
+
+    文件大小和修改时间与清单记录一致时直接视为未变化; 大小相同但修改时间不同且启用`checksum`时比较 sha256,
+    目标文件的 sha256 在清单中缓存, 避免下次重复计算
+
+    Returns:
+        tuple[FileSyncReport, dict[str, _SyncFileStat], set[str], set[str], dict[str, dict[str, Any]]]:
+            同步差异, 源文件状态表, 源目录集合, 目标目录集合, 新的同步清单记录
+    """
+    src_root, dst_root, only_name = _get_sync_roots(src_path, dst_path)
+    report = FileSyncReport(src_path=src_path, dst_path=dst_path)
+    src_files, src_dirs = _scan_sync_tree(src_root, only_name=only_name)
+    logger.info("%s 中的文件数量: %s", src_path, len(src_files))
+    dst_files, dst_dirs = _scan_sync_tree(dst_root, only_name=only_name) if dst_root.is_dir() else ({}, set())
+    logger.info("%s 中的文件数量: %s", dst_path, len(dst_files))
+
+    # 单文件同步时目标根目录是文件所在的目录, 不在其中保存同步清单
+    manifest = _load_sync_manifest(dst_root / SYNC_MANIFEST_NAME) if only_name is None else {}
+    records: dict[str, dict[str, Any]] = {}
+    hash_candidates: list[tuple[str, str | None]] = []
+    for rel_path in sorted(src_files):
+        src_stat = src_files[rel_path]
+        dst_stat = dst_files.get(rel_path)
+        if dst_stat is None:
+            report.added.append(rel_path)
+            continue
+
+        record = manifest.get(rel_path)
+        dst_recorded = record is not None and record.get("size") == dst_stat.size and record.get("mtime_ns") == dst_stat.mtime_ns
+        if dst_recorded and record.get("src_size") == src_stat.size and record.get("src_mtime_ns") == src_stat.mtime_ns:
+            report.unchanged += 1
+            records[rel_path] = record
+            continue
+
+        if src_stat == dst_stat:
+            report.unchanged += 1
+            records[rel_path] = _sync_record(src_stat, dst_stat, record.get("sha256") if dst_recorded else None)
+            continue
+
+        if skip_newer_dst and dst_stat.mtime_ns > src_stat.mtime_ns:
+            logger.debug("目标文件比源文件更新, 跳过同步: %s", rel_path)
+            report.unchanged += 1
+            continue
+
+        if checksum and src_stat.size == dst_stat.size:
+            hash_candidates.append((rel_path, record.get("sha256") if dst_recorded else None))
+            continue
+
+        report.updated.append(rel_path)
+
+    if hash_candidates:
+        logger.info("通过 sha256 比较 %s 个大小相同但修改时间不同的文件", len(hash_candidates))
+
+        def _compare(
+            candidate: tuple[str, str | None],
+        ) -> tuple[str, str, bool]:
+            rel_path, dst_hash = candidate
+            src_hash = _file_sha256(src_root / rel_path)
+            if dst_hash is None:
+                dst_hash = _file_sha256(dst_root / rel_path)
+            return rel_path, src_hash, src_hash == dst_hash
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-sync-hash") as executor:
+            for rel_path, src_hash, same in executor.map(_compare, hash_candidates):
+                if same:
+                    report.unchanged += 1
+                    records[rel_path] = _sync_record(src_files[rel_path], dst_files[rel_path], src_hash)
+                else:
+                    report.updated.append(rel_path)
+        report.updated.sort()
+
+    if delete and only_name is None:
+        report.deleted = sorted(rel_path for rel_path in dst_files if rel_path not in src_files)
+
+    # 保留不在本次同步范围内的目标文件记录
+    for rel_path, record in manifest.items():
+        if rel_path not in src_files and rel_path in dst_files and rel_path not in report.deleted:
+            records[rel_path] = record
+
+    return report, src_files, src_dirs, dst_dirs, records
+
+
 def get_sync_files(
     src_path: Path,
     dst_path: Path,
@@ -549,22 +1035,13 @@ def get_sync_files(
     Returns:
         list[Path]: 要进行同步的文件
     """
-    try:
-        from tqdm import tqdm
-    except ImportError:
-        from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
-
-    src_is_file = src_path.is_file()
-    src_files = get_file_list(src_path)
-    logger.info("%s 中的文件数量: %s", src_path, len(src_files))
-    dst_files = get_file_list(dst_path)
-    logger.info("%s 中的文件数量: %s", dst_path, len(dst_files))
     if src_path.is_dir() and dst_path.is_file():
         logger.warning("%s 为目录, 而 %s 为文件, 无法进行复制", src_path, dst_path)
-        sync_file_list = []
-    else:
-        dst_files_set = set(dst_files)  # 加快统计速度
-        sync_file_list = [x for x in tqdm(src_files, desc="计算需要同步的文件") if (dst_path / x.relative_to(src_path if not src_is_file else src_path.parent)) not in dst_files_set]
+        return []
+
+    report, *_ = _plan_file_sync(src_path, dst_path, delete=False, checksum=True, skip_newer_dst=False, workers=SYNC_COPY_WORKERS)
+    src_root, _, _ = _get_sync_roots(src_path, dst_path)
+    sync_file_list = [src_root / rel_path for rel_path in report.files_to_copy]
     logger.info("要进行同步的文件数量: %s", len(sync_file_list))
     return sync_file_list
 
@@ -572,14 +1049,35 @@ def get_sync_files(
 def sync_files(
     src_path: Path,
     dst_path: Path,
-) -> None:
+    delete: bool = False,
+    checksum: bool = True,
+    dry_run: bool = False,
+    skip_newer_dst: bool = False,
+    workers: int | None = None,
+) -> FileSyncReport:
     """同步文件 (增量同步)
 
+    使用`os.scandir`扫描源路径和目标路径, 通过文件大小和修改时间判断文件是否变化,
+    并在目标路径中保存同步清单 (`SYNC_MANIFEST_NAME`) 缓存比较结果和 sha256, 新增和变化的文件使用多线程并行复制
+
     Args:
         src_path (Path):
             同步文件的源路径
         dst_path (Path):
             同步文件到的路径
+        delete (bool):
+            是否删除目标路径中存在但源路径中不存在的文件
+        checksum (bool):
+            文件大小相同但修改时间不同时是否比较 sha256, 为`False`时直接视为文件已变化
+        dry_run (bool):
+            只计算并输出差异报告, 不修改任何文件
+        skip_newer_dst (bool):
+            目标文件比源文件更新时跳过该文件
+        workers (int | None):
+            并行复制和计算 sha256 的线程数, 为`None`时使用`SYNC_COPY_WORKERS`
+
+    Returns:
+        FileSyncReport: 同步结果
 
     Raises:
         RuntimeError:
@@ -591,26 +1089,93 @@ def sync_files(
         from sd_webui_all_in_one.simple_tqdm import SimpleTqdm as tqdm
 
     logger.info("增量同步文件: %s -> %s", src_path, dst_path)
-    file_list = get_sync_files(src_path, dst_path)
-    if len(file_list) == 0:
+    workers = max(1, workers or SYNC_COPY_WORKERS)
+    if src_path.is_dir() and dst_path.is_file():
+        logger.warning("%s 为目录, 而 %s 为文件, 无法进行复制", src_path, dst_path)
+        return FileSyncReport(src_path=src_path, dst_path=dst_path, dry_run=dry_run)
+
+    try:
+        report, src_files, src_dirs, dst_dirs, records = _plan_file_sync(
+            src_path,
+            dst_path,
+            delete=delete,
+            checksum=checksum,
+            skip_newer_dst=skip_newer_dst,
+            workers=workers,
+        )
+    except OSError as e:
+        logger.error("计算 %s 到 %s 的同步差异时发生错误: %s", src_path, dst_path, e)
+        raise RuntimeError(f"同步 '{src_path}' 到 '{dst_path}' 时发生错误: {e}") from e
+
+    report.dry_run = dry_run
+    src_root, dst_root, only_name = _get_sync_roots(src_path, dst_path)
+
+    def _save_records() -> None:
+        if only_name is None:
+            _save_sync_manifest(dst_root / SYNC_MANIFEST_NAME, records)
+
+    if dry_run:
+        logger.info("同步差异 (仅预览):\n%s", report.format_diff())
+        return report
+
+    if not report.files_to_copy and not report.deleted and src_dirs <= dst_dirs:
         logger.info("没有需要同步的文件")
-        return
-    for file in tqdm(file_list, desc="同步文件"):
-        dst = dst_path / file.relative_to(src_path)
-        try:
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy(file, dst)
-        except (shutil.Error, PermissionError, IsADirectoryError, OSError) as e:
-            logger.error("同步 %s 到 %s 时发生错误: %s", file, dst, e)
-            if dst.exists():
-                logger.warning("删除未复制完成的文件: %s", dst)
+        if records:
+            _save_records()
+        return report
+
+    try:
+        dst_root.mkdir(parents=True, exist_ok=True)
+        for rel_dir in sorted(src_dirs - dst_dirs):
+            (dst_root / rel_dir).mkdir(parents=True, exist_ok=True)
+
+        logger.info("要进行同步的文件数量: %s", len(report.files_to_copy))
+        copy_list = report.files_to_copy
+        progress_lock = threading.Lock()
+        with tqdm(total=sum(src_files[rel_path].size for rel_path in copy_list), desc="同步文件", unit="B", unit_scale=True, unit_divisor=1024) as pbar:
+
+            def _on_progress(
+                n: int,
+            ) -> None:
+                with progress_lock:
+                    report.copied_bytes += n
+                    pbar.update(n)
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="file-sync-copy") as executor:
+                futures = {executor.submit(_copy_sync_file, src_root / rel_path, dst_root / rel_path, _on_progress): rel_path for rel_path in copy_list}
+                try:
+                    for future in as_completed(futures):
+                        rel_path = futures[future]
+                        try:
+                            future.result()
+                        except (shutil.Error, PermissionError, IsADirectoryError, OSError) as e:
+                            logger.error("同步 %s 到 %s 时发生错误: %s", src_root / rel_path, dst_root / rel_path, e)
+                            raise
+                        dst_stat = os.stat(dst_root / rel_path)
+                        records[rel_path] = _sync_record(
+                            src_files[rel_path],
+                            _SyncFileStat(size=dst_stat.st_size, mtime_ns=dst_stat.st_mtime_ns),
+                        )
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+        for rel_path in report.deleted:
+            remove_files(dst_root / rel_path)
+        if report.deleted and only_name is None:
+            # 从最深层开始删除源路径中已不存在的空目录
+            for rel_dir in sorted(dst_dirs - src_dirs, key=lambda x: x.count("/"), reverse=True):
                 try:
-                    os.remove(dst)
-                except Exception as e1:
-                    logger.error("删除未复制完成的文件失败: %s", e1)
-            raise RuntimeError(f"同步 '{src_path}' 到 '{dst_path}' 时发生错误: {e}") from e
+                    (dst_root / rel_dir).rmdir()
+                except OSError:
+                    pass
+    except (shutil.Error, PermissionError, IsADirectoryError, OSError, ValueError) as e:
+        _save_records()
+        raise RuntimeError(f"同步 '{src_path}' 到 '{dst_path}' 时发生错误: {e}") from e
 
-    logger.info("同步文件完成")
+    _save_records()
+    logger.info("同步文件完成, 新增: %s, 更新: %s, 删除: %s", len(report.added), len(report.updated), len(report.deleted))
+    return report
 
 
 def sync_files_and_create_symlink(
@@ -624,7 +1189,7 @@ def sync_files_and_create_symlink(
 
     链接路径若已存在, 并且存在文件, 将检查链接路径中的文件是否存在于源路径中
 
-    在链接路径存在但在源路径不存在的文件将被复制 (增量同步)
+    在链接路径存在但在源路径不存在, 或比源路径中的文件更新且内容不同的文件将被复制 (增量同步)
 
     完成增量同步后将链接路径属性, 若为实际路径则对该路径进行重命名; 如果为链接路径则删除链接
 
@@ -652,6 +1217,7 @@ def sync_files_and_create_symlink(
             sync_files(
                 src_path=link_path,
                 dst_path=src_path if not src_is_file else src_path.parent,
+                skip_newer_dst=True,
             )
             if link_path.is_symlink():
                 link_path.unlink()
@@ -1,5 +1,7 @@
 """模型下载管理器"""
 
+from typing import Any
+
 from sd_webui_all_in_one.model_downloader.types import (
     SupportedWebUiType,
     SUPPORTED_WEBUI_LIST,
@@ -11,9 +13,46 @@ from sd_webui_all_in_one.model_downloader.types import (
     ModelCardList,
 )
 from sd_webui_all_in_one.model_downloader.model_data import (
-    MODEL_DOWNLOAD_DICT,
+    MODEL_DATA_PATH,
+    ModelCardRecord,
+    ModelCatalog,
+    get_model_catalog,
+    load_model_data,
+)
+from sd_webui_all_in_one.model_downloader.model_store import (
+    ModelStore,
+    ModelStoreLinkMode,
+)
+from sd_webui_all_in_one.model_downloader.model_fingerprint import (
+    ModelArchitecture,
+    MODEL_ARCHITECTURE_LIST,
+    ModelComponent,
+    MODEL_COMPONENT_LIST,
+    MODEL_COMPONENT_SAVE_DIRS,
+    ModelFingerprint,
+    SafetensorsHeaderInfo,
+    classify_tensor_keys,
+    fingerprint_model,
+    fingerprint_models,
+    read_safetensors_header,
+    suggest_model_save_dir,
+)
+from sd_webui_all_in_one.model_downloader.model_inventory import (
+    ModelInventory,
+    ModelInventoryChanges,
+    ModelInventoryEntry,
+    get_model_inventory_db_path,
+    match_model_library,
+)
+from sd_webui_all_in_one.model_downloader.model_search import (
+    ModelSearchIndex,
+    get_model_search_index,
+    freeze_model_card,
+    thaw_model_card,
+    thaw_model_list,
 )
 from sd_webui_all_in_one.model_downloader.model_utils import (
+    ModelDownloadError,
     export_model_list,
     download_model,
     query_model_info,
@@ -33,10 +72,53 @@ __all__ = [
     "ModelCardList",
     # model_data.py: 模型数据
     "MODEL_DOWNLOAD_DICT",
+    "MODEL_DATA_PATH",
+    "ModelCardRecord",
+    "ModelCatalog",
+    "get_model_catalog",
+    "load_model_data",
+    # model_store.py: 模型存储
+    "ModelStore",
+    "ModelStoreLinkMode",
+    # model_fingerprint.py: 模型文件识别
+    "ModelArchitecture",
+    "MODEL_ARCHITECTURE_LIST",
+    "ModelComponent",
+    "MODEL_COMPONENT_LIST",
+    "MODEL_COMPONENT_SAVE_DIRS",
+    "ModelFingerprint",
+    "SafetensorsHeaderInfo",
+    "classify_tensor_keys",
+    "fingerprint_model",
+    "fingerprint_models",
+    "read_safetensors_header",
+    "suggest_model_save_dir",
+    # model_inventory.py: 本地模型清单
+    "ModelInventory",
+    "ModelInventoryChanges",
+    "ModelInventoryEntry",
+    "get_model_inventory_db_path",
+    "match_model_library",
+    # model_search.py: 模型库搜索
+    "ModelSearchIndex",
+    "get_model_search_index",
+    "freeze_model_card",
+    "thaw_model_card",
+    "thaw_model_list",
     # model_utils.py: 工具函数
+    "ModelDownloadError",
     "export_model_list",
     "download_model",
     "query_model_info",
     "display_model_table",
     "search_models_from_library",
 ]
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    # `MODEL_DOWNLOAD_DICT` 在首次访问时才加载
+    if name == "MODEL_DOWNLOAD_DICT":
+        return get_model_catalog().cards
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8029 +1,216 @@
-"""内置模型下载信息。"""
+"""内置模型下载信息
 
-from sd_webui_all_in_one.model_downloader.types import ModelCardList
+模型库保存在同目录下的`model_data.json`中 (每行一个模型), 首次访问时才读取并缓存, 导入该模块时不会构建模型库
+"""
 
+import json
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    Mapping,
+)
 
-MODEL_DOWNLOAD_DICT: ModelCardList = [
-    # SD 1.5
-    {
-        "name": "v1-5-pruned-emaonly",
-        "filename": "v1-5-pruned-emaonly.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/v1-5-pruned-emaonly.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/v1-5-pruned-emaonly.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animefull-final-pruned",
-        "filename": "animefull-final-pruned.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/animefull-final-pruned.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/animefull-final-pruned.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "nai1-artist_all_in_one_merge",
-        "filename": "nai1-artist_all_in_one_merge.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/nai1-artist_all_in_one_merge.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/nai1-artist_all_in_one_merge.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Counterfeit-V3.0_fp16",
-        "filename": "Counterfeit-V3.0_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/Counterfeit-V3.0_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/Counterfeit-V3.0_fp16.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "cetusMix_Whalefall2",
-        "filename": "cetusMix_Whalefall2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/cetusMix_Whalefall2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/cetusMix_Whalefall2.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "cuteyukimixAdorable_neochapter3",
-        "filename": "cuteyukimixAdorable_neochapter3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/cuteyukimixAdorable_neochapter3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/cuteyukimixAdorable_neochapter3.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ekmix-pastel-fp16-no-ema",
-        "filename": "ekmix-pastel-fp16-no-ema.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/ekmix-pastel-fp16-no-ema.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/ekmix-pastel-fp16-no-ema.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ex2K_sse2",
-        "filename": "ex2K_sse2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/ex2K_sse2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/ex2K_sse2.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohakuV5_rev2",
-        "filename": "kohakuV5_rev2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/kohakuV5_rev2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/kohakuV5_rev2.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "meinamix_meinaV11",
-        "filename": "meinamix_meinaV11.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/meinamix_meinaV11.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/meinamix_meinaV11.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "oukaStar_10",
-        "filename": "oukaStar_10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/oukaStar_10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/oukaStar_10.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "pastelMixStylizedAnime_pastelMixPrunedFP16",
-        "filename": "pastelMixStylizedAnime_pastelMixPrunedFP16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/pastelMixStylizedAnime_pastelMixPrunedFP16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/pastelMixStylizedAnime_pastelMixPrunedFP16.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "rabbit_v6",
-        "filename": "rabbit_v6.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/rabbit_v6.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/rabbit_v6.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sweetSugarSyndrome_rev15",
-        "filename": "sweetSugarSyndrome_rev15.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/sweetSugarSyndrome_rev15.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/sweetSugarSyndrome_rev15.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "AnythingV5Ink_ink",
-        "filename": "AnythingV5Ink_ink.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/AnythingV5Ink_ink.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/AnythingV5Ink_ink.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "bartstyledbBlueArchiveArtStyleFineTunedModel_v10",
-        "filename": "bartstyledbBlueArchiveArtStyleFineTunedModel_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/bartstyledbBlueArchiveArtStyleFineTunedModel_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/bartstyledbBlueArchiveArtStyleFineTunedModel_v10.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "meinapastel_v6Pastel",
-        "filename": "meinapastel_v6Pastel.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/meinapastel_v6Pastel.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/meinapastel_v6Pastel.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "qteamixQ_omegaFp16",
-        "filename": "qteamixQ_omegaFp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/qteamixQ_omegaFp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/qteamixQ_omegaFp16.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "tmndMix_tmndMixSPRAINBOW",
-        "filename": "tmndMix_tmndMixSPRAINBOW.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_1.5/tmndMix_tmndMixSPRAINBOW.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_1.5/tmndMix_tmndMixSPRAINBOW.safetensors",
-        },
-        "dtype": "SD 1.5",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    # SD 2.1
-    {
-        "name": "v2-1_768-ema-pruned",
-        "filename": "v2-1_768-ema-pruned.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_2.1/v2-1_768-ema-pruned.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_2.1/v2-1_768-ema-pruned.safetensors",
-        },
-        "dtype": "SD 2.1",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "wd-1-4-anime_e2",
-        "filename": "wd-1-4-anime_e2.ckpt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_2.1/wd-1-4-anime_e2.ckpt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_2.1/wd-1-4-anime_e2.ckpt",
-        },
-        "dtype": "SD 2.1",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "wd-mofu-fp16",
-        "filename": "wd-mofu-fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sd_2.1/wd-mofu-fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sd_2.1/wd-mofu-fp16.safetensors",
-        },
-        "dtype": "SD 2.1",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    # SDXL
-    {
-        "name": "sd_xl_offset_example-lora_1.0",
-        "filename": "sd_xl_offset_example-lora_1.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-lora/resolve/main/sdxl/sd_xl_offset_example-lora_1.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-lora/resolve/master/sdxl/sd_xl_offset_example-lora_1.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "Lora",
-            "comfyui": "Lora",
-            "invokeai": "Lora",
-            "fooocus": "Lora",
-            "sd_trainer": "Lora",
-            "sd_scripts": "Lora",
-        },
-    },
-    {
-        "name": "sd_xl_base_1.0_0.9vae",
-        "filename": "sd_xl_base_1.0_0.9vae.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sd_xl_base_1.0_0.9vae.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sd_xl_base_1.0_0.9vae.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd_xl_refiner_1.0_0.9vae",
-        "filename": "sd_xl_refiner_1.0_0.9vae.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sd_xl_refiner_1.0_0.9vae.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sd_xl_refiner_1.0_0.9vae.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd_xl_turbo_1.0_fp16",
-        "filename": "sd_xl_turbo_1.0_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sd_xl_turbo_1.0_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sd_xl_turbo_1.0_fp16.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "cosxl",
-        "filename": "cosxl.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/cosxl.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/cosxl.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "cosxl_edit",
-        "filename": "cosxl_edit.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/cosxl_edit.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/cosxl_edit.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-3.0-base",
-        "filename": "animagine-xl-3.0-base.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-3.0-base.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-3.0-base.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-3.0",
-        "filename": "animagine-xl-3.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-3.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-3.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-3.1",
-        "filename": "animagine-xl-3.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-3.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-3.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-4.0",
-        "filename": "animagine-xl-4.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-4.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-4.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-4.0-opt",
-        "filename": "animagine-xl-4.0-opt.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-4.0-opt.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-4.0-opt.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animagine-xl-4.0-zero",
-        "filename": "animagine-xl-4.0-zero.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animagine-xl-4.0-zero.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animagine-xl-4.0-zero.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "holodayo-xl-2.1",
-        "filename": "holodayo-xl-2.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/holodayo-xl-2.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/holodayo-xl-2.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kivotos-xl-2.0",
-        "filename": "kivotos-xl-2.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kivotos-xl-2.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kivotos-xl-2.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "clandestine-xl-1.0",
-        "filename": "clandestine-xl-1.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/clandestine-xl-1.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/clandestine-xl-1.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "UrangDiffusion-1.1",
-        "filename": "UrangDiffusion-1.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/UrangDiffusion-1.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/UrangDiffusion-1.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "RaeDiffusion-XL-v2",
-        "filename": "RaeDiffusion-XL-v2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/RaeDiffusion-XL-v2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/RaeDiffusion-XL-v2.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd_xl_anime_V52",
-        "filename": "sd_xl_anime_V52.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sd_xl_anime_V52.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sd_xl_anime_V52.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohaku-xl-delta-rev1",
-        "filename": "kohaku-xl-delta-rev1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kohaku-xl-delta-rev1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kohaku-xl-delta-rev1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohakuXLEpsilon_rev1",
-        "filename": "kohakuXLEpsilon_rev1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kohakuXLEpsilon_rev1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kohakuXLEpsilon_rev1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohaku-xl-epsilon-rev2",
-        "filename": "kohaku-xl-epsilon-rev2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kohaku-xl-epsilon-rev2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kohaku-xl-epsilon-rev2.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohaku-xl-epsilon-rev3",
-        "filename": "kohaku-xl-epsilon-rev3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kohaku-xl-epsilon-rev3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kohaku-xl-epsilon-rev3.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "kohaku-xl-zeta",
-        "filename": "kohaku-xl-zeta.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/kohaku-xl-zeta.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/kohaku-xl-zeta.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "starryXLV52_v52",
-        "filename": "starryXLV52_v52.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/starryXLV52_v52.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/starryXLV52_v52.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "heartOfAppleXL_v20",
-        "filename": "heartOfAppleXL_v20.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/heartOfAppleXL_v20.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/heartOfAppleXL_v20.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "heartOfAppleXL_v30",
-        "filename": "heartOfAppleXL_v30.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/heartOfAppleXL_v30.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/heartOfAppleXL_v30.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "baxlBartstylexlBlueArchiveFlatCelluloid_xlv1",
-        "filename": "baxlBartstylexlBlueArchiveFlatCelluloid_xlv1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/baxlBartstylexlBlueArchiveFlatCelluloid_xlv1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/baxlBartstylexlBlueArchiveFlatCelluloid_xlv1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "baxlBlueArchiveFlatCelluloidStyle_xlv3",
-        "filename": "baxlBlueArchiveFlatCelluloidStyle_xlv3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/baxlBlueArchiveFlatCelluloidStyle_xlv3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/baxlBlueArchiveFlatCelluloidStyle_xlv3.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sanaexlAnimeV10_v10",
-        "filename": "sanaexlAnimeV10_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sanaexlAnimeV10_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sanaexlAnimeV10_v10.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sanaexlAnimeV10_v11",
-        "filename": "sanaexlAnimeV10_v11.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/sanaexlAnimeV10_v11.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/sanaexlAnimeV10_v11.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "SanaeXL-Anime-v1.2-aesthetic",
-        "filename": "SanaeXL-Anime-v1.2-aesthetic.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/SanaeXL-Anime-v1.2-aesthetic.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/SanaeXL-Anime-v1.2-aesthetic.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "SanaeXL-Anime-v1.3-aesthetic",
-        "filename": "SanaeXL-Anime-v1.3-aesthetic.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/SanaeXL-Anime-v1.3-aesthetic.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/SanaeXL-Anime-v1.3-aesthetic.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v0.1",
-        "filename": "Illustrious-XL-v0.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v0.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v0.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v0.1-GUIDED",
-        "filename": "Illustrious-XL-v0.1-GUIDED.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v0.1-GUIDED.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v0.1-GUIDED.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v1.0",
-        "filename": "Illustrious-XL-v1.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v1.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v1.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v1.1",
-        "filename": "Illustrious-XL-v1.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v1.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v1.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v2.0-stable",
-        "filename": "Illustrious-XL-v2.0-stable.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v2.0-stable.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v2.0-stable.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "Illustrious-XL-v2.0",
-        "filename": "Illustrious-XL-v2.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/Illustrious-XL-v2.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/Illustrious-XL-v2.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "jruTheJourneyRemains_v25XL",
-        "filename": "jruTheJourneyRemains_v25XL.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/jruTheJourneyRemains_v25XL.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/jruTheJourneyRemains_v25XL.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "PVCStyleModelMovable_illustriousxl10",
-        "filename": "PVCStyleModelMovable_illustriousxl10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/PVCStyleModelMovable_illustriousxl10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/PVCStyleModelMovable_illustriousxl10.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "miaomiaoHarem_v15a",
-        "filename": "miaomiaoHarem_v15a.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/miaomiaoHarem_v15a.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/miaomiaoHarem_v15a.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "waiNSFWIllustrious_v80",
-        "filename": "waiNSFWIllustrious_v80.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/waiNSFWIllustrious_v80.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/waiNSFWIllustrious_v80.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "tIllunai3_v4",
-        "filename": "tIllunai3_v4.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/tIllunai3_v4.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/tIllunai3_v4.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_earlyAccessVersion",
-        "filename": "noobaiXLNAIXL_earlyAccessVersion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_earlyAccessVersion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_earlyAccessVersion.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_epsilonPred05Version",
-        "filename": "noobaiXLNAIXL_epsilonPred05Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_epsilonPred05Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_epsilonPred05Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_epsilonPred075",
-        "filename": "noobaiXLNAIXL_epsilonPred075.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_epsilonPred075.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_epsilonPred075.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_epsilonPred077",
-        "filename": "noobaiXLNAIXL_epsilonPred077.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_epsilonPred077.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_epsilonPred077.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_epsilonPred10Version",
-        "filename": "noobaiXLNAIXL_epsilonPred10Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_epsilonPred10Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_epsilonPred10Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_epsilonPred11Version",
-        "filename": "noobaiXLNAIXL_epsilonPred11Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_epsilonPred11Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_epsilonPred11Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPredTestVersion",
-        "filename": "noobaiXLNAIXL_vPredTestVersion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPredTestVersion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPredTestVersion.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred05Version",
-        "filename": "noobaiXLNAIXL_vPred05Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred05Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred05Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred06Version",
-        "filename": "noobaiXLNAIXL_vPred06Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred06Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred06Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred065SVersion",
-        "filename": "noobaiXLNAIXL_vPred065SVersion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred065SVersion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred065SVersion.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred075SVersion",
-        "filename": "noobaiXLNAIXL_vPred075SVersion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred075SVersion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred075SVersion.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred09RVersion",
-        "filename": "noobaiXLNAIXL_vPred09RVersion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred09RVersion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred09RVersion.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "noobaiXLNAIXL_vPred10Version",
-        "filename": "noobaiXLNAIXL_vPred10Version.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/noobaiXLNAIXL_vPred10Version.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/noobaiXLNAIXL_vPred10Version.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ChenkinNoob-XL-V0.1",
-        "filename": "ChenkinNoob-XL-V0.1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/ChenkinNoob-XL-V0.1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/ChenkinNoob-XL-V0.1.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ChenkinNoob-XL-V0.2",
-        "filename": "ChenkinNoob-XL-V0.2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/ChenkinNoob-XL-V0.2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/ChenkinNoob-XL-V0.2.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ChenkinNoob-XL-v0.2-Rectified-Flow",
-        "filename": "ChenkinNoob-XL-v0.2-Rectified-Flow.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/ChenkinNoob-XL-v0.2-Rectified-Flow.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/ChenkinNoob-XL-v0.2-Rectified-Flow.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ChenkinNoob-XL-V0.5",
-        "filename": "ChenkinNoob-XL-V0.5.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/ChenkinNoob-XL-V0.5.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/ChenkinNoob-XL-V0.5.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "PVCStyleModelMovable_nbxl12",
-        "filename": "PVCStyleModelMovable_nbxl12.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/PVCStyleModelMovable_nbxl12.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/PVCStyleModelMovable_nbxl12.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "PVCStyleModelMovable_nbxlVPredV10",
-        "filename": "PVCStyleModelMovable_nbxlVPredV10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/PVCStyleModelMovable_nbxlVPredV10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/PVCStyleModelMovable_nbxlVPredV10.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ponyDiffusionV6XL_v6StartWithThisOne",
-        "filename": "ponyDiffusionV6XL_v6StartWithThisOne.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/ponyDiffusionV6XL_v6StartWithThisOne.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/ponyDiffusionV6XL_v6StartWithThisOne.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "pdForAnime_v20",
-        "filename": "pdForAnime_v20.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/pdForAnime_v20.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/pdForAnime_v20.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "tPonynai3_v51WeightOptimized",
-        "filename": "tPonynai3_v51WeightOptimized.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/tPonynai3_v51WeightOptimized.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/tPonynai3_v51WeightOptimized.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "omegaPonyXLAnime_v20",
-        "filename": "omegaPonyXLAnime_v20.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/omegaPonyXLAnime_v20.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/omegaPonyXLAnime_v20.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animeIllustDiffusion_v061",
-        "filename": "animeIllustDiffusion_v061.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animeIllustDiffusion_v061.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animeIllustDiffusion_v061.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "artiwaifuDiffusion_v10",
-        "filename": "artiwaifuDiffusion_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/artiwaifuDiffusion_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/artiwaifuDiffusion_v10.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "artiwaifu-diffusion-v2",
-        "filename": "artiwaifu-diffusion-v2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/artiwaifu-diffusion-v2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/artiwaifu-diffusion-v2.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "AnythingXL_xl",
-        "filename": "AnythingXL_xl.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/AnythingXL_xl.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/AnythingXL_xl.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "abyssorangeXLElse_v10",
-        "filename": "abyssorangeXLElse_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/abyssorangeXLElse_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/abyssorangeXLElse_v10.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "animaPencilXL_v200",
-        "filename": "animaPencilXL_v200.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/animaPencilXL_v200.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/animaPencilXL_v200.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "bluePencilXL_v401",
-        "filename": "bluePencilXL_v401.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/bluePencilXL_v401.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/bluePencilXL_v401.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "nekorayxl_v06W3",
-        "filename": "nekorayxl_v06W3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/nekorayxl_v06W3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/nekorayxl_v06W3.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "CounterfeitXL-V1.0",
-        "filename": "CounterfeitXL-V1.0.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-model/resolve/main/sdxl_1.0/CounterfeitXL-V1.0.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-model/resolve/master/sdxl_1.0/CounterfeitXL-V1.0.safetensors",
-        },
-        "dtype": "SDXL",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    # SD 3
-    {
-        "name": "sd3_medium",
-        "filename": "sd3_medium.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3_medium.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3_medium.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3_medium_incl_clips",
-        "filename": "sd3_medium_incl_clips.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3_medium_incl_clips.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3_medium_incl_clips.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3_medium_incl_clips_t5xxlfp8",
-        "filename": "sd3_medium_incl_clips_t5xxlfp8.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3_medium_incl_clips_t5xxlfp8.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3_medium_incl_clips_t5xxlfp8.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3.5_large",
-        "filename": "sd3.5_large.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3.5_large.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3.5_large.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3.5_large_fp8_scaled",
-        "filename": "sd3.5_large_fp8_scaled.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3.5_large_fp8_scaled.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3.5_large_fp8_scaled.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3.5_large_turbo",
-        "filename": "sd3.5_large_turbo.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3.5_large_turbo.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3.5_large_turbo.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3.5_medium",
-        "filename": "sd3.5_medium.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3.5_medium.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3.5_medium.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "sd3.5_medium_incl_clips_t5xxlfp8scaled",
-        "filename": "sd3.5_medium_incl_clips_t5xxlfp8scaled.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/sd3.5_medium_incl_clips_t5xxlfp8scaled.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/sd3.5_medium_incl_clips_t5xxlfp8scaled.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "emi3",
-        "filename": "emi3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/emi3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/emi3.safetensors",
-        },
-        "dtype": "SD 3",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "fooocus": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    # SD 3 Text Encoder
-    {
-        "name": "clip_g",
-        "filename": "clip_g.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/text_encoders/clip_g.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/text_encoders/clip_g.safetensors",
-        },
-        "dtype": "SD 3 Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "clip_l",
-        "filename": "clip_l.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/text_encoders/clip_l.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/text_encoders/clip_l.safetensors",
-        },
-        "dtype": "SD 3 Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5xxl_fp16",
-        "filename": "t5xxl_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/text_encoders/t5xxl_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/text_encoders/t5xxl_fp16.safetensors",
-        },
-        "dtype": "SD 3 Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5xxl_fp8_e4m3fn",
-        "filename": "t5xxl_fp8_e4m3fn.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/text_encoders/t5xxl_fp8_e4m3fn.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/text_encoders/t5xxl_fp8_e4m3fn.safetensors",
-        },
-        "dtype": "SD 3 Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5xxl_fp8_e4m3fn_scaled",
-        "filename": "t5xxl_fp8_e4m3fn_scaled.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-3-model/resolve/main/text_encoders/t5xxl_fp8_e4m3fn_scaled.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-3-model/resolve/master/text_encoders/t5xxl_fp8_e4m3fn_scaled.safetensors",
-        },
-        "dtype": "SD 3 Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    # HunyuanDiT
-    {
-        "name": "hunyuan_dit_1.2",
-        "filename": "hunyuan_dit_1.2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/comfyui-extension-models/resolve/main/hunyuan_dit_comfyui/hunyuan_dit_1.2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/comfyui-extension-models/resolve/master/hunyuan_dit_comfyui/hunyuan_dit_1.2.safetensors",
-        },
-        "dtype": "HunyuanDiT",
-        "supported_webui": [
-            "comfyui",
-        ],
-        "save_dir": {
-            "comfyui": "models/checkpoints",
-        },
-    },
-    {
-        "name": "comfy_freeway_animation_hunyuan_dit_180w",
-        "filename": "comfy_freeway_animation_hunyuan_dit_180w.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/comfyui-extension-models/resolve/main/hunyuan_dit_comfyui/comfy_freeway_animation_hunyuan_dit_180w.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/comfyui-extension-models/resolve/master/hunyuan_dit_comfyui/comfy_freeway_animation_hunyuan_dit_180w.safetensors",
-        },
-        "dtype": "HunyuanDiT",
-        "supported_webui": [
-            "comfyui",
-        ],
-        "save_dir": {
-            "comfyui": "models/checkpoints",
-        },
-    },
-    # FLUX
-    {
-        "name": "flux1-dev",
-        "filename": "flux1-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-fp8",
-        "filename": "flux1-dev-fp8.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-fp8.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-fp8.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux_dev_fp8_scaled_diffusion_model",
-        "filename": "flux_dev_fp8_scaled_diffusion_model.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux_dev_fp8_scaled_diffusion_model.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux_dev_fp8_scaled_diffusion_model.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-bnb-nf4-v2",
-        "filename": "flux1-dev-bnb-nf4-v2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-bnb-nf4-v2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-bnb-nf4-v2.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-bnb-nf4",
-        "filename": "flux1-dev-bnb-nf4.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-bnb-nf4.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-bnb-nf4.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q2_K",
-        "filename": "flux1-dev-Q2_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q2_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q2_K.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q3_K_S",
-        "filename": "flux1-dev-Q3_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q3_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q3_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q4_0",
-        "filename": "flux1-dev-Q4_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q4_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q4_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q4_1",
-        "filename": "flux1-dev-Q4_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q4_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q4_1.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q4_K_S",
-        "filename": "flux1-dev-Q4_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q4_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q4_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q5_0",
-        "filename": "flux1-dev-Q5_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q5_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q5_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q5_1",
-        "filename": "flux1-dev-Q5_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q5_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q5_1.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q5_K_S",
-        "filename": "flux1-dev-Q5_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q5_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q5_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q6_K",
-        "filename": "flux1-dev-Q6_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q6_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q6_K.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-Q8_0",
-        "filename": "flux1-dev-Q8_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-Q8_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-Q8_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-F16",
-        "filename": "flux1-dev-F16.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-F16.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-F16.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell",
-        "filename": "flux1-schnell.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-fp8",
-        "filename": "flux1-schnell-fp8.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-fp8.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-fp8.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/checkpoints",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q2_K",
-        "filename": "flux1-schnell-Q2_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q2_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q2_K.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q3_K_S",
-        "filename": "flux1-schnell-Q3_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q3_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q3_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q4_0",
-        "filename": "flux1-schnell-Q4_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q4_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q4_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q4_1",
-        "filename": "flux1-schnell-Q4_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q4_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q4_1.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q4_K_S",
-        "filename": "flux1-schnell-Q4_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q4_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q4_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q5_0",
-        "filename": "flux1-schnell-Q5_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q5_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q5_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q5_1",
-        "filename": "flux1-schnell-Q5_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q5_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q5_1.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q5_K_S",
-        "filename": "flux1-schnell-Q5_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q5_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q5_K_S.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q6_K",
-        "filename": "flux1-schnell-Q6_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q6_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q6_K.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-Q8_0",
-        "filename": "flux1-schnell-Q8_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-Q8_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-Q8_0.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-schnell-F16",
-        "filename": "flux1-schnell-F16.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-schnell-F16.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-schnell-F16.gguf",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "ashen0209-flux1-dev2pro",
-        "filename": "ashen0209-flux1-dev2pro.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/ashen0209-flux1-dev2pro.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/ashen0209-flux1-dev2pro.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "jimmycarter-LibreFLUX",
-        "filename": "jimmycarter-LibreFLUX.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/jimmycarter-LibreFLUX.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/jimmycarter-LibreFLUX.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "nyanko7-flux-dev-de-distill",
-        "filename": "nyanko7-flux-dev-de-distill.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/nyanko7-flux-dev-de-distill.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/nyanko7-flux-dev-de-distill.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "shuttle-3-diffusion",
-        "filename": "shuttle-3-diffusion.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/shuttle-3-diffusion.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/shuttle-3-diffusion.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-krea-dev_fp8_scaled",
-        "filename": "flux1-krea-dev_fp8_scaled.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-krea-dev_fp8_scaled.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-krea-dev_fp8_scaled.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-krea-dev",
-        "filename": "flux1-krea-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-krea-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-krea-dev.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-dev-kontext_fp8_scaled",
-        "filename": "flux1-dev-kontext_fp8_scaled.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-dev-kontext_fp8_scaled.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-dev-kontext_fp8_scaled.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "flux1-kontext-dev",
-        "filename": "flux1-kontext-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/flux1-kontext-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/flux1-kontext-dev.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    {
-        "name": "chroma-unlocked-v50",
-        "filename": "chroma-unlocked-v50.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_1/chroma-unlocked-v50.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_1/chroma-unlocked-v50.safetensors",
-        },
-        "dtype": "FLUX",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Stable-diffusion",
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/checkpoints",
-            "sd_trainer": "sd-models/checkpoints",
-            "sd_scripts": "sd-models/checkpoints",
-        },
-    },
-    # FLUX Text Encoder
-    {
-        "name": "clip_l",
-        "filename": "clip_l.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/clip_l.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/clip_l.safetensors",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5xxl_fp16",
-        "filename": "t5xxl_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5xxl_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5xxl_fp16.safetensors",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5xxl_fp8_e4m3fn",
-        "filename": "t5xxl_fp8_e4m3fn.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5xxl_fp8_e4m3fn.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5xxl_fp8_e4m3fn.safetensors",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q3_K_L",
-        "filename": "t5-v1_1-xxl-encoder-Q3_K_L.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_L.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_L.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q3_K_M",
-        "filename": "t5-v1_1-xxl-encoder-Q3_K_M.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_M.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_M.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q3_K_S",
-        "filename": "t5-v1_1-xxl-encoder-Q3_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q3_K_S.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q4_K_M",
-        "filename": "t5-v1_1-xxl-encoder-Q4_K_M.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q4_K_M.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q4_K_M.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q4_K_S",
-        "filename": "t5-v1_1-xxl-encoder-Q4_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q4_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q4_K_S.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q5_K_M",
-        "filename": "t5-v1_1-xxl-encoder-Q5_K_M.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q5_K_M.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q5_K_M.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q5_K_S",
-        "filename": "t5-v1_1-xxl-encoder-Q5_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q5_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q5_K_S.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q6_K",
-        "filename": "t5-v1_1-xxl-encoder-Q6_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q6_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q6_K.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-Q8_0",
-        "filename": "t5-v1_1-xxl-encoder-Q8_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-Q8_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-Q8_0.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-f16",
-        "filename": "t5-v1_1-xxl-encoder-f16.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-f16.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-f16.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    {
-        "name": "t5-v1_1-xxl-encoder-f32",
-        "filename": "t5-v1_1-xxl-encoder-f32.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_text_encoders/t5-v1_1-xxl-encoder-f32.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_text_encoders/t5-v1_1-xxl-encoder-f32.gguf",
-        },
-        "dtype": "FLUX Text Encoder",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "sd_webui": "models/text_encoder",
-            "comfyui": "models/text_encoders",
-            "invokeai": "models/text_encoders",
-        },
-    },
-    # FLUX VAE
-    {
-        "name": "ae",
-        "filename": "ae.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux-model/resolve/main/flux_vae/ae.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux-model/resolve/master/flux_vae/ae.safetensors",
-        },
-        "dtype": "FLUX VAE",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE",
-            "comfyui": "models/vae",
-            "invokeai": "models/vae",
-            "sd_trainer": "sd-models/vae",
-            "sd_scripts": "sd-models/vae",
-        },
-    },
-    # SD 1.5 VAE
-    {
-        "name": "vae-ft-ema-560000-ema-pruned",
-        "filename": "vae-ft-ema-560000-ema-pruned.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/sd_1.5/vae-ft-ema-560000-ema-pruned.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/sd_1.5/vae-ft-ema-560000-ema-pruned.safetensors",
-        },
-        "dtype": "SD 1.5 VAE",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE",
-            "comfyui": "models/vae",
-            "invokeai": "models/vae",
-            "fooocus": "models/vae",
-            "sd_trainer": "sd-models/vae",
-            "sd_scripts": "sd-models/vae",
-        },
-    },
-    {
-        "name": "vae-ft-mse-840000-ema-pruned",
-        "filename": "vae-ft-mse-840000-ema-pruned.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/sd_1.5/vae-ft-mse-840000-ema-pruned.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/sd_1.5/vae-ft-mse-840000-ema-pruned.safetensors",
-        },
-        "dtype": "SD 1.5 VAE",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE",
-            "comfyui": "models/vae",
-            "invokeai": "models/vae",
-            "fooocus": "models/vae",
-            "sd_trainer": "sd-models/vae",
-            "sd_scripts": "sd-models/vae",
-        },
-    },
-    # SDXL VAE
-    {
-        "name": "sdxl_vae",
-        "filename": "sdxl_vae.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/sdxl_1.0/sdxl_vae.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/sdxl_1.0/sdxl_vae.safetensors",
-        },
-        "dtype": "SDXL VAE",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE",
-            "comfyui": "models/vae",
-            "invokeai": "models/vae",
-            "fooocus": "models/vae",
-            "sd_trainer": "sd-models/vae",
-            "sd_scripts": "sd-models/vae",
-        },
-    },
-    {
-        "name": "sdxl_fp16_fix_vae",
-        "filename": "sdxl_fp16_fix_vae.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/sdxl_1.0/sdxl_fp16_fix_vae.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/sdxl_1.0/sdxl_fp16_fix_vae.safetensors",
-        },
-        "dtype": "SDXL VAE",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-            "sd_trainer",
-            "sd_scripts",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE",
-            "comfyui": "models/vae",
-            "invokeai": "models/vae",
-            "fooocus": "models/vae",
-            "sd_trainer": "sd-models/vae",
-            "sd_scripts": "sd-models/vae",
-        },
-    },
-    # VAE approx
-    {
-        "name": "model",
-        "filename": "model.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/vae-approx/model.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/vae-approx/model.pt",
-        },
-        "dtype": "VAE approx",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE-approx",
-            "comfyui": "models/vae_approx",
-            "invokeai": "models/vae_approx",
-            "fooocus": "models/vae_approx",
-        },
-    },
-    {
-        "name": "vaeapprox-sdxl",
-        "filename": "vaeapprox-sdxl.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/vae-approx/vaeapprox-sdxl.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/vae-approx/vaeapprox-sdxl.pt",
-        },
-        "dtype": "VAE approx",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE-approx",
-            "comfyui": "models/vae_approx",
-            "invokeai": "models/vae_approx",
-            "fooocus": "models/vae_approx",
-        },
-    },
-    {
-        "name": "vaeapprox-sd3",
-        "filename": "vaeapprox-sd3.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-vae/resolve/main/vae-approx/vaeapprox-sd3.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-vae/resolve/master/vae-approx/vaeapprox-sd3.pt",
-        },
-        "dtype": "VAE approx",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/VAE-approx",
-            "comfyui": "models/vae_approx",
-            "invokeai": "models/vae_approx",
-            "fooocus": "models/vae_approx",
-        },
-    },
-    # Upscale
-    {
-        "name": "codeformer-v0.1.0",
-        "filename": "codeformer-v0.1.0.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/Codeformer/codeformer-v0.1.0.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/Codeformer/codeformer-v0.1.0.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/Codeformer",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_2_x2",
-        "filename": "DAT_2_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_2_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_2_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_2_x3",
-        "filename": "DAT_2_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_2_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_2_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_2_x4",
-        "filename": "DAT_2_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_2_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_2_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_S_x2",
-        "filename": "DAT_S_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_S_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_S_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_S_x3",
-        "filename": "DAT_S_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_S_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_S_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_S_x4",
-        "filename": "DAT_S_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_S_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_S_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_light_x2",
-        "filename": "DAT_light_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_light_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_light_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_light_x3",
-        "filename": "DAT_light_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_light_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_light_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_light_x4",
-        "filename": "DAT_light_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_light_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_light_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_x2",
-        "filename": "DAT_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_x3",
-        "filename": "DAT_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "DAT_x4",
-        "filename": "DAT_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/DAT/DAT_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/DAT/DAT_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/DAT",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "16xPSNR",
-        "filename": "16xPSNR.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/16xPSNR.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/16xPSNR.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x-ITF-SkinDiffDetail-Lite-v1",
-        "filename": "1x-ITF-SkinDiffDetail-Lite-v1.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x-ITF-SkinDiffDetail-Lite-v1.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x-ITF-SkinDiffDetail-Lite-v1.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x_NMKD-BrightenRedux_200k",
-        "filename": "1x_NMKD-BrightenRedux_200k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x_NMKD-BrightenRedux_200k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x_NMKD-BrightenRedux_200k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x_NMKD-YandereInpaint_375000_G",
-        "filename": "1x_NMKD-YandereInpaint_375000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x_NMKD-YandereInpaint_375000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x_NMKD-YandereInpaint_375000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x_NMKDDetoon_97500_G",
-        "filename": "1x_NMKDDetoon_97500_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x_NMKDDetoon_97500_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x_NMKDDetoon_97500_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x_NoiseToner-Poisson-Detailed_108000_G",
-        "filename": "1x_NoiseToner-Poisson-Detailed_108000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x_NoiseToner-Poisson-Detailed_108000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x_NoiseToner-Poisson-Detailed_108000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "1x_NoiseToner-Uniform-Detailed_100000_G",
-        "filename": "1x_NoiseToner-Uniform-Detailed_100000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/1x_NoiseToner-Uniform-Detailed_100000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/1x_NoiseToner-Uniform-Detailed_100000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x-UltraSharp",
-        "filename": "4x-UltraSharp.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x-UltraSharp.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x-UltraSharp.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4xPSNR",
-        "filename": "4xPSNR.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4xPSNR.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4xPSNR.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_CountryRoads_377000_G",
-        "filename": "4x_CountryRoads_377000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_CountryRoads_377000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_CountryRoads_377000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_Fatality_Comix_260000_G",
-        "filename": "4x_Fatality_Comix_260000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_Fatality_Comix_260000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_Fatality_Comix_260000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-Siax_200k",
-        "filename": "4x_NMKD-Siax_200k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-Siax_200k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-Siax_200k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-Superscale-Artisoftject_210000_G",
-        "filename": "4x_NMKD-Superscale-Artisoftject_210000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-Superscale-Artisoftject_210000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-Superscale-Artisoftject_210000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-Superscale-SP_178000_G",
-        "filename": "4x_NMKD-Superscale-SP_178000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-Superscale-SP_178000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-Superscale-SP_178000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-UltraYandere-Lite_280k",
-        "filename": "4x_NMKD-UltraYandere-Lite_280k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-UltraYandere-Lite_280k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-UltraYandere-Lite_280k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-UltraYandere_300k",
-        "filename": "4x_NMKD-UltraYandere_300k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-UltraYandere_300k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-UltraYandere_300k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKD-YandereNeoXL_200k",
-        "filename": "4x_NMKD-YandereNeoXL_200k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKD-YandereNeoXL_200k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKD-YandereNeoXL_200k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NMKDSuperscale_Artisoft_120000_G",
-        "filename": "4x_NMKDSuperscale_Artisoft_120000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NMKDSuperscale_Artisoft_120000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NMKDSuperscale_Artisoft_120000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_NickelbackFS_72000_G",
-        "filename": "4x_NickelbackFS_72000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_NickelbackFS_72000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_NickelbackFS_72000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_Nickelback_70000G",
-        "filename": "4x_Nickelback_70000G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_Nickelback_70000G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_Nickelback_70000G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_RealisticRescaler_100000_G",
-        "filename": "4x_RealisticRescaler_100000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_RealisticRescaler_100000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_RealisticRescaler_100000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_Valar_v1",
-        "filename": "4x_Valar_v1.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_Valar_v1.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_Valar_v1.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_fatal_Anime_500000_G",
-        "filename": "4x_fatal_Anime_500000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_fatal_Anime_500000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_fatal_Anime_500000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_foolhardy_Remacri",
-        "filename": "4x_foolhardy_Remacri.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/4x_foolhardy_Remacri.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/4x_foolhardy_Remacri.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "8xPSNR",
-        "filename": "8xPSNR.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/8xPSNR.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/8xPSNR.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "8x_NMKD-Superscale_150000_G",
-        "filename": "8x_NMKD-Superscale_150000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/8x_NMKD-Superscale_150000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/8x_NMKD-Superscale_150000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "8x_NMKD-Typescale_175k",
-        "filename": "8x_NMKD-Typescale_175k.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/8x_NMKD-Typescale_175k.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/8x_NMKD-Typescale_175k.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "A_ESRGAN_Single",
-        "filename": "A_ESRGAN_Single.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/A_ESRGAN_Single.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/A_ESRGAN_Single.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "BSRGAN",
-        "filename": "BSRGAN.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/BSRGAN.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/BSRGAN.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "BSRGANx2",
-        "filename": "BSRGANx2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/BSRGANx2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/BSRGANx2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "BSRNet",
-        "filename": "BSRNet.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/BSRNet.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/BSRNet.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "ESRGAN_4x",
-        "filename": "ESRGAN_4x.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/ESRGAN_4x.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/ESRGAN_4x.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "LADDIER1_282500_G",
-        "filename": "LADDIER1_282500_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/LADDIER1_282500_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/LADDIER1_282500_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_UniversalUpscalerV2-Neutral_115000_swaG",
-        "filename": "4x_UniversalUpscalerV2-Neutral_115000_swaG.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Neutral_115000_swaG.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Neutral_115000_swaG.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_UniversalUpscalerV2-Sharp_101000_G",
-        "filename": "4x_UniversalUpscalerV2-Sharp_101000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Sharp_101000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Sharp_101000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_UniversalUpscalerV2-Sharper_103000_G",
-        "filename": "4x_UniversalUpscalerV2-Sharper_103000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Sharper_103000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/UniversalUpscaler/4x_UniversalUpscalerV2-Sharper_103000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_UniversalUpscaler-Detailed_155000_G",
-        "filename": "4x_UniversalUpscaler-Detailed_155000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/UniversalUpscaler/Legacy/4x_UniversalUpscaler-Detailed_155000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/UniversalUpscaler/Legacy/4x_UniversalUpscaler-Detailed_155000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "4x_UniversalUpscaler-Soft_190000_G",
-        "filename": "4x_UniversalUpscaler-Soft_190000_G.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/UniversalUpscaler/Legacy/4x_UniversalUpscaler-Soft_190000_G.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/UniversalUpscaler/Legacy/4x_UniversalUpscaler-Soft_190000_G.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "WaifuGAN_v3_30000",
-        "filename": "WaifuGAN_v3_30000.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/WaifuGAN_v3_30000.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/WaifuGAN_v3_30000.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "lollypop",
-        "filename": "lollypop.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/lollypop.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/lollypop.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "sudo_rife4_269.662_testV1_scale1",
-        "filename": "sudo_rife4_269.662_testV1_scale1.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/ESRGAN/sudo_rife4_269.662_testV1_scale1.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/ESRGAN/sudo_rife4_269.662_testV1_scale1.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "GFPGANv1.3",
-        "filename": "GFPGANv1.3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/GFPGAN/GFPGANv1.3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/GFPGAN/GFPGANv1.3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/GFPGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "GFPGANv1.4",
-        "filename": "GFPGANv1.4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/GFPGAN/GFPGANv1.4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/GFPGAN/GFPGANv1.4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/GFPGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "detection_Resnet50_Final",
-        "filename": "detection_Resnet50_Final.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/GFPGAN/detection_Resnet50_Final.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/GFPGAN/detection_Resnet50_Final.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/GFPGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "parsing_bisenet",
-        "filename": "parsing_bisenet.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/GFPGAN/parsing_bisenet.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/GFPGAN/parsing_bisenet.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/GFPGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "parsing_parsenet",
-        "filename": "parsing_parsenet.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/GFPGAN/parsing_parsenet.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/GFPGAN/parsing_parsenet.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/GFPGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "RealESRGAN_x4plus",
-        "filename": "RealESRGAN_x4plus.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/RealESRGAN/RealESRGAN_x4plus.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/RealESRGAN/RealESRGAN_x4plus.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/RealESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "RealESRGAN_x4plus_anime_6B",
-        "filename": "RealESRGAN_x4plus_anime_6B.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/RealESRGAN/RealESRGAN_x4plus_anime_6B.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/RealESRGAN/RealESRGAN_x4plus_anime_6B.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/RealESRGAN",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DF2K_s64w8_SwinIR-M_x2",
-        "filename": "001_classicalSR_DF2K_s64w8_SwinIR-M_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DF2K_s64w8_SwinIR-M_x3",
-        "filename": "001_classicalSR_DF2K_s64w8_SwinIR-M_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DF2K_s64w8_SwinIR-M_x4",
-        "filename": "001_classicalSR_DF2K_s64w8_SwinIR-M_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DF2K_s64w8_SwinIR-M_x8",
-        "filename": "001_classicalSR_DF2K_s64w8_SwinIR-M_x8.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x8.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DF2K_s64w8_SwinIR-M_x8.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x2",
-        "filename": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x2.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x2.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x2.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x3",
-        "filename": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x3.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x3.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x3.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x4",
-        "filename": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x4.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x4.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x4.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x8",
-        "filename": "001_classicalSR_DIV2K_s48w8_SwinIR-M_x8.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x8.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/001_classicalSR_DIV2K_s48w8_SwinIR-M_x8.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "003_realSR_BSRGAN_DFOWMFC_s64w8_SwinIR-L_x4_GAN-with-dict-keys-params-and-params_ema",
-        "filename": "003_realSR_BSRGAN_DFOWMFC_s64w8_SwinIR-L_x4_GAN-with-dict-keys-params-and-params_ema.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/003_realSR_BSRGAN_DFOWMFC_s64w8_SwinIR-L_x4_GAN-with-dict-keys-params-and-params_ema.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/003_realSR_BSRGAN_DFOWMFC_s64w8_SwinIR-L_x4_GAN-with-dict-keys-params-and-params_ema.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "003_realSR_BSRGAN_DFO_s64w8_SwinIR-M_x2_GAN-with-dict-keys-params-and-params_ema",
-        "filename": "003_realSR_BSRGAN_DFO_s64w8_SwinIR-M_x2_GAN-with-dict-keys-params-and-params_ema.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/003_realSR_BSRGAN_DFO_s64w8_SwinIR-M_x2_GAN-with-dict-keys-params-and-params_ema.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/003_realSR_BSRGAN_DFO_s64w8_SwinIR-M_x2_GAN-with-dict-keys-params-and-params_ema.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "Swin2SR_ClassicalSR_X2_64",
-        "filename": "Swin2SR_ClassicalSR_X2_64.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/Swin2SR_ClassicalSR_X2_64.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/Swin2SR_ClassicalSR_X2_64.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "Swin2SR_ClassicalSR_X4_64",
-        "filename": "Swin2SR_ClassicalSR_X4_64.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/Swin2SR_ClassicalSR_X4_64.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/Swin2SR_ClassicalSR_X4_64.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "Swin2SR_CompressedSR_X4_48",
-        "filename": "Swin2SR_CompressedSR_X4_48.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/Swin2SR_CompressedSR_X4_48.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/Swin2SR_CompressedSR_X4_48.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "Swin2SR_RealworldSR_X4_64_BSRGAN_PSNR",
-        "filename": "Swin2SR_RealworldSR_X4_64_BSRGAN_PSNR.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/Swin2SR_RealworldSR_X4_64_BSRGAN_PSNR.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/Swin2SR_RealworldSR_X4_64_BSRGAN_PSNR.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    {
-        "name": "SwinIR_4x",
-        "filename": "SwinIR_4x.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-upscaler-models/resolve/main/SwinIR/SwinIR_4x.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-upscaler-models/resolve/master/SwinIR/SwinIR_4x.pth",
-        },
-        "dtype": "Upscale",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/SwinIR",
-            "comfyui": "models/upscale_models",
-            "invokeai": "models/upscale_models",
-            "fooocus": "models/upscale_models",
-        },
-    },
-    # Embedding
-    {
-        "name": "EasyNegativeV2",
-        "filename": "EasyNegativeV2.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/EasyNegativeV2.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/EasyNegativeV2.safetensors",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "bad-artist-anime",
-        "filename": "bad-artist-anime.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/bad-artist-anime.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/bad-artist-anime.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "bad-artist",
-        "filename": "bad-artist.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/bad-artist.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/bad-artist.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "bad-hands-5",
-        "filename": "bad-hands-5.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/bad-hands-5.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/bad-hands-5.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "bad-image-v2-39000",
-        "filename": "bad-image-v2-39000.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/bad-image-v2-39000.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/bad-image-v2-39000.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "bad_prompt_version2",
-        "filename": "bad_prompt_version2.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/bad_prompt_version2.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/bad_prompt_version2.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "ng_deepnegative_v1_75t",
-        "filename": "ng_deepnegative_v1_75t.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/ng_deepnegative_v1_75t.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/ng_deepnegative_v1_75t.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    {
-        "name": "verybadimagenegative_v1.3",
-        "filename": "verybadimagenegative_v1.3.pt",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd-embeddings/resolve/main/sd_1.5/verybadimagenegative_v1.3.pt",
-            "modelscope": "https://modelscope.cn/models/licyks/sd-embeddings/resolve/master/sd_1.5/verybadimagenegative_v1.3.pt",
-        },
-        "dtype": "Embedding",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "embeddings",
-            "comfyui": "models/embeddings",
-            "invokeai": "models/embeddings",
-            "fooocus": "models/embeddings",
-        },
-    },
-    # SD 1.5 ControlNet
-    {
-        "name": "control_v11e_sd15_ip2p_fp16",
-        "filename": "control_v11e_sd15_ip2p_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11e_sd15_ip2p_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11e_sd15_ip2p_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11e_sd15_shuffle_fp16",
-        "filename": "control_v11e_sd15_shuffle_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11e_sd15_shuffle_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11e_sd15_shuffle_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11f1e_sd15_tile_fp16",
-        "filename": "control_v11f1e_sd15_tile_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11f1e_sd15_tile_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11f1e_sd15_tile_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11f1p_sd15_depth_fp16",
-        "filename": "control_v11f1p_sd15_depth_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11f1p_sd15_depth_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11f1p_sd15_depth_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_canny_fp16",
-        "filename": "control_v11p_sd15_canny_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_canny_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_canny_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_inpaint_fp16",
-        "filename": "control_v11p_sd15_inpaint_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_inpaint_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_inpaint_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_lineart_fp16",
-        "filename": "control_v11p_sd15_lineart_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_lineart_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_lineart_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_mlsd_fp16",
-        "filename": "control_v11p_sd15_mlsd_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_mlsd_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_mlsd_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_normalbae_fp16",
-        "filename": "control_v11p_sd15_normalbae_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_normalbae_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_normalbae_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_openpose_fp16",
-        "filename": "control_v11p_sd15_openpose_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_openpose_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_openpose_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_scribble_fp16",
-        "filename": "control_v11p_sd15_scribble_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_scribble_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_scribble_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_seg_fp16",
-        "filename": "control_v11p_sd15_seg_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_seg_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_seg_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15_softedge_fp16",
-        "filename": "control_v11p_sd15_softedge_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15_softedge_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15_softedge_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v11p_sd15s2_lineart_anime_fp16",
-        "filename": "control_v11p_sd15s2_lineart_anime_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v11p_sd15s2_lineart_anime_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v11p_sd15s2_lineart_anime_fp16.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v1p_sd15_brightness",
-        "filename": "control_v1p_sd15_brightness.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v1p_sd15_brightness.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v1p_sd15_brightness.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v1p_sd15_illumination",
-        "filename": "control_v1p_sd15_illumination.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v1p_sd15_illumination.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v1p_sd15_illumination.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control_v1p_sd15_qrcode_monster",
-        "filename": "control_v1p_sd15_qrcode_monster.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/control_v1p_sd15_qrcode_monster.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/control_v1p_sd15_qrcode_monster.safetensors",
-        },
-        "dtype": "SD 1.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # SDXL ControlNet
-    {
-        "name": "monster-labs-control_v1p_sdxl_qrcode_monster",
-        "filename": "monster-labs-control_v1p_sdxl_qrcode_monster.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/monster-labs-control_v1p_sdxl_qrcode_monster.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/monster-labs-control_v1p_sdxl_qrcode_monster.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "mistoLine_fp16",
-        "filename": "mistoLine_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/mistoLine_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/mistoLine_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "destitech-controlnet-inpaint-dreamer-sdxl",
-        "filename": "destitech-controlnet-inpaint-dreamer-sdxl.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/destitech-controlnet-inpaint-dreamer-sdxl.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/destitech-controlnet-inpaint-dreamer-sdxl.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "control-lora-recolor-rank128-sdxl",
-        "filename": "control-lora-recolor-rank128-sdxl.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/control-lora/resolve/main/control-lora-recolor-rank128-sdxl.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/control-lora/resolve/master/control-lora-recolor-rank128-sdxl.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "xinsir-controlnet-union-sdxl-1.0-promax",
-        "filename": "xinsir-controlnet-union-sdxl-1.0-promax.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/xinsir-controlnet-union-sdxl-1.0-promax.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/xinsir-controlnet-union-sdxl-1.0-promax.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "kohakuXLControlnet_canny",
-        "filename": "kohakuXLControlnet_canny.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/kohakuXLControlnet_canny.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/kohakuXLControlnet_canny.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "animagineXL40_canny",
-        "filename": "animagineXL40_canny.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/animagineXL40_canny.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/animagineXL40_canny.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLCanny_v10",
-        "filename": "illustriousXLCanny_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLCanny_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLCanny_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLLineart_v10",
-        "filename": "illustriousXLLineart_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLLineart_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLLineart_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLDepth_v10",
-        "filename": "illustriousXLDepth_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLDepth_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLDepth_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLSoftedge_v10",
-        "filename": "illustriousXLSoftedge_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLSoftedge_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLSoftedge_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLLineartRrealistic_v10",
-        "filename": "illustriousXLLineartRrealistic_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLLineartRrealistic_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLLineartRrealistic_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLShuffle_v10",
-        "filename": "illustriousXLShuffle_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLShuffle_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLShuffle_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLOpenPose_v10",
-        "filename": "illustriousXLOpenPose_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLOpenPose_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLOpenPose_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLTile_v10",
-        "filename": "illustriousXLTile_v10.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLTile_v10.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLTile_v10.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLv0.1_inpainting_fp16",
-        "filename": "illustriousXLv0.1_inpainting_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLv0.1_inpainting_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLv0.1_inpainting_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLv1.1_canny_fp16",
-        "filename": "illustriousXLv1.1_canny_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLv1.1_canny_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLv1.1_canny_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLv1.1_depth_midas_fp16",
-        "filename": "illustriousXLv1.1_depth_midas_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLv1.1_depth_midas_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLv1.1_depth_midas_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLv1.1_inpainting_fp16",
-        "filename": "illustriousXLv1.1_inpainting_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLv1.1_inpainting_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLv1.1_inpainting_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "illustriousXLv1.1_tile_fp16",
-        "filename": "illustriousXLv1.1_tile_fp16.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/illustriousXLv1.1_tile_fp16.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/illustriousXLv1.1_tile_fp16.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsCanny",
-        "filename": "noobaiXLControlnet_epsCanny.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsCanny.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsCanny.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsDepthMidas",
-        "filename": "noobaiXLControlnet_epsDepthMidas.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsDepthMidas.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsDepthMidas.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsLineartAnime",
-        "filename": "noobaiXLControlnet_epsLineartAnime.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsLineartAnime.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsLineartAnime.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsNormalMidas",
-        "filename": "noobaiXLControlnet_epsNormalMidas.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsNormalMidas.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsNormalMidas.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsSoftedgeHed",
-        "filename": "noobaiXLControlnet_epsSoftedgeHed.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsSoftedgeHed.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsSoftedgeHed.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsMangaLine",
-        "filename": "noobaiXLControlnet_epsMangaLine.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsMangaLine.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsMangaLine.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsLineartRealistic",
-        "filename": "noobaiXLControlnet_epsLineartRealistic.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsLineartRealistic.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsLineartRealistic.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsDepthMidasV11",
-        "filename": "noobaiXLControlnet_epsDepthMidasV11.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsDepthMidasV11.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsDepthMidasV11.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsScribbleHed",
-        "filename": "noobaiXLControlnet_epsScribbleHed.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsScribbleHed.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsScribbleHed.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsScribblePidinet",
-        "filename": "noobaiXLControlnet_epsScribblePidinet.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsScribblePidinet.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsScribblePidinet.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_openposeModel",
-        "filename": "noobaiXLControlnet_openposeModel.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_openposeModel.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_openposeModel.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobaiXLControlnet_epsTile",
-        "filename": "noobaiXLControlnet_epsTile.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/noobaiXLControlnet_epsTile.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/noobaiXLControlnet_epsTile.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "Chenkin-UniControl-XL",
-        "filename": "Chenkin-UniControl-XL.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/Chenkin-UniControl-XL.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/Chenkin-UniControl-XL.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "NoobAI_Inpainting_ControlNet",
-        "filename": "NoobAI_Inpainting_ControlNet.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd_control_collection/resolve/main/NoobAI_Inpainting_ControlNet.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd_control_collection/resolve/master/NoobAI_Inpainting_ControlNet.safetensors",
-        },
-        "dtype": "SDXL ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # SD 3.5 ControlNet
-    {
-        "name": "sd3.5_large_controlnet_blur",
-        "filename": "sd3.5_large_controlnet_blur.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd3_controlnet/resolve/main/sd3.5_large_controlnet_blur.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd3_controlnet/resolve/master/sd3.5_large_controlnet_blur.safetensors",
-        },
-        "dtype": "SD 3.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "sd3.5_large_controlnet_canny",
-        "filename": "sd3.5_large_controlnet_canny.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd3_controlnet/resolve/main/sd3.5_large_controlnet_canny.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd3_controlnet/resolve/master/sd3.5_large_controlnet_canny.safetensors",
-        },
-        "dtype": "SD 3.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "sd3.5_large_controlnet_depth",
-        "filename": "sd3.5_large_controlnet_depth.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/sd3_controlnet/resolve/main/sd3.5_large_controlnet_depth.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/sd3_controlnet/resolve/master/sd3.5_large_controlnet_depth.safetensors",
-        },
-        "dtype": "SD 3.5 ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # FLUX ControlNet
-    {
-        "name": "flux1-redux-dev",
-        "filename": "flux1-redux-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-redux-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-redux-dev.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-        ],
-        "save_dir": {
-            "comfyui": "models/style_models",
-        },
-    },
-    {
-        "name": "flux1-fill-dev",
-        "filename": "flux1-fill-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q3_K_S",
-        "filename": "flux1-fill-dev-Q3_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q3_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q3_K_S.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q4_0",
-        "filename": "flux1-fill-dev-Q4_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q4_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q4_0.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q4_1",
-        "filename": "flux1-fill-dev-Q4_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q4_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q4_1.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q4_K_S",
-        "filename": "flux1-fill-dev-Q4_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q4_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q4_K_S.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q5_0",
-        "filename": "flux1-fill-dev-Q5_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q5_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q5_0.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q5_1",
-        "filename": "flux1-fill-dev-Q5_1.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q5_1.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q5_1.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q5_K_S",
-        "filename": "flux1-fill-dev-Q5_K_S.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q5_K_S.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q5_K_S.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q6_K",
-        "filename": "flux1-fill-dev-Q6_K.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q6_K.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q6_K.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-Q8_0",
-        "filename": "flux1-fill-dev-Q8_0.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-Q8_0.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-Q8_0.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-fp16-F16-GGUF",
-        "filename": "flux1-fill-dev-fp16-F16-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-fp16-F16-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-fp16-F16-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-fp16-Q4_0-GGUF",
-        "filename": "flux1-fill-dev-fp16-Q4_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-fp16-Q4_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-fp16-Q4_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-fp16-Q5_0-GGUF",
-        "filename": "flux1-fill-dev-fp16-Q5_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-fp16-Q5_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-fp16-Q5_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-fp16-Q8_0-GGUF",
-        "filename": "flux1-fill-dev-fp16-Q8_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-fp16-Q8_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-fp16-Q8_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank128",
-        "filename": "flux1-fill-dev-lora-rank128.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank128.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank128.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank256",
-        "filename": "flux1-fill-dev-lora-rank256.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank256.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank256.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank32",
-        "filename": "flux1-fill-dev-lora-rank32.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank32.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank32.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank4",
-        "filename": "flux1-fill-dev-lora-rank4.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank4.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank4.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank64",
-        "filename": "flux1-fill-dev-lora-rank64.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank64.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank64.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-fill-dev-lora-rank8",
-        "filename": "flux1-fill-dev-lora-rank8.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-fill-dev-lora-rank8.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-fill-dev-lora-rank8.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-canny-dev-lora",
-        "filename": "flux1-canny-dev-lora.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev-lora.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev-lora.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-canny-dev",
-        "filename": "flux1-canny-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-canny-dev-fp16-F16-GGUF",
-        "filename": "flux1-canny-dev-fp16-F16-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev-fp16-F16-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev-fp16-F16-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-canny-dev-fp16-Q4_0-GGUF",
-        "filename": "flux1-canny-dev-fp16-Q4_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev-fp16-Q4_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev-fp16-Q4_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-canny-dev-fp16-Q5_0-GGUF",
-        "filename": "flux1-canny-dev-fp16-Q5_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev-fp16-Q5_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev-fp16-Q5_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-canny-dev-fp16-Q8_0-GGUF",
-        "filename": "flux1-canny-dev-fp16-Q8_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-canny-dev-fp16-Q8_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-canny-dev-fp16-Q8_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-depth-dev-fp16-F16-GGUF",
-        "filename": "flux1-depth-dev-fp16-F16-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev-fp16-F16-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev-fp16-F16-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-depth-dev-fp16-Q4_0-GGUF",
-        "filename": "flux1-depth-dev-fp16-Q4_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev-fp16-Q4_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev-fp16-Q4_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-depth-dev-fp16-Q5_0-GGUF",
-        "filename": "flux1-depth-dev-fp16-Q5_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev-fp16-Q5_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev-fp16-Q5_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-depth-dev-fp16-Q8_0-GGUF",
-        "filename": "flux1-depth-dev-fp16-Q8_0-GGUF.gguf",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev-fp16-Q8_0-GGUF.gguf",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev-fp16-Q8_0-GGUF.gguf",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-depth-dev-lora",
-        "filename": "flux1-depth-dev-lora.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev-lora.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev-lora.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/loras",
-            "invokeai": "models/loras",
-        },
-    },
-    {
-        "name": "flux1-depth-dev",
-        "filename": "flux1-depth-dev.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-depth-dev.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-depth-dev.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "comfyui",
-            "invokeai",
-        ],
-        "save_dir": {
-            "comfyui": "models/diffusion_models",
-            "invokeai": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-xlabs-canny-controlnet-v3",
-        "filename": "flux1-xlabs-canny-controlnet-v3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-xlabs-canny-controlnet-v3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-xlabs-canny-controlnet-v3.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-xlabs-depth-controlnet-v3",
-        "filename": "flux1-xlabs-depth-controlnet-v3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-xlabs-depth-controlnet-v3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-xlabs-depth-controlnet-v3.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-xlabs-hed-controlnet-v3",
-        "filename": "flux1-xlabs-hed-controlnet-v3.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-xlabs-hed-controlnet-v3.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-xlabs-hed-controlnet-v3.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-jasperai-Controlnet-Depth",
-        "filename": "flux1-dev-jasperai-Controlnet-Depth.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-jasperai-Controlnet-Depth.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-jasperai-Controlnet-Depth.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-jasperai-Controlnet-Surface-Normals",
-        "filename": "flux1-dev-jasperai-Controlnet-Surface-Normals.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-jasperai-Controlnet-Surface-Normals.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-jasperai-Controlnet-Surface-Normals.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-jasperai-Controlnet-Upscaler",
-        "filename": "flux1-dev-jasperai-Controlnet-Upscaler.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-jasperai-Controlnet-Upscaler.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-jasperai-Controlnet-Upscaler.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-instantx-controlnet-union",
-        "filename": "flux1-dev-instantx-controlnet-union.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-instantx-controlnet-union.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-instantx-controlnet-union.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-mistoline",
-        "filename": "flux1-dev-mistoline.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-mistoline.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-mistoline.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "flux1-dev-shakker-labs-controlnet-union-pro",
-        "filename": "flux1-dev-shakker-labs-controlnet-union-pro.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-dev-shakker-labs-controlnet-union-pro.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-dev-shakker-labs-controlnet-union-pro.safetensors",
-        },
-        "dtype": "FLUX ControlNet",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # CLIP Vision
-    {
-        "name": "clip_g",
-        "filename": "clip_g.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1_annotator/resolve/main/clip_vision/clip_g.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1_annotator/resolve/master/clip_vision/clip_g.pth",
-        },
-        "dtype": "CLIP Vision",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/clip_vision",
-            "comfyui": "models/clip_vision",
-            "invokeai": "models/clip_vision",
-            "fooocus": "models/clip_vision",
-        },
-    },
-    {
-        "name": "clip_h",
-        "filename": "clip_h.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1_annotator/resolve/main/clip_vision/clip_h.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1_annotator/resolve/master/clip_vision/clip_h.pth",
-        },
-        "dtype": "CLIP Vision",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/clip_vision",
-            "comfyui": "models/clip_vision",
-            "invokeai": "models/clip_vision",
-            "fooocus": "models/clip_vision",
-        },
-    },
-    {
-        "name": "clip_vitl",
-        "filename": "clip_vitl.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1_annotator/resolve/main/clip_vision/clip_vitl.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1_annotator/resolve/master/clip_vision/clip_vitl.pth",
-        },
-        "dtype": "CLIP Vision",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/clip_vision",
-            "comfyui": "models/clip_vision",
-            "invokeai": "models/clip_vision",
-            "fooocus": "models/clip_vision",
-        },
-    },
-    # SD 1.5 IP Adapter
-    {
-        "name": "ip-adapter_sd15",
-        "filename": "ip-adapter_sd15.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sd15.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sd15.pth",
-        },
-        "dtype": "SD 1.5 IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "ip-adapter_sd15_light",
-        "filename": "ip-adapter_sd15_light.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sd15_light.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sd15_light.pth",
-        },
-        "dtype": "SD 1.5 IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "ip-adapter_sd15_plus",
-        "filename": "ip-adapter_sd15_plus.pth",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sd15_plus.pth",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sd15_plus.pth",
-        },
-        "dtype": "SD 1.5 IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "ip-adapter_sd15_vit-G",
-        "filename": "ip-adapter_sd15_vit-G.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sd15_vit-G.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sd15_vit-G.safetensors",
-        },
-        "dtype": "SD 1.5 IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # SDXL IP Adapter
-    {
-        "name": "ip-adapter-plus_sdxl_vit-h",
-        "filename": "ip-adapter-plus_sdxl_vit-h.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter-plus_sdxl_vit-h.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter-plus_sdxl_vit-h.safetensors",
-        },
-        "dtype": "SDXL IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "ip-adapter_sdxl",
-        "filename": "ip-adapter_sdxl.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sdxl.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sdxl.safetensors",
-        },
-        "dtype": "SDXL IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "noobIPAMARK1_mark1",
-        "filename": "noobIPAMARK1_mark1.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/noobIPAMARK1_mark1.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/noobIPAMARK1_mark1.safetensors",
-        },
-        "dtype": "SDXL IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    {
-        "name": "ip-adapter_sdxl_vit-h",
-        "filename": "ip-adapter_sdxl_vit-h.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/controlnet_v1.1/resolve/main/ip-adapter_sdxl_vit-h.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/controlnet_v1.1/resolve/master/ip-adapter_sdxl_vit-h.safetensors",
-        },
-        "dtype": "SDXL IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-    # FLUX IP Adapter
-    {
-        "name": "flux1-xlabs-ip-adapter",
-        "filename": "flux1-xlabs-ip-adapter.safetensors",
-        "url": {
-            "huggingface": "https://huggingface.co/licyk/flux_controlnet/resolve/main/flux1-xlabs-ip-adapter.safetensors",
-            "modelscope": "https://modelscope.cn/models/licyks/flux_controlnet/resolve/master/flux1-xlabs-ip-adapter.safetensors",
-        },
-        "dtype": "FLUX IP Adapter",
-        "supported_webui": [
-            "sd_webui",
-            "comfyui",
-            "invokeai",
-            "fooocus",
-        ],
-        "save_dir": {
-            "sd_webui": "models/ControlNet",
-            "comfyui": "models/controlnet",
-            "invokeai": "models/controlNet",
-            "fooocus": "models/controlnet",
-        },
-    },
-]
-"""模型下载信息字典"""
+from sd_webui_all_in_one.model_downloader.types import (
+    ModelCard,
+    ModelCardList,
+    SupportedWebUiType,
+)
+
+
+MODEL_DATA_PATH = Path(__file__).with_name("model_data.json")
+"""内置模型库数据文件路径"""
+
+
+class ModelCardRecord:
+    """模型库中的一条模型记录"""
+
+    __slots__ = (
+        "index",
+        "name",
+        "filename",
+        "dtype",
+        "supported_webui",
+        "save_dir",
+        "url",
+    )
+
+    def __init__(
+        self,
+        index: int,
+        card: ModelCard,
+    ) -> None:
+        """模型记录初始化
+
+        Args:
+            index (int):
+                模型在模型库中的位置
+            card (ModelCard):
+                模型下载信息
+        """
+        self.index = index
+        """模型在模型库中的位置 (从 0 开始)"""
+
+        self.name: str = card["name"]
+        """模型名称"""
+
+        self.filename: str = card["filename"]
+        """模型的保存名字"""
+
+        self.dtype: str = card["dtype"]
+        """模型的类型"""
+
+        self.supported_webui: tuple[SupportedWebUiType, ...] = tuple(card["supported_webui"])
+        """支持的 WebUI 类型"""
+
+        self.save_dir: Mapping[str, str | None] = MappingProxyType({**card["save_dir"]})
+        """模型在各个 WebUI 中的保存路径"""
+
+        self.url: Mapping[str, str | None] = MappingProxyType({**card["url"]})
+        """模型下载链接"""
+
+    def __repr__(self) -> str:
+        return f"ModelCardRecord(index={self.index!r}, name={self.name!r}, dtype={self.dtype!r})"
+
+
+def _freeze_lookup(
+    lookup: dict[str, list[int]],
+) -> dict[str, tuple[int, ...]]:
+    return {key: tuple(value) for key, value in lookup.items()}
+
+
+class ModelCatalog:
+    """模型库目录
+
+    保存模型库原始数据, 按顺序排列的模型记录, 以及按模型名称 / 文件名 / 模型类型 / 支持的 WebUI 预先计算的查找表.
+    查找表的值为模型在模型库中的位置, 按模型库中的顺序排列
+    """
+
+    __slots__ = (
+        "cards",
+        "records",
+        "by_name",
+        "by_filename",
+        "by_dtype",
+        "by_webui",
+    )
+
+    def __init__(
+        self,
+        cards: ModelCardList,
+    ) -> None:
+        """模型库目录初始化
+
+        Args:
+            cards (ModelCardList):
+                模型下载信息列表
+        """
+        self.cards = cards
+        """模型下载信息列表"""
+
+        self.records = tuple(ModelCardRecord(index, card) for index, card in enumerate(cards))
+        """模型记录列表"""
+
+        by_name: dict[str, list[int]] = {}
+        by_filename: dict[str, list[int]] = {}
+        by_dtype: dict[str, list[int]] = {}
+        by_webui: dict[str, list[int]] = {}
+        for record in self.records:
+            by_name.setdefault(record.name, []).append(record.index)
+            by_filename.setdefault(record.filename, []).append(record.index)
+            by_dtype.setdefault(record.dtype, []).append(record.index)
+            for webui in record.supported_webui:
+                by_webui.setdefault(webui, []).append(record.index)
+
+        self.by_name = _freeze_lookup(by_name)
+        """模型名称查找表"""
+
+        self.by_filename = _freeze_lookup(by_filename)
+        """模型文件名查找表"""
+
+        self.by_dtype = _freeze_lookup(by_dtype)
+        """模型类型查找表"""
+
+        self.by_webui = _freeze_lookup(by_webui)
+        """支持的 WebUI 查找表"""
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def select(
+        self,
+        name: str | None = None,
+        filename: str | None = None,
+        dtype: str | None = None,
+        webui: SupportedWebUiType | None = None,
+    ) -> list[ModelCardRecord]:
+        """按条件查找模型记录, 多个条件需要同时满足
+
+        Args:
+            name (str | None):
+                模型名称
+            filename (str | None):
+                模型文件名
+            dtype (str | None):
+                模型类型
+            webui (SupportedWebUiType | None):
+                支持的 WebUI 类型
+
+        Returns:
+            list[ModelCardRecord]: 按模型库顺序排列的模型记录, 未提供任何条件时返回全部记录
+        """
+        selected: set[int] | None = None
+        candidates: tuple[int, ...] | None = None
+        for lookup, key in (
+            (self.by_name, name),
+            (self.by_filename, filename),
+            (self.by_dtype, dtype),
+            (self.by_webui, webui),
+        ):
+            if key is None:
+                continue
+            indices = lookup.get(key, ())
+            if candidates is None:
+                candidates = indices
+            else:
+                selected = set(indices) if selected is None else selected.intersection(indices)
+
+        if candidates is None:
+            return list(self.records)
+        return [self.records[index] for index in candidates if selected is None or index in selected]
+
+
+def load_model_data(
+    path: Path | None = None,
+) -> ModelCardList:
+    """读取模型库数据文件
+
+    Args:
+        path (Path | None):
+            模型库数据文件路径, 为 None 时使用内置的模型库
+
+    Returns:
+        ModelCardList: 模型下载信息列表
+    """
+    with open(path or MODEL_DATA_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def get_model_catalog() -> ModelCatalog:
+    """获取内置模型库目录, 首次调用时读取模型库数据文件, 之后返回缓存的目录
+
+    Returns:
+        ModelCatalog: 内置模型库目录
+    """
+    return ModelCatalog(load_model_data())
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    # `MODEL_DOWNLOAD_DICT` 在首次访问时才加载
+    if name == "MODEL_DOWNLOAD_DICT":
+        return get_model_catalog().cards
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
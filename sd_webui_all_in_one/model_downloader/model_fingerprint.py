@@ -0,0 +1,614 @@
+"""模型文件识别
+
+只读取模型文件的头部信息识别模型结构, 不加载张量数据:
+
+- safetensors: 通过 mmap 读取文件开头的 JSON 文件头, 得到张量名称、形状和数据类型
+- PyTorch `.ckpt` / `.pt` / `.pth` / `.bin` (zip 格式): 读取 zip 目录和 `data.pkl`, 使用 `pickletools` 逐条解析操作码提取张量名称, 不执行 pickle
+
+根据张量名称识别模型的架构 (SD 1.5 / SDXL / FLUX 等) 和组件类型 (完整模型 / LoRA / VAE 等), 统计参数量, 并计算不需要读取整个文件的模型指纹
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import pickletools
+import struct
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Iterable,
+    Literal,
+    TypeAlias,
+    TypedDict,
+    get_args,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+from sd_webui_all_in_one.model_downloader.types import SupportedWebUiType
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+ModelArchitecture: TypeAlias = Literal["sd15", "sd2", "sdxl", "sd3", "flux", "unknown"]
+"""模型所属的基础模型架构"""
+
+MODEL_ARCHITECTURE_LIST: list[str] = list(get_args(ModelArchitecture))
+"""模型架构列表"""
+
+ModelComponent: TypeAlias = Literal[
+    "checkpoint",
+    "diffusion_model",
+    "lora",
+    "vae",
+    "controlnet",
+    "embedding",
+    "text_encoder",
+    "upscaler",
+    "unknown",
+]
+"""模型的组件类型"""
+
+MODEL_COMPONENT_LIST: list[str] = list(get_args(ModelComponent))
+"""模型组件类型列表"""
+
+ModelFileFormat: TypeAlias = Literal["safetensors", "pytorch", "unknown"]
+"""模型文件格式"""
+
+MODEL_FINGERPRINT_VERSION = 1
+"""模型指纹算法版本, 写入指纹前缀, 算法变化时旧指纹不会与新指纹混用"""
+
+SAFETENSORS_HEADER_MAX_SIZE = 100 * 1024 * 1024
+"""safetensors 文件头的最大长度, 超过时视为无效文件"""
+
+SAFETENSORS_METADATA_VALUE_MAX_LENGTH = 4096
+"""保留的 safetensors 元数据值的最大长度, 过长的值 (例如训练标签统计) 不保留"""
+
+PICKLE_DATA_MAX_SIZE = 64 * 1024 * 1024
+"""解析的 PyTorch `data.pkl` 最大长度"""
+
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+"""计算模型指纹时每个采样块的大小"""
+
+FINGERPRINT_SAMPLE_COUNT = 3
+"""计算模型指纹时在张量数据中均匀采样的块数"""
+
+MODEL_FINGERPRINT_WORKERS = 8
+"""批量识别模型文件时的默认线程数"""
+
+_TORCH_STORAGE_SIZE = {
+    "DoubleStorage": 8,
+    "LongStorage": 8,
+    "FloatStorage": 4,
+    "IntStorage": 4,
+    "HalfStorage": 2,
+    "BFloat16Storage": 2,
+    "ShortStorage": 2,
+    "ByteStorage": 1,
+    "CharStorage": 1,
+    "BoolStorage": 1,
+    "Float8_e4m3fnStorage": 1,
+    "Float8_e5m2Storage": 1,
+}
+"""PyTorch 存储类型的元素字节数"""
+
+_PICKLE_STRING_OPCODES = frozenset({"SHORT_BINUNICODE", "BINUNICODE", "BINUNICODE8", "UNICODE", "SHORT_BINSTRING", "BINSTRING", "STRING", "GLOBAL"})
+"""携带字符串参数的 pickle 操作码"""
+
+_LORA_MARKERS = ("lora_up.", "lora_down.", "lora_A.", "lora_B.", ".lora.", "hada_w1", "lokr_w1", "oft_blocks")
+_EMBEDDING_MARKERS = ("string_to_param", "emb_params")
+_CONTROLNET_MARKERS = ("control_model.", "controlnet_cond_embedding", "input_hint_block", "controlnet_blocks", "controlnet_x_embedder")
+_UPSCALER_MARKERS = ("RRDB_trunk", "body.0.rdb1", "conv_first.weight", "residual_group", "upconv1.weight", "model.1.sub.0.RDB1")
+_VAE_MARKERS = ("encoder.down.0.block.0", "decoder.up.0.block.0", "encoder.down_blocks.0.resnets", "decoder.up_blocks.0.resnets")
+_TEXT_ENCODER_MARKERS = ("text_model.encoder.layers", "encoder.block.0.layer.0.SelfAttention", "transformer.resblocks.0.attn")
+_CHECKPOINT_MARKERS = ("first_stage_model.", "cond_stage_model.", "conditioner.embedders", "text_encoders.")
+_DIFFUSION_MARKERS = ("diffusion_model.", "double_blocks.", "joint_blocks.", "input_blocks.", "down_blocks.0.attentions", "transformer_blocks.0.attn")
+
+_ARCHITECTURE_RULES: tuple[tuple[ModelArchitecture, tuple[str, ...]], ...] = (
+    ("sd3", ("joint_blocks", "pos_embed")),
+    ("flux", ("double_blocks", "single_blocks", "single_transformer_blocks", "x_embedder")),
+    ("sdxl", ("conditioner.embedders.1", "label_emb.0", "add_embedding", "lora_te2_", "lora_te1_", "input_blocks_4_1_transformer_blocks_1", "input_blocks.4.1.transformer_blocks.1", "clip_g")),
+    ("sd2", ("cond_stage_model.model.transformer", "lora_te_text_model_encoder_layers_22")),
+    ("sd15", ("cond_stage_model.transformer", "model.diffusion_model.input_blocks", "lora_unet_down_blocks", "lora_unet_input_blocks", "lora_te_text_model", "down_blocks.0.attentions", "input_blocks.1.1", "clip_l")),
+)
+"""按张量名称识别基础模型架构的规则, 按顺序匹配"""
+
+_METADATA_ARCHITECTURE_RULES: tuple[tuple[ModelArchitecture, tuple[str, ...]], ...] = (
+    ("flux", ("flux",)),
+    ("sd3", ("stable-diffusion-3", "sd3")),
+    ("sdxl", ("xl", "sdxl")),
+    ("sd2", ("v2", "sd_v2")),
+    ("sd15", ("v1", "sd_v1")),
+)
+"""按 safetensors 元数据 (`modelspec.architecture` / `ss_base_model_version`) 识别基础模型架构的规则"""
+
+MODEL_COMPONENT_SAVE_DIRS: dict[SupportedWebUiType, dict[ModelComponent, str]] = {
+    "sd_webui": {
+        "checkpoint": "models/Stable-diffusion",
+        "diffusion_model": "models/Stable-diffusion",
+        "lora": "models/Lora",
+        "vae": "models/VAE",
+        "controlnet": "models/ControlNet",
+        "embedding": "embeddings",
+        "text_encoder": "models/text_encoder",
+        "upscaler": "models/ESRGAN",
+    },
+    "comfyui": {
+        "checkpoint": "models/checkpoints",
+        "diffusion_model": "models/diffusion_models",
+        "lora": "models/loras",
+        "vae": "models/vae",
+        "controlnet": "models/controlnet",
+        "embedding": "models/embeddings",
+        "text_encoder": "models/text_encoders",
+        "upscaler": "models/upscale_models",
+    },
+    "invokeai": {
+        "checkpoint": "models/checkpoints",
+        "diffusion_model": "models/checkpoints",
+        "lora": "models/loras",
+        "vae": "models/vae",
+        "controlnet": "models/controlnet",
+        "embedding": "models/embeddings",
+        "text_encoder": "models/text_encoders",
+        "upscaler": "models/upscale_models",
+    },
+    "fooocus": {
+        "checkpoint": "models/checkpoints",
+        "lora": "models/loras",
+        "vae": "models/vae",
+        "controlnet": "models/controlnet",
+        "embedding": "models/embeddings",
+        "upscaler": "models/upscale_models",
+    },
+    "sd_trainer": {
+        "checkpoint": "sd-models/checkpoints",
+        "vae": "sd-models/vae",
+    },
+    "sd_scripts": {
+        "checkpoint": "sd-models/checkpoints",
+        "vae": "sd-models/vae",
+    },
+}
+"""各 WebUI 中不同组件类型的模型保存路径 (使用相对路径, 初始位置为 WebUI 的根目录)"""
+
+
+class SafetensorsHeaderInfo(TypedDict):
+    """safetensors 文件头摘要"""
+
+    tensor_count: int
+    """张量数量"""
+
+    dtypes: list[str]
+    """张量使用的数据类型"""
+
+    metadata: dict[str, str]
+    """`__metadata__` 中的元数据"""
+
+
+@dataclass
+class ModelFingerprint:
+    """模型文件识别结果"""
+
+    path: Path
+    """模型文件路径"""
+
+    format: ModelFileFormat
+    """模型文件格式"""
+
+    size: int
+    """模型文件大小"""
+
+    architecture: ModelArchitecture = "unknown"
+    """基础模型架构"""
+
+    component: ModelComponent = "unknown"
+    """模型组件类型"""
+
+    tensor_count: int = 0
+    """张量数量, PyTorch 格式为存储块数量"""
+
+    parameter_count: int | None = None
+    """参数量, 无法确定时为 None"""
+
+    dtypes: list[str] = field(default_factory=list)
+    """张量使用的数据类型"""
+
+    metadata: dict[str, str] = field(default_factory=dict)
+    """模型元数据"""
+
+    structure_hash: str | None = None
+    """模型结构哈希, 由去掉元数据后的文件头 (张量名称、形状、数据类型和偏移) 决定, 相同结构的不同权重结果相同"""
+
+    fingerprint: str | None = None
+    """模型指纹, 由结构哈希、文件大小和张量数据的采样块决定, 可用于快速判断两个模型文件是否相同"""
+
+
+def _read_safetensors_header_bytes(
+    buffer: mmap.mmap | bytes,
+) -> tuple[dict[str, Any], bytes, int] | None:
+    if len(buffer) < 8:
+        return None
+    (length,) = struct.unpack_from("<Q", buffer, 0)
+    if length <= 0 or length > SAFETENSORS_HEADER_MAX_SIZE or 8 + length > len(buffer):
+        return None
+    raw_header = buffer[8 : 8 + length]
+    try:
+        header = json.loads(raw_header)
+    except ValueError:
+        return None
+    if not isinstance(header, dict):
+        return None
+    return header, raw_header, 8 + length
+
+
+def _strip_raw_metadata(
+    raw_header: bytes,
+) -> bytes:
+    """从原始文件头中去掉 `__metadata__` 的值, 避免重新序列化整个文件头"""
+    if b'"__metadata__"' not in raw_header:
+        return raw_header
+    text = raw_header.decode("utf-8")
+    start = text.find('"__metadata__"')
+    value_start = text.index(":", start) + 1
+    while text[value_start : value_start + 1].isspace():
+        value_start += 1
+    try:
+        _, value_end = json.JSONDecoder().raw_decode(text, value_start)
+    except ValueError:
+        return raw_header
+    return (text[:start] + text[value_end:]).encode("utf-8")
+
+
+def _filter_metadata(
+    raw_metadata: Any,
+) -> dict[str, str]:
+    metadata: dict[str, str] = {}
+    if isinstance(raw_metadata, dict):
+        for key, value in raw_metadata.items():
+            if isinstance(value, str) and len(value) <= SAFETENSORS_METADATA_VALUE_MAX_LENGTH:
+                metadata[str(key)] = value
+    return metadata
+
+
+def read_safetensors_header(
+    path: Path,
+) -> SafetensorsHeaderInfo | None:
+    """读取 safetensors 文件头摘要
+
+    safetensors 文件以 8 字节小端无符号整数表示的文件头长度开头, 之后是 JSON 格式的文件头, 只需要读取文件开头的少量数据
+
+    Args:
+        path (Path):
+            safetensors 文件路径
+
+    Returns:
+        (SafetensorsHeaderInfo | None): 文件头摘要, 文件头无效时返回 None
+    """
+    try:
+        with open(path, "rb") as f:
+            raw_length = f.read(8)
+            if len(raw_length) != 8:
+                return None
+            (length,) = struct.unpack("<Q", raw_length)
+            if length <= 0 or length > SAFETENSORS_HEADER_MAX_SIZE:
+                return None
+            parsed = _read_safetensors_header_bytes(raw_length + f.read(length))
+    except OSError:
+        return None
+    if parsed is None:
+        return None
+    header, _, _ = parsed
+    metadata = _filter_metadata(header.pop("__metadata__", None))
+    dtypes = {tensor["dtype"] for tensor in header.values() if isinstance(tensor, dict) and isinstance(tensor.get("dtype"), str)}
+    return {
+        "tensor_count": len(header),
+        "dtypes": sorted(dtypes),
+        "metadata": metadata,
+    }
+
+
+def _match_markers(
+    blob: str,
+    markers: Iterable[str],
+) -> bool:
+    return any(marker in blob for marker in markers)
+
+
+def _architecture_from_metadata(
+    metadata: dict[str, str],
+) -> ModelArchitecture | None:
+    value = (metadata.get("modelspec.architecture") or metadata.get("ss_base_model_version") or "").lower()
+    if not value:
+        return None
+    for architecture, markers in _METADATA_ARCHITECTURE_RULES:
+        if _match_markers(value, markers):
+            return architecture
+    return None
+
+
+def classify_tensor_keys(
+    keys: Iterable[str],
+    metadata: dict[str, str] | None = None,
+) -> tuple[ModelArchitecture, ModelComponent]:
+    """根据张量名称识别模型的架构和组件类型
+
+    Args:
+        keys (Iterable[str]):
+            张量名称
+        metadata (dict[str, str] | None):
+            safetensors 元数据, 包含 `modelspec.architecture` 或 `ss_base_model_version` 时优先使用
+
+    Returns:
+        tuple[ModelArchitecture, ModelComponent]: 模型架构和组件类型
+    """
+    # 把所有名称拼接成一个字符串后做子串查找, 比逐个名称匹配快得多
+    blob = "\n".join(keys)
+    metadata = metadata or {}
+
+    component: ModelComponent
+    if _match_markers(blob, _LORA_MARKERS) or metadata.get("modelspec.architecture", "").endswith("/lora"):
+        component = "lora"
+    elif _match_markers(blob, _EMBEDDING_MARKERS) or blob in ("clip_l\nclip_g", "clip_g\nclip_l"):
+        component = "embedding"
+    elif _match_markers(blob, _CONTROLNET_MARKERS):
+        component = "controlnet"
+    elif _match_markers(blob, _CHECKPOINT_MARKERS) and _match_markers(blob, _DIFFUSION_MARKERS):
+        component = "checkpoint"
+    elif _match_markers(blob, _DIFFUSION_MARKERS):
+        component = "diffusion_model"
+    elif _match_markers(blob, _VAE_MARKERS):
+        component = "vae"
+    elif _match_markers(blob, _UPSCALER_MARKERS):
+        component = "upscaler"
+    elif _match_markers(blob, _TEXT_ENCODER_MARKERS):
+        component = "text_encoder"
+    else:
+        component = "unknown"
+
+    architecture = _architecture_from_metadata(metadata)
+    if architecture is None:
+        architecture = "unknown"
+        if component not in ("vae", "upscaler", "text_encoder", "unknown"):
+            for candidate, markers in _ARCHITECTURE_RULES:
+                if _match_markers(blob, markers):
+                    architecture = candidate
+                    break
+    return architecture, component
+
+
+def _sample_offsets(
+    start: int,
+    end: int,
+) -> list[int]:
+    span = end - start
+    if span <= FINGERPRINT_SAMPLE_SIZE * FINGERPRINT_SAMPLE_COUNT:
+        return [start]
+    step = (span - FINGERPRINT_SAMPLE_SIZE) // (FINGERPRINT_SAMPLE_COUNT - 1)
+    return [start + step * index for index in range(FINGERPRINT_SAMPLE_COUNT)]
+
+
+def _compute_fingerprint(
+    buffer: mmap.mmap,
+    structure_hash: str,
+    data_start: int,
+) -> str:
+    hash_sha256 = hashlib.sha256()
+    hash_sha256.update(structure_hash.encode("ascii"))
+    hash_sha256.update(struct.pack("<Q", len(buffer)))
+    for offset in _sample_offsets(data_start, len(buffer)):
+        hash_sha256.update(buffer[offset : offset + FINGERPRINT_SAMPLE_SIZE])
+    return f"v{MODEL_FINGERPRINT_VERSION}:{hash_sha256.hexdigest()}"
+
+
+def _fingerprint_safetensors(
+    result: ModelFingerprint,
+    buffer: mmap.mmap,
+) -> bool:
+    parsed = _read_safetensors_header_bytes(buffer)
+    if parsed is None:
+        return False
+    header, raw_header, data_start = parsed
+    result.format = "safetensors"
+    result.metadata = _filter_metadata(header.pop("__metadata__", None))
+
+    dtypes: set[str] = set()
+    parameter_count = 0
+    for tensor in header.values():
+        if not isinstance(tensor, dict):
+            continue
+        dtype = tensor.get("dtype")
+        if isinstance(dtype, str):
+            dtypes.add(dtype)
+        shape = tensor.get("shape")
+        if isinstance(shape, list):
+            parameter_count += math.prod(shape)
+    result.tensor_count = len(header)
+    result.parameter_count = parameter_count
+    result.dtypes = sorted(dtypes)
+    result.architecture, result.component = classify_tensor_keys(header.keys(), result.metadata)
+    result.structure_hash = hashlib.sha256(_strip_raw_metadata(raw_header)).hexdigest()
+    result.fingerprint = _compute_fingerprint(buffer, result.structure_hash, data_start)
+    return True
+
+
+def _pickle_strings(
+    data: bytes,
+) -> list[str]:
+    """逐条解析 pickle 操作码并提取字符串参数, 不会执行 pickle 中的任何代码"""
+    strings: list[str] = []
+    try:
+        for opcode, arg, _ in pickletools.genops(data):
+            if opcode.name in _PICKLE_STRING_OPCODES and isinstance(arg, str):
+                strings.append(arg)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # 截断或无法识别的 pickle, 使用已经解析到的部分
+        pass
+    return strings
+
+
+def _fingerprint_torch_zip(
+    result: ModelFingerprint,
+    buffer: mmap.mmap,
+) -> bool:
+    try:
+        archive = zipfile.ZipFile(_MmapReader(buffer))
+    except (zipfile.BadZipFile, OSError, ValueError):
+        return False
+    with archive:
+        infos = archive.infolist()
+        pickle_info = next((info for info in infos if info.filename.endswith("/data.pkl") or info.filename == "data.pkl"), None)
+        if pickle_info is None or pickle_info.file_size > PICKLE_DATA_MAX_SIZE:
+            return False
+        data = archive.read(pickle_info)
+        storages = [info for info in infos if "/data/" in info.filename and not info.filename.endswith("/")]
+        data_start = min((info.header_offset for info in storages), default=0)
+
+    strings = _pickle_strings(data)
+    storage_types = {value for value in strings if value in _TORCH_STORAGE_SIZE}
+    # GLOBAL 操作码的参数为 "torch HalfStorage" 形式
+    storage_types.update(value.split(" ", 1)[1] for value in strings if value.startswith("torch ") and value.split(" ", 1)[1] in _TORCH_STORAGE_SIZE)
+
+    result.format = "pytorch"
+    result.tensor_count = len(storages)
+    result.dtypes = sorted(storage_types)
+    if len(storage_types) == 1:
+        itemsize = _TORCH_STORAGE_SIZE[next(iter(storage_types))]
+        result.parameter_count = sum(info.file_size for info in storages) // itemsize
+    result.architecture, result.component = classify_tensor_keys(strings)
+    result.structure_hash = hashlib.sha256(data).hexdigest()
+    result.fingerprint = _compute_fingerprint(buffer, result.structure_hash, data_start)
+    return True
+
+
+class _MmapReader:
+    """为 mmap 提供 zipfile 需要的只读文件对象接口, 读取 zip 目录时不会复制整个文件"""
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+    ) -> None:
+        self.buffer = buffer
+        self.position = 0
+
+    def seek(
+        self,
+        offset: int,
+        whence: int = os.SEEK_SET,
+    ) -> int:
+        if whence == os.SEEK_SET:
+            self.position = offset
+        elif whence == os.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = len(self.buffer) + offset
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+    def read(
+        self,
+        size: int = -1,
+    ) -> bytes:
+        end = len(self.buffer) if size is None or size < 0 else min(len(self.buffer), self.position + size)
+        data = self.buffer[self.position : end]
+        self.position = end
+        return data
+
+    def seekable(self) -> bool:
+        return True
+
+
+def fingerprint_model(
+    path: Path,
+) -> ModelFingerprint:
+    """识别模型文件
+
+    只读取 safetensors 文件头或 PyTorch zip 目录和 `data.pkl`, 不加载张量数据. 无法识别的文件返回 `format` 为 `unknown` 的结果
+
+    Args:
+        path (Path):
+            模型文件路径
+
+    Returns:
+        ModelFingerprint: 模型文件识别结果
+
+    Raises:
+        OSError:
+            模型文件无法读取时
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        result = ModelFingerprint(path=path, format="unknown", size=size)
+        if size == 0:
+            return result
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer[:2] == b"PK":
+                _fingerprint_torch_zip(result, buffer)
+            else:
+                _fingerprint_safetensors(result, buffer)
+    return result
+
+
+def fingerprint_models(
+    paths: Iterable[Path],
+    workers: int | None = None,
+) -> list[ModelFingerprint | None]:
+    """批量识别模型文件
+
+    Args:
+        paths (Iterable[Path]):
+            模型文件路径
+        workers (int | None):
+            并行读取的线程数, 为 None 时使用 `MODEL_FINGERPRINT_WORKERS`
+
+    Returns:
+        list[ModelFingerprint | None]: 与输入顺序一致的识别结果, 文件无法读取时为 None
+    """
+
+    def _fingerprint(path: Path) -> ModelFingerprint | None:
+        try:
+            return fingerprint_model(path)
+        except OSError as e:
+            logger.debug("读取模型文件 '%s' 失败: %s", path, e)
+            return None
+
+    paths = list(paths)
+    workers = max(1, workers or MODEL_FINGERPRINT_WORKERS)
+    if workers == 1 or len(paths) <= 1:
+        return [_fingerprint(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(_fingerprint, paths))
+
+
+def suggest_model_save_dir(
+    dtype: SupportedWebUiType,
+    fingerprint: ModelFingerprint,
+) -> str | None:
+    """根据模型组件类型获取模型在 WebUI 中的保存路径
+
+    Args:
+        dtype (SupportedWebUiType):
+            WebUI 的类型
+        fingerprint (ModelFingerprint):
+            模型文件识别结果
+
+    Returns:
+        (str | None): 相对 WebUI 根目录的保存路径, 该 WebUI 不支持此类模型或无法识别时返回 None
+    """
+    return MODEL_COMPONENT_SAVE_DIRS.get(dtype, {}).get(fingerprint.component)
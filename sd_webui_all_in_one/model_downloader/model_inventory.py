@@ -0,0 +1,813 @@
+"""本地模型清单索引
+
+使用 SQLite 保存 WebUI 模型目录中每个模型文件的路径、大小、修改时间、sha256 (按需计算)、safetensors 文件头信息、模型识别结果和匹配的模型库条目.
+索引按目录修改时间增量刷新, 修改时间未变化的目录不会重新读取, 模型列表、搜索和重复模型检测都直接查询索引
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    TypedDict,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+    SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH,
+)
+from sd_webui_all_in_one.model_downloader.model_data import get_model_catalog
+from sd_webui_all_in_one.model_downloader.model_fingerprint import (
+    ModelArchitecture,
+    ModelComponent,
+    SafetensorsHeaderInfo,
+    fingerprint_model,
+)
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+MODEL_INVENTORY_VERSION = 2
+"""模型清单索引版本, 版本不一致时重建索引"""
+
+MODEL_INVENTORY_EXTENSIONS = (
+    ".safetensors",
+    ".sft",
+    ".ckpt",
+    ".pt",
+    ".pth",
+    ".bin",
+    ".gguf",
+    ".onnx",
+    ".pkl",
+    ".th",
+)
+"""纳入模型清单的文件扩展名"""
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+"""计算 sha256 时的读取块大小"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS models (
+    path TEXT PRIMARY KEY,
+    dir TEXT NOT NULL,
+    name TEXT NOT NULL,
+    model_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    dev INTEGER NOT NULL,
+    ino INTEGER NOT NULL,
+    sha256 TEXT,
+    safetensors TEXT,
+    architecture TEXT NOT NULL,
+    component TEXT NOT NULL,
+    parameter_count INTEGER,
+    fingerprint TEXT,
+    model_name TEXT,
+    model_dtype TEXT
+);
+CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent);
+CREATE INDEX IF NOT EXISTS models_dir ON models (dir);
+CREATE INDEX IF NOT EXISTS models_size ON models (size);
+CREATE INDEX IF NOT EXISTS models_sha256 ON models (sha256);
+CREATE INDEX IF NOT EXISTS models_fingerprint ON models (fingerprint);
+"""
+
+_ENTRY_COLUMNS = "path, name, model_type, size, mtime_ns, sha256, safetensors, architecture, component, parameter_count, fingerprint, model_name, model_dtype"
+
+
+class ModelInventoryEntry(TypedDict):
+    """模型清单条目"""
+
+    path: Path
+    """模型文件的绝对路径"""
+
+    relpath: str
+    """模型文件相对模型根目录的路径 (使用 `/` 分隔)"""
+
+    name: str
+    """模型文件名"""
+
+    model_type: str
+    """模型类型, 即模型根目录下的第一级目录名, 位于模型根目录中的文件为空字符串"""
+
+    size: int
+    """模型文件大小"""
+
+    mtime_ns: int
+    """模型文件修改时间 (纳秒)"""
+
+    sha256: str | None
+    """模型文件的 sha256, 未计算时为 None"""
+
+    safetensors: SafetensorsHeaderInfo | None
+    """safetensors 文件头摘要, 非 safetensors 文件或文件头无效时为 None"""
+
+    architecture: ModelArchitecture
+    """根据张量名称识别的基础模型架构"""
+
+    component: ModelComponent
+    """根据张量名称识别的模型组件类型"""
+
+    parameter_count: int | None
+    """模型参数量, 无法确定时为 None"""
+
+    fingerprint: str | None
+    """模型指纹, 无法识别的文件为 None"""
+
+    model_name: str | None
+    """匹配的模型库条目名称, 未匹配时为 None"""
+
+    model_dtype: str | None
+    """匹配的模型库条目的模型类型, 未匹配时为 None"""
+
+
+@dataclass
+class ModelInventoryChanges:
+    """一次模型清单刷新的变化统计"""
+
+    added: int = 0
+    """新增的模型数量"""
+
+    updated: int = 0
+    """发生变化的模型数量"""
+
+    removed: int = 0
+    """已删除的模型数量"""
+
+    scanned_dirs: int = 0
+    """重新读取的目录数量"""
+
+    skipped_dirs: int = 0
+    """修改时间未变化而跳过读取的目录数量"""
+
+
+def match_model_library(
+    filename: str,
+    save_dir: str | None = None,
+) -> tuple[str, str] | None:
+    """根据文件名在模型库中查找对应的模型
+
+    Args:
+        filename (str):
+            模型文件名
+        save_dir (str | None):
+            模型文件所在目录相对 WebUI 根目录的路径 (使用 `/` 分隔), 同名模型有多个时优先选择保存目录一致的模型
+
+    Returns:
+        (tuple[str, str] | None): 模型名称和模型类型, 未找到时返回 None
+    """
+    candidates = get_model_catalog().select(filename=filename)
+    if not candidates:
+        return None
+    if save_dir is not None:
+        for record in candidates:
+            if any(value and value.strip("/") == save_dir for value in record.save_dir.values()):
+                return record.name, record.dtype
+    return candidates[0].name, candidates[0].dtype
+
+
+def _file_sha256(
+    path: Path,
+) -> str:
+    hash_sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
+
+
+def get_model_inventory_db_path(
+    root: Path,
+) -> Path:
+    """获取模型根目录对应的索引文件路径
+
+    索引文件保存在 `SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH` 中, 文件名由模型根目录的名称和绝对路径的哈希值组成
+
+    Args:
+        root (Path):
+            模型根目录
+
+    Returns:
+        Path: 索引文件路径
+    """
+    root = Path(root).absolute()
+    digest = hashlib.sha256(os.path.normcase(str(root)).encode("utf-8")).hexdigest()[:16]
+    return SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH / f"{root.name or 'models'}-{digest}.sqlite3"
+
+
+def _join_rel(
+    parent: str,
+    name: str,
+) -> str:
+    return f"{parent}/{name}" if parent else name
+
+
+def _escape_like(
+    value: str,
+) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class ModelInventory:
+    """WebUI 模型目录的本地模型清单
+
+    索引默认保存在 `get_model_inventory_db_path()` 返回的缓存路径中, 记录每个目录的修改时间和每个模型文件的元数据.
+    刷新时只重新读取修改时间发生变化的目录, 新增或发生变化的模型文件会重新识别模型 (只读取文件头) 并匹配模型库, sha256 在需要时才计算
+
+    Attributes:
+        root (Path):
+            模型根目录, 例如 `ComfyUI/models`
+        db_path (Path):
+            索引文件路径
+        lock (threading.Lock):
+            索引读写锁
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Path | None = None,
+    ) -> None:
+        """模型清单初始化
+
+        Args:
+            root (Path):
+                模型根目录
+            db_path (Path | None):
+                索引文件路径, 为 None 时使用 `get_model_inventory_db_path()`
+        """
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path is not None else get_model_inventory_db_path(self.root)
+        self.lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def __enter__(self) -> "ModelInventory":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """关闭索引数据库连接"""
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            self._init_schema(conn)
+        except (OSError, sqlite3.Error) as e:
+            # 模型目录只读或索引文件损坏时使用内存索引, 仍然可以完成本次查询
+            logger.warning("模型清单索引 '%s' 无法使用, 将使用临时索引: %s", self.db_path, e)
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._init_schema(conn)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _init_schema(
+        conn: sqlite3.Connection,
+    ) -> None:
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(MODEL_INVENTORY_VERSION):
+            with conn:
+                conn.execute("DELETE FROM dirs")
+                conn.execute("DELETE FROM models")
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(MODEL_INVENTORY_VERSION),))
+
+    def _row_to_entry(
+        self,
+        row: sqlite3.Row | tuple[Any, ...],
+    ) -> ModelInventoryEntry:
+        relpath, name, model_type, size, mtime_ns, sha256, safetensors, architecture, component, parameter_count, fingerprint, model_name, model_dtype = row
+        return {
+            "path": self.root.joinpath(*relpath.split("/")).absolute(),
+            "relpath": relpath,
+            "name": name,
+            "model_type": model_type,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": sha256,
+            "safetensors": json.loads(safetensors) if safetensors else None,
+            "architecture": architecture,
+            "component": component,
+            "parameter_count": parameter_count,
+            "fingerprint": fingerprint,
+            "model_name": model_name,
+            "model_dtype": model_dtype,
+        }
+
+    def _describe_file(
+        self,
+        relpath: str,
+        name: str,
+        parent: str,
+        st: os.stat_result,
+    ) -> tuple[Any, ...]:
+        file_path = self.root.joinpath(*relpath.split("/"))
+        try:
+            fingerprint = fingerprint_model(file_path)
+        except (OSError, ValueError) as e:
+            logger.debug("识别模型文件 '%s' 失败: %s", file_path, e)
+            fingerprint = None
+        safetensors: SafetensorsHeaderInfo | None = None
+        if fingerprint is not None and fingerprint.format == "safetensors":
+            safetensors = {
+                "tensor_count": fingerprint.tensor_count,
+                "dtypes": fingerprint.dtypes,
+                "metadata": fingerprint.metadata,
+            }
+        save_dir = "/".join(x for x in (self.root.name, parent) if x)
+        matched = match_model_library(name, save_dir)
+        return (
+            relpath,
+            parent,
+            name,
+            relpath.split("/", 1)[0] if "/" in relpath else "",
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_dev,
+            st.st_ino,
+            None,
+            json.dumps(safetensors, ensure_ascii=False, sort_keys=True) if safetensors is not None else None,
+            fingerprint.architecture if fingerprint is not None else "unknown",
+            fingerprint.component if fingerprint is not None else "unknown",
+            fingerprint.parameter_count if fingerprint is not None else None,
+            fingerprint.fingerprint if fingerprint is not None else None,
+            matched[0] if matched else None,
+            matched[1] if matched else None,
+        )
+
+    @staticmethod
+    def _delete_subtree(
+        conn: sqlite3.Connection,
+        relpath: str,
+    ) -> int:
+        pattern = _escape_like(relpath) + "/%"
+        conn.execute("DELETE FROM dirs WHERE path = ? OR path LIKE ? ESCAPE '\\'", (relpath, pattern))
+        cursor = conn.execute("DELETE FROM models WHERE dir = ? OR dir LIKE ? ESCAPE '\\'", (relpath, pattern))
+        return cursor.rowcount
+
+    def refresh(
+        self,
+        full: bool = False,
+    ) -> ModelInventoryChanges:
+        """增量刷新模型清单
+
+        目录中新增、删除或重命名文件时目录的修改时间会变化, 修改时间未变化的目录直接使用索引中的记录.
+        原地覆盖写入模型文件不会改变目录的修改时间, 此时可以使用 `full=True` 重新检查所有文件
+
+        Args:
+            full (bool):
+                是否重新读取所有目录并检查所有文件的大小和修改时间
+
+        Returns:
+            ModelInventoryChanges: 刷新过程中的变化统计
+        """
+        changes = ModelInventoryChanges()
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                if not self.root.is_dir():
+                    changes.removed = conn.execute("DELETE FROM models").rowcount
+                    conn.execute("DELETE FROM dirs")
+                    return changes
+
+                visited: set[tuple[int, int]] = set()
+                stack: list[tuple[str, str | None]] = [("", None)]
+                while stack:
+                    rel_dir, parent = stack.pop()
+                    dir_path = self.root.joinpath(*rel_dir.split("/")) if rel_dir else self.root
+                    try:
+                        dir_st = dir_path.stat()
+                    except OSError:
+                        changes.removed += self._delete_subtree(conn, rel_dir)
+                        continue
+                    # 跟随目录软链接时避免循环
+                    key = (dir_st.st_dev, dir_st.st_ino)
+                    if key in visited:
+                        continue
+                    visited.add(key)
+
+                    row = conn.execute("SELECT mtime_ns FROM dirs WHERE path = ?", (rel_dir,)).fetchone()
+                    if not full and row is not None and row[0] == dir_st.st_mtime_ns:
+                        changes.skipped_dirs += 1
+                        for (child,) in conn.execute("SELECT path FROM dirs WHERE parent = ?", (rel_dir,)).fetchall():
+                            stack.append((child, rel_dir))
+                        continue
+
+                    changes.scanned_dirs += 1
+                    self._scan_dir(conn, rel_dir, dir_path, stack, changes)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                        (rel_dir, parent, dir_st.st_mtime_ns),
+                    )
+
+        if changes.added or changes.updated or changes.removed:
+            logger.debug(
+                "模型清单 '%s' 已刷新: 新增 %d, 变化 %d, 删除 %d, 读取目录 %d, 跳过目录 %d",
+                self.root,
+                changes.added,
+                changes.updated,
+                changes.removed,
+                changes.scanned_dirs,
+                changes.skipped_dirs,
+            )
+        return changes
+
+    def refresh_dir(
+        self,
+        path: Path,
+    ) -> ModelInventoryChanges:
+        """只重新读取一个目录 (不递归), 用于下载单个模型后更新索引
+
+        目录中新出现的子目录只登记到索引中, 在下次 `refresh()` 时读取. 索引从未刷新过时执行一次完整的 `refresh()`
+
+        Args:
+            path (Path):
+                模型根目录中的目录
+
+        Returns:
+            ModelInventoryChanges: 刷新过程中的变化统计
+
+        Raises:
+            ValueError:
+                目录不在模型根目录中时
+        """
+        rel_dir = Path(path).absolute().relative_to(self.root.absolute()).as_posix()
+        rel_dir = "" if rel_dir == "." else rel_dir
+        with self.lock:
+            indexed = self._connect().execute("SELECT 1 FROM dirs LIMIT 1").fetchone() is not None
+        if not indexed:
+            return self.refresh()
+
+        changes = ModelInventoryChanges()
+        dir_path = self.root.joinpath(*rel_dir.split("/")) if rel_dir else self.root
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                try:
+                    dir_st = dir_path.stat()
+                except OSError:
+                    changes.removed += self._delete_subtree(conn, rel_dir)
+                    return changes
+                stack: list[tuple[str, str | None]] = []
+                changes.scanned_dirs += 1
+                self._scan_dir(conn, rel_dir, dir_path, stack, changes)
+                parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ("" if rel_dir else None)
+                conn.execute(
+                    "INSERT OR REPLACE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, ?)",
+                    (rel_dir, parent, dir_st.st_mtime_ns),
+                )
+                # 子目录的修改时间记为 -1, 保证下次 refresh() 时会被读取
+                conn.executemany(
+                    "INSERT OR IGNORE INTO dirs (path, parent, mtime_ns) VALUES (?, ?, -1)",
+                    [(child, rel_dir) for child, _ in stack],
+                )
+        return changes
+
+    def _scan_dir(
+        self,
+        conn: sqlite3.Connection,
+        rel_dir: str,
+        dir_path: Path,
+        stack: list[tuple[str, str | None]],
+        changes: ModelInventoryChanges,
+    ) -> None:
+        known_files = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT name, size, mtime_ns FROM models WHERE dir = ?", (rel_dir,))}
+        known_dirs = {row[0] for row in conn.execute("SELECT path FROM dirs WHERE parent = ?", (rel_dir,))}
+        seen_files: set[str] = set()
+        seen_dirs: set[str] = set()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("读取模型目录 '%s' 失败: %s", dir_path, e)
+            entries = []
+
+        for entry in entries:
+            rel = _join_rel(rel_dir, entry.name)
+            try:
+                if entry.is_dir():
+                    seen_dirs.add(rel)
+                    stack.append((rel, rel_dir))
+                    continue
+                if not entry.name.lower().endswith(MODEL_INVENTORY_EXTENSIONS) or not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            seen_files.add(entry.name)
+            known = known_files.get(entry.name)
+            if known == (st.st_size, st.st_mtime_ns):
+                continue
+            conn.execute(
+                "INSERT OR REPLACE INTO models "
+                "(path, dir, name, model_type, size, mtime_ns, dev, ino, sha256, safetensors, architecture, component, parameter_count, fingerprint, model_name, model_dtype) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._describe_file(rel, entry.name, rel_dir, st),
+            )
+            if known is None:
+                changes.added += 1
+            else:
+                changes.updated += 1
+
+        for name in known_files.keys() - seen_files:
+            conn.execute("DELETE FROM models WHERE path = ?", (_join_rel(rel_dir, name),))
+            changes.removed += 1
+        for child in known_dirs - seen_dirs:
+            changes.removed += self._delete_subtree(conn, child)
+
+    def _query(
+        self,
+        where: str = "",
+        params: tuple[Any, ...] = (),
+    ) -> list[ModelInventoryEntry]:
+        with self.lock:
+            rows = self._connect().execute(f"SELECT {_ENTRY_COLUMNS} FROM models {where} ORDER BY path", params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    @staticmethod
+    def _type_filter(
+        model_type: str | None,
+    ) -> tuple[str, tuple[Any, ...]]:
+        if model_type is None:
+            return "", ()
+        model_type = model_type.strip("/").replace("\\", "/")
+        return "(dir = ? OR dir LIKE ? ESCAPE '\\')", (model_type, _escape_like(model_type) + "/%")
+
+    def get(
+        self,
+        path: Path,
+    ) -> ModelInventoryEntry | None:
+        """按文件路径获取模型清单条目
+
+        Args:
+            path (Path):
+                模型文件路径
+
+        Returns:
+            (ModelInventoryEntry | None): 模型清单条目, 文件不在模型根目录或索引中时返回 None
+        """
+        try:
+            relpath = Path(path).absolute().relative_to(self.root.absolute()).as_posix()
+        except ValueError:
+            return None
+        entries = self._query("WHERE path = ?", (relpath,))
+        return entries[0] if entries else None
+
+    def list_models(
+        self,
+        model_type: str | None = None,
+    ) -> list[ModelInventoryEntry]:
+        """列出模型清单中的模型
+
+        Args:
+            model_type (str | None):
+                模型所在的目录 (相对模型根目录), 为 None 时列出所有模型
+
+        Returns:
+            list[ModelInventoryEntry]: 按路径排序的模型列表
+        """
+        condition, params = self._type_filter(model_type)
+        return self._query(f"WHERE {condition}" if condition else "", params)
+
+    def search(
+        self,
+        query: str,
+        model_type: str | None = None,
+    ) -> list[ModelInventoryEntry]:
+        """按文件名或模型库名称搜索模型 (不区分大小写的子串匹配)
+
+        Args:
+            query (str):
+                搜索关键字
+            model_type (str | None):
+                模型所在的目录 (相对模型根目录), 为 None 时搜索所有模型
+
+        Returns:
+            list[ModelInventoryEntry]: 按路径排序的匹配模型列表
+        """
+        pattern = f"%{_escape_like(query.lower())}%"
+        conditions = ["(lower(name) LIKE ? ESCAPE '\\' OR lower(ifnull(model_name, '')) LIKE ? ESCAPE '\\')"]
+        params: tuple[Any, ...] = (pattern, pattern)
+        condition, type_params = self._type_filter(model_type)
+        if condition:
+            conditions.append(condition)
+            params += type_params
+        return self._query("WHERE " + " AND ".join(conditions), params)
+
+    def sha256(
+        self,
+        entry: ModelInventoryEntry,
+    ) -> str:
+        """获取模型文件的 sha256, 索引中没有或文件已变化时计算并保存到索引
+
+        Args:
+            entry (ModelInventoryEntry):
+                模型清单条目
+
+        Returns:
+            str: 模型文件的 sha256
+
+        Raises:
+            OSError:
+                模型文件无法读取时
+        """
+        st = entry["path"].stat()
+        with self.lock:
+            row = self._connect().execute("SELECT size, mtime_ns, sha256 FROM models WHERE path = ?", (entry["relpath"],)).fetchone()
+        if row is not None and row[2] and (row[0], row[1]) == (st.st_size, st.st_mtime_ns):
+            entry["sha256"] = row[2]
+            return row[2]
+
+        logger.debug("计算模型 sha256: %s", entry["path"])
+        sha256 = _file_sha256(entry["path"])
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE models SET sha256 = ?, size = ?, mtime_ns = ? WHERE path = ?",
+                    (sha256, st.st_size, st.st_mtime_ns, entry["relpath"]),
+                )
+        entry["sha256"] = sha256
+        entry["size"] = st.st_size
+        entry["mtime_ns"] = st.st_mtime_ns
+        return sha256
+
+    def find_duplicates(
+        self,
+        model_type: str | None = None,
+    ) -> list[list[ModelInventoryEntry]]:
+        """查找内容相同的模型文件
+
+        先按文件大小和模型指纹分组, 只为大小和指纹都相同的文件计算 sha256 确认. 指向同一个文件的硬链接不占用额外空间, 不视为重复
+
+        Args:
+            model_type (str | None):
+                模型所在的目录 (相对模型根目录), 为 None 时在所有模型中查找
+
+        Returns:
+            list[list[ModelInventoryEntry]]: 重复模型分组, 每组包含 2 个及以上的模型
+        """
+        condition, params = self._type_filter(model_type)
+        type_condition = f"AND {condition}" if condition else ""
+        with self.lock:
+            conn = self._connect()
+            sizes = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT size FROM models WHERE size > 0 {type_condition} GROUP BY size HAVING count(DISTINCT dev || ':' || ino) > 1",
+                    params,
+                )
+            ]
+            inodes = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, dev, ino FROM models")}
+
+        groups: dict[str, list[ModelInventoryEntry]] = {}
+        for size in sizes:
+            candidates: dict[str | None, list[ModelInventoryEntry]] = {}
+            for entry in self._query(f"WHERE size = ? {type_condition}", (size, *params)):
+                candidates.setdefault(entry["fingerprint"], []).append(entry)
+            # 指纹不同的文件内容一定不同, 无法识别的文件 (指纹为 None) 需要全部计算 sha256
+            for fingerprint, entries in candidates.items():
+                if fingerprint is not None and len({inodes.get(entry["relpath"]) for entry in entries}) < 2:
+                    continue
+                self._group_by_sha256(entries, groups)
+
+        return [
+            group
+            for group in groups.values()
+            if len({inodes.get(entry["relpath"]) for entry in group}) > 1
+        ]
+
+    def _group_by_sha256(
+        self,
+        entries: list[ModelInventoryEntry],
+        groups: dict[str, list[ModelInventoryEntry]],
+    ) -> None:
+        for entry in entries:
+            try:
+                sha256 = self.sha256(entry)
+            except OSError as e:
+                logger.warning("读取模型 '%s' 失败: %s", entry["path"], e)
+                continue
+            groups.setdefault(sha256, []).append(entry)
+
+    def is_up_to_date(
+        self,
+        model_type: str | None = None,
+    ) -> bool:
+        """检查索引是否与模型目录一致 (只比较目录的修改时间, 不读取目录内容)
+
+        Args:
+            model_type (str | None):
+                模型所在的目录 (相对模型根目录), 为 None 时检查所有目录
+
+        Returns:
+            bool: 索引中有该目录的记录且所有目录的修改时间都未变化时返回 True
+        """
+        where = ""
+        params: tuple[Any, ...] = ()
+        if model_type is not None:
+            model_type = model_type.strip("/").replace("\\", "/")
+            where, params = "WHERE path = ? OR path LIKE ? ESCAPE '\\'", (model_type, _escape_like(model_type) + "/%")
+        with self.lock:
+            rows = self._connect().execute(f"SELECT path, mtime_ns FROM dirs {where}", params).fetchall()
+        if not rows:
+            return False
+        for rel_dir, mtime_ns in rows:
+            dir_path = self.root.joinpath(*rel_dir.split("/")) if rel_dir else self.root
+            try:
+                if dir_path.stat().st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def find_by_name(
+        self,
+        name: str,
+        model_type: str | None = None,
+    ) -> list[ModelInventoryEntry]:
+        """按文件名查找模型 (不区分大小写的子串匹配), 不匹配模型库名称
+
+        Args:
+            name (str):
+                文件名关键字
+            model_type (str | None):
+                模型所在的目录 (相对模型根目录), 为 None 时在所有模型中查找
+
+        Returns:
+            list[ModelInventoryEntry]: 按路径排序的匹配模型列表
+        """
+        conditions = ["lower(name) LIKE ? ESCAPE '\\'"]
+        params: tuple[Any, ...] = (f"%{_escape_like(name.lower())}%",)
+        condition, type_params = self._type_filter(model_type)
+        if condition:
+            conditions.append(condition)
+            params += type_params
+        return self._query("WHERE " + " AND ".join(conditions), params)
+
+    def find_by_fingerprint(
+        self,
+        fingerprint: str,
+    ) -> list[ModelInventoryEntry]:
+        """查找模型指纹相同的模型
+
+        Args:
+            fingerprint (str):
+                模型指纹
+
+        Returns:
+            list[ModelInventoryEntry]: 按路径排序的模型列表
+        """
+        return self._query("WHERE fingerprint = ?", (fingerprint,))
+
+    def forget(
+        self,
+        paths: list[Path],
+    ) -> None:
+        """从索引中移除模型记录, 在删除模型文件后调用
+
+        Args:
+            paths (list[Path]):
+                已删除的模型文件路径
+        """
+        root = self.root.absolute()
+        relpaths = []
+        for path in paths:
+            try:
+                relpaths.append(Path(path).absolute().relative_to(root).as_posix())
+            except ValueError:
+                continue
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM models WHERE path = ?", [(x,) for x in relpaths])
@@ -0,0 +1,411 @@
+"""模型库搜索索引
+
+为模型列表预先构建倒排索引 (词 -> 模型序号) 和归一化文本的三元组索引 (n-gram -> 模型序号), 搜索时只需要检查候选模型,
+并按匹配程度对结果排序. 索引按模型列表缓存, 边输入边搜索时不会重复构建
+"""
+
+import bisect
+import difflib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Any,
+    Iterable,
+    Mapping,
+    Sequence,
+    cast,
+)
+
+from sd_webui_all_in_one.model_downloader.types import (
+    SUPPORTED_WEBUI_LIST,
+    ModelCard,
+    ModelCardList,
+)
+
+
+MODEL_SEARCH_NGRAM_SIZE = 3
+"""归一化文本索引使用的 n-gram 长度"""
+
+MODEL_SEARCH_INDEX_CACHE_SIZE = 8
+"""缓存的搜索索引数量"""
+
+MODEL_SEARCH_FUZZY_CUTOFF = 0.8
+"""模糊匹配时词的最低相似度"""
+
+MODEL_SEARCH_FUZZY_MIN_LENGTH = 4
+"""启用模糊匹配的最短搜索词长度"""
+
+_QUERY_SPLIT_PATTERN = re.compile(r"[\s,，;；/\\._-]+")
+"""搜索关键词的分隔符"""
+
+_SCORE_EXACT_TOKEN = 4
+_SCORE_PREFIX_TOKEN = 3
+_SCORE_SUBSTRING = 1
+_SCORE_FUZZY = 1
+_SCORE_NAME_BONUS = 2
+_SCORE_FULL_QUERY_BONUS = 2
+
+
+def normalize_model_search_text(
+    value: str,
+) -> str:
+    """归一化模型搜索文本
+
+    Args:
+        value (str):
+            要归一化的文本
+
+    Returns:
+        str: 去除分隔符并转换为小写后的文本
+    """
+    return "".join(char.lower() for char in value if char.isalnum())
+
+
+def split_model_search_query(
+    query: str,
+) -> list[str]:
+    """将搜索关键词拆分为归一化的搜索词
+
+    Args:
+        query (str):
+            搜索关键词
+
+    Returns:
+        list[str]: 去除空词后的归一化搜索词
+    """
+    terms = (normalize_model_search_text(term) for term in _QUERY_SPLIT_PATTERN.split(query))
+    return [term for term in terms if term]
+
+
+def get_model_search_fields(
+    model: ModelCard,
+) -> list[str]:
+    """获取模型参与搜索的字段
+
+    Args:
+        model (ModelCard):
+            模型信息
+
+    Returns:
+        list[str]: 模型名称、文件名、类型、支持的 WebUI 和保存路径等字段
+    """
+    fields: list[str] = [
+        model["name"],
+        model["filename"],
+        model["dtype"],
+        Path(model["filename"]).stem,
+    ]
+    fields.extend(model["supported_webui"])
+    for webui in SUPPORTED_WEBUI_LIST:
+        save_dir = model["save_dir"].get(webui)
+        if save_dir is not None:
+            fields.append(save_dir)
+    return fields
+
+
+def _ngrams(
+    value: str,
+) -> set[str]:
+    size = MODEL_SEARCH_NGRAM_SIZE
+    return {value[i : i + size] for i in range(len(value) - size + 1)}
+
+
+@dataclass(frozen=True)
+class _IndexedModel:
+    """已建立索引的模型"""
+
+    raw_text: str
+    """原始搜索文本 (小写)"""
+
+    normalized_text: str
+    """归一化搜索文本"""
+
+    name_text: str
+    """归一化的模型名称和文件名, 用于提高名称匹配的排序"""
+
+    tokens: frozenset[str]
+    """模型的所有词"""
+
+
+class ModelSearchIndex:
+    """模型列表的搜索索引
+
+    搜索规则与逐个模型匹配一致: 搜索关键词是原始文本的子串, 或归一化后的关键词是归一化文本的子串, 或所有搜索词都是归一化文本的子串.
+    在此基础上, 没有任何结果时对较长的搜索词使用模糊匹配 (与模型中的词相似度达到 `MODEL_SEARCH_FUZZY_CUTOFF`)
+
+    结果按匹配程度排序: 完整匹配词 > 匹配词的前缀 > 匹配子串, 匹配模型名称或文件名时额外加分, 分数相同时保持模型列表中的顺序
+    """
+
+    def __init__(
+        self,
+        models: Sequence[ModelCard],
+    ) -> None:
+        """构建搜索索引
+
+        Args:
+            models (Sequence[ModelCard]):
+                模型列表
+        """
+        self.models = models
+        self._entries: list[_IndexedModel] = []
+        self._token_index: dict[str, set[int]] = {}
+        self._ngram_index: dict[str, set[int]] = {}
+        self._sorted_tokens: list[str] = []
+
+        for model_id, model in enumerate(models):
+            fields = get_model_search_fields(model)
+            raw_text = " ".join(fields).lower()
+            normalized_text = normalize_model_search_text(raw_text)
+            tokens = frozenset(token for field in fields for token in split_model_search_query(field))
+            self._entries.append(
+                _IndexedModel(
+                    raw_text=raw_text,
+                    normalized_text=normalized_text,
+                    name_text=normalize_model_search_text(f"{model['name']} {model['filename']}"),
+                    tokens=tokens,
+                )
+            )
+            for token in tokens:
+                self._token_index.setdefault(token, set()).add(model_id)
+            for gram in _ngrams(normalized_text):
+                self._ngram_index.setdefault(gram, set()).add(model_id)
+        self._sorted_tokens = sorted(self._token_index)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _substring_candidates(
+        self,
+        term: str,
+    ) -> set[int] | None:
+        """通过 n-gram 索引获取可能包含搜索词的模型, 搜索词过短时返回 None 表示需要检查所有模型"""
+        if len(term) < MODEL_SEARCH_NGRAM_SIZE:
+            return None
+        candidates: set[int] | None = None
+        # 从最少出现的 n-gram 开始求交集
+        for gram in sorted(_ngrams(term), key=lambda x: len(self._ngram_index.get(x, ()))):
+            postings = self._ngram_index.get(gram)
+            if not postings:
+                return set()
+            candidates = set(postings) if candidates is None else candidates & postings
+            if not candidates:
+                break
+        return candidates if candidates is not None else set()
+
+    def _models_containing(
+        self,
+        term: str,
+        pool: set[int] | None,
+    ) -> set[int]:
+        candidates = self._substring_candidates(term)
+        if candidates is None:
+            candidates = pool if pool is not None else set(range(len(self._entries)))
+        elif pool is not None:
+            candidates &= pool
+        return {model_id for model_id in candidates if term in self._entries[model_id].normalized_text}
+
+    def _prefix_tokens(
+        self,
+        term: str,
+    ) -> list[str]:
+        start = bisect.bisect_left(self._sorted_tokens, term)
+        tokens: list[str] = []
+        for token in self._sorted_tokens[start:]:
+            if not token.startswith(term):
+                break
+            tokens.append(token)
+        return tokens
+
+    def _score_term(
+        self,
+        model_id: int,
+        term: str,
+        prefix_matches: set[int],
+    ) -> int:
+        entry = self._entries[model_id]
+        if term in entry.tokens:
+            score = _SCORE_EXACT_TOKEN
+        elif model_id in prefix_matches:
+            score = _SCORE_PREFIX_TOKEN
+        else:
+            score = _SCORE_SUBSTRING
+        if term in entry.name_text:
+            score += _SCORE_NAME_BONUS
+        return score
+
+    def _fuzzy_search(
+        self,
+        terms: list[str],
+    ) -> dict[int, int]:
+        scores: dict[int, int] | None = None
+        for term in terms:
+            matched = {model_id: _SCORE_SUBSTRING for model_id in self._models_containing(term, None if scores is None else set(scores))}
+            if len(term) >= MODEL_SEARCH_FUZZY_MIN_LENGTH:
+                for token in difflib.get_close_matches(term, self._sorted_tokens, n=10, cutoff=MODEL_SEARCH_FUZZY_CUTOFF):
+                    for model_id in self._token_index[token]:
+                        matched.setdefault(model_id, _SCORE_FUZZY)
+            if scores is None:
+                scores = matched
+            else:
+                scores = {model_id: scores[model_id] + score for model_id, score in matched.items() if model_id in scores}
+            if not scores:
+                return {}
+        return scores or {}
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = None,
+        fuzzy: bool = True,
+    ) -> list[int]:
+        """搜索模型
+
+        Args:
+            query (str):
+                搜索关键词
+            limit (int | None):
+                最多返回的结果数量, 为 None 时返回所有结果
+            fuzzy (bool):
+                没有精确结果时是否使用模糊匹配
+
+        Returns:
+            list[int]: 按匹配程度排序的模型序号 (从 0 开始)
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        query_lower = query.lower()
+        terms = split_model_search_query(query)
+        scores: dict[int, int] = {}
+
+        if terms:
+            pool: set[int] | None = None
+            # 先处理较长的搜索词, 候选集合更小
+            for term in sorted(set(terms), key=len, reverse=True):
+                pool = self._models_containing(term, pool)
+                if not pool:
+                    break
+            for model_id in pool or ():
+                scores[model_id] = 0
+            for term in set(terms):
+                prefix_matches: set[int] = set()
+                for token in self._prefix_tokens(term):
+                    prefix_matches |= self._token_index[token]
+                for model_id in scores:
+                    scores[model_id] += self._score_term(model_id, term, prefix_matches)
+
+        # 所有搜索词都匹配是最宽的匹配条件, 关键词整体出现在原始文本或归一化文本中的模型只额外加分;
+        # 不包含任何字母数字的关键词 (例如只有分隔符) 没有搜索词, 只能按原始文本匹配
+        normalized_query = normalize_model_search_text(query)
+        for model_id in list(scores) if terms else range(len(self._entries)):
+            entry = self._entries[model_id]
+            if query_lower in entry.raw_text or (len(terms) > 1 and normalized_query in entry.normalized_text):
+                scores[model_id] = scores.get(model_id, 0) + _SCORE_FULL_QUERY_BONUS
+
+        if not scores and fuzzy and terms:
+            scores = self._fuzzy_search(terms)
+
+        ranked = sorted(scores, key=lambda model_id: (-scores[model_id], model_id))
+        return ranked[:limit] if limit is not None else ranked
+
+
+_search_index_cache: "OrderedDict[tuple[int, ...], ModelSearchIndex]" = OrderedDict()
+_search_index_lock = threading.Lock()
+
+
+def get_model_search_index(
+    models: Sequence[ModelCard],
+) -> ModelSearchIndex:
+    """获取模型列表的搜索索引, 同一组模型对象只构建一次
+
+    缓存按模型对象的身份识别, `export_model_list` 返回的只读模型视图在多次调用之间保持不变, 因此可以直接命中缓存
+
+    Args:
+        models (Sequence[ModelCard]):
+            模型列表
+
+    Returns:
+        ModelSearchIndex: 搜索索引
+    """
+    key = tuple(map(id, models))
+    with _search_index_lock:
+        index = _search_index_cache.get(key)
+        if index is not None:
+            _search_index_cache.move_to_end(key)
+            return index
+
+    index = ModelSearchIndex(list(models))
+    with _search_index_lock:
+        # 索引保存了模型对象的引用, 缓存期间模型对象的 id 不会被复用
+        _search_index_cache[key] = index
+        while len(_search_index_cache) > MODEL_SEARCH_INDEX_CACHE_SIZE:
+            _search_index_cache.popitem(last=False)
+    return index
+
+
+def freeze_model_card(
+    model: ModelCard,
+) -> ModelCard:
+    """创建模型信息的只读视图
+
+    视图中的字典为 `MappingProxyType`, 列表为元组, 修改时会抛出 `TypeError`
+
+    Args:
+        model (ModelCard):
+            模型信息
+
+    Returns:
+        ModelCard: 只读的模型信息
+    """
+    frozen: dict[str, Any] = {}
+    for key, value in model.items():
+        if isinstance(value, Mapping):
+            frozen[key] = MappingProxyType(dict(value))
+        elif isinstance(value, (list, tuple)):
+            frozen[key] = tuple(value)
+        else:
+            frozen[key] = value
+    return cast(ModelCard, MappingProxyType(frozen))
+
+
+def thaw_model_card(
+    model: ModelCard,
+) -> ModelCard:
+    """将只读的模型信息复制为可修改的字典
+
+    Args:
+        model (ModelCard):
+            模型信息
+
+    Returns:
+        ModelCard: 可修改的模型信息副本
+    """
+    thawed: dict[str, Any] = {}
+    for key, value in model.items():
+        if isinstance(value, Mapping):
+            thawed[key] = dict(value)
+        elif isinstance(value, (list, tuple)):
+            thawed[key] = list(value)
+        else:
+            thawed[key] = value
+    return cast(ModelCard, thawed)
+
+
+def thaw_model_list(
+    models: Iterable[ModelCard],
+) -> ModelCardList:
+    """将只读的模型列表复制为可修改的模型列表
+
+    Args:
+        models (Iterable[ModelCard]):
+            模型列表
+
+    Returns:
+        ModelCardList: 可修改的模型列表副本
+    """
+    return [thaw_model_card(model) for model in models]
@@ -0,0 +1,333 @@
+"""模型内容寻址存储
+
+多个 WebUI 共享同一份模型文件: 模型文件按 sha256 保存在存储目录的 `blobs` 中, 再通过硬链接 / reflink / 软链接 / 复制放置到各个 WebUI 的模型目录
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import uuid
+from pathlib import Path
+from typing import (
+    Literal,
+    TypeAlias,
+    TypedDict,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+ModelStoreLinkMode: TypeAlias = Literal["hardlink", "reflink", "symlink", "copy"]
+"""模型文件放置到 WebUI 目录时使用的方式"""
+
+MODEL_STORE_INDEX_VERSION = 1
+"""模型存储索引版本"""
+
+MODEL_STORE_INDEX_FILE = "index.json"
+"""模型存储索引文件名"""
+
+MODEL_STORE_BLOB_DIR = "blobs"
+"""模型存储文件目录名"""
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+"""计算 sha256 时的读取块大小"""
+
+_FICLONE = 0x40049409
+"""Linux FICLONE ioctl 请求码"""
+
+
+class ModelStoreEntry(TypedDict):
+    """模型存储索引条目"""
+
+    sha256: str
+    """模型文件的 sha256"""
+
+    size: int
+    """模型文件大小"""
+
+    filename: str
+    """模型文件名"""
+
+    url: str
+    """模型下载链接"""
+
+    mtime_ns: int
+    """加入存储时模型文件的修改时间 (纳秒), 大小和修改时间都未变化的文件不再重新计算 sha256"""
+
+
+def _file_sha256(
+    path: Path,
+) -> str:
+    hash_sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
+
+
+def _reflink(
+    src: Path,
+    dst: Path,
+) -> None:
+    """使用 FICLONE 创建 reflink, 仅支持 Linux 上的 Btrfs / XFS 等文件系统"""
+    if not sys.platform.startswith("linux"):
+        raise OSError("当前平台不支持 reflink")
+
+    import fcntl
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        try:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+        except OSError:
+            dst_file.close()
+            dst.unlink(missing_ok=True)
+            raise
+
+
+def _same_file(
+    a: Path,
+    b: Path,
+) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+class ModelStore:
+    """跨 WebUI 共享的模型内容寻址存储
+
+    模型文件保存为 `<root>/blobs/<sha256 前 2 位>/<sha256>`, 索引文件 `<root>/index.json` 记录 `文件名 + 下载链接` 到 sha256 的映射
+
+    Attributes:
+        root (Path):
+            存储根目录
+        blob_dir (Path):
+            模型文件保存目录
+        index_file (Path):
+            索引文件路径
+        lock (threading.Lock):
+            索引读写锁
+    """
+
+    def __init__(
+        self,
+        root: Path,
+    ) -> None:
+        """模型存储初始化
+
+        Args:
+            root (Path):
+                存储根目录
+        """
+        self.root = Path(root)
+        self.blob_dir = self.root / MODEL_STORE_BLOB_DIR
+        self.index_file = self.root / MODEL_STORE_INDEX_FILE
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def entry_key(
+        filename: str,
+        url: str,
+    ) -> str:
+        """生成索引条目的键
+
+        Args:
+            filename (str):
+                模型文件名
+            url (str):
+                模型下载链接
+
+        Returns:
+            str: 索引条目的键
+        """
+        return f"{filename}\n{url}"
+
+    def blob_path(
+        self,
+        sha256: str,
+    ) -> Path:
+        """获取 sha256 对应的模型文件路径
+
+        Args:
+            sha256 (str):
+                模型文件的 sha256
+
+        Returns:
+            Path: 模型文件在存储中的路径
+        """
+        sha256 = sha256.lower()
+        return self.blob_dir / sha256[:2] / sha256
+
+    def _load_index(self) -> dict[str, ModelStoreEntry]:
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("模型存储索引 '%s' 无法读取, 将重建索引: %s", self.index_file, e)
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MODEL_STORE_INDEX_VERSION or not isinstance(data.get("entries"), dict):
+            return {}
+        return data["entries"]
+
+    def _save_index(
+        self,
+        entries: dict[str, ModelStoreEntry],
+    ) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"version": MODEL_STORE_INDEX_VERSION, "entries": entries}, ensure_ascii=False, indent=2, sort_keys=True)
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.{uuid.uuid4().hex}.tmp")
+        tmp_file.write_text(payload, encoding="utf-8")
+        tmp_file.replace(self.index_file)
+
+    def find(
+        self,
+        filename: str,
+        url: str,
+    ) -> Path | None:
+        """查找已保存在存储中的模型文件
+
+        Args:
+            filename (str):
+                模型文件名
+            url (str):
+                模型下载链接
+
+        Returns:
+            (Path | None): 找到时返回模型文件在存储中的路径, 否则返回 None
+        """
+        with self.lock:
+            entry = self._load_index().get(self.entry_key(filename, url))
+        if entry is None:
+            return None
+        blob = self.blob_path(entry["sha256"])
+        try:
+            if blob.stat().st_size != entry["size"]:
+                logger.warning("模型存储中的 '%s' 大小与索引不一致, 忽略该文件", blob)
+                return None
+        except OSError:
+            return None
+        return blob
+
+    def add(
+        self,
+        file_path: Path,
+        url: str,
+        filename: str | None = None,
+    ) -> Path:
+        """将已下载的模型文件加入存储, 并把原文件替换为指向存储的链接
+
+        Args:
+            file_path (Path):
+                已下载的模型文件路径
+            url (str):
+                模型下载链接
+            filename (str | None):
+                模型文件名, 为 None 时使用 `file_path` 的文件名
+
+        Returns:
+            Path: 模型文件在存储中的路径
+        """
+        filename = filename or file_path.name
+        real_file = file_path.resolve()
+        st = real_file.stat()
+        size = st.st_size
+        key = self.entry_key(filename, url)
+        with self.lock:
+            entry = self._load_index().get(key)
+
+        sha256: str | None = None
+        if entry is not None:
+            blob = self.blob_path(entry["sha256"])
+            if _same_file(blob, real_file):
+                # 文件已经是指向存储的链接, 不需要重新计算 sha256
+                return blob
+            if entry["size"] == size and entry.get("mtime_ns") == st.st_mtime_ns and blob.exists():
+                sha256 = entry["sha256"]
+
+        if sha256 is None:
+            sha256 = _file_sha256(real_file)
+        blob = self.blob_path(sha256)
+
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp_blob = blob.with_name(f"{blob.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                os.link(real_file, tmp_blob)
+            except OSError:
+                shutil.copy2(real_file, tmp_blob)
+            tmp_blob.replace(blob)
+            logger.debug("已将 '%s' 保存到模型存储: %s", file_path, blob)
+        if not _same_file(blob, real_file):
+            # 存储中已有相同内容的文件, 或跨设备无法硬链接时复制到了存储中, 用链接替换下载得到的副本以释放空间
+            self.link(blob, file_path)
+
+        with self.lock:
+            entries = self._load_index()
+            entries[key] = {
+                "sha256": sha256,
+                "size": size,
+                "filename": filename,
+                "url": url,
+                "mtime_ns": blob.stat().st_mtime_ns,
+            }
+            self._save_index(entries)
+        return blob
+
+    def link(
+        self,
+        blob: Path,
+        target: Path,
+    ) -> ModelStoreLinkMode:
+        """将存储中的模型文件放置到目标路径
+
+        依次尝试硬链接、reflink、软链接和复制, 使用第一个成功的方式
+
+        Args:
+            blob (Path):
+                模型文件在存储中的路径
+            target (Path):
+                模型文件的目标路径
+
+        Returns:
+            ModelStoreLinkMode: 实际使用的放置方式
+
+        Raises:
+            OSError:
+                所有放置方式均失败时
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+        mode: ModelStoreLinkMode
+        try:
+            os.link(blob, tmp_target)
+            mode = "hardlink"
+        except OSError:
+            try:
+                _reflink(blob, tmp_target)
+                mode = "reflink"
+            except OSError:
+                try:
+                    tmp_target.symlink_to(blob.resolve())
+                    mode = "symlink"
+                except OSError:
+                    shutil.copy2(blob, tmp_target)
+                    mode = "copy"
+        tmp_target.replace(target)
+        logger.debug("使用 %s 方式将 '%s' 放置到 '%s'", mode, blob, target)
+        return mode
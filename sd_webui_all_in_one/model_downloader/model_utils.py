@@ -1,21 +1,36 @@
 """模型库管理工具"""
 
-import copy
-import re
+import threading
 from pathlib import Path
 
 from sd_webui_all_in_one.downloader import (
     download_file,
     DownloadToolType,
+    DownloadScheduler,
+    DownloadSchedulerError,
+    DownloadTask,
+    DownloadFailurePolicy,
 )
 from sd_webui_all_in_one.config import (
     LOGGER_LEVEL,
     LOGGER_COLOR,
     LOGGER_NAME,
+    SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH,
 )
 from sd_webui_all_in_one.logger import get_logger
 from sd_webui_all_in_one.ansi_color import ANSIColor
-from sd_webui_all_in_one.model_downloader.model_data import MODEL_DOWNLOAD_DICT
+from sd_webui_all_in_one.model_downloader.model_data import (
+    ModelCatalog,
+    get_model_catalog,
+)
+from sd_webui_all_in_one.model_downloader.model_store import ModelStore
+from sd_webui_all_in_one.model_downloader.model_search import (
+    freeze_model_card,
+    get_model_search_fields,
+    get_model_search_index,
+    normalize_model_search_text,
+    split_model_search_query,
+)
 from sd_webui_all_in_one.model_downloader.types import (
     SUPPORTED_WEBUI_LIST,
     ModelCard,
@@ -31,11 +46,29 @@ logger = get_logger(
 )
 
 
+_frozen_library: tuple[ModelCatalog, ModelCardList] | None = None
+"""模型库目录和模型库只读视图的缓存"""
+
+_frozen_library_lock = threading.Lock()
+
+
+def _get_frozen_library() -> tuple[ModelCatalog, ModelCardList]:
+    """获取模型库目录和模型库的只读视图, 模型库目录变化时重新创建"""
+    global _frozen_library
+    catalog = get_model_catalog()
+    with _frozen_library_lock:
+        if _frozen_library is None or _frozen_library[0] is not catalog:
+            _frozen_library = (catalog, [freeze_model_card(m) for m in catalog.cards])
+        return _frozen_library
+
+
 def export_model_list(
     dtype: SupportedWebUiType,
 ) -> ModelCardList:
     """导出模型列表
 
+    返回的模型信息为共享的只读视图 (修改时抛出 `TypeError`), 需要修改时使用 `thaw_model_list` 复制
+
     Args:
         dtype (SupportedWebUiType): 要导出的模型类型
 
@@ -50,11 +83,37 @@ def export_model_list(
     if dtype not in SUPPORTED_WEBUI_LIST:
         raise ValueError(f"不支持的 WebUI 类型: '{dtype}'")
 
-    new_model_list = [copy.deepcopy(m) for m in MODEL_DOWNLOAD_DICT if dtype in m["supported_webui"]]
+    catalog, frozen_library = _get_frozen_library()
+    new_model_list = [frozen_library[index] for index in catalog.by_webui.get(dtype, ())]
 
     return new_model_list
 
 
+class ModelDownloadError(RuntimeError):
+    """下载模型时发生错误, 同时携带已下载完成的模型的保存路径
+
+    Attributes:
+        save_paths (list[Path]):
+            已下载完成 (或从模型存储中复用) 的模型的保存路径
+    """
+
+    def __init__(
+        self,
+        message: str,
+        save_paths: list[Path],
+    ) -> None:
+        """初始化模型下载异常
+
+        Args:
+            message (str):
+                异常的描述信息
+            save_paths (list[Path]):
+                已下载完成的模型的保存路径
+        """
+        super().__init__(message)
+        self.save_paths = save_paths
+
+
 def download_model(
     dtype: SupportedWebUiType,
     base_path: Path,
@@ -62,9 +121,14 @@ def download_model(
     model_name: str | list[str] | None = None,
     model_index: int | list[int] | None = None,
     downloader: DownloadToolType | None = None,
+    model_store_path: Path | None = None,
+    max_parallel_files: int = 1,
+    failure_policy: DownloadFailurePolicy = "fail_fast",
 ) -> list[Path]:
     """下载模型到 WebUI 目录中
 
+    启用模型存储时, 已保存在存储中的模型将直接链接到 WebUI 目录中, 新下载的模型也会加入存储供其他 WebUI 复用
+
     Args:
         dtype (SupportedWebUiType):
             WebUI 的类型
@@ -78,12 +142,21 @@ def download_model(
             下载的模型在列表中的索引值, 索引值从 1 开始. 当同时提供 `model_name` 和 `model_index` 时, 优先使用 `model_index` 查找模型
         downloader (DownloadToolType | None):
             下载模型使用的工具
+        model_store_path (Path | None):
+            跨 WebUI 共享的模型存储目录, 为 None 时使用 `SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH` 环境变量的配置, 均未设置时不使用模型存储
+        max_parallel_files (int):
+            同时下载的模型数, 大于 1 时使用并行下载调度器, 所有模型共享全局连接数预算
+        failure_policy (DownloadFailurePolicy):
+            并行下载时任务失败的处理策略, `fail_fast` 时停止调度剩余模型, `continue` 时继续下载其他模型.
+            两种策略下已下载完成的模型都会加入模型存储, 并通过异常的 `save_paths` 返回
 
     Returns:
         list[Path]:
             模型的保存路径列表
 
     Raises:
+        ModelDownloadError:
+            并行下载模型时存在下载失败的模型时, 已下载完成的模型保存在异常的 `save_paths` 中
         RuntimeError:
             下载模型时发生错误时
     """
@@ -96,9 +169,13 @@ def download_model(
         model_index=model_index,
     )
     logger.debug("查询到的模型下载列表: %s", queue_model)
+    if model_store_path is None:
+        model_store_path = SD_WEBUI_ALL_IN_ONE_MODEL_STORE_PATH
+    model_store = ModelStore(model_store_path) if model_store_path is not None else None
     count = 0
     sums = len(queue_model)
-    save_paths: list[Path] = []
+    save_paths: list[Path | None] = []
+    pending: list[tuple[int, str, str, str, Path]] = []
     for model in queue_model:
         count += 1
         name = model["name"]
@@ -108,6 +185,21 @@ def download_model(
         if save_dir_name is None or url is None:
             raise RuntimeError(f"模型 {name} 缺少 {dtype} 的保存路径或 {download_resource_type} 下载地址")
         save_dir = base_path / save_dir_name
+        target = save_dir / filename
+        if model_store is not None and not target.exists():
+            blob = model_store.find(filename, url)
+            if blob is not None:
+                mode = model_store.link(blob, target)
+                logger.info("[%s/%s] 从模型存储中复用 %s (%s)", count, sums, name, mode)
+                save_paths.append(target)
+                continue
+
+        if max_parallel_files > 1:
+            # 先占位保持模型顺序, 下载失败的模型不会出现在返回的保存路径中
+            save_paths.append(None)
+            pending.append((len(save_paths) - 1, name, url, filename, save_dir))
+            continue
+
         logger.info("[%s/%s] 下载 %s 到 %s 中", count, sums, name, save_dir)
         try:
             p = download_file(
@@ -122,7 +214,45 @@ def download_model(
             logger.info("[%s/%s] 下载 %s 时发生错误: %s", count, sums, name, e)
             raise RuntimeError(f"下载 {name} 时发生错误: {e}") from e
 
-    return save_paths
+        _add_to_model_store(model_store, p, url, filename)
+
+    if pending:
+        logger.info("并行下载 %s 个模型中", len(pending))
+        scheduler = DownloadScheduler(
+            tool=downloader,
+            max_parallel_files=max_parallel_files,
+            failure_policy=failure_policy,
+        )
+        error: DownloadSchedulerError | None = None
+        try:
+            results = scheduler.run([DownloadTask(url=url, path=save_dir, save_name=filename) for _, _, url, filename, save_dir in pending])
+        except DownloadSchedulerError as e:
+            error = e
+            results = e.results
+        for (slot, _, url, filename, _), p in zip(pending, results):
+            if p is None:
+                continue
+            save_paths[slot] = p
+            _add_to_model_store(model_store, p, url, filename)
+        if error is not None:
+            raise ModelDownloadError(f"并行下载模型时发生错误: {error}", [p for p in save_paths if p is not None]) from error
+
+    return [p for p in save_paths if p is not None]
+
+
+def _add_to_model_store(
+    model_store: ModelStore | None,
+    path: Path,
+    url: str,
+    filename: str,
+) -> None:
+    """将下载完成的模型加入模型存储, 失败时仅记录警告"""
+    if model_store is None:
+        return
+    try:
+        model_store.add(path, url=url, filename=filename)
+    except OSError as e:
+        logger.warning("将 %s 加入模型存储失败: %s", path, e)
 
 
 def query_model_info(
@@ -158,17 +288,13 @@ def query_model_info(
             raise ValueError(f"索引值 {index} 超出范围, 模型有效的范围为: 1 ~ {len(model_list)}")
 
     def _get_model_with_name(name: str) -> ModelCardList:
-        _queue_model: ModelCardList = []
-        has_found = False
-        for model in model_list:
-            if model["name"] == name:
-                _queue_model.append(model)
-                has_found = True
-        if not has_found:
+        _queue_model = [frozen_library[record.index] for record in catalog.select(name=name, webui=dtype)]
+        if not _queue_model:
             raise FileNotFoundError(f"未找到指定的模型名称: {name}")
         return _queue_model
 
     model_list = export_model_list(dtype)
+    catalog, frozen_library = _get_frozen_library()
     if model_name is None and model_index is None:
         raise ValueError("`model_name` 和 `model_index` 缺失, 需要提供其中一项才能进行模型信息查找")
 
@@ -218,21 +344,6 @@ def display_model_table(
         print()
 
 
-def normalize_model_search_text(
-    value: str,
-) -> str:
-    """归一化模型搜索文本
-
-    Args:
-        value (str):
-            要归一化的文本
-
-    Returns:
-        str: 去除分隔符并转换为小写后的文本
-    """
-    return "".join(char.lower() for char in value if char.isalnum())
-
-
 def get_model_search_text(
     model: ModelCard,
 ) -> tuple[str, str]:
@@ -245,18 +356,7 @@ def get_model_search_text(
     Returns:
         tuple[str, str]: 原始搜索文本和归一化搜索文本
     """
-    fields: list[str] = [
-        model["name"],
-        model["filename"],
-        model["dtype"],
-        Path(model["filename"]).stem,
-    ]
-    fields.extend(model["supported_webui"])
-    for webui in SUPPORTED_WEBUI_LIST:
-        save_dir = model["save_dir"].get(webui)
-        if save_dir is not None:
-            fields.append(save_dir)
-    raw_text = " ".join(fields).lower()
+    raw_text = " ".join(get_model_search_fields(model)).lower()
     normalized_text = normalize_model_search_text(raw_text)
     return raw_text, normalized_text
 
@@ -267,6 +367,8 @@ def model_matches_search_query(
 ) -> bool:
     """判断模型是否匹配搜索关键词
 
+    搜索整个模型列表时使用 `search_models_from_library`, 它使用缓存的搜索索引, 不需要为每个模型重新计算搜索文本
+
     Args:
         model (ModelCard):
             模型信息
@@ -282,7 +384,7 @@ def model_matches_search_query(
 
     query_lower = query.lower()
     normalized_query = normalize_model_search_text(query)
-    query_terms = [normalize_model_search_text(term) for term in re.split(r"[\s,，;；/\\._-]+", query) if normalize_model_search_text(term)]
+    query_terms = split_model_search_query(query)
     raw_text, normalized_text = get_model_search_text(model)
 
     if query_lower in raw_text:
@@ -307,18 +409,13 @@ def search_models_from_library(
             模型列表
 
     Returns:
-        list[int]: 匹配到的模型序号列表
+        list[int]: 按匹配程度排序的模型序号列表
     """
 
-    results_indices = []
-    matched_items = []
-
-    for index, model in enumerate(models, start=1):
-        if model_matches_search_query(model, query):
-            results_indices.append(index)
-            matched_items.append((index, model))
+    results_indices = [model_id + 1 for model_id in get_model_search_index(models).search(query)]
 
-    for idx, model in matched_items:
+    for idx in results_indices:
+        model = models[idx - 1]
         filename = model["filename"]
         dtype = model["dtype"]
         print(f" - {ANSIColor.GOLD}{idx}{ANSIColor.RESET}、{ANSIColor.WHITE}{filename}{ANSIColor.RESET} ({ANSIColor.BLUE}{dtype}{ANSIColor.RESET})")
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Literal, TypeAlias, TypedDict
 
 from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.bootstrap import start_environment_bootstrap
 from sd_webui_all_in_one.pytorch_manager import (
     get_gpu_list,
     has_gpus,
@@ -129,6 +130,8 @@ class BaseManager:
             port (int | None):
                 内网穿透端口
         """
+        # 系统代理检测在后台进行, 初始化完成前等待检测结果
+        bootstrap = start_environment_bootstrap()
         self.workspace = Path(workspace)
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.workfolder = workfolder
@@ -139,6 +142,7 @@ class BaseManager:
         self.remove_files = remove_files
         self.move_files = move_files
         self.run_cmd = run_cmd
+        bootstrap.wait()
 
     def stop_all_tunnels(
         self,
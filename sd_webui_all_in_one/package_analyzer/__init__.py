@@ -5,16 +5,19 @@
 模块分层结构:
     底层:
         - ``py_whl_parse``: PEP 508 解析器基础设施
-        - ``py_ver_cmp``: PEP 440 版本比较器
+        - ``py_ver_cmp``: PEP 440 版本比较器 (解析结果缓存, 预先计算全序排序键)
         - ``ver_cmp``: 通用版本比较器
     中层:
         - ``version_utils``: 版本字符串工具 (canonical 检查、包名/版本提取)
         - ``wheel_parser``: Wheel 文件名解析
         - ``requirement_parser``: PEP 508 依赖声明解析与 marker 评估
+        - ``installed_index``: 已安装软件包索引 (一次遍历 ``importlib.metadata.distributions()``, 按目录修改时间失效)
     高层:
         - ``requirement_normalizer``: 依赖声明标准化 (组合中层模块完成 requirements 列表标准化)
+        - ``requirement_cache``: 依赖文件解析结果缓存 (按路径、修改时间和大小失效, 展开 ``-r`` / ``-c`` 引用的文件)
     最高层:
         - ``installation_checker``: 安装状态检查与依赖验证
+        - ``requirement_solver``: 依赖约束求解 (将同名软件包的所有约束折叠为版本区间集合, 检测冲突及其来源)
 """
 
 # 版本字符串工具
@@ -51,6 +54,23 @@ from sd_webui_all_in_one.package_analyzer.requirement_parser import (
 from sd_webui_all_in_one.package_analyzer.requirement_normalizer import (
     parse_requirement_list,
 )
+from sd_webui_all_in_one.package_analyzer.requirement_cache import (
+    RequirementFileCache,
+    RequirementFileEntry,
+    get_requirement_file_cache,
+    get_requirement_specs,
+    parse_requirement_file,
+)
+
+# 已安装软件包索引
+from sd_webui_all_in_one.package_analyzer.installed_index import (
+    InstalledDistribution,
+    InstalledDistributionIndex,
+    build_installed_distribution_index,
+    get_installed_distribution_index,
+    invalidate_installed_distribution_index,
+    get_installed_requires,
+)
 
 # 依赖分类
 from sd_webui_all_in_one.package_analyzer.dependency_categorizer import (
@@ -70,10 +90,26 @@ from sd_webui_all_in_one.package_analyzer.installation_checker import (
     check_version_constraint,
 )
 
+# 依赖约束求解
+from sd_webui_all_in_one.package_analyzer.requirement_solver import (
+    PackageConflict,
+    RequirementSolver,
+    RequirementSource,
+    VersionInterval,
+    VersionSet,
+    version_key,
+    version_set_from_specs,
+)
+
 # PEP 440 版本比较
 from sd_webui_all_in_one.package_analyzer.py_ver_cmp import (
+    PyWhlVersion,
     PyWhlVersionComparison,
     PyWhlVersionMatcher,
+    parse_pywhl_version,
+    post_release_ceiling_key,
+    public_version_key,
+    version_sort_key,
 )
 
 # 通用版本比较
@@ -105,6 +141,19 @@ __all__ = [
     "evaluate_marker",
     "parse_requirement_to_list",
     "parse_requirement_list",
+    # requirement_cache
+    "RequirementFileCache",
+    "RequirementFileEntry",
+    "get_requirement_file_cache",
+    "get_requirement_specs",
+    "parse_requirement_file",
+    # installed_index
+    "InstalledDistribution",
+    "InstalledDistributionIndex",
+    "build_installed_distribution_index",
+    "get_installed_distribution_index",
+    "invalidate_installed_distribution_index",
+    "get_installed_requires",
     # dependency_categorizer
     "PackageDependencies",
     "format_requirement",
@@ -118,9 +167,22 @@ __all__ = [
     "validate_requirements",
     "parse_package_spec",
     "check_version_constraint",
+    # requirement_solver
+    "PackageConflict",
+    "RequirementSolver",
+    "RequirementSource",
+    "VersionInterval",
+    "VersionSet",
+    "version_key",
+    "version_set_from_specs",
     # py_ver_cmp
+    "PyWhlVersion",
     "PyWhlVersionComparison",
     "PyWhlVersionMatcher",
+    "parse_pywhl_version",
+    "post_release_ceiling_key",
+    "public_version_key",
+    "version_sort_key",
     # ver_cmp
     "CommonVersionComparison",
     "version_increment",
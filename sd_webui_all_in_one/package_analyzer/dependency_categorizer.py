@@ -1,6 +1,5 @@
 """依赖导出工具"""
 
-from importlib.metadata import requires
 from typing import Any, TypedDict
 
 from sd_webui_all_in_one.package_analyzer import (
@@ -8,6 +7,7 @@ from sd_webui_all_in_one.package_analyzer import (
     parse_requirement,
 )
 from sd_webui_all_in_one.package_analyzer.py_whl_parse import get_parse_bindings
+from sd_webui_all_in_one.package_analyzer.installed_index import get_installed_requires
 from sd_webui_all_in_one.config import (
     LOGGER_NAME,
     LOGGER_LEVEL,
@@ -154,7 +154,7 @@ def get_categorized_dependencies(
         print(deps["mandatory"])  # ['urllib3>=1.21.1,<3']
         print(deps["optional"])   # {'socks': ['PySocks>=1.5.6,!=1.5.7']}
         ```"""
-    raw_reqs = requires(package_name)
+    raw_reqs = get_installed_requires(package_name)
     bindings = get_parse_bindings()
     result: PackageDependencies = {"mandatory": [], "optional": {}}
 
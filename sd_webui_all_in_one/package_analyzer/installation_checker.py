@@ -7,7 +7,6 @@
     - https://peps.python.org/pep-0508/
 """
 
-import importlib.metadata
 import re
 from pathlib import Path
 
@@ -19,9 +18,9 @@ from sd_webui_all_in_one.config import (
 )
 from sd_webui_all_in_one.package_analyzer.py_ver_cmp import PyWhlVersionComparison
 from sd_webui_all_in_one.package_analyzer.dependency_categorizer import get_categorized_dependencies
+from sd_webui_all_in_one.package_analyzer.installed_index import get_installed_distribution_index
 from sd_webui_all_in_one.package_analyzer.version_utils import _try_parse_requirement
-from sd_webui_all_in_one.package_analyzer.requirement_normalizer import parse_requirement_list
-from sd_webui_all_in_one.package_analyzer.requirement_parser import read_packages_from_requirements_file
+from sd_webui_all_in_one.package_analyzer.requirement_cache import get_requirement_specs
 
 
 logger = get_logger(
@@ -93,7 +92,7 @@ def get_package_version_from_library(
 ) -> str | None:
     """获取已安装的 Python 软件包版本号
 
-    依次尝试原始包名、小写包名、下划线转连字符包名进行查找.
+    从共用的已安装软件包索引中按规范化包名查找, 不会重新扫描 ``sys.path``.
 
     Args:
         package_name (str):
@@ -102,24 +101,7 @@ def get_package_version_from_library(
     Returns:
         str | None: 如果获取到版本号则返回版本号字符串, 否则返回 ``None``
     """
-    try:
-        ver = importlib.metadata.version(package_name)
-    except Exception:
-        ver = None
-
-    if ver is None:
-        try:
-            ver = importlib.metadata.version(package_name.lower())
-        except Exception:
-            ver = None
-
-    if ver is None:
-        try:
-            ver = importlib.metadata.version(package_name.replace("_", "-"))
-        except Exception:
-            ver = None
-
-    return ver
+    return get_installed_distribution_index().version(package_name)
 
 
 def parse_package_spec(
@@ -345,7 +327,8 @@ def validate_requirements(
 ) -> bool:
     """检测环境依赖是否完整
 
-    读取 requirements 文件并检查所有依赖是否已正确安装.
+    读取 requirements 文件 (包括 ``-r`` 引用的依赖文件和 ``-c`` 引用的约束文件) 并检查所有依赖是否已正确安装.
+    依赖文件的解析结果会被缓存, 文件未修改时不会重新解析.
 
     Args:
         requirement_path (str | Path):
@@ -354,8 +337,7 @@ def validate_requirements(
     Returns:
         bool: 如果有缺失依赖则返回 ``False``
     """
-    origin_requires = read_packages_from_requirements_file(requirement_path)
-    requires = parse_requirement_list(origin_requires)
+    requires = get_requirement_specs(requirement_path)
     for package in requires:
         if not is_package_installed(package):
             return False
@@ -0,0 +1,318 @@
+"""已安装 Python 软件包索引
+
+``importlib.metadata.version()`` / ``requires()`` 每次查找都会重新扫描 ``sys.path`` 中所有目录的 ``.dist-info``,
+逐行检查依赖文件时开销很大. 该模块只遍历一次 ``importlib.metadata.distributions()`` 构建已安装软件包索引
+(规范化包名, 版本号, optional extras, ``Requires-Dist``), 所有安装状态检查共用同一个索引.
+``sys.path`` 或其中目录的修改时间发生变化 (安装 / 卸载软件包) 时自动重新构建索引.
+
+参考:
+    - https://peps.python.org/pep-0503/#normalized-names
+    - https://packaging.python.org/en/latest/specifications/core-metadata/
+"""
+
+import importlib.metadata
+import os
+import sys
+import threading
+from typing import (
+    Iterable,
+    Sequence,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+from sd_webui_all_in_one.package_analyzer.version_utils import normalize_package_name
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+PathSignature = tuple[tuple[str, int | None], ...]
+"""``sys.path`` 中各目录及其修改时间 (纳秒), 目录不存在时修改时间为 ``None``"""
+
+
+class InstalledDistribution:
+    """一个已安装的 Python 软件包"""
+
+    __slots__ = (
+        "name",
+        "canonical_name",
+        "version",
+        "extras",
+        "requires",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        extras: Iterable[str] = (),
+        requires: Iterable[str] | None = None,
+    ) -> None:
+        """已安装软件包初始化
+
+        Args:
+            name (str):
+                软件包名 (metadata 中的 ``Name``)
+            version (str):
+                版本号
+            extras (Iterable[str]):
+                软件包提供的 optional extra 分组名
+            requires (Iterable[str] | None):
+                软件包的依赖声明 (``Requires-Dist``), 没有依赖信息时为 ``None``
+        """
+        self.name = name
+        """软件包名"""
+
+        self.canonical_name = normalize_package_name(name)
+        """规范化后的软件包名"""
+
+        self.version = version
+        """版本号"""
+
+        self.extras: tuple[str, ...] = tuple(dict.fromkeys(normalize_package_name(extra) for extra in extras))
+        """规范化后的 optional extra 分组名"""
+
+        self.requires: tuple[str, ...] | None = None if requires is None else tuple(requires)
+        """依赖声明列表"""
+
+    def __repr__(self) -> str:
+        return f"InstalledDistribution(name={self.name!r}, version={self.version!r})"
+
+
+class InstalledDistributionIndex:
+    """已安装 Python 软件包索引, 按规范化包名查找
+
+    同一个软件包在 ``sys.path`` 中出现多次时, 与 ``importlib.metadata`` 一致使用最先找到的一个
+    """
+
+    __slots__ = (
+        "distributions",
+        "signature",
+    )
+
+    def __init__(
+        self,
+        distributions: Iterable[InstalledDistribution],
+        signature: PathSignature = (),
+    ) -> None:
+        """已安装软件包索引初始化
+
+        Args:
+            distributions (Iterable[InstalledDistribution]):
+                按 ``sys.path`` 顺序排列的已安装软件包
+            signature (PathSignature):
+                构建索引时 ``sys.path`` 中各目录的修改时间
+        """
+        by_name: dict[str, InstalledDistribution] = {}
+        for dist in distributions:
+            by_name.setdefault(dist.canonical_name, dist)
+
+        self.distributions = by_name
+        """规范化包名到已安装软件包的映射"""
+
+        self.signature = signature
+        """构建索引时 ``sys.path`` 中各目录的修改时间"""
+
+    def __len__(self) -> int:
+        return len(self.distributions)
+
+    def __contains__(
+        self,
+        package_name: object,
+    ) -> bool:
+        return isinstance(package_name, str) and normalize_package_name(package_name) in self.distributions
+
+    def get(
+        self,
+        package_name: str,
+    ) -> InstalledDistribution | None:
+        """查找已安装的软件包
+
+        Args:
+            package_name (str):
+                软件包名, 查找时会进行规范化
+
+        Returns:
+            (InstalledDistribution | None): 已安装的软件包, 未安装时返回 ``None``
+        """
+        return self.distributions.get(normalize_package_name(package_name))
+
+    def version(
+        self,
+        package_name: str,
+    ) -> str | None:
+        """获取已安装软件包的版本号
+
+        Args:
+            package_name (str):
+                软件包名, 查找时会进行规范化
+
+        Returns:
+            (str | None): 版本号, 未安装时返回 ``None``
+        """
+        dist = self.get(package_name)
+        return None if dist is None else dist.version
+
+
+def get_path_signature(
+    paths: Sequence[str],
+) -> PathSignature:
+    """获取各目录的修改时间, 用于判断已安装软件包索引是否过期
+
+    Args:
+        paths (Sequence[str]):
+            目录列表, 空字符串表示当前目录
+
+    Returns:
+        PathSignature: 各目录及其修改时间
+    """
+    signature: list[tuple[str, int | None]] = []
+    for path in paths:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+        except (OSError, ValueError):
+            mtime = None
+        signature.append((path, mtime))
+    return tuple(signature)
+
+
+_METADATA_FIELDS = {
+    "name": "Name",
+    "version": "Version",
+    "requires-dist": "Requires-Dist",
+    "provides-extra": "Provides-Extra",
+}
+"""索引需要的 metadata 字段 (小写字段名到标准字段名的映射)"""
+
+
+def _parse_metadata_headers(
+    text: str,
+) -> dict[str, list[str]]:
+    """只解析 metadata 头部中索引需要的字段, 比 ``email`` 解析器快得多"""
+    fields: dict[str, list[str]] = {}
+    for line in text.splitlines():
+        if not line:
+            # 空行之后为软件包描述
+            break
+        if line[0] in " \t":
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        field = _METADATA_FIELDS.get(key.strip().lower())
+        if field is not None:
+            fields.setdefault(field, []).append(value.strip())
+    return fields
+
+
+def _read_distribution(
+    dist: importlib.metadata.Distribution,
+) -> InstalledDistribution | None:
+    """读取一个软件包的 metadata, metadata 不完整时返回 ``None``"""
+    try:
+        text = dist.read_text("METADATA") or dist.read_text("PKG-INFO")
+        if text is None:
+            return None
+        fields = _parse_metadata_headers(text)
+        name = fields.get("Name", [""])[0]
+        version = fields.get("Version", [None])[0]
+        if not name or version is None:
+            return None
+        requires: list[str] | None = fields.get("Requires-Dist")
+        if requires is None:
+            # 旧版 egg-info 格式的依赖保存在 requires.txt 中
+            requires = dist.requires
+        return InstalledDistribution(
+            name=name,
+            version=version,
+            extras=fields.get("Provides-Extra", ()),
+            requires=requires,
+        )
+    except Exception as e:
+        logger.debug("读取 Python 软件包 metadata 失败: %s", e)
+        return None
+
+
+def build_installed_distribution_index(
+    paths: Sequence[str] | None = None,
+) -> InstalledDistributionIndex:
+    """遍历一次已安装的软件包并构建索引
+
+    Args:
+        paths (Sequence[str] | None):
+            查找软件包的目录列表, 为 ``None`` 时使用 ``sys.path``
+
+    Returns:
+        InstalledDistributionIndex: 已安装软件包索引
+    """
+    paths = list(sys.path if paths is None else paths)
+    # 在遍历前记录修改时间, 遍历过程中安装的软件包会在下次获取索引时重新构建
+    signature = get_path_signature(paths)
+    distributions: list[InstalledDistribution] = []
+    for dist in importlib.metadata.distributions(path=paths):
+        record = _read_distribution(dist)
+        if record is not None:
+            distributions.append(record)
+    logger.debug("已构建 Python 软件包索引, 共 %s 个软件包", len(distributions))
+    return InstalledDistributionIndex(distributions, signature)
+
+
+_index: InstalledDistributionIndex | None = None
+"""当前进程共用的已安装软件包索引"""
+
+_index_lock = threading.Lock()
+
+
+def get_installed_distribution_index() -> InstalledDistributionIndex:
+    """获取当前环境的已安装软件包索引
+
+    首次调用时构建索引, 之后只检查 ``sys.path`` 中各目录的修改时间, 发生变化时重新构建
+
+    Returns:
+        InstalledDistributionIndex: 已安装软件包索引
+    """
+    global _index
+    paths = list(sys.path)
+    signature = get_path_signature(paths)
+    with _index_lock:
+        if _index is None or _index.signature != signature:
+            _index = build_installed_distribution_index(paths)
+        return _index
+
+
+def invalidate_installed_distribution_index() -> None:
+    """清除已安装软件包索引, 下次获取时重新构建"""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def get_installed_requires(
+    package_name: str,
+) -> list[str] | None:
+    """从已安装软件包索引中获取软件包的依赖声明, 与 ``importlib.metadata.requires()`` 的行为一致
+
+    Args:
+        package_name (str):
+            软件包名
+
+    Returns:
+        (list[str] | None): 依赖声明列表, 软件包没有依赖信息时返回 ``None``
+
+    Raises:
+        importlib.metadata.PackageNotFoundError:
+            软件包未安装时
+    """
+    dist = get_installed_distribution_index().get(package_name)
+    if dist is None:
+        raise importlib.metadata.PackageNotFoundError(package_name)
+    return None if dist.requires is None else list(dist.requires)
@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import (
     Callable,
     NamedTuple,
@@ -286,57 +287,11 @@ class PyWhlVersionComparison:
 
         Raises:
             ValueError: 如果 Python 版本号不符合 PEP 440 规范
+
+        Note:
+            解析结果由 ``parse_pywhl_version()`` 缓存, 相同的版本号字符串只解析一次
         """
-        # 检测并剥离通配符
-        wildcard = version_str.endswith(".*") or version_str.endswith("*")
-        clean_str = version_str.rstrip("*").rstrip(".") if wildcard else version_str
-
-        match = self.WHL_VERSION_PARSE_REGEX.match(clean_str)
-        if not match:
-            logger.debug("未知的版本号字符串: %s", version_str)
-            raise ValueError(f"未知的版本号字符串: {version_str}")
-
-        components = match.groupdict()
-
-        # 处理 release 段 (允许空字符串)
-        release_str = components["release"] or "0"
-        release_segments = tuple(int(seg) for seg in release_str.split("."))
-
-        # 规范化 pre-release 标签
-        pre_l: str | None = None
-        pre_n: int | None = None
-        if components["pre_l"]:
-            raw_label = components["pre_l"].lower()
-            pre_l = _PRE_RELEASE_NORMALIZATION.get(raw_label, raw_label)
-            pre_n = int(components["pre_n"]) if components["pre_n"] else 0
-
-        # 规范化 post-release
-        post_n: int | None = None
-        if components["post_n1"]:
-            post_n = int(components["post_n1"])
-        elif components["post_l"]:
-            post_n = int(components["post_n2"]) if components["post_n2"] else 0
-
-        # 规范化 dev-release
-        dev_n: int | None = None
-        if components["dev_l"]:
-            dev_n = int(components["dev_n"]) if components["dev_n"] else 0
-
-        # 规范化 local version
-        local = components["local"]
-        if local:
-            local = local.replace("-", ".").replace("_", ".")
-
-        return PyWhlVersionComponent(
-            epoch=int(components["epoch"] or 0),
-            release=release_segments,
-            pre_l=pre_l,
-            pre_n=pre_n,
-            post_n=post_n,
-            dev_n=dev_n,
-            local=local,
-            is_wildcard=wildcard,
-        )
+        return parse_pywhl_version(version_str).components
 
     def compare_version_objects(
         self,
@@ -518,9 +473,13 @@ class PyWhlVersionComparison:
         Returns:
             int: 如果 version1 > version2 则返回正数, 小于则返回负数, 相等则返回 ``0``
         """
-        v1 = self.parse_version(version1)
-        v2 = self.parse_version(version2)
-        return self.compare_version_objects(v1, v2, ignore_local=ignore_local)
+        v1 = parse_pywhl_version(version1)
+        v2 = parse_pywhl_version(version2)
+        if ignore_local:
+            key1, key2 = v1.public_key, v2.public_key
+        else:
+            key1, key2 = v1.sort_key, v2.sort_key
+        return (key1 > key2) - (key1 < key2)
 
     def compatible_version_matcher(
         self,
@@ -545,24 +504,25 @@ class PyWhlVersionComparison:
         Raises:
             ValueError: 如果版本号只有单段 (如 ``1``)
         """
-        spec = self.parse_version(spec_version)
+        spec = parse_pywhl_version(spec_version)
+        spec_release = spec.components.release
 
-        if len(spec.release) < 2:
+        if len(spec_release) < 2:
             logger.debug("~= 操作符不能用于单段版本号: %s", spec_version)
             raise ValueError(f"~= 操作符不能用于单段版本号: {spec_version}")
 
-        prefix_length = len(spec.release) - 1
-        prefix_pattern = spec.release[:prefix_length]
+        prefix_length = len(spec_release) - 1
+        prefix_pattern = spec_release[:prefix_length]
 
         def _is_compatible(version_str: str) -> bool:
-            target = self.parse_version(version_str)
-            target_prefix = target.release[:prefix_length]
+            target = parse_pywhl_version(version_str)
+            target_prefix = target.components.release[:prefix_length]
             if len(target_prefix) < prefix_length:
                 target_prefix = target_prefix + (0,) * (prefix_length - len(target_prefix))
             if target_prefix != prefix_pattern:
                 return False
             # PEP 440: 有序比较忽略 local version
-            return self.compare_version_objects(target, spec, ignore_local=True) >= 0
+            return target.public_key >= spec.public_key
 
         return _is_compatible
 
@@ -645,37 +605,24 @@ class PyWhlVersionComparison:
         Returns:
             bool: 如果 candidate 满足 ``> spec`` 则返回 ``True``
         """
-        candidate_ver = self.parse_version(candidate)
-        spec_ver = self.parse_version(spec)
+        candidate_parsed = parse_pywhl_version(candidate)
+        spec_parsed = parse_pywhl_version(spec)
 
         # 忽略 candidate 的 local version 进行比较
-        cmp_result = self.compare_version_objects(candidate_ver, spec_ver, ignore_local=True)
-
-        if cmp_result <= 0:
+        # 公共部分等于 spec 时 (candidate 只是多了 local version) 也不匹配: >V MUST NOT match a local version of V
+        if candidate_parsed.public_key <= spec_parsed.public_key:
             return False
 
-        # >V MUST NOT match a local version of V (即 candidate 不能是 spec 的 local version 变体)
-        # 如果公共部分相等, 且 candidate 只是多了 local version, 则不匹配
-        public_cmp = self.compare_version_objects(candidate_ver, spec_ver, ignore_local=True)
-        if public_cmp == 0:
-            return False  # candidate 的公共部分等于 spec, 只是 local 不同
+        candidate_ver = candidate_parsed.components
+        spec_ver = spec_parsed.components
 
         # >V MUST NOT allow a post-release of V unless V itself is a post release
         if spec_ver.post_n is None and candidate_ver.post_n is not None:
             # spec 不是 post-release, 检查 candidate 是否是 spec 的 post-release
             # 构造一个没有 post 的 candidate 来比较 release 部分
-            candidate_no_post = PyWhlVersionComponent(
-                epoch=candidate_ver.epoch,
-                release=candidate_ver.release,
-                pre_l=candidate_ver.pre_l,
-                pre_n=candidate_ver.pre_n,
-                post_n=None,
-                dev_n=candidate_ver.dev_n,
-                local=None,
-                is_wildcard=False,
-            )
+            candidate_no_post = candidate_ver._replace(post_n=None, local=None, is_wildcard=False)
             # 如果去掉 post 后与 spec 的公共部分相等, 则这是 spec 的 post-release, 不允许
-            if self.compare_version_objects(candidate_no_post, spec_ver, ignore_local=True) == 0:
+            if public_version_key(candidate_no_post) == spec_parsed.public_key:
                 return False
 
         return True
@@ -700,26 +647,23 @@ class PyWhlVersionComparison:
         Returns:
             bool: 如果 candidate 满足 ``< spec`` 则返回 ``True``
         """
-        candidate_ver = self.parse_version(candidate)
-        spec_ver = self.parse_version(spec)
+        candidate_parsed = parse_pywhl_version(candidate)
+        spec_parsed = parse_pywhl_version(spec)
 
         # 忽略 candidate 的 local version 进行比较
-        cmp_result = self.compare_version_objects(candidate_ver, spec_ver, ignore_local=True)
-
-        if cmp_result >= 0:
+        if candidate_parsed.public_key >= spec_parsed.public_key:
             return False
 
+        candidate_ver = candidate_parsed.components
+        spec_ver = spec_parsed.components
+
         # <V MUST NOT allow a pre-release of V unless V itself is a pre-release
         if spec_ver.pre_l is None and spec_ver.dev_n is None:
-            # spec 不是 pre-release 也不是 dev release
-            if candidate_ver.pre_l is not None or candidate_ver.dev_n is not None:
-                # candidate 是 pre-release 或 dev release
-                # 检查 candidate 是否是 spec 的 pre-release (即 release 部分相同)
-                max_len = max(len(candidate_ver.release), len(spec_ver.release))
-                c_rel = candidate_ver.release + (0,) * (max_len - len(candidate_ver.release))
-                s_rel = spec_ver.release + (0,) * (max_len - len(spec_ver.release))
-                if c_rel == s_rel and candidate_ver.epoch == spec_ver.epoch:
-                    return False
+            # spec 不是 pre-release 也不是 dev release, V 的 pre-release 和 dev release 都不小于 V.dev0
+            # (V 为 post-release 时只排除 V 自身的 dev release, 例如 <1.0.post1 不包含 1.0.post1.dev2, 但包含 1.0a1)
+            spec_dev0 = spec_ver._replace(dev_n=0, local=None, is_wildcard=False)
+            if candidate_parsed.public_key >= public_version_key(spec_dev0):
+                return False
 
         return True
 
@@ -895,3 +839,256 @@ class PyWhlVersionMatcher:
 
     def __repr__(self) -> str:
         return f"~{self.spec_version}"
+
+
+def _parse_version_components(
+    version_str: str,
+) -> PyWhlVersionComponent:
+    """使用 PEP 440 正则表达式解析版本号并规范化各组件"""
+    # 检测并剥离通配符
+    wildcard = version_str.endswith(".*") or version_str.endswith("*")
+    clean_str = version_str.rstrip("*").rstrip(".") if wildcard else version_str
+
+    match = PyWhlVersionComparison.WHL_VERSION_PARSE_REGEX.match(clean_str)
+    if not match:
+        logger.debug("未知的版本号字符串: %s", version_str)
+        raise ValueError(f"未知的版本号字符串: {version_str}")
+
+    components = match.groupdict()
+
+    # 处理 release 段 (允许空字符串)
+    release_str = components["release"] or "0"
+    release_segments = tuple(int(seg) for seg in release_str.split("."))
+
+    # 规范化 pre-release 标签
+    pre_l: str | None = None
+    pre_n: int | None = None
+    if components["pre_l"]:
+        raw_label = components["pre_l"].lower()
+        pre_l = _PRE_RELEASE_NORMALIZATION.get(raw_label, raw_label)
+        pre_n = int(components["pre_n"]) if components["pre_n"] else 0
+
+    # 规范化 post-release
+    post_n: int | None = None
+    if components["post_n1"]:
+        post_n = int(components["post_n1"])
+    elif components["post_l"]:
+        post_n = int(components["post_n2"]) if components["post_n2"] else 0
+
+    # 规范化 dev-release
+    dev_n: int | None = None
+    if components["dev_l"]:
+        dev_n = int(components["dev_n"]) if components["dev_n"] else 0
+
+    # 规范化 local version
+    local = components["local"]
+    if local:
+        local = local.replace("-", ".").replace("_", ".")
+
+    return PyWhlVersionComponent(
+        epoch=int(components["epoch"] or 0),
+        release=release_segments,
+        pre_l=pre_l,
+        pre_n=pre_n,
+        post_n=post_n,
+        dev_n=dev_n,
+        local=local,
+        is_wildcard=wildcard,
+    )
+
+
+def _strip_release(
+    release: tuple[int, ...],
+) -> tuple[int, ...]:
+    """去掉 release 段末尾的 0, 使 ``1.0`` 和 ``1.0.0`` 的排序键相同"""
+    end = len(release)
+    while end > 1 and release[end - 1] == 0:
+        end -= 1
+    return release[:end]
+
+
+def _local_version_key(
+    local: str | None,
+) -> tuple[tuple[int, int, str], ...]:
+    """生成 local version 的排序键, 规则与 ``PyWhlVersionComparison._compare_local_version()`` 一致
+
+    没有 local version 时为空元组 (小于任何 local version), 纯数字段排序键大于字母段
+    """
+    if local is None:
+        return ()
+    return tuple((1, int(part), "") if part.isdigit() else (0, 0, part.lower()) for part in local.split("."))
+
+
+def public_version_key(
+    version: PyWhlVersionComponent,
+) -> tuple[int, tuple[int, ...], tuple[int, int, int, int, int, int]]:
+    """计算公共版本号 (不含 local version) 的全序排序键
+
+    Args:
+        version (PyWhlVersionComponent):
+            已解析的版本号组件
+
+    Returns:
+        tuple[int, tuple[int, ...], tuple[int, int, int, int, int, int]]:
+            排序键 ``(epoch, 去掉末尾 0 的 release, 后缀排序键)``, 与 ``compare_version_objects(ignore_local=True)`` 的顺序一致
+    """
+    return (
+        version.epoch,
+        _strip_release(version.release),
+        PyWhlVersionComparison._version_suffix_key(version),  # pylint: disable=protected-access
+    )
+
+
+def post_release_ceiling_key(
+    version: PyWhlVersionComponent,
+) -> tuple[int, tuple[int, ...], tuple[int, int, int, int, int, int]]:
+    """计算恰好大于版本号及其所有 post-release 的排序键
+
+    ``>V`` 不包含 V 的 post-release (V 本身为 post-release 时除外), 这个排序键可作为 ``>V`` 的排他性下界.
+
+    Args:
+        version (PyWhlVersionComponent):
+            已解析的版本号组件 (不是 post-release 和 dev-release)
+
+    Returns:
+        tuple[int, tuple[int, ...], tuple[int, int, int, int, int, int]]:
+            大于 V 的所有 post-release, 且小于 V 之后任意版本的排序键
+    """
+    epoch, release, (pre_key, pre_n, _, _, _, _) = public_version_key(version)
+    # post_key 只有 0 (无 post) 和 1 (post-release) 两种取值, 2 比任何 post-release 都大
+    return (epoch, release, (pre_key, pre_n, 2, 0, 0, 0))
+
+
+class PyWhlVersion:
+    """已解析的 Python 软件包版本号
+
+    由 ``parse_pywhl_version()`` 创建并缓存, 相同的版本号字符串共用同一个对象. 创建时预先计算全序排序键,
+    版本比较只需要比较元组, 不再重复解析版本号字符串.
+
+    使用示例:
+        ```python
+        parse_pywhl_version("2.0.0") < parse_pywhl_version("2.3.0+cu118")  # True
+        parse_pywhl_version("1.0") == parse_pywhl_version("1.0.0")  # True
+        sorted(["1.0", "1.0rc1", "1.0.post1"], key=version_sort_key)  # ["1.0rc1", "1.0", "1.0.post1"]
+        ```
+
+    Attributes:
+        version (str):
+            原始版本号字符串
+        components (PyWhlVersionComponent):
+            版本号组件
+        public_key (tuple):
+            公共版本号的排序键, 用于忽略 local version 的比较
+        sort_key (tuple):
+            包含 local version 的完整排序键
+    """
+
+    __slots__ = (
+        "version",
+        "components",
+        "public_key",
+        "sort_key",
+    )
+
+    def __init__(
+        self,
+        version: str,
+        components: PyWhlVersionComponent,
+    ) -> None:
+        """初始化已解析的 Python 软件包版本号
+
+        Args:
+            version (str):
+                原始版本号字符串
+            components (PyWhlVersionComponent):
+                版本号组件
+        """
+        self.version = version
+        self.components = components
+        self.public_key = public_version_key(components)
+        self.sort_key = self.public_key + (_local_version_key(components.local),)
+
+    def __hash__(self) -> int:
+        return hash(self.sort_key)
+
+    def __eq__(
+        self,
+        other: object,
+    ) -> bool:
+        if not isinstance(other, PyWhlVersion):
+            return NotImplemented
+        return self.sort_key == other.sort_key
+
+    def __lt__(
+        self,
+        other: PyWhlVersion,
+    ) -> bool:
+        if not isinstance(other, PyWhlVersion):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(
+        self,
+        other: PyWhlVersion,
+    ) -> bool:
+        if not isinstance(other, PyWhlVersion):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(
+        self,
+        other: PyWhlVersion,
+    ) -> bool:
+        if not isinstance(other, PyWhlVersion):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(
+        self,
+        other: PyWhlVersion,
+    ) -> bool:
+        if not isinstance(other, PyWhlVersion):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
+
+    def __repr__(self) -> str:
+        return f"PyWhlVersion({self.version!r})"
+
+
+@lru_cache(maxsize=4096)
+def parse_pywhl_version(
+    version_str: str,
+) -> PyWhlVersion:
+    """解析 Python 软件包版本号, 相同的版本号字符串只解析一次
+
+    Args:
+        version_str (str):
+            Python 软件包版本号字符串, 可以以 ``*`` 或 ``.*`` 结尾
+
+    Returns:
+        PyWhlVersion: 已解析的版本号
+
+    Raises:
+        ValueError: 如果 Python 版本号不符合 PEP 440 规范
+    """
+    return PyWhlVersion(version_str, _parse_version_components(version_str))
+
+
+def version_sort_key(
+    version_str: str,
+) -> tuple[int, tuple]:
+    """获取版本号字符串的排序键, 用于 ``sorted(key=...)``
+
+    不符合 PEP 440 规范的版本号排在所有规范版本号之前, 它们之间按字符串排序
+
+    Args:
+        version_str (str):
+            Python 软件包版本号字符串
+
+    Returns:
+        tuple[int, tuple]: 排序键
+    """
+    try:
+        return (1, parse_pywhl_version(version_str).sort_key)
+    except ValueError:
+        return (0, (version_str,))
@@ -0,0 +1,370 @@
+"""依赖文件解析结果缓存
+
+每次检查运行环境时, ``read_packages_from_requirements_file()`` → ``parse_requirement_list()`` 都会重新读取并解析所有依赖文件,
+安装了大量扩展时大部分依赖文件并没有变化. 该模块按文件路径, 修改时间 (纳秒) 和文件大小缓存每个依赖文件标准化后的软件包声明,
+并保存到磁盘中, 未修改的依赖文件在下次启动时不再重新解析.
+
+依赖文件中的 ``-r`` / ``--requirement`` 和 ``-c`` / ``--constraint`` 引用的文件单独缓存, 获取依赖列表时再展开,
+只有发生变化的文件会被重新解析. 约束文件 (``-c``) 不会增加依赖, 只会给已声明的同名软件包增加版本约束, 与 pip 的行为一致.
+
+缓存的解析结果依赖当前环境的 PEP 508 marker 变量 (Python 版本, 系统平台等), 环境变化时整个缓存失效.
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterable
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+    SD_WEBUI_ALL_IN_ONE_REQUIREMENT_CACHE_PATH,
+)
+from sd_webui_all_in_one.package_analyzer.py_whl_parse import get_parse_bindings
+from sd_webui_all_in_one.package_analyzer.requirement_parser import read_packages_from_requirements_file
+from sd_webui_all_in_one.package_analyzer.requirement_normalizer import parse_requirement_list
+from sd_webui_all_in_one.package_analyzer.version_utils import (
+    get_package_name,
+    normalize_package_name,
+)
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+REQUIREMENT_CACHE_VERSION = 1
+"""依赖文件解析结果缓存文件的格式版本"""
+
+_REFERENCE_PATTERN = re.compile(r"^(?P<option>-r|--requirement|-c|--constraint)(?:\s*=\s*|\s+|(?=[^\s=]))(?P<path>[^\s#]+)")
+"""引用其他依赖文件的行: ``-r other.txt``, ``--requirement=other.txt``, ``-c constraints.txt``"""
+
+
+class RequirementFileEntry:
+    """一个依赖文件的解析结果"""
+
+    __slots__ = (
+        "path",
+        "mtime_ns",
+        "size",
+        "requires",
+        "includes",
+        "constraints",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        mtime_ns: int,
+        size: int,
+        requires: Iterable[str] = (),
+        includes: Iterable[str] = (),
+        constraints: Iterable[str] = (),
+    ) -> None:
+        """依赖文件解析结果初始化
+
+        Args:
+            path (str):
+                依赖文件的绝对路径
+            mtime_ns (int):
+                解析时依赖文件的修改时间 (纳秒)
+            size (int):
+                解析时依赖文件的大小
+            requires (Iterable[str]):
+                文件中声明的标准化软件包声明, 不包含引用的文件
+            includes (Iterable[str]):
+                ``-r`` 引用的依赖文件的绝对路径
+            constraints (Iterable[str]):
+                ``-c`` 引用的约束文件的绝对路径
+        """
+        self.path = path
+        """依赖文件的绝对路径"""
+
+        self.mtime_ns = mtime_ns
+        """解析时依赖文件的修改时间 (纳秒)"""
+
+        self.size = size
+        """解析时依赖文件的大小"""
+
+        self.requires: tuple[str, ...] = tuple(requires)
+        """标准化后的软件包声明"""
+
+        self.includes: tuple[str, ...] = tuple(includes)
+        """``-r`` 引用的依赖文件"""
+
+        self.constraints: tuple[str, ...] = tuple(constraints)
+        """``-c`` 引用的约束文件"""
+
+    def to_dict(self) -> dict[str, object]:
+        """转换为可以保存到 JSON 中的字典
+
+        Returns:
+            dict[str, object]: 解析结果字典
+        """
+        return {
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "requires": list(self.requires),
+            "includes": list(self.includes),
+            "constraints": list(self.constraints),
+        }
+
+    def __repr__(self) -> str:
+        return f"RequirementFileEntry(path={self.path!r}, requires={len(self.requires)})"
+
+
+def _resolve_path(
+    path: str | Path,
+) -> str:
+    return os.path.abspath(os.fspath(path))
+
+
+def parse_requirement_file(
+    path: str | Path,
+) -> RequirementFileEntry | None:
+    """读取并解析一个依赖文件, 不展开引用的文件
+
+    Args:
+        path (str | Path):
+            依赖文件路径
+
+    Returns:
+        (RequirementFileEntry | None): 解析结果, 文件不存在时返回 ``None``
+    """
+    resolved = _resolve_path(path)
+    try:
+        stat = os.stat(resolved)
+    except OSError as e:
+        logger.debug("读取依赖文件 %s 失败: %s", resolved, e)
+        return None
+
+    base_dir = os.path.dirname(resolved)
+    lines: list[str] = []
+    includes: list[str] = []
+    constraints: list[str] = []
+    for line in read_packages_from_requirements_file(resolved):
+        match = _REFERENCE_PATTERN.match(line.strip())
+        if match is None:
+            lines.append(line)
+            continue
+        reference = match.group("path")
+        if "://" in reference:
+            logger.debug("跳过依赖文件 %s 中引用的远程文件: %s", resolved, reference)
+            continue
+        target = os.path.normpath(os.path.join(base_dir, os.path.expanduser(reference)))
+        (constraints if match.group("option") in ("-c", "--constraint") else includes).append(target)
+
+    return RequirementFileEntry(
+        path=resolved,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        requires=parse_requirement_list(lines),
+        includes=includes,
+        constraints=constraints,
+    )
+
+
+def _environment_signature() -> dict[str, str]:
+    """影响解析结果的环境信息 (PEP 508 marker 变量)"""
+    return dict(sorted(get_parse_bindings().items()))
+
+
+class RequirementFileCache:
+    """依赖文件解析结果缓存
+
+    使用示例:
+        ```python
+        cache = RequirementFileCache()
+        for path in requirement_paths:
+            requires = cache.get_requirements(path)
+        cache.save()
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | None = None,
+    ) -> None:
+        """依赖文件解析结果缓存初始化
+
+        Args:
+            cache_path (Path | None):
+                缓存文件路径, 为 ``None`` 时只在内存中缓存
+        """
+        self.cache_path = cache_path
+        """缓存文件路径"""
+
+        self._entries: dict[str, RequirementFileEntry] = {}
+        self._environment = _environment_signature()
+        self._loaded = cache_path is None
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    def _load(self) -> None:
+        """首次使用时从缓存文件中读取解析结果, 格式版本或环境不一致, 或缓存文件不属于当前用户时忽略缓存文件"""
+        from sd_webui_all_in_one.utils import is_owned_by_current_user
+
+        self._loaded = True
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                if not is_owned_by_current_user(os.fstat(f.fileno())):
+                    # 其他用户放置的缓存文件可能隐藏缺失的依赖
+                    logger.warning("依赖文件解析结果缓存 '%s' 不属于当前用户, 忽略该缓存", self.cache_path)
+                    return
+                data = json.load(f)
+            if data.get("version") != REQUIREMENT_CACHE_VERSION or data.get("environment") != self._environment:
+                return
+            for path, item in data["files"].items():
+                self._entries[path] = RequirementFileEntry(
+                    path=path,
+                    mtime_ns=int(item["mtime_ns"]),
+                    size=int(item["size"]),
+                    requires=item["requires"],
+                    includes=item["includes"],
+                    constraints=item["constraints"],
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("读取依赖文件解析结果缓存失败: %s", e)
+            self._entries.clear()
+
+    def get_entry(
+        self,
+        path: str | Path,
+    ) -> RequirementFileEntry | None:
+        """获取一个依赖文件的解析结果, 文件的修改时间或大小发生变化时重新解析
+
+        Args:
+            path (str | Path):
+                依赖文件路径
+
+        Returns:
+            (RequirementFileEntry | None): 解析结果, 文件不存在时返回 ``None``
+        """
+        resolved = _resolve_path(path)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            try:
+                stat = os.stat(resolved)
+            except OSError:
+                if self._entries.pop(resolved, None) is not None:
+                    self._dirty = True
+                return None
+
+            entry = self._entries.get(resolved)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                return entry
+
+            entry = parse_requirement_file(resolved)
+            if entry is None:
+                return None
+            logger.debug("已解析依赖文件: %s", resolved)
+            self._entries[resolved] = entry
+            self._dirty = True
+            return entry
+
+    def get_requirements(
+        self,
+        path: str | Path,
+    ) -> list[str]:
+        """获取依赖文件的标准化软件包声明列表, 展开 ``-r`` 引用的依赖文件并应用 ``-c`` 引用的约束文件
+
+        Args:
+            path (str | Path):
+                依赖文件路径
+
+        Returns:
+            list[str]: 标准化后的软件包声明列表, 与 ``parse_requirement_list(read_packages_from_requirements_file(path))`` 的格式一致
+        """
+        requires: list[str] = []
+        constraints: list[str] = []
+        visited: set[tuple[str, bool]] = set()
+        pending: list[tuple[str, bool]] = [(_resolve_path(path), False)]
+        while pending:
+            current, is_constraint = pending.pop()
+            if (current, is_constraint) in visited:
+                continue
+            visited.add((current, is_constraint))
+            entry = self.get_entry(current)
+            if entry is None:
+                continue
+            (constraints if is_constraint else requires).extend(entry.requires)
+            # 倒序入栈, 使引用的文件按在依赖文件中出现的顺序展开
+            pending.extend((constraint, True) for constraint in reversed(entry.constraints))
+            pending.extend((include, is_constraint) for include in reversed(entry.includes))
+
+        if constraints:
+            names = {normalize_package_name(get_package_name(require)) for require in requires}
+            requires.extend(constraint for constraint in constraints if normalize_package_name(get_package_name(constraint)) in names)
+
+        return list(dict.fromkeys(requires))
+
+    def save(self) -> None:
+        """将解析结果保存到缓存文件中, 没有新的解析结果时不写入"""
+        with self._lock:
+            if self.cache_path is None or not self._dirty:
+                return
+            data = {
+                "version": REQUIREMENT_CACHE_VERSION,
+                "environment": self._environment,
+                "files": {path: entry.to_dict() for path, entry in self._entries.items()},
+            }
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                logger.debug("保存依赖文件解析结果缓存失败: %s", e)
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+
+_cache: RequirementFileCache | None = None
+"""当前进程共用的依赖文件解析结果缓存"""
+
+_cache_lock = threading.Lock()
+
+
+def get_requirement_file_cache() -> RequirementFileCache:
+    """获取当前进程共用的依赖文件解析结果缓存, 缓存文件路径为 ``SD_WEBUI_ALL_IN_ONE_REQUIREMENT_CACHE_PATH``
+
+    Returns:
+        RequirementFileCache: 依赖文件解析结果缓存
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RequirementFileCache(SD_WEBUI_ALL_IN_ONE_REQUIREMENT_CACHE_PATH)
+        return _cache
+
+
+def get_requirement_specs(
+    path: str | Path,
+) -> list[str]:
+    """使用共用的缓存获取依赖文件的标准化软件包声明列表, 有新的解析结果时保存缓存文件
+
+    Args:
+        path (str | Path):
+            依赖文件路径
+
+    Returns:
+        list[str]: 标准化后的软件包声明列表
+    """
+    cache = get_requirement_file_cache()
+    requires = cache.get_requirements(path)
+    cache.save()
+    return requires
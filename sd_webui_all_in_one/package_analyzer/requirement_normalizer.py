@@ -42,6 +42,54 @@ logger = get_logger(
 )
 
 
+_COMMENT_PATTERN = re.compile(r"\s*#.*$")
+"""行尾注释"""
+
+_EGG_NAME_PATTERN = re.compile(r"egg=([^#&]+)")
+"""Git 仓库引用中的 ``egg=`` 软件包名"""
+
+_GIT_REPO_NAME_PATTERNS = (
+    re.compile(r"git\+[a-z]+://[^/]+/(?:[^/]+/)*([^/@]+?)(?:\.git)?(?:@|$)"),
+    re.compile(r"git\+https://[^/]+/[^/]+/([^/@]+?)(?:\.git)?(?:@|$)"),
+    re.compile(r"git\+ssh://git@[^:]+:[^/]+/([^/@]+?)(?:\.git)?(?:@|$)"),
+    re.compile(r"/([^/@]+?)(?:\.git)?(?:@|$)"),
+)
+"""从 Git 仓库 URL 中提取仓库名称的正则表达式, 按顺序尝试"""
+
+_SKIPPED_REQUIREMENT_PREFIXES = (
+    "#",
+    "--index-url",
+    "--extra-index-url",
+    "--find-links",
+    "-e .",
+    "-r ",
+    "-c ",
+    "--requirement",
+    "--constraint",
+)
+"""不是软件包声明的行 (注释, pip 选项, 引用其他依赖文件)"""
+
+
+def _extract_repo_name(
+    url_string: str,
+) -> str | None:
+    """从包含 Git 仓库 URL 的字符串中提取仓库名称
+
+    Args:
+        url_string (str):
+            包含 Git 仓库 URL 的字符串
+
+    Returns:
+        (str | None): 提取到的仓库名称, 如果未找到则返回 ``None``
+    """
+    for pattern in _GIT_REPO_NAME_PATTERNS:
+        match = pattern.search(url_string)
+        if match:
+            return match.group(1)
+
+    return None
+
+
 def parse_requirement_list(
     requirements: list[str],
 ) -> list[str]:
@@ -73,51 +121,17 @@ def parse_requirement_list(
         list[str]: 标准化后的 Python 软件包声明列表
     """
 
-    def _extract_repo_name(url_string: str) -> str | None:
-        """从包含 Git 仓库 URL 的字符串中提取仓库名称
-
-        Args:
-            url_string (str):
-                包含 Git 仓库 URL 的字符串
-
-        Returns:
-            str | None: 提取到的仓库名称, 如果未找到则返回 ``None``
-        """
-        patterns = [
-            r"git\+[a-z]+://[^/]+/(?:[^/]+/)*([^/@]+?)(?:\.git)?(?:@|$)",
-            r"git\+https://[^/]+/[^/]+/([^/@]+?)(?:\.git)?(?:@|$)",
-            r"git\+ssh://git@[^:]+:[^/]+/([^/@]+?)(?:\.git)?(?:@|$)",
-            r"/([^/@]+?)(?:\.git)?(?:@|$)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url_string)
-            if match:
-                return match.group(1)
-
-        return None
-
     package_list: list[str] = []
     canonical_package_list: list[str] = []
     for requirement in requirements:
-        requirement = re.sub(r"\s*#.*$", "", requirement).strip()
+        requirement = _COMMENT_PATTERN.sub("", requirement).strip()
         logger.debug("原始 Python 软件包名: %s", requirement)
 
-        if (
-            requirement is None
-            or requirement == ""
-            or requirement.startswith("#")
-            or "# skip_verify" in requirement
-            or requirement.startswith("--index-url")
-            or requirement.startswith("--extra-index-url")
-            or requirement.startswith("--find-links")
-            or requirement.startswith("-e .")
-            or requirement.startswith("-r ")
-        ):
+        if requirement is None or requirement == "" or "# skip_verify" in requirement or requirement.startswith(_SKIPPED_REQUIREMENT_PREFIXES):
             continue
 
         if requirement.startswith("-e git+http") or requirement.startswith("git+http") or requirement.startswith("-e git+ssh://") or requirement.startswith("git+ssh://"):
-            egg_match = re.search(r"egg=([^#&]+)", requirement)
+            egg_match = _EGG_NAME_PATTERN.search(requirement)
             if egg_match:
                 package_list.append(egg_match.group(1).split("-")[0])
                 continue
@@ -7,6 +7,7 @@
     - https://peps.python.org/pep-0440/
 """
 
+from functools import lru_cache
 from typing import Any
 from pathlib import Path
 
@@ -183,15 +184,29 @@ def parse_requirement_to_list(
     Returns:
         list[str]: 解析后的依赖声明列表
     """
+    return list(_parse_requirement_to_tuple(text))
+
+
+@lru_cache(maxsize=1)
+def _get_cached_parse_bindings() -> dict[str, str]:
+    """当前进程的 PEP 508 marker 变量绑定, 只需要获取一次"""
+    return get_parse_bindings()
+
+
+@lru_cache(maxsize=8192)
+def _parse_requirement_to_tuple(
+    text: str,
+) -> tuple[str, ...]:
+    """``parse_requirement_to_list()`` 的缓存实现, 不同依赖文件中相同的依赖声明只解析一次"""
     try:
-        bindings = get_parse_bindings()
+        bindings = _get_cached_parse_bindings()
         name, _, version_specs, marker = parse_requirement(text, bindings)
     except Exception as e:
         logger.debug("解析失败: %s", e)
-        return []
+        return ()
 
     if not evaluate_marker(marker):
-        return []
+        return ()
 
     dependencies: list[str] = []
 
@@ -204,7 +219,7 @@ def parse_requirement_to_list(
         else:
             dependencies.append(name)
 
-    return dependencies
+    return tuple(dependencies)
 
 
 def read_packages_from_requirements_file(
@@ -0,0 +1,579 @@
+"""Python 软件包依赖约束求解器
+
+将同一个软件包的所有版本约束折叠为一个规范化的版本区间集合, 区间集合为空时说明这些约束不可同时满足.
+每个软件包只需要一次遍历即可判断是否存在冲突, 不需要对依赖声明两两比较.
+
+版本区间在 PEP 440 的公共版本号 (不含 local version) 上计算, 各操作符的语义与 ``py_ver_cmp`` 一致:
+
+- ``>=V``, ``<=V``: 包含 V 的半开区间
+- ``>V``: 不包含 V 的 post-release (V 本身为 post-release 时除外)
+- ``<V``: 不包含 V 的 pre-release 和 dev-release (V 本身为 pre-release 或 dev-release 时除外),
+  例如 ``<1.0`` 不包含 ``1.0a1``, ``<1.0.post1`` 不包含 ``1.0.post1.dev2``
+- ``==V``: 单个版本, ``==V.*``: 以 V 为前缀的所有版本
+- ``~=V``: ``>=V`` 与 ``==V 的前缀.*`` 的交集
+- ``!=V``, ``!=V.*``: 排除单个版本或以 V 为前缀的所有版本
+- ``===V``: 任意相等, 字符串不同的 ``===`` 约束互相冲突
+- ``==V+local``: 固定 local version, local version 不同的约束互相冲突
+- ``!=V+local``: 只排除一个 local version, 不影响公共版本号区间, 与固定同一个 local version 的 ``==V+local`` 冲突
+
+参考:
+    - https://peps.python.org/pep-0440/#version-specifiers
+"""
+
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Iterable,
+    NamedTuple,
+)
+
+from sd_webui_all_in_one.logger import get_logger
+from sd_webui_all_in_one.config import (
+    LOGGER_LEVEL,
+    LOGGER_COLOR,
+    LOGGER_NAME,
+)
+from sd_webui_all_in_one.package_analyzer.py_ver_cmp import (
+    PyWhlVersionComponent,
+    parse_pywhl_version,
+    post_release_ceiling_key,
+    public_version_key,
+)
+from sd_webui_all_in_one.package_analyzer.version_utils import normalize_package_name
+from sd_webui_all_in_one.package_analyzer.installation_checker import parse_package_spec
+
+
+logger = get_logger(
+    name=LOGGER_NAME,
+    level=LOGGER_LEVEL,
+    color=LOGGER_COLOR,
+)
+
+
+VersionKey = tuple[int, tuple[int, ...], tuple[int, int, int, int, int, int]]
+"""公共版本号的全序排序键: ``(epoch, 去掉末尾 0 的 release, 后缀排序键)``"""
+
+
+class VersionInterval(NamedTuple):
+    """版本区间, 边界为 ``None`` 时表示无穷"""
+
+    lower: VersionKey | None
+    lower_inclusive: bool
+    upper: VersionKey | None
+    upper_inclusive: bool
+
+    def is_empty(self) -> bool:
+        """判断区间是否为空"""
+        if self.lower is None or self.upper is None:
+            return False
+        if self.lower < self.upper:
+            return False
+        return not (self.lower == self.upper and self.lower_inclusive and self.upper_inclusive)
+
+    def contains(
+        self,
+        key: VersionKey,
+    ) -> bool:
+        """判断版本是否在区间中"""
+        if self.lower is not None and (key < self.lower or (key == self.lower and not self.lower_inclusive)):
+            return False
+        if self.upper is not None and (key > self.upper or (key == self.upper and not self.upper_inclusive)):
+            return False
+        return True
+
+
+_FULL_INTERVAL = VersionInterval(None, False, None, False)
+
+
+def version_key(
+    version: PyWhlVersionComponent,
+) -> VersionKey:
+    """计算公共版本号的全序排序键, 忽略 local version
+
+    Args:
+        version (PyWhlVersionComponent):
+            已解析的版本号
+
+    Returns:
+        VersionKey: 排序键, 与 ``compare_version_objects(ignore_local=True)`` 的顺序一致
+    """
+    return public_version_key(version)
+
+
+def _release_floor_key(
+    epoch: int,
+    release: tuple[int, ...],
+) -> VersionKey:
+    """``release.dev0`` 的排序键, 是 release 段为 ``release`` 的最小版本"""
+    return public_version_key(
+        PyWhlVersionComponent(
+            epoch=epoch,
+            release=release,
+            pre_l=None,
+            pre_n=None,
+            post_n=None,
+            dev_n=0,
+            local=None,
+            is_wildcard=False,
+        )
+    )
+
+
+def _normalize_local(
+    local: str,
+) -> str:
+    """规范化 local version, 分隔符统一为 ``.`` 并转为小写"""
+    return local.replace("-", ".").replace("_", ".").lower()
+
+
+def _prefix_interval(
+    epoch: int,
+    prefix: tuple[int, ...],
+    lower: VersionKey | None = None,
+) -> VersionInterval:
+    """以 release 前缀匹配的所有版本: ``[prefix.dev0, next_prefix.dev0)``"""
+    next_prefix = prefix[:-1] + (prefix[-1] + 1,)
+    if lower is None:
+        lower = _release_floor_key(epoch, prefix)
+    return VersionInterval(lower, True, _release_floor_key(epoch, next_prefix), False)
+
+
+def _complement(
+    interval: VersionInterval,
+) -> tuple[VersionInterval, ...]:
+    return (
+        VersionInterval(None, False, interval.lower, not interval.lower_inclusive),
+        VersionInterval(interval.upper, not interval.upper_inclusive, None, False),
+    )
+
+
+def _intersect_intervals(
+    a: tuple[VersionInterval, ...],
+    b: tuple[VersionInterval, ...],
+) -> tuple[VersionInterval, ...]:
+    """求两个有序且互不相交的区间列表的交集"""
+    result: list[VersionInterval] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        x, y = a[i], b[j]
+
+        # 下界取较大者, 键相同时不包含边界的更严格
+        if x.lower is None:
+            lower, lower_inclusive = y.lower, y.lower_inclusive
+        elif y.lower is None or x.lower > y.lower:
+            lower, lower_inclusive = x.lower, x.lower_inclusive
+        elif x.lower < y.lower:
+            lower, lower_inclusive = y.lower, y.lower_inclusive
+        else:
+            lower, lower_inclusive = x.lower, x.lower_inclusive and y.lower_inclusive
+
+        # 上界取较小者, 并移动先结束的区间
+        if x.upper is None:
+            upper, upper_inclusive, x_first = y.upper, y.upper_inclusive, False
+        elif y.upper is None or x.upper < y.upper:
+            upper, upper_inclusive, x_first = x.upper, x.upper_inclusive, True
+        elif x.upper > y.upper:
+            upper, upper_inclusive, x_first = y.upper, y.upper_inclusive, False
+        else:
+            upper, upper_inclusive, x_first = x.upper, x.upper_inclusive and y.upper_inclusive, not x.upper_inclusive or y.upper_inclusive
+
+        interval = VersionInterval(lower, lower_inclusive, upper, upper_inclusive)
+        if not interval.is_empty():
+            result.append(interval)
+
+        if x_first:
+            i += 1
+        else:
+            j += 1
+    return tuple(result)
+
+
+class VersionSet:
+    """满足一组版本约束的版本集合"""
+
+    __slots__ = (
+        "intervals",
+        "local",
+        "excluded_locals",
+        "arbitrary",
+        "is_empty",
+    )
+
+    def __init__(
+        self,
+        intervals: tuple[VersionInterval, ...] = (_FULL_INTERVAL,),
+        local: str | None = None,
+        arbitrary: str | None = None,
+        empty: bool = False,
+        excluded_locals: frozenset[tuple[VersionKey, str]] = frozenset(),
+    ) -> None:
+        """版本集合初始化
+
+        Args:
+            intervals (tuple[VersionInterval, ...]):
+                有序且互不相交的公共版本号区间列表
+            local (str | None):
+                ``==V+local`` 固定的 local version (已规范化)
+            arbitrary (str | None):
+                ``===V`` 固定的版本字符串 (小写)
+            empty (bool):
+                local version 或任意相等约束互相冲突时为 ``True``
+            excluded_locals (frozenset[tuple[VersionKey, str]]):
+                ``!=V+local`` 排除的 ``(公共版本号排序键, 已规范化的 local version)``
+        """
+        self.intervals = intervals
+        """有序且互不相交的公共版本号区间列表"""
+
+        self.local = local
+        """固定的 local version"""
+
+        self.excluded_locals = excluded_locals
+        """排除的 local version"""
+
+        self.arbitrary = arbitrary
+        """任意相等约束固定的版本字符串"""
+
+        self.is_empty = empty or not intervals
+        """版本集合是否为空, 为空时说明约束不可同时满足"""
+
+    def __repr__(self) -> str:
+        return f"VersionSet(intervals={self.intervals!r}, local={self.local!r}, excluded_locals={self.excluded_locals!r}, arbitrary={self.arbitrary!r}, is_empty={self.is_empty!r})"
+
+    def intersect(
+        self,
+        other: "VersionSet",
+    ) -> "VersionSet":
+        """求两个版本集合的交集
+
+        Args:
+            other (VersionSet):
+                另一个版本集合
+
+        Returns:
+            VersionSet: 同时满足两组约束的版本集合
+        """
+        if self.is_empty or other.is_empty:
+            return _EMPTY_SET
+        empty = False
+        if self.local is not None and other.local is not None and self.local != other.local:
+            empty = True
+        if self.arbitrary is not None and other.arbitrary is not None and self.arbitrary != other.arbitrary:
+            empty = True
+        intervals = _intersect_intervals(self.intervals, other.intervals)
+        local = self.local if self.local is not None else other.local
+        excluded_locals = self.excluded_locals | other.excluded_locals
+        if local is not None and len(intervals) == 1:
+            # ==V+local 只剩下一个版本, 这个版本被 !=V+local 排除时为空集
+            interval = intervals[0]
+            if interval.lower is not None and interval.lower == interval.upper and (interval.lower, local) in excluded_locals:
+                empty = True
+        return VersionSet(
+            intervals=intervals,
+            local=local,
+            arbitrary=self.arbitrary if self.arbitrary is not None else other.arbitrary,
+            empty=empty,
+            excluded_locals=excluded_locals,
+        )
+
+    def contains(
+        self,
+        version: str,
+    ) -> bool:
+        """判断版本号是否满足这组约束
+
+        Args:
+            version (str):
+                版本号
+
+        Returns:
+            bool: 如果版本号在集合中则返回 ``True``
+        """
+        if self.is_empty:
+            return False
+        if self.arbitrary is not None and version.lower() != self.arbitrary:
+            return False
+        parsed = parse_pywhl_version(version)
+        local = _normalize_local(parsed.components.local or "")
+        if self.local is not None and local != self.local:
+            return False
+        if (parsed.public_key, local) in self.excluded_locals:
+            return False
+        return any(interval.contains(parsed.public_key) for interval in self.intervals)
+
+
+_EMPTY_SET = VersionSet(intervals=(), empty=True)
+
+_FULL_SET = VersionSet()
+
+
+def _intervals_from_spec(
+    op: str,
+    version: str,
+) -> tuple[VersionInterval, ...]:
+    """将单个版本约束转换为公共版本号区间列表"""
+    parsed_version = parse_pywhl_version(version)
+    parsed = parsed_version.components
+    key = parsed_version.public_key
+    epoch = parsed.epoch
+
+    if op in ("==", "!="):
+        if parsed.is_wildcard:
+            interval = _prefix_interval(epoch, parsed.release)
+        else:
+            interval = VersionInterval(key, True, key, True)
+        if op == "==":
+            return (interval,)
+        if parsed.local is not None and not parsed.is_wildcard:
+            # 只排除特定的 local version, 公共版本号仍然可用
+            return (_FULL_INTERVAL,)
+        return _complement(interval)
+
+    if op == "===":
+        return (VersionInterval(key, True, key, True),)
+
+    if op == "~=":
+        if len(parsed.release) < 2:
+            raise ValueError(f"~= 操作符不能用于单段版本号: {version}")
+        return (_prefix_interval(epoch, parsed.release[:-1], lower=key),)
+
+    if op == ">=":
+        return (VersionInterval(key, True, None, False),)
+
+    if op == "<=":
+        return (VersionInterval(None, False, key, True),)
+
+    if op == ">":
+        if parsed.post_n is None and parsed.dev_n is None:
+            # >V 不包含 V 的 post-release, 使用比 V 的所有 post-release 都大的排序键作为边界
+            return (VersionInterval(post_release_ceiling_key(parsed), False, None, False),)
+        return (VersionInterval(key, False, None, False),)
+
+    if op == "<":
+        if parsed.pre_l is None and parsed.dev_n is None:
+            # <V 不包含 V 的 pre-release 和 dev-release, 使用 V.dev0 作为边界
+            return (VersionInterval(None, False, public_version_key(parsed._replace(dev_n=0, local=None)), False),)
+        return (VersionInterval(None, False, key, False),)
+
+    raise ValueError(f"未知的版本约束操作符: {op}")
+
+
+def version_set_from_specs(
+    specs: Iterable[tuple[str, str]],
+) -> VersionSet:
+    """将一组版本约束折叠为版本集合
+
+    无法解析的版本约束会被忽略 (视为不限制版本).
+
+    Args:
+        specs (Iterable[tuple[str, str]]):
+            ``[(操作符, 版本号), ...]`` 形式的版本约束列表, 多个约束为逻辑 AND
+
+    Returns:
+        VersionSet: 满足所有约束的版本集合
+    """
+    result = _FULL_SET
+    for op, version in specs:
+        try:
+            intervals = _intervals_from_spec(op, version)
+        except ValueError as e:
+            if op != "===":
+                logger.debug("忽略无法解析的版本约束 %s%s: %s", op, version, e)
+                continue
+            # 任意相等约束允许不符合 PEP 440 的版本字符串, 只按字符串比较
+            intervals = (_FULL_INTERVAL,)
+
+        local: str | None = None
+        arbitrary: str | None = None
+        excluded_locals: frozenset[tuple[VersionKey, str]] = frozenset()
+        if op == "===":
+            arbitrary = version.strip().lower()
+        elif op in ("==", "!=") and "+" in version and not version.endswith("*"):
+            parsed = parse_pywhl_version(version)
+            if op == "==":
+                local = _normalize_local(parsed.components.local or "")
+            else:
+                excluded_locals = frozenset(((parsed.public_key, _normalize_local(parsed.components.local or "")),))
+        result = result.intersect(VersionSet(intervals=intervals, local=local, arbitrary=arbitrary, excluded_locals=excluded_locals))
+    return result
+
+
+class RequirementSource(NamedTuple):
+    """版本约束的来源"""
+
+    source: str | None
+    """声明该依赖的组件名称"""
+
+    requirement: str
+    """依赖声明字符串"""
+
+
+@dataclass
+class PackageConflict:
+    """不可同时满足的软件包版本约束"""
+
+    name: str
+    """规范化后的软件包名"""
+
+    display_name: str
+    """依赖声明中第一次出现的软件包名"""
+
+    requirements: list[RequirementSource] = field(default_factory=list)
+    """造成冲突的依赖声明及其来源"""
+
+    @property
+    def sources(self) -> list[str | None]:
+        """造成冲突的组件名称列表 (去重, 保持顺序)"""
+        return list(dict.fromkeys(item.source for item in self.requirements))
+
+
+class _PackageConstraints:
+    """一个软件包的所有版本约束, 相同的依赖声明只计算一次版本集合"""
+
+    __slots__ = (
+        "display_name",
+        "requirements",
+        "sets",
+        "combined",
+    )
+
+    def __init__(
+        self,
+        display_name: str,
+    ) -> None:
+        self.display_name = display_name
+        self.requirements: dict[str, list[str | None]] = {}
+        self.sets: dict[str, VersionSet] = {}
+        self.combined = _FULL_SET
+
+    def add(
+        self,
+        requirement: str,
+        specs: list[tuple[str, str]],
+        source: str | None,
+    ) -> None:
+        sources = self.requirements.get(requirement)
+        if sources is not None:
+            sources.append(source)
+            return
+        self.requirements[requirement] = [source]
+        version_set = version_set_from_specs(specs)
+        self.sets[requirement] = version_set
+        self.combined = self.combined.intersect(version_set)
+
+    def find_contributors(self) -> list[str]:
+        """找出造成冲突的依赖声明
+
+        自身不可满足的依赖声明, 以及与其他依赖声明两两冲突的依赖声明都会被列出;
+        只有 3 个及以上的约束组合才冲突时, 通过逐个删除约束求出一个最小冲突集合
+        """
+        texts = list(self.sets)
+        contributors: set[str] = {text for text in texts if self.sets[text].is_empty}
+        candidates = [text for text in texts if text not in contributors]
+        for i, first in enumerate(candidates):
+            for second in candidates[i + 1 :]:
+                if self.sets[first].intersect(self.sets[second]).is_empty:
+                    contributors.update((first, second))
+
+        if not contributors:
+            core = list(texts)
+            for text in texts:
+                trial = [item for item in core if item != text]
+                combined = _FULL_SET
+                for item in trial:
+                    combined = combined.intersect(self.sets[item])
+                if combined.is_empty:
+                    core = trial
+            contributors.update(core)
+
+        return [text for text in texts if text in contributors]
+
+
+class RequirementSolver:
+    """整个环境的依赖约束求解器
+
+    使用示例:
+        ```python
+        solver = RequirementSolver()
+        solver.add_requirements(["numpy<2", "torch>=2.0"], source="ComfyUI")
+        solver.add_requirements(["numpy>=2"], source="node")
+        for conflict in solver.find_conflicts():
+            print(conflict.name, conflict.requirements)
+        ```
+    """
+
+    def __init__(self) -> None:
+        """依赖约束求解器初始化"""
+        self._packages: dict[str, _PackageConstraints] = {}
+
+    def add_requirement(
+        self,
+        requirement: str,
+        source: str | None = None,
+    ) -> None:
+        """添加一条依赖声明, 没有版本约束的依赖声明和 URL 依赖不参与求解
+
+        Args:
+            requirement (str):
+                依赖声明字符串
+            source (str | None):
+                声明该依赖的组件名称
+        """
+        name, specs, is_url = parse_package_spec(requirement)
+        if is_url or not specs:
+            return
+        key = normalize_package_name(name)
+        package = self._packages.get(key)
+        if package is None:
+            package = self._packages[key] = _PackageConstraints(name)
+        package.add(requirement, specs, source)
+
+    def add_requirements(
+        self,
+        requirements: Iterable[str],
+        source: str | None = None,
+    ) -> None:
+        """添加多条依赖声明
+
+        Args:
+            requirements (Iterable[str]):
+                依赖声明列表
+            source (str | None):
+                声明这些依赖的组件名称
+        """
+        for requirement in requirements:
+            self.add_requirement(requirement, source=source)
+
+    def allowed_versions(
+        self,
+        package_name: str,
+    ) -> VersionSet:
+        """获取满足某个软件包所有版本约束的版本集合
+
+        Args:
+            package_name (str):
+                软件包名
+
+        Returns:
+            VersionSet: 版本集合, 没有版本约束时为全集
+        """
+        package = self._packages.get(normalize_package_name(package_name))
+        return _FULL_SET if package is None else package.combined
+
+    def find_conflicts(self) -> list[PackageConflict]:
+        """找出版本约束不可同时满足的软件包
+
+        Returns:
+            list[PackageConflict]: 冲突的软件包列表, 按软件包第一次出现的顺序排列
+        """
+        conflicts: list[PackageConflict] = []
+        for key, package in self._packages.items():
+            if not package.combined.is_empty:
+                continue
+            conflict = PackageConflict(name=key, display_name=package.display_name)
+            for text in package.find_contributors():
+                conflict.requirements.extend(RequirementSource(source, text) for source in package.requirements[text])
+            logger.debug("冲突依赖: %s, 造成冲突的依赖声明: %s", key, conflict.requirements)
+            conflicts.append(conflict)
+        return conflicts
@@ -8,6 +8,7 @@
 """
 
 import re
+from functools import lru_cache
 
 from sd_webui_all_in_one.package_analyzer.py_whl_parse import (
     ParsedPyWhlRequirement,
@@ -62,10 +63,11 @@ def version_string_is_canonical(
     return _CANONICAL_VERSION_REGEX.match(version) is not None
 
 
+@lru_cache(maxsize=8192)
 def _try_parse_requirement(
     package: str,
 ) -> ParsedPyWhlRequirement | None:
-    """尝试使用 PEP 508 解析器解析软件包声明
+    """尝试使用 PEP 508 解析器解析软件包声明, 相同的声明只解析一次, 调用方不能修改返回结果
 
     Args:
         package (str):
@@ -1,5 +1,7 @@
 """PyTorch / PyPI 镜像管理器"""
 
+from typing import Any
+
 from sd_webui_all_in_one.pytorch_manager.types import (
     PYPI_INDEX_MIRROR_OFFICIAL,
     PYPI_INDEX_MIRROR_TENCENT,
@@ -27,7 +29,11 @@ from sd_webui_all_in_one.pytorch_manager.mirror_data import (
     PYTORCH_ROCM_MIRROR_DICT,
 )
 from sd_webui_all_in_one.pytorch_manager.version_data import (
-    PYTORCH_DOWNLOAD_DICT,
+    PYTORCH_VERSION_DATA_PATH,
+    PyTorchVersionRecord,
+    PyTorchVersionCatalog,
+    get_pytorch_version_catalog,
+    load_pytorch_version_data,
 )
 from sd_webui_all_in_one.pytorch_manager.gpu_detector import (
     GPUDeviceInfo,
@@ -91,6 +97,11 @@ __all__ = [
     "PYTORCH_ROCM_MIRROR_DICT",
     # version_data.py: 版本下载数据
     "PYTORCH_DOWNLOAD_DICT",
+    "PYTORCH_VERSION_DATA_PATH",
+    "PyTorchVersionRecord",
+    "PyTorchVersionCatalog",
+    "get_pytorch_version_catalog",
+    "load_pytorch_version_data",
     # gpu_detector.py: 硬件检测
     "GPUDeviceInfo",
     "get_cuda_comp_cap",
@@ -122,3 +133,12 @@ __all__ = [
     "display_pytorch_config",
     "query_pytorch_info_from_library",
 ]
+
+
+def __getattr__(
+    name: str,
+) -> Any:
+    # `PYTORCH_DOWNLOAD_DICT` 在首次访问时才加载
+    if name == "PYTORCH_DOWNLOAD_DICT":
+        return get_pytorch_version_catalog().versions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
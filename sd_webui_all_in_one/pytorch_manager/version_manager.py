@@ -2,6 +2,7 @@
 
 import copy
 import sys
+from typing import AbstractSet
 
 from sd_webui_all_in_one.ansi_color import ANSIColor
 from sd_webui_all_in_one.config import SD_WEBUI_ALL_IN_ONE_SKIP_TORCH_DEVICE_COMPATIBILITY
@@ -14,12 +15,10 @@ from sd_webui_all_in_one.package_analyzer import (
 from sd_webui_all_in_one.pytorch_manager.gpu_detector import get_avaliable_pytorch_device_type
 from sd_webui_all_in_one.pytorch_manager.types import (
     PyTorchVersionInfo,
-    PyTorchDeviceType,
-)
-from sd_webui_all_in_one.pytorch_manager.version_data import (
-    PYTORCH_DOWNLOAD_DICT,
     PyTorchVersionInfoList,
+    PyTorchDeviceType,
 )
+from sd_webui_all_in_one.pytorch_manager.version_data import get_pytorch_version_catalog
 
 
 def export_pytorch_list() -> PyTorchVersionInfoList:
@@ -30,22 +29,24 @@ def export_pytorch_list() -> PyTorchVersionInfoList:
             PyTorch 版本列表
     """
     device_list = set(get_avaliable_pytorch_device_type())
-    new_pytorch_list: PyTorchVersionInfoList = []
-    current_platform = sys.platform
+    return [_export_pytorch_info(i, device_list) for i in get_pytorch_version_catalog().versions]
 
-    for i in PYTORCH_DOWNLOAD_DICT:
-        item: PyTorchVersionInfo = copy.deepcopy(i)
-        supported = False
-        if current_platform in item["platform"]:
-            if SD_WEBUI_ALL_IN_ONE_SKIP_TORCH_DEVICE_COMPATIBILITY:
-                supported = True
-            elif item["dtype"] in device_list:
-                supported = True
 
-        item["supported"] = supported
-        new_pytorch_list.append(item)
+def _export_pytorch_info(
+    info: PyTorchVersionInfo,
+    device_list: AbstractSet[str],
+) -> PyTorchVersionInfo:
+    """复制 PyTorch 版本下载信息并标注当前平台是否支持"""
+    item: PyTorchVersionInfo = copy.deepcopy(info)
+    supported = False
+    if sys.platform in item["platform"]:
+        if SD_WEBUI_ALL_IN_ONE_SKIP_TORCH_DEVICE_COMPATIBILITY:
+            supported = True
+        elif item["dtype"] in device_list:
+            supported = True
 
-    return new_pytorch_list
+    item["supported"] = supported
+    return item
 
 
 def find_latest_pytorch_info(
@@ -76,8 +77,9 @@ def find_latest_pytorch_info(
 
         return "0.0"
 
-    pytorch_list = export_pytorch_list()
-    pytorch_info_list = [x for x in pytorch_list if x["dtype"] == dtype]
+    catalog = get_pytorch_version_catalog()
+    device_list = set(get_avaliable_pytorch_device_type())
+    pytorch_info_list = [_export_pytorch_info(catalog.versions[index], device_list) for index in catalog.by_dtype.get(dtype, ())]
     if not pytorch_info_list:
         raise ValueError(f"PyTorch 类型不存在: '{dtype}'")
 
@@ -146,13 +148,14 @@ def query_pytorch_info_from_library(
             raise ValueError(f"索引值 {index} 超出范围, 模型有效的范围为: 1 ~ {len(pytorch_list)}")
 
     def _get_pytorch_with_name(name: str) -> PyTorchVersionInfo:
-        for m in pytorch_list:
-            if m["name"] == name:
-                return copy.deepcopy(m)
+        indices = catalog.by_name.get(name)
+        if indices:
+            return copy.deepcopy(pytorch_list[indices[0]])
 
         raise FileNotFoundError(f"未找到指定的 PyTorch 版本组合名称: {name}")
 
-    pytorch_list = PYTORCH_DOWNLOAD_DICT
+    catalog = get_pytorch_version_catalog()
+    pytorch_list = catalog.versions
     if pytorch_name is None and pytorch_index is None:
         raise ValueError("`pytorch_name` 和 `pytorch_index` 缺失, 需要提供其中一项才能进行 PyTorch 下载信息查找")
 
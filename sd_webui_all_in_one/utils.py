@@ -184,6 +184,24 @@ def normalized_filepath(
     return filepath
 
 
+def is_owned_by_current_user(
+    st: os.stat_result,
+) -> bool:
+    """检查文件是否属于当前用户, 用于拒绝读取其他用户放置的缓存文件
+
+    Args:
+        st (os.stat_result):
+            文件的状态信息
+
+    Returns:
+        bool: 文件属于当前用户时返回 True, 不支持用户 ID 的平台 (Windows) 总是返回 True
+    """
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        return True
+    return st.st_uid == getuid()
+
+
 def append_python_path(
     new_path: Path,
     origin_env: dict[str, str] | None = None,
@@ -6,6 +6,12 @@ import pytest
 
 from sd_webui_all_in_one.custom_exceptions import AggregateError
 from sd_webui_all_in_one.env_check import comfyui_env_analyze as analyzer
+from sd_webui_all_in_one.package_analyzer import requirement_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_requirement_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(requirement_cache, "_cache", requirement_cache.RequirementFileCache(tmp_path / "requirement-cache.json"))
 
 
 def test_comfyui_environment_dict_updates_missing_and_conflict_lists(monkeypatch, tmp_path):
@@ -61,6 +67,26 @@ def test_process_comfyui_env_analysis_detects_conflicts_and_missing_paths(monkey
         analyzer.process_comfyui_env_analysis(tmp_path / "missing")
 
 
+def test_process_comfyui_env_analysis_only_flags_conflicting_components(monkeypatch, tmp_path):
+    comfyui = tmp_path / "ComfyUI"
+    nodes = comfyui / "custom_nodes"
+    for name, requirements in [("pinned", "torch==2.1.0\n"), ("compatible", "torch>=2.0\nnumpy>=1.0\n"), ("newer", "torch>=2.3\n")]:
+        (nodes / name).mkdir(parents=True)
+        (nodes / name / "requirements.txt").write_text(requirements, encoding="utf-8")
+    (comfyui / "requirements.txt").write_text("torch\nnumpy<2\n", encoding="utf-8")
+    monkeypatch.setattr(analyzer, "is_package_installed", lambda _package: True)
+
+    env_data, req_list, conflict_info = analyzer.process_comfyui_env_analysis(comfyui)
+
+    assert env_data["pinned"]["conflict_requires"] == ["torch==2.1.0"]
+    assert env_data["newer"]["conflict_requires"] == ["torch>=2.3"]
+    assert env_data["compatible"]["has_conflict_requires"] is False
+    assert env_data["ComfyUI"]["has_conflict_requires"] is False
+    assert sorted(req_list) == sorted([nodes / "pinned" / "requirements.txt", nodes / "newer" / "requirements.txt"])
+    assert sorted(conflict_info.splitlines()[1:]) == [" - newer: torch>=2.3", " - pinned: torch==2.1.0"]
+    assert conflict_info.splitlines()[0] == "torch:"
+
+
 def test_comfyui_conflict_analyzer_installs_needed_requirements_and_aggregates(monkeypatch, tmp_path):
     node_a = tmp_path / "custom_nodes" / "node-a"
     node_b = tmp_path / "custom_nodes" / "node-b"
@@ -158,6 +184,33 @@ def test_comfyui_conflict_analyzer_falls_back_to_sequential_when_batch_fails(mon
     assert calls[2][2] == node_b
 
 
+def test_comfyui_conflict_analyzer_installs_only_missing_lines_and_isolates_conflicts(monkeypatch, tmp_path):
+    nodes = {}
+    for name, requirements in [("node-a", "demo>=1.0  # pinned\nnumpy\n"), ("node-b", "Pillow[extra]\nnumpy\n"), ("node-c", "torch==2.1.0\n")]:
+        node = tmp_path / "custom_nodes" / name
+        node.mkdir(parents=True)
+        (node / "requirements.txt").write_text(requirements, encoding="utf-8")
+        nodes[name] = node
+
+    req_paths = [(node / "requirements.txt").resolve() for node in nodes.values()]
+    env_data = {
+        "node-a": {"requirement_path": req_paths[0], "missing_requires": ["demo>=1.0"], "has_conflict_requires": False},
+        "node-b": {"requirement_path": req_paths[1], "missing_requires": ["pillow"], "has_conflict_requires": False},
+        "node-c": {"requirement_path": req_paths[2], "missing_requires": ["torch==2.1.0"], "has_conflict_requires": True},
+    }
+    calls = []
+    monkeypatch.setattr(analyzer, "process_comfyui_env_analysis", lambda _path: (env_data, req_paths, "torch:"))
+    monkeypatch.setattr(analyzer, "pip_install", lambda *args, use_uv, custom_env, cwd: calls.append((args, cwd)))
+    monkeypatch.setattr(analyzer, "install_requirements", lambda **_kwargs: pytest.fail("install_requirements should not be called"))
+
+    analyzer.comfyui_conflict_analyzer(tmp_path, install_conflict_component_requirement=True, use_uv=False)
+
+    assert calls == [
+        (("demo>=1.0", "Pillow[extra]"), tmp_path.resolve()),
+        (("torch==2.1.0",), nodes["node-c"]),
+    ]
+
+
 def test_comfyui_conflict_analyzer_runs_install_scripts_sequentially(monkeypatch, tmp_path):
     node_a = tmp_path / "custom_nodes" / "node-a"
     node_b = tmp_path / "custom_nodes" / "node-b"
@@ -4,14 +4,24 @@
 - _is_constraint_pair_conflicting: 单对约束冲突检测
 - detect_conflict_package: 两个包声明之间的冲突检测
 - detect_conflict_package_from_list: 包列表中的冲突检测
+- RequirementSolver: 整个环境的依赖约束求解
 """
 
+import pytest
+
 from sd_webui_all_in_one.env_check.comfyui_env_analyze import (
     _is_constraint_pair_conflicting,
     detect_conflict_package,
     detect_conflict_package_from_list,
     normalize_package_name,
 )
+from sd_webui_all_in_one.package_analyzer.installation_checker import check_version_constraint
+from sd_webui_all_in_one.package_analyzer.py_ver_cmp import PyWhlVersionComparison
+from sd_webui_all_in_one.package_analyzer.requirement_solver import (
+    RequirementSolver,
+    RequirementSource,
+    version_set_from_specs,
+)
 
 
 # ============================================================================
@@ -409,3 +419,151 @@ class TestNormalizePackageName:
 
     def test_uppercase(self):
         assert normalize_package_name("MyPackage") == "mypackage"
+
+
+# ============================================================================
+# RequirementSolver: 依赖约束求解
+# ============================================================================
+
+
+SOLVER_CANDIDATES = [
+    f"{release}{suffix}"
+    for release in ["1", "1.0.1", "1.4", "1.4.5", "2.0", "2.0.0", "2.1", "3.0"]
+    for suffix in ["", "a1", "rc1", ".post1", ".dev1", "+cu118"]
+]
+
+
+class TestRequirementSolver:
+    """测试版本区间集合和整个环境的冲突检测"""
+
+    @pytest.mark.parametrize(
+        "op, version",
+        [
+            ("==", "2.0"),
+            ("==", "1.4.*"),
+            ("!=", "2.0"),
+            ("!=", "1.*"),
+            (">=", "1.4"),
+            ("<=", "2.0"),
+            (">", "2.0"),
+            (">", "2.0.post1"),
+            ("<", "2.0"),
+            ("<", "2.0rc1"),
+            ("<", "2.0.post1"),
+            ("~=", "1.4"),
+            ("~=", "1.4.5"),
+        ],
+    )
+    def test_version_set_matches_check_version_constraint(self, op, version):
+        """版本区间集合与逐个版本检查的结果一致"""
+        version_set = version_set_from_specs([(op, version)])
+        for candidate in SOLVER_CANDIDATES:
+            expected = check_version_constraint(candidate, op, version, PyWhlVersionComparison(candidate))
+            assert version_set.contains(candidate) is expected, (op, version, candidate)
+
+    def test_exclusions_split_intervals(self):
+        """!= 排除的版本和前缀会拆分区间, 排除全部剩余版本时冲突"""
+        assert version_set_from_specs([(">=", "1.0"), ("<", "2.0"), ("!=", "1.*")]).is_empty is True
+        version_set = version_set_from_specs([(">=", "1.0"), ("<", "4.0"), ("!=", "2.*"), ("!=", "1.5")])
+        assert len(version_set.intervals) == 3
+        assert version_set.contains("1.4") is True
+        assert version_set.contains("1.5") is False
+        assert version_set.contains("2.9") is False
+        assert version_set.contains("2.10") is False
+        assert version_set.contains("3.0rc1") is True
+        assert version_set.contains("4.0rc1") is False
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            [("<", "1.0.post1")],
+            [("<", "1.0.post2")],
+            [(">", "1.0")],
+            [("!=", "1.0+cpu")],
+            [("==", "1.0+cpu")],
+            [("==", "1.0+cpu"), ("!=", "1.0+cpu")],
+            [("==", "1.0+cpu"), ("!=", "1.0+cu118")],
+            [("<", "1.0.post1"), (">=", "1.0.post1.dev1")],
+        ],
+    )
+    def test_version_set_matches_packaging_specifiers(self, specs):
+        """版本区间集合与 packaging.specifiers 的结果一致"""
+        specifiers = pytest.importorskip("packaging.specifiers")
+        specifier_set = specifiers.SpecifierSet(",".join(f"{op}{version}" for op, version in specs))
+        version_set = version_set_from_specs(specs)
+        candidates = [
+            "0.9",
+            "1.0.dev1",
+            "1.0a1",
+            "1.0a1.post1",
+            "1.0",
+            "1.0+cpu",
+            "1.0+cu118",
+            "1.0.post0.dev1",
+            "1.0.post0",
+            "1.0.post1.dev2",
+            "1.0.post1",
+            "1.0.post1+cpu",
+            "1.0.post2.dev1",
+            "1.0.post2",
+            "1.1.dev1",
+            "1.1",
+        ]
+        for candidate in candidates:
+            assert version_set.contains(candidate) is specifier_set.contains(candidate, prereleases=True), (specs, candidate)
+        assert version_set.is_empty is not any(specifier_set.contains(candidate, prereleases=True) for candidate in candidates)
+
+    def test_local_and_arbitrary_pins(self):
+        """local version 和任意相等约束的冲突检测"""
+        assert version_set_from_specs([("==", "2.1.0+cu118"), ("==", "2.1.0+cu121")]).is_empty is True
+        assert version_set_from_specs([("==", "2.1.0+cu118"), (">=", "2.1")]).is_empty is False
+        assert version_set_from_specs([("==", "2.1.0+cu118"), ("!=", "2.1.0+CU118")]).is_empty is True
+        assert version_set_from_specs([("==", "2.1.0+cu118"), ("!=", "2.1.0+cu121")]).is_empty is False
+        assert version_set_from_specs([("<", "1.0.post1"), (">=", "1.0.post1.dev1")]).is_empty is True
+        assert version_set_from_specs([("===", "foobar"), ("===", "FOOBAR")]).is_empty is False
+        assert version_set_from_specs([("===", "foobar"), ("===", "other")]).is_empty is True
+
+    def test_reports_conflicting_components(self):
+        """只列出造成冲突的依赖声明及其组件"""
+        solver = RequirementSolver()
+        solver.add_requirements(["numpy<2", "torch>=2.0", "pillow"], source="ComfyUI")
+        solver.add_requirements(["numpy>=1.20", "torch"], source="node-a")
+        solver.add_requirements(["numpy>=2.1", "Torch<3"], source="node-b")
+        solver.add_requirements(["numpy>=2.1"], source="node-c")
+
+        conflicts = solver.find_conflicts()
+
+        assert [conflict.name for conflict in conflicts] == ["numpy"]
+        assert conflicts[0].requirements == [
+            RequirementSource("ComfyUI", "numpy<2"),
+            RequirementSource("node-b", "numpy>=2.1"),
+            RequirementSource("node-c", "numpy>=2.1"),
+        ]
+        assert conflicts[0].sources == ["ComfyUI", "node-b", "node-c"]
+        assert solver.allowed_versions("torch").contains("2.5.1") is True
+        assert solver.allowed_versions("TORCH").contains("3.0") is False
+
+    def test_reports_minimal_core_without_conflicting_pairs(self):
+        """只有多个约束组合才冲突时给出最小冲突集合"""
+        solver = RequirementSolver()
+        solver.add_requirement("pkg>=1.0", source="a")
+        solver.add_requirement("pkg<=1.0", source="b")
+        solver.add_requirement("pkg!=1.0", source="c")
+        solver.add_requirement("pkg>0.5", source="d")
+
+        (conflict,) = solver.find_conflicts()
+
+        assert conflict.sources == ["a", "b", "c"]
+
+    def test_many_components_are_folded_per_package(self):
+        """大量组件的依赖逐个折叠到版本区间集合中"""
+        solver = RequirementSolver()
+        for index in range(500):
+            solver.add_requirements([f"pkg-{index % 50}>=1.{index % 7}", "shared>=1.0", "shared<3"], source=f"node-{index}")
+        assert solver.find_conflicts() == []
+
+        solver.add_requirement("shared==3.1", source="late")
+        (conflict,) = solver.find_conflicts()
+        assert conflict.name == "shared"
+        assert conflict.sources[-1] == "late"
+        assert len(conflict.sources) == 501
@@ -2,6 +2,7 @@ import io
 import math
 import runpy
 import sys
+import types
 from datetime import date, datetime, time, timezone
 
 import pytest
@@ -400,49 +401,42 @@ def test_cli_main_dispatches_registered_callback(monkeypatch):
     from sd_webui_all_in_one.cli_manager import cli
 
     calls = []
+    loaded = []
 
     def register_demo(subparsers):
         parser = subparsers.add_parser("demo")
         parser.set_defaults(func=lambda args: calls.append(args.main_command))
 
-    def noop_register(_subparsers):
-        return None
-
-    for name in [
-        "register_sd_trainer",
-        "register_sd_scripts",
-        "register_invokeai",
-        "register_fooocus",
-        "register_comfyui",
-        "register_qwen_tts_webui",
-        "register_manager",
-    ]:
-        monkeypatch.setattr(cli, name, noop_register)
-    monkeypatch.setattr(cli, "register_sd_webui", register_demo)
+    def fake_load_command_register(spec):
+        loaded.append(spec.name)
+        return register_demo
+
+    monkeypatch.setattr(
+        cli,
+        "CLI_COMMANDS",
+        (
+            cli.CliCommandSpec("other", "其他命令", "missing.module", "register_other"),
+            cli.CliCommandSpec("demo", "演示命令", "missing.module", "register_demo"),
+        ),
+    )
+    monkeypatch.setattr(cli, "load_command_register", fake_load_command_register)
+    monkeypatch.setattr(cli, "start_environment_bootstrap", lambda: types.SimpleNamespace(wait=lambda: calls.append("bootstrap")))
     monkeypatch.setattr(sys, "argv", ["sd-webui-all-in-one", "demo"])
 
     cli.main()
 
-    assert calls == ["demo"]
+    assert calls == ["bootstrap", "demo"]
+    assert loaded == ["demo"]
 
 
 def test_cli_main_prints_help_without_subcommand(monkeypatch, capsys):
     from sd_webui_all_in_one.cli_manager import cli
 
-    def noop_register(_subparsers):
-        return None
-
-    for name in [
-        "register_sd_webui",
-        "register_sd_trainer",
-        "register_sd_scripts",
-        "register_invokeai",
-        "register_fooocus",
-        "register_comfyui",
-        "register_qwen_tts_webui",
-        "register_manager",
-    ]:
-        monkeypatch.setattr(cli, name, noop_register)
+    def fail_load_command_register(spec):
+        raise AssertionError(f"不应导入 {spec.module}")
+
+    monkeypatch.setattr(cli, "load_command_register", fail_load_command_register)
+    monkeypatch.setattr(cli, "start_environment_bootstrap", lambda: pytest.fail("未选择子命令时不应初始化运行环境"))
     monkeypatch.setattr(sys, "argv", ["sd-webui-all-in-one"])
 
     cli.main()
@@ -450,3 +444,63 @@ def test_cli_main_prints_help_without_subcommand(monkeypatch, capsys):
     output = capsys.readouterr().out
     assert "SD WebUI All In One" in output
     assert "usage:" in output
+    for spec in cli.CLI_COMMANDS:
+        assert spec.name in output
+        assert spec.help in output
+
+
+def test_cli_command_specs_match_registered_parsers():
+    import argparse
+
+    from sd_webui_all_in_one.cli_manager import cli
+
+    for spec in cli.CLI_COMMANDS:
+        parser = argparse.ArgumentParser()
+        subparsers = parser.add_subparsers(dest="main_command")
+        cli.load_command_register(spec)(subparsers)
+        assert list(subparsers.choices) == [spec.name]
+        assert [action.help for action in subparsers._choices_actions] == [spec.help]
+
+
+CLI_STARTUP_IMPORT_BUDGET_SECONDS = 1.0
+"""`--help`/`--version` 导入本项目模块的总耗时上限, 远大于正常耗时, 只用于发现重新引入的全量导入"""
+
+CLI_STARTUP_FORBIDDEN_MODULES = (
+    "sd_webui_all_in_one.base_manager",
+    "sd_webui_all_in_one.notebook_manager",
+    "sd_webui_all_in_one.model_downloader",
+    "sd_webui_all_in_one.pytorch_manager",
+    "sd_webui_all_in_one.downloader",
+    "sd_webui_all_in_one.tunnel",
+    "sd_webui_all_in_one.cli_manager.utils",
+    "sd_webui_all_in_one.cli_manager.sd_webui_cli",
+    "sd_webui_all_in_one.cli_manager.comfyui_cli",
+)
+
+
+@pytest.mark.parametrize("option", ["--help", "--version"])
+def test_cli_startup_import_budget(option):
+    import re
+    import subprocess
+    from pathlib import Path
+
+    code = "import sys; from sd_webui_all_in_one.cli_manager.cli import main; main(sys.argv[1:])"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, option],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+    imported: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$", line)
+        if match is not None:
+            imported[match.group(4)] = int(match.group(2))
+
+    forbidden = sorted(name for name in imported if name.startswith(CLI_STARTUP_FORBIDDEN_MODULES))
+    assert forbidden == []
+    # 命令行入口模块的累计导入耗时包含包本身和它导入的所有模块
+    assert imported["sd_webui_all_in_one.cli_manager.cli"] / 1_000_000 < CLI_STARTUP_IMPORT_BUDGET_SECONDS
@@ -1,8 +1,10 @@
 import builtins
+import errno
 import io
 import os
 import sys
 import tarfile
+import time
 import types
 import zipfile
 
@@ -11,6 +13,7 @@ import pytest
 from sd_webui_all_in_one.custom_exceptions import AggregateError
 from sd_webui_all_in_one.downloader import archive_downloader
 from sd_webui_all_in_one.downloader import downloader as downloader_module
+from sd_webui_all_in_one.downloader import download_scheduler
 from sd_webui_all_in_one.downloader.multi_thread import MultiThreadDownloader
 from sd_webui_all_in_one import archive_manager
 from sd_webui_all_in_one import file_manager
@@ -157,6 +160,107 @@ def test_download_archive_and_unpack_uses_url_name_and_wraps_errors(monkeypatch,
     assert "bad archive" in str(exc.value)
 
 
+class _FakeStreamResponse:
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+        self.headers = {"Content-Length": str(len(data))}
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return False
+
+
+def _tar_gz_bytes(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_download_archive_and_unpack_streams_tar_archives(monkeypatch, tmp_path):
+    requests_seen = []
+    data = _tar_gz_bytes([("pkg/a.txt", b"alpha"), ("pkg/sub/b.txt", b"beta")])
+
+    def fake_urlopen(req, timeout):
+        requests_seen.append((req.full_url, req.get_header("User-agent"), timeout))
+        return _FakeStreamResponse(data)
+
+    monkeypatch.setattr(archive_downloader.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(archive_downloader, "download_file", lambda **_kwargs: pytest.fail("tar archive should be streamed"))
+
+    archive_downloader.download_archive_and_unpack("https://example.test/pkg.tar.gz", tmp_path / "out")
+
+    assert requests_seen[0][0] == "https://example.test/pkg.tar.gz"
+    assert requests_seen[0][1] == archive_downloader.DEFAULT_USER_AGENT
+    assert (tmp_path / "out" / "pkg" / "a.txt").read_bytes() == b"alpha"
+    assert (tmp_path / "out" / "pkg" / "sub" / "b.txt").read_bytes() == b"beta"
+
+
+def test_download_archive_and_unpack_stream_rejects_unsafe_tar_member(monkeypatch, tmp_path):
+    data = _tar_gz_bytes([("ok.txt", b"ok"), ("../evil.txt", b"evil")])
+    monkeypatch.setattr(archive_downloader.urllib.request, "urlopen", lambda _req, timeout: _FakeStreamResponse(data))
+    monkeypatch.setattr(archive_downloader, "download_file", lambda **_kwargs: pytest.fail("unsafe archive must not fall back"))
+
+    with pytest.raises(RuntimeError) as exc:
+        archive_downloader.download_archive_and_unpack("https://example.test/pkg.tar.gz", tmp_path / "out")
+
+    assert "不安全的路径" in str(exc.value)
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_download_archive_and_unpack_stream_falls_back_on_network_error(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_urlopen(_req, timeout):
+        raise OSError("connection reset")
+
+    def fake_download_file(url, path, save_name):
+        calls.append(("download", save_name))
+        archive = path / save_name
+        archive.write_bytes(_tar_gz_bytes([("a.txt", b"alpha")]))
+        return archive
+
+    monkeypatch.setattr(archive_downloader.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(archive_downloader, "download_file", fake_download_file)
+
+    archive_downloader.download_archive_and_unpack("https://example.test/pkg.tgz", tmp_path / "out")
+
+    assert calls == [("download", "pkg.tgz")]
+    assert (tmp_path / "out" / "a.txt").read_bytes() == b"alpha"
+
+
+def test_download_archive_and_unpack_stream_falls_back_on_truncated_stream(monkeypatch, tmp_path):
+    calls = []
+    data = _tar_gz_bytes([("pkg/a.txt", os.urandom(200_000)), ("pkg/b.txt", b"beta")])
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "existing.txt").write_text("keep", encoding="utf-8")
+
+    def fake_download_file(url, path, save_name):
+        calls.append(("download", save_name))
+        archive = path / save_name
+        archive.write_bytes(_tar_gz_bytes([("pkg/a.txt", b"alpha")]))
+        return archive
+
+    monkeypatch.setattr(archive_downloader.urllib.request, "urlopen", lambda _req, timeout: _FakeStreamResponse(data[: len(data) // 2]))
+    monkeypatch.setattr(archive_downloader, "download_file", fake_download_file)
+
+    archive_downloader.download_archive_and_unpack("https://example.test/pkg.tar.gz", out)
+
+    assert calls == [("download", "pkg.tar.gz")]
+    assert (out / "pkg" / "a.txt").read_bytes() == b"alpha"
+    assert not (out / "pkg" / "b.txt").exists()
+    assert sorted(path.name for path in out.iterdir()) == ["existing.txt", "pkg"]
+
+
 def test_multi_thread_downloader_runs_args_kwargs_and_aggregates_errors():
     calls = []
 
@@ -184,6 +288,113 @@ def test_multi_thread_downloader_runs_args_kwargs_and_aggregates_errors():
     assert len(exc.value.exceptions) == 2
 
 
+def test_download_scheduler_shares_connection_budget_across_files(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_download_file(url, path, save_name, tool, progress, split, max_connection_per_server, progress_callback):
+        calls.append((url if isinstance(url, str) else url[0], split, max_connection_per_server, progress))
+        path.mkdir(parents=True, exist_ok=True)
+        (path / save_name).write_bytes(b"data")
+        return path / save_name
+
+    monkeypatch.setattr(download_scheduler, "download_file", fake_download_file)
+    scheduler = download_scheduler.DownloadScheduler(split=8, max_connections=12, max_connection_per_server=6, max_parallel_files=3, progress=False)
+    tasks = [
+        download_scheduler.DownloadTask(url="https://a.example/one", path=tmp_path, save_name="one"),
+        download_scheduler.DownloadTask(url=["https://b.example/two", "https://c.example/two"], path=tmp_path, save_name="two"),
+    ]
+
+    assert scheduler.run(tasks) == [tmp_path / "one", tmp_path / "two"]
+    assert sorted(calls) == [("https://a.example/one", 6, 6, False), ("https://b.example/two", 6, 6, False)]
+
+    budget = download_scheduler._ConnectionBudget(max_connections=4, max_connection_per_server=3)
+    assert budget.acquire("https://a.example/x", 8) == 3
+    assert budget.acquire("https://b.example/x", 8) == 1
+    budget.release("https://a.example/x", 3)
+    assert budget.acquire("https://a.example/y", 8) == 3
+
+
+def test_download_scheduler_splits_host_connections_between_files():
+    url = "https://mirror.example/model"
+    budget = download_scheduler._ConnectionBudget(max_connections=64, max_connection_per_server=16, max_parallel_files=4)
+    for _ in range(6):
+        budget.register(url)
+
+    # 第一个文件不会占满同一服务器的所有连接, 其他文件可以同时开始下载
+    assert [budget.acquire(url, 32) for _ in range(4)] == [4, 4, 4, 4]
+
+    for _ in range(4):
+        budget.release(url, 4)
+    for _ in range(5):
+        budget.unregister(url)
+    assert budget.acquire(url, 32) == 16
+
+
+def test_download_scheduler_reports_bytes_before_files_complete(monkeypatch, tmp_path):
+    postfixes = []
+    seen_before_complete = []
+
+    class _Bar:
+        def __init__(self, *_args, **_kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return False
+
+        def set_postfix_str(self, text):
+            postfixes.append(text)
+
+        def update(self, _count):
+            pass
+
+    def fake_download_file(url, path, save_name, progress_callback, **_kwargs):
+        progress_callback(2 * 1024 * 1024)
+        progress_callback(1024 * 1024)
+        seen_before_complete.extend(postfixes)
+        (path / save_name).write_bytes(b"x" * (3 * 1024 * 1024))
+        return path / save_name
+
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=_Bar))
+    monkeypatch.setattr(download_scheduler, "download_file", fake_download_file)
+    monkeypatch.setattr(download_scheduler, "PROGRESS_REFRESH_INTERVAL", 0)
+    scheduler = download_scheduler.DownloadScheduler(max_parallel_files=1)
+
+    assert scheduler.run([download_scheduler.DownloadTask(url="https://example.test/a", path=tmp_path, save_name="a")]) == [tmp_path / "a"]
+    assert [text.split(",")[0] for text in seen_before_complete] == ["2.0 MB", "3.0 MB"]
+    # 完成时以文件实际大小为准, 不重复计算回调报告的字节数
+    assert postfixes[-1].startswith("3.0 MB")
+
+
+@pytest.mark.parametrize(("failure_policy", "expected_calls"), [("fail_fast", 1), ("continue", 3)])
+def test_download_scheduler_failure_policy(monkeypatch, tmp_path, failure_policy, expected_calls):
+    calls = []
+
+    def fake_download_file(url, path, save_name, **_kwargs):
+        calls.append(url)
+        if save_name == "bad":
+            raise RuntimeError("download failed")
+        (path / save_name).write_bytes(b"data")
+        return path / save_name
+
+    monkeypatch.setattr(download_scheduler, "download_file", fake_download_file)
+    scheduler = download_scheduler.DownloadScheduler(max_parallel_files=1, failure_policy=failure_policy, progress=False)
+    tasks = [download_scheduler.DownloadTask(url=f"https://example.test/{name}", path=tmp_path, save_name=name) for name in ("bad", "ok1", "ok2")]
+
+    with pytest.raises(download_scheduler.DownloadSchedulerError) as exc:
+        scheduler.run(tasks)
+
+    assert isinstance(exc.value, AggregateError)
+    assert len(exc.value.exceptions) == 1
+    assert len(calls) == expected_calls
+    expected_results = [None, tmp_path / "ok1", tmp_path / "ok2"] if failure_policy == "continue" else [None, None, None]
+    assert exc.value.results == expected_results
+    with pytest.raises(ValueError):
+        download_scheduler.DownloadScheduler(failure_policy="unknown")
+
+
 def test_file_manager_copy_move_remove_scan_and_sync(tmp_path):
     src = tmp_path / "src"
     src.mkdir()
@@ -218,6 +429,83 @@ def test_file_manager_copy_move_remove_scan_and_sync(tmp_path):
     assert not moved.exists()
 
 
+def test_scan_files_filters_depth_symlinks_and_parallel_mode(tmp_path):
+    root = tmp_path / "models"
+    (root / "lora" / "deep").mkdir(parents=True)
+    (root / "a.safetensors").write_bytes(b"a")
+    (root / "lora" / "b.SAFETENSORS").write_bytes(b"b")
+    (root / "lora" / "notes.txt").write_text("n", encoding="utf-8")
+    (root / "lora" / "deep" / "c.ckpt").write_bytes(b"c")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "linked.ckpt").write_bytes(b"l")
+    (root / "linked-dir").symlink_to(outside, target_is_directory=True)
+
+    def names(**kwargs):
+        return sorted(os.path.relpath(entry.path, root).replace(os.sep, "/") for entry in file_manager.scan_files(root, **kwargs))
+
+    assert names() == ["a.safetensors", "lora/b.SAFETENSORS", "lora/deep/c.ckpt", "lora/notes.txt"]
+    assert names(extensions=[".safetensors", ".ckpt"]) == ["a.safetensors", "lora/b.SAFETENSORS", "lora/deep/c.ckpt"]
+    assert names(patterns=["*.txt"]) == ["lora/notes.txt"]
+    assert names(max_depth=0, include_dirs=True) == ["a.safetensors", "linked-dir", "lora"]
+    assert names(follow_symlinks=True, extensions=[".ckpt"]) == ["linked-dir/linked.ckpt", "lora/deep/c.ckpt"]
+    assert names(workers=4) == names()
+    assert list(file_manager.scan_files(root / "a.safetensors")) == []
+
+    entry = next(file_manager.scan_files(root, patterns=["a.*"]))
+    assert entry.stat().st_size == 1
+
+    assert sorted(path.relative_to(root).as_posix() for path in file_manager.get_file_list(root, max_depth=1, show_progress=False)) == [
+        "a.safetensors",
+        "lora/b.SAFETENSORS",
+        "lora/notes.txt",
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_files_depth_include_dirs_and_symlinks_match_across_workers(tmp_path, workers):
+    root = tmp_path / "models"
+    (root / "a" / "b" / "c").mkdir(parents=True)
+    (root / "top.bin").write_bytes(b"0")
+    (root / "a" / "one.bin").write_bytes(b"1")
+    (root / "a" / "b" / "two.bin").write_bytes(b"2")
+    (root / "a" / "b" / "c" / "three.bin").write_bytes(b"3")
+    outside = tmp_path / "outside"
+    (outside / "nested").mkdir(parents=True)
+    (outside / "nested" / "linked.bin").write_bytes(b"l")
+    (root / "a" / "link").symlink_to(outside, target_is_directory=True)
+    (root / "a" / "file-link.bin").symlink_to(root / "top.bin")
+
+    def names(**kwargs):
+        return sorted(os.path.relpath(entry.path, root).replace(os.sep, "/") for entry in file_manager.scan_files(root, workers=workers, **kwargs))
+
+    everything = ["a/b/c/three.bin", "a/b/two.bin", "a/file-link.bin", "a/one.bin", "top.bin"]
+    assert names() == everything
+    assert names(max_depth=None) == everything
+    assert names(max_depth=0) == ["top.bin"]
+    assert names(max_depth=1) == ["a/file-link.bin", "a/one.bin", "top.bin"]
+    assert names(max_depth=1, include_dirs=True) == ["a", "a/b", "a/file-link.bin", "a/link", "a/one.bin", "top.bin"]
+    # 目录条目不受 patterns 过滤, 目录软链接默认只返回条目本身而不进入
+    assert names(patterns=["*.txt"], include_dirs=True) == ["a", "a/b", "a/b/c", "a/link"]
+    assert names(follow_symlinks=True) == sorted(everything + ["a/link/nested/linked.bin"])
+    assert names(follow_symlinks=True, max_depth=2) == sorted(["a/b/two.bin", "a/file-link.bin", "a/one.bin", "top.bin"])
+    assert names(follow_symlinks=True, max_depth=3, patterns=["linked*"]) == ["a/link/nested/linked.bin"]
+
+
+def test_scan_files_parallel_mode_stops_cleanly_when_closed_early(tmp_path):
+    root = tmp_path / "models"
+    for index in range(20):
+        (root / f"dir-{index}").mkdir(parents=True)
+        (root / f"dir-{index}" / "model.bin").write_bytes(b"m")
+
+    iterator = file_manager.scan_files(root, workers=4)
+    first = next(iterator)
+    iterator.close()
+
+    assert first.name == "model.bin"
+    assert len(list(file_manager.scan_files(root, workers=4))) == 20
+
+
 def test_file_manager_copy_merge_directly_merges_directory(tmp_path):
     src = tmp_path / "t"
     src.mkdir()
@@ -330,6 +618,147 @@ def test_file_manager_merge_variants_preserve_directory_symlink(tmp_path):
     assert (target_dir / "a.txt").read_text(encoding="utf-8") == "a"
 
 
+def test_sync_files_updates_changed_files_and_uses_manifest(monkeypatch, tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_text("a", encoding="utf-8")
+    (src / "nested" / "b.txt").write_text("b", encoding="utf-8")
+    (src / "empty").mkdir()
+
+    report = file_manager.sync_files(src, dst)
+    assert report.added == ["a.txt", "nested/b.txt"]
+    assert (dst / "empty").is_dir()
+    assert (dst / file_manager.SYNC_MANIFEST_NAME).exists()
+    assert os.stat(dst / "a.txt").st_mtime_ns == os.stat(src / "a.txt").st_mtime_ns
+
+    (src / "a.txt").write_text("changed", encoding="utf-8")
+    report = file_manager.sync_files(src, dst)
+    assert report.updated == ["a.txt"]
+    assert report.unchanged == 1
+    assert (dst / "a.txt").read_text(encoding="utf-8") == "changed"
+
+    copies = []
+    monkeypatch.setattr(file_manager, "_copy_sync_file", lambda *args: copies.append(args))
+    report = file_manager.sync_files(src, dst)
+    assert report.files_to_copy == []
+    assert report.unchanged == 2
+    assert copies == []
+
+
+def test_sync_files_checksum_caches_hash_for_same_content(monkeypatch, tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+    (src / "model.bin").write_bytes(b"same")
+    (dst / "model.bin").write_bytes(b"same")
+    os.utime(dst / "model.bin", ns=(1_000_000_000, 1_000_000_000))
+
+    hashed = []
+    original_hash = file_manager._file_sha256
+    monkeypatch.setattr(file_manager, "_file_sha256", lambda path: hashed.append(path.parent.name) or original_hash(path))
+
+    report = file_manager.sync_files(src, dst)
+    assert report.unchanged == 1
+    assert sorted(hashed) == ["dst", "src"]
+
+    hashed.clear()
+    report = file_manager.sync_files(src, dst)
+    assert report.unchanged == 1
+    assert hashed == []
+
+    report = file_manager.sync_files(src, dst, checksum=False, dry_run=True)
+    assert report.files_to_copy == []
+
+    (dst / "model.bin").write_bytes(b"diff")
+    os.utime(dst / "model.bin", ns=(2_000_000_000, 2_000_000_000))
+    report = file_manager.sync_files(src, dst)
+    assert report.updated == ["model.bin"]
+    assert (dst / "model.bin").read_bytes() == b"same"
+
+
+def test_sync_files_dry_run_reports_delete_without_modifying(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    (dst / "old").mkdir(parents=True)
+    (src / "new.txt").write_text("new", encoding="utf-8")
+    (dst / "old" / "stale.txt").write_text("stale", encoding="utf-8")
+
+    report = file_manager.sync_files(src, dst, delete=True, dry_run=True)
+
+    assert report.dry_run is True
+    assert report.added == ["new.txt"]
+    assert report.deleted == ["old/stale.txt"]
+    assert "+ new.txt" in report.format_diff()
+    assert "- old/stale.txt" in report.format_diff()
+    assert not (dst / "new.txt").exists()
+    assert (dst / "old" / "stale.txt").exists()
+    assert not (dst / file_manager.SYNC_MANIFEST_NAME).exists()
+
+    file_manager.sync_files(src, dst, delete=True)
+
+    assert (dst / "new.txt").read_text(encoding="utf-8") == "new"
+    assert not (dst / "old").exists()
+
+
+def test_sync_files_skip_newer_dst_and_copy_fallback(monkeypatch, tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+    (src / "config.json").write_text("old-local", encoding="utf-8")
+    os.utime(src / "config.json", ns=(1_000_000_000, 1_000_000_000))
+    (dst / "config.json").write_text("newer-remote", encoding="utf-8")
+    (src / "data.bin").write_bytes(b"x" * 1000)
+
+    def unsupported(*_args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(file_manager.os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(file_manager.os, "sendfile", unsupported, raising=False)
+
+    report = file_manager.sync_files(src, dst, skip_newer_dst=True, workers=2)
+
+    assert report.added == ["data.bin"]
+    assert report.copied_bytes == 1000
+    assert (dst / "data.bin").read_bytes() == b"x" * 1000
+    assert (dst / "config.json").read_text(encoding="utf-8") == "newer-remote"
+
+
+def test_sync_files_writes_through_symlinked_destination(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    drive = tmp_path / "drive"
+    src.mkdir()
+    dst.mkdir()
+    drive.mkdir()
+    (src / "model.bin").write_bytes(b"new")
+    (drive / "model.bin").write_bytes(b"old")
+    os.utime(drive / "model.bin", ns=(1_000_000_000, 1_000_000_000))
+    (dst / "model.bin").symlink_to(drive / "model.bin")
+
+    report = file_manager.sync_files(src, dst)
+
+    assert report.updated == ["model.bin"]
+    assert (dst / "model.bin").is_symlink()
+    assert (drive / "model.bin").read_bytes() == b"new"
+
+
+def test_sync_files_single_file_does_not_write_manifest(tmp_path):
+    src = tmp_path / "src" / "model.bin"
+    dst = tmp_path / "dst"
+    src.parent.mkdir()
+    src.write_bytes(b"model")
+
+    report = file_manager.sync_files(src, dst)
+
+    assert report.added == ["model.bin"]
+    assert (dst / "model.bin").read_bytes() == b"model"
+    assert not (dst / file_manager.SYNC_MANIFEST_NAME).exists()
+
+
 def test_sync_files_and_create_symlink_preserves_existing_link_contents(tmp_path):
     src = tmp_path / "drive" / "models"
     link = tmp_path / "workspace" / "models"
@@ -547,6 +976,265 @@ def test_archive_extract_rejects_unsafe_member_paths(tmp_path):
     assert not (tmp_path / "outside.txt").exists()
 
 
+def test_archive_extract_zip_in_parallel_shards(monkeypatch, tmp_path):
+    opened = []
+    original_zipfile = archive_manager.zipfile.ZipFile
+
+    class CountingZipFile(original_zipfile):
+        def __init__(self, *args, **kwargs):
+            opened.append(args[0])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(archive_manager.zipfile, "ZipFile", CountingZipFile)
+
+    zip_path = tmp_path / "many.zip"
+    with original_zipfile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        dir_info = zipfile.ZipInfo("pkg/", date_time=(2020, 1, 2, 3, 4, 6))
+        zf.writestr(dir_info, b"")
+        for index in range(40):
+            info = zipfile.ZipInfo(f"pkg/file_{index}.txt", date_time=(2021, 1, 2, 3, 4, 6))
+            info.external_attr = 0o640 << 16
+            zf.writestr(info, f"payload {index}\n".encode() * (index + 1))
+
+    progress_bars = []
+
+    class FakeTqdm:
+        def __init__(self, total, **_kwargs):
+            self.total = total
+            self.n = 0
+            progress_bars.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return None
+
+        def update(self, value):
+            self.n += value
+
+    monkeypatch.setattr(archive_manager, "_get_tqdm_class", lambda: FakeTqdm)
+
+    archive_manager.extract_archive(zip_path, tmp_path / "out", workers=4)
+
+    out = tmp_path / "out" / "pkg"
+    for index in range(40):
+        assert (out / f"file_{index}.txt").read_bytes() == f"payload {index}\n".encode() * (index + 1)
+    assert (out / "file_3.txt").stat().st_mode & 0o777 == 0o640
+    assert time.localtime(out.stat().st_mtime)[:3] == (2020, 1, 2)
+    assert progress_bars[0].n == progress_bars[0].total
+    # 主句柄加上 4 个分片各自打开的句柄
+    assert len(opened) == 5
+
+
+def test_archive_extract_zip_parallel_shard_error_is_raised(monkeypatch, tmp_path):
+    zip_path = tmp_path / "many.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for index in range(8):
+            zf.writestr(f"file_{index}.txt", b"x")
+
+    original_member = archive_manager._extract_zip_member
+
+    def failing_member(zip_ref, member, extract_to, progress_bar):
+        if member.filename == "file_5.txt":
+            raise OSError("disk full")
+        original_member(zip_ref, member, extract_to, progress_bar)
+
+    monkeypatch.setattr(archive_manager, "_extract_zip_member", failing_member)
+
+    with pytest.raises(OSError, match="disk full"):
+        archive_manager.extract_archive(zip_path, tmp_path / "out", progress=False, workers=3)
+
+
+def test_archive_extract_7z_shards_solid_folders(monkeypatch, tmp_path):
+    folder_a = object()
+    folder_b = object()
+    folder_c = object()
+    entries = [
+        types.SimpleNamespace(filename="a/1.bin", uncompressed=10, folder=folder_a, emptystream=False, is_directory=False),
+        types.SimpleNamespace(filename="a/2.bin", uncompressed=10, folder=folder_a, emptystream=False, is_directory=False),
+        types.SimpleNamespace(filename="b/1.bin", uncompressed=30, folder=folder_b, emptystream=False, is_directory=False),
+        types.SimpleNamespace(filename="c/1.bin", uncompressed=5, folder=folder_c, emptystream=False, is_directory=False),
+        types.SimpleNamespace(filename="empty", uncompressed=0, folder=None, emptystream=True, is_directory=True),
+    ]
+    extract_calls = []
+    opened = []
+
+    class FakeSevenZipFile:
+        def __init__(self, path, mode):
+            self.files = entries
+            self.needs_reset = False
+            opened.append(path)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return False
+
+        def list(self):
+            return entries
+
+        def extract(self, path, targets):
+            assert not self.needs_reset
+            self.needs_reset = True
+            extract_calls.append(sorted(targets))
+
+        def reset(self):
+            self.needs_reset = False
+
+        def extractall(self, path, callback=None):
+            pytest.fail("multi-folder archive should be extracted in parallel")
+
+    monkeypatch.setitem(sys.modules, "py7zr", types.SimpleNamespace(SevenZipFile=FakeSevenZipFile))
+
+    archive_manager.extract_archive(tmp_path / "pkg.7z", tmp_path / "out", progress=False, workers=2)
+
+    assert sorted(extract_calls) == [["a/1.bin", "a/2.bin", "empty"], ["b/1.bin"], ["c/1.bin"]]
+    # 1 次读取成员列表 + 每个线程 1 次, 不随 solid 块数量增加
+    assert len(opened) == 3
+
+
+def _make_compress_source(tmp_path):
+    source_dir = tmp_path / "source"
+    (source_dir / "sub").mkdir(parents=True)
+    for index in range(12):
+        (source_dir / f"file_{index}.txt").write_bytes(f"line {index}\n".encode() * (200 * (index + 1)))
+    (source_dir / "sub" / "big.bin").write_bytes(os.urandom(50_000) * 3)
+    return source_dir
+
+
+def test_create_archive_zip_compresses_members_in_parallel_and_in_order(monkeypatch, tmp_path):
+    monkeypatch.setattr(archive_manager, "ZIP_PARALLEL_MEMBER_MAX_SIZE", 100_000)
+    source_dir = _make_compress_source(tmp_path)
+
+    parallel_zip = tmp_path / "parallel.zip"
+    serial_zip = tmp_path / "serial.zip"
+    archive_manager.create_archive([source_dir], parallel_zip, progress=False, level=9, threads=4)
+    archive_manager.create_archive([source_dir], serial_zip, progress=False, threads=1)
+
+    with zipfile.ZipFile(parallel_zip) as parallel, zipfile.ZipFile(serial_zip) as serial:
+        assert parallel.testzip() is None
+        assert parallel.namelist() == serial.namelist()
+        for name in serial.namelist():
+            assert parallel.read(name) == serial.read(name)
+        assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in parallel.infolist())
+
+
+def test_precompressed_zip_write_supported_on_current_python(tmp_path):
+    # 在每个支持的 Python 版本上运行, ZipFile 内部实现变化时提醒更新 _write_precompressed_zip_member
+    min_version, max_version = archive_manager._PRECOMPRESSED_ZIP_PYTHON_VERSIONS
+    member = tmp_path / "a.txt"
+    member.write_bytes(b"abc" * 100)
+    with zipfile.ZipFile(tmp_path / "probe.zip", "w") as zip_ref:
+        supported = archive_manager._can_write_precompressed_zip_member(zip_ref)
+        if supported:
+            archive_manager._write_precompressed_zip_member(zip_ref, zipfile.ZipInfo("a.txt"), *archive_manager._deflate_file(member, 6))
+        zip_ref.writestr("b.txt", b"public")
+
+    assert supported is (min_version <= sys.version_info[:2] <= max_version)
+    with zipfile.ZipFile(tmp_path / "probe.zip") as zip_ref:
+        assert zip_ref.testzip() is None
+        assert zip_ref.read("b.txt") == b"public"
+        if supported:
+            assert zip_ref.read("a.txt") == member.read_bytes()
+
+
+def test_create_archive_zip_streams_members_on_unverified_python(monkeypatch, tmp_path):
+    monkeypatch.setattr(archive_manager, "ZIP_PARALLEL_MEMBER_MAX_SIZE", 100_000)
+    monkeypatch.setattr(archive_manager, "_PRECOMPRESSED_ZIP_PYTHON_VERSIONS", ((3, 0), (3, 0)))
+    monkeypatch.setattr(archive_manager, "_deflate_file", lambda *_args: pytest.fail("unexpected precompression"))
+    source_dir = _make_compress_source(tmp_path)
+
+    archive_path = tmp_path / "fallback.zip"
+    archive_manager.create_archive([source_dir], archive_path, progress=False, level=9, threads=4)
+
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        assert zip_ref.testzip() is None
+        for path in source_dir.rglob("*"):
+            if path.is_file():
+                assert zip_ref.read(path.relative_to(tmp_path).as_posix()) == path.read_bytes()
+
+
+@pytest.mark.parametrize("suffix", [".tar.gz", ".tar.bz2", ".tar.xz"])
+def test_create_archive_tar_uses_parallel_block_compressor(monkeypatch, tmp_path, suffix):
+    monkeypatch.setattr(archive_manager, "ARCHIVE_COMPRESS_BLOCK_SIZE", 4096)
+    monkeypatch.setattr(archive_manager, "XZ_COMPRESS_BLOCK_SIZE", 4096)
+    source_dir = _make_compress_source(tmp_path)
+
+    archive_path = tmp_path / f"created{suffix}"
+    archive_manager.create_archive([source_dir], archive_path, progress=False, level=1, threads=3)
+
+    data = archive_path.read_bytes()
+    magic = {".tar.gz": b"\x1f\x8b\x08", ".tar.bz2": b"BZh1", ".tar.xz": b"\xfd7zXZ\x00"}[suffix]
+    assert data.count(magic) > 1
+    archive_manager.extract_archive(archive_path, tmp_path / "out", progress=False)
+    for path in source_dir.rglob("*"):
+        if path.is_file():
+            assert (tmp_path / "out" / "source" / path.relative_to(source_dir)).read_bytes() == path.read_bytes()
+
+
+def test_create_archive_zstd_exposes_level_and_threads(monkeypatch, tmp_path):
+    created = []
+
+    class FakeWriter:
+        def __init__(self, fileobj):
+            self.fileobj = fileobj
+            self.position = 0
+
+        def write(self, data):
+            self.position += len(data)
+            return self.fileobj.write(data)
+
+        def tell(self):
+            return self.position
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return False
+
+    class FakeZstdCompressor:
+        def __init__(self, level, threads):
+            created.append((level, threads))
+
+        def stream_writer(self, fileobj):
+            return FakeWriter(fileobj)
+
+    monkeypatch.setitem(sys.modules, "zstandard", types.SimpleNamespace(ZstdCompressor=FakeZstdCompressor))
+    source = tmp_path / "a.txt"
+    source.write_text("payload", encoding="utf-8")
+
+    archive_manager.create_archive([source], tmp_path / "a.tar.zst", progress=False, level=19, threads=8)
+    archive_manager.create_archive([source], tmp_path / "b.tar.zst", progress=False, threads=1)
+
+    assert created == [(19, 8), (3, 0)]
+    with tarfile.open(tmp_path / "a.tar.zst", "r:") as tf:
+        assert tf.getnames() == ["a.txt"]
+
+
+def test_register_tar_compressor_falls_back_to_default_dispatch(monkeypatch, tmp_path):
+    calls = []
+
+    def unavailable(fileobj, level, threads):
+        calls.append((level, threads))
+        return None
+
+    monkeypatch.setattr(archive_manager, "_TAR_COMPRESSORS", dict(archive_manager._TAR_COMPRESSORS))
+    archive_manager.register_tar_compressor(".TAR.GZ", unavailable)
+    source = tmp_path / "a.txt"
+    source.write_text("payload", encoding="utf-8")
+
+    archive_manager.create_archive([source], tmp_path / "a.tar.gz", progress=False, threads=2)
+
+    assert calls == [(None, 2)]
+    with tarfile.open(tmp_path / "a.tar.gz", "r:gz") as tf:
+        assert tf.getnames() == ["a.txt"]
+    with pytest.raises(ValueError):
+        archive_manager.register_tar_compressor(".zip", unavailable)
+
+
 def test_file_manager_error_paths_tree_and_empty_status(tmp_path, capsys):
     with pytest.raises(FileNotFoundError):
         file_manager.copy_files(tmp_path / "missing", tmp_path / "out")
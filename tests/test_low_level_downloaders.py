@@ -1,6 +1,8 @@
 import base64
 import hashlib
+import io
 import json
+import os
 import subprocess
 import sys
 import types
@@ -124,7 +126,7 @@ def _request_state(
             }
         )
     state = {
-        "version": requests_downloader.STATE_VERSION,
+        "version": requests_downloader.LEGACY_JSON_STATE_VERSION,
         "url": url,
         "total_size": total_size,
         "etag": etag,
@@ -633,6 +635,80 @@ def test_uri_pool_limits_connections_per_host():
     pool.release(third)
 
 
+def test_uri_pool_racing_prefers_faster_hosts_and_drops_failing_mirrors():
+    pool = requests_downloader._UriPool(
+        [
+            "https://slow.example.test/model.bin",
+            "https://fast.example.test/model.bin",
+            "https://new.example.test/model.bin",
+        ],
+        max_connection_per_server=1,
+        racing=True,
+    )
+    pool.record_throughput("https://slow.example.test/model.bin", 2 * 1024 * 1024, 1.0)
+    pool.record_throughput("https://fast.example.test/model.bin", 80 * 1024 * 1024, 1.0)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    third = pool.acquire()
+    assert [first, second, third] == [
+        "https://new.example.test/model.bin",
+        "https://fast.example.test/model.bin",
+        "https://slow.example.test/model.bin",
+    ]
+    for url in (first, second, third):
+        pool.release(url)
+
+    for _ in range(requests_downloader.MIRROR_MAX_RETRYABLE_FAILURES):
+        pool.record_failure("https://new.example.test/model.bin")
+        pool.record_failure("https://fast.example.test/model.bin")
+    for _ in range(requests_downloader.MIRROR_MAX_RETRYABLE_FAILURES):
+        pool.record_failure("https://slow.example.test/model.bin")
+
+    assert pool.dropped_hosts == {
+        requests_downloader._url_host_key("https://new.example.test/model.bin"),
+        requests_downloader._url_host_key("https://fast.example.test/model.bin"),
+    }
+    assert pool.acquire() == "https://slow.example.test/model.bin"
+
+
+def test_requests_downloader_mirror_racing_drops_mirror_returning_retryable_status(monkeypatch, tmp_path):
+    payload = b"abcdefghijklmnop"
+    data_urls = []
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        data_urls.append(url)
+        if url.startswith("https://busy."):
+            return FakeRangeResponse(status_code=503)
+        _, response = _range_response(payload, headers)
+        return response
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+    monkeypatch.setattr(requests_downloader.time, "sleep", lambda _seconds: None)
+
+    result = requests_downloader.download_file_from_url(
+        [
+            "https://busy.example.test/model.bin",
+            "https://ok.example.test/model.bin",
+        ],
+        save_path=tmp_path,
+        progress=False,
+        split=2,
+        max_connection_per_server=1,
+        min_split_size=4,
+        piece_length=4,
+        max_tries=10,
+        mirror_racing=True,
+    )
+
+    assert result.read_bytes() == payload
+    assert data_urls.count("https://busy.example.test/model.bin") <= requests_downloader.MIRROR_MAX_RETRYABLE_FAILURES
+
+
 def test_requests_downloader_uses_mirror_urls_for_range_workers(monkeypatch, tmp_path):
     payload = b"abcdefgh"
     piece_length = 4
@@ -728,7 +804,70 @@ def test_requests_downloader_http_range_download_uses_piece_segments(monkeypatch
     assert "bytes=0-" in range_calls
     assert all(item.endswith("-") for item in range_calls)
     assert not (tmp_path / "model.bin.tmp").exists()
-    assert not (tmp_path / "model.bin.tmp.state.json").exists()
+    assert not (tmp_path / "model.bin.tmp.state").exists()
+
+
+class FakeRawStream:
+    def __init__(self, payload):
+        self.stream = io.BytesIO(payload)
+        self.buffers = set()
+
+    def readinto(self, buffer):
+        self.buffers.add(id(buffer.obj))
+        return self.stream.readinto(buffer[:3])
+
+
+def test_requests_downloader_reads_raw_stream_into_reused_buffer(monkeypatch, tmp_path):
+    payload = b"abcdefghijklmnop"
+    raw_streams = []
+    fallocate_calls = []
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        _, response = _range_response(payload, headers)
+        response.raw = FakeRawStream(response.payload)
+        response.iter_content = None
+        raw_streams.append(response.raw)
+        return response
+
+    def fake_posix_fallocate(fd, offset, length):
+        fallocate_calls.append((offset, length))
+        os.truncate(fd, offset + length)
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+    monkeypatch.setattr(requests_downloader.os, "posix_fallocate", fake_posix_fallocate, raising=False)
+
+    result = requests_downloader.download_file_from_url(
+        "https://example.test/model.bin",
+        save_path=tmp_path,
+        progress=False,
+        split=1,
+        piece_length=4,
+    )
+
+    assert result.read_bytes() == payload
+    assert fallocate_calls == [(0, len(payload))]
+    assert all(len(raw.buffers) == 1 for raw in raw_streams)
+
+
+def test_piece_file_writer_falls_back_to_locked_seek_without_pwrite(monkeypatch, tmp_path):
+    temp_file = tmp_path / "model.bin.tmp"
+    temp_file.write_bytes(b"")
+    monkeypatch.delattr(requests_downloader.os, "posix_fallocate", raising=False)
+    requests_downloader._preallocate_file(temp_file, 8)
+    monkeypatch.delattr(requests_downloader.os, "pwrite", raising=False)
+
+    writer = requests_downloader._PieceFileWriter(temp_file)
+    try:
+        writer.write_at(4, memoryview(b"efgh"))
+        writer.write_at(0, memoryview(bytearray(b"abcd")))
+    finally:
+        writer.close()
+
+    assert temp_file.read_bytes() == b"abcdefgh"
 
 
 def test_requests_downloader_default_min_split_size_avoids_small_file_oversplitting(monkeypatch, tmp_path):
@@ -811,6 +950,73 @@ def test_requests_downloader_resumes_completed_pieces_from_state(monkeypatch, tm
     assert result.read_bytes() == payload
 
 
+def test_requests_downloader_hashes_pieces_while_downloading(monkeypatch, tmp_path):
+    payload = b"abcdefghijklmnop"
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        _, response = _range_response(payload, headers)
+        return response
+
+    def unexpected_full_read(*_args, **_kwargs):
+        raise AssertionError("range downloads should not re-read the file to verify sha256")
+
+    monkeypatch.setattr(requests_downloader, "compare_sha256", unexpected_full_read)
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+
+    result = requests_downloader.download_file_from_url(
+        "https://example.test/model.bin",
+        save_path=tmp_path,
+        progress=False,
+        hash_prefix=hashlib.sha256(payload).hexdigest()[:16],
+        split=3,
+        max_connection_per_server=3,
+        min_split_size=4,
+        piece_length=4,
+    )
+
+    assert result.read_bytes() == payload
+
+
+def test_requests_downloader_redownloads_resumed_piece_with_bad_sha256(monkeypatch, tmp_path):
+    payload = b"abcdefghijkl"
+    temp_file = tmp_path / "model.bin.tmp"
+    state_file = tmp_path / "model.bin.tmp.state.json"
+    temp_file.write_bytes(b"abcdXXXX" + b"\0" * 4)
+    state = _request_state(url="https://example.test/model.bin", total_size=len(payload), completed=[True, True, False])
+    state["piece_sha256"] = [hashlib.sha256(payload[index : index + 4]).hexdigest() for index in (0, 4)]
+    state_file.write_text(json.dumps(state), encoding="utf-8")
+    range_calls = []
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        range_header, response = _range_response(payload, headers)
+        range_calls.append(range_header)
+        return response
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+
+    result = requests_downloader.download_file_from_url(
+        "https://example.test/model.bin",
+        save_path=tmp_path,
+        progress=False,
+        hash_prefix=hashlib.sha256(payload).hexdigest(),
+        split=1,
+        max_connection_per_server=1,
+        min_split_size=4,
+        piece_length=4,
+    )
+
+    assert range_calls == ["bytes=4-"]
+    assert result.read_bytes() == payload
+
+
 def test_requests_downloader_loads_matching_partial_state_without_continue_flag(monkeypatch, tmp_path):
     payload = b"abcdefghijkl"
     temp_file = tmp_path / "model.bin.tmp"
@@ -958,65 +1164,111 @@ def test_requests_downloader_rejects_malformed_resume_state(monkeypatch, tmp_pat
         )
 
 
-def test_requests_downloader_skips_unchanged_json_state_writes(monkeypatch, tmp_path):
-    state_file = tmp_path / "model.bin.tmp.state.json"
+def test_requests_downloader_updates_binary_state_in_place(tmp_path):
+    state_file = tmp_path / "model.bin.tmp.state"
     temp_file = tmp_path / "model.bin.tmp"
-    temp_file.write_bytes(b"\0" * 8)
-    storage = requests_downloader._PieceStorage(total_size=8, piece_length=4)
-    options = requests_downloader._DownloadOptions(
-        split=1,
-        max_connection_per_server=1,
-        min_split_size=4,
-        piece_length=4,
-        allow_piece_length_change=False,
-        max_tries=1,
-        retry_wait=0,
-        continue_download=False,
-        conditional_get=False,
-        remote_time=True,
-    )
-    write_calls = []
-    replace_calls = []
-    original_write_text = Path.write_text
-    original_replace = Path.replace
-
-    def spy_write_text(self, *args, **kwargs):
-        if self.name.endswith("__temp"):
-            write_calls.append(self.name)
-        return original_write_text(self, *args, **kwargs)
+    temp_file.write_bytes(b"\0" * 10)
+    remote_info = requests_downloader._RemoteFileInfo(total_size=10, supports_range=True, etag="v1")
+    piece_hash = hashlib.sha256(b"abcd").hexdigest()
 
-    def spy_replace(self, target):
-        replace_calls.append((self.name, Path(target).name))
-        return original_replace(self, target)
-
-    monkeypatch.setattr(Path, "write_text", spy_write_text)
-    monkeypatch.setattr(Path, "replace", spy_replace)
-
-    requests_downloader._save_resume_state(
+    resume_state = requests_downloader._ResumeStateFile.create(
         state_file,
-        urls=["https://example.test/model.bin"],
-        remote_info=requests_downloader._RemoteFileInfo(total_size=8, supports_range=True),
-        options=options,
-        piece_storage=storage,
+        total_size=10,
+        piece_length=4,
+        metadata=requests_downloader._resume_state_metadata(["https://example.test/model.bin"], remote_info),
+        completed=[False, False, False],
+        in_flight_lengths=[0, 0, 0],
     )
-    requests_downloader._save_resume_state(
+    size = state_file.stat().st_size
+    resume_state.set_completed(0, True)
+    resume_state.set_piece_hash(0, piece_hash)
+    resume_state.set_hashed_piece_count(1)
+    resume_state.set_in_flight_length(1, 3)
+    resume_state.close()
+    resume_state.close()
+
+    assert state_file.read_bytes().startswith(b"SDAIORS\0")
+    assert state_file.stat().st_size == size
+    assert not requests_downloader._state_temp_path_for(state_file).exists()
+    assert requests_downloader._read_resume_state(
         state_file,
-        urls=["https://example.test/model.bin"],
-        remote_info=requests_downloader._RemoteFileInfo(total_size=8, supports_range=True),
-        options=options,
-        piece_storage=storage,
-    )
+        remote_info=remote_info,
+        piece_length=4,
+        allow_piece_length_change=False,
+    ) == ([True, False, False], [0, 3, 0], [piece_hash])
 
-    assert write_calls == ["model.bin.tmp.state.json__temp"]
-    assert replace_calls == [("model.bin.tmp.state.json__temp", "model.bin.tmp.state.json")]
-    assert json.loads(state_file.read_text(encoding="utf-8"))["version"] == requests_downloader.STATE_VERSION
+    with pytest.raises(requests_downloader._ResumeStateError, match="大小不匹配"):
+        requests_downloader._read_resume_state(
+            state_file,
+            remote_info=requests_downloader._RemoteFileInfo(total_size=12, supports_range=True),
+            piece_length=4,
+            allow_piece_length_change=False,
+        )
 
+    legacy_state_file = requests_downloader._legacy_state_path_for(state_file)
+    legacy_state_file.write_text("{}", encoding="utf-8")
     requests_downloader._state_temp_path_for(state_file).write_text("stale", encoding="utf-8")
     requests_downloader._cleanup_resume_files(temp_file, state_file)
     assert not state_file.exists()
+    assert not legacy_state_file.exists()
     assert not requests_downloader._state_temp_path_for(state_file).exists()
 
 
+def test_requests_downloader_migrates_json_state_to_binary(monkeypatch, tmp_path):
+    payload = b"abcdefghijkl"
+    temp_file = tmp_path / "model.bin.tmp"
+    legacy_state_file = tmp_path / "model.bin.tmp.state.json"
+    temp_file.write_bytes(payload[:4] + b"\0" * 8)
+    legacy_state_file.write_text(
+        json.dumps(
+            _request_state(
+                url="https://example.test/model.bin",
+                total_size=len(payload),
+                completed=[True, False, False],
+                in_flight_lengths=[0, 2, 0],
+            )
+        ),
+        encoding="utf-8",
+    )
+    range_calls = []
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        range_header, response = _range_response(payload, headers)
+        range_calls.append(range_header)
+        if range_header == "bytes=6-":
+            raise ConnectionError("network down")
+        return response
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+    monkeypatch.setattr(requests_downloader.time, "sleep", lambda _seconds: None)
+
+    with pytest.raises(IOError):
+        requests_downloader.download_file_from_url(
+            "https://example.test/model.bin",
+            save_path=tmp_path,
+            progress=False,
+            split=1,
+            max_connection_per_server=1,
+            min_split_size=4,
+            piece_length=4,
+            max_tries=1,
+        )
+
+    state_file = tmp_path / "model.bin.tmp.state"
+    assert range_calls[0] == "bytes=6-"
+    assert not legacy_state_file.exists()
+    assert requests_downloader._read_resume_state(
+        state_file,
+        remote_info=requests_downloader._RemoteFileInfo(total_size=len(payload), supports_range=True),
+        piece_length=4,
+        allow_piece_length_change=False,
+    )[:2] == ([True, False, False], [0, 2, 0])
+
+
 def test_requests_downloader_normalizes_options_with_aria2_bounds(monkeypatch):
     monkeypatch.setattr(requests_downloader, "ARIA2_SIZE_OPTION_MIN", 1024 * 1024)
     monkeypatch.setattr(requests_downloader, "ARIA2_SIZE_OPTION_MAX", 1024 * 1024 * 1024)
@@ -1370,7 +1622,8 @@ def test_requests_downloader_preserves_resume_state_when_range_probe_is_unsuppor
 
     assert calls == ["bytes=0-0", "bytes=4-"]
     assert temp_file.exists()
-    assert state_file.exists()
+    assert not state_file.exists()
+    assert (tmp_path / "model.bin.tmp.state").exists()
 
 
 def test_requests_downloader_preserves_state_when_content_range_is_invalid(monkeypatch, tmp_path):
@@ -1404,7 +1657,7 @@ def test_requests_downloader_preserves_state_when_content_range_is_invalid(monke
 
     assert calls == ["bytes=0-"]
     assert (tmp_path / "model.bin.tmp").exists()
-    assert (tmp_path / "model.bin.tmp.state.json").exists()
+    assert (tmp_path / "model.bin.tmp.state").exists()
 
 
 def test_requests_downloader_skips_range_validation_for_transfer_encoding():
@@ -1480,7 +1733,8 @@ def test_requests_downloader_preserves_state_when_resume_range_is_ignored(monkey
 
     assert calls == ["bytes=4-"]
     assert temp_file.exists()
-    assert state_file.exists()
+    assert not state_file.exists()
+    assert (tmp_path / "model.bin.tmp.state").exists()
 
 
 def test_requests_downloader_retries_failed_ranges(monkeypatch, tmp_path):
@@ -1661,6 +1915,97 @@ def test_requests_downloader_closes_thread_sessions_after_range_failure(monkeypa
     assert all(session.closed for session in sessions)
 
 
+def test_adaptive_controller_grows_until_throughput_stops_improving():
+    controller = requests_downloader._AdaptiveConnectionController(16, initial_workers=2, sample_interval=1.0)
+    now = controller.last_sample_time
+
+    def run_sample(workers, rate_per_worker):
+        nonlocal now
+        for owner in list(controller.active_owners):
+            controller.worker_finished(owner)
+        for owner in range(workers):
+            controller.worker_started(owner)
+            controller.record(owner, rate_per_worker)
+        now += 1.0
+        assert controller.sample(now)
+
+    assert not controller.sample(now + 0.5)
+    run_sample(2, 100)
+    assert controller.target == 4
+    run_sample(4, 100)
+    assert controller.target == 8
+    run_sample(8, 50)
+    assert controller.target == 4
+    assert controller.saturated
+    run_sample(8, 50)
+    assert controller.over_target()
+    assert controller.try_retire(7)
+    assert controller.peak_workers == 8
+
+
+def test_segment_manager_steals_tail_pieces_from_slow_connection():
+    storage = requests_downloader._PieceStorage(total_size=8, piece_length=1)
+    controller = requests_downloader._AdaptiveConnectionController(4, initial_workers=4, sample_interval=1.0)
+    manager = requests_downloader._SegmentManager(storage, min_split_size=1024, controller=controller)
+    slow_segment = manager.get_segment(owner_id=1)
+    fast_segment = storage.check_out_piece(7, owner_id=2)
+    assert slow_segment is not None and slow_segment.start_piece == 0
+    assert fast_segment is not None
+    storage.record_progress(slow_segment, 1)
+    assert storage.mark_complete(fast_segment) == 1
+
+    for owner in (1, 2, 3):
+        controller.worker_started(owner)
+    controller.record(1, 1)
+    controller.record(2, 100)
+    controller.record(3, 100)
+    assert controller.sample(controller.last_sample_time + 1.0)
+
+    assert storage.check_out_segment(1024, owner_id=2) is None
+    stolen = manager.get_segment(owner_id=2)
+    assert stolen is not None
+    assert stolen.start_piece == 4
+    assert controller.stolen_pieces == 1
+    assert manager.get_next_segment(slow_segment).start_piece == 1
+
+
+def test_requests_downloader_adaptive_mode_reports_tuning(monkeypatch, tmp_path):
+    payload = bytes(range(64))
+    tunings = []
+
+    def fake_head(url, allow_redirects=True, timeout=60, headers=None):
+        return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
+
+    def fake_get(url, stream=True, timeout=60, headers=None):
+        _, response = _range_response(payload, headers)
+        return response
+
+    monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
+    monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=FakeTqdm))
+    monkeypatch.setattr(requests_downloader, "ADAPTIVE_INITIAL_CONNECTIONS", 2)
+
+    result = requests_downloader.download_file_from_url(
+        "https://example.test/model.bin",
+        save_path=tmp_path,
+        progress=False,
+        split=8,
+        max_connection_per_server=8,
+        min_split_size=4,
+        piece_length=4,
+        adaptive=True,
+        tuning_callback=tunings.append,
+    )
+
+    assert result.read_bytes() == payload
+    assert len(tunings) == 1
+    tuning = tunings[0]
+    assert tuning.split == 8
+    assert 1 <= tuning.connections <= 8
+    assert 1 <= tuning.peak_connections <= 8
+    assert tuning.piece_length == 4
+    assert tuning.throughput > 0
+
+
 def test_requests_downloader_batches_state_writes_and_updates_streaming_progress(monkeypatch, tmp_path):
     payload = b"abcdefghijklmnop"
     save_state_calls = []
@@ -1671,11 +2016,11 @@ def test_requests_downloader_batches_state_writes_and_updates_streaming_progress
             super().__init__(*args, **kwargs)
             progress_bars.append(self)
 
-    original_save_state = requests_downloader._save_resume_state
+    original_flush = requests_downloader._ResumeStateFile.flush
 
-    def fake_save_state(*args, **kwargs):
-        save_state_calls.append(kwargs["piece_storage"].snapshot_completed())
-        return original_save_state(*args, **kwargs)
+    def fake_flush(self):
+        save_state_calls.append(self.path.name)
+        return original_flush(self)
 
     def fake_head(url, allow_redirects=True, timeout=60, headers=None):
         return FakeRangeResponse(status_code=200, headers={"Content-Length": str(len(payload)), "Accept-Ranges": "bytes"})
@@ -1684,7 +2029,7 @@ def test_requests_downloader_batches_state_writes_and_updates_streaming_progress
         _, response = _range_response(payload, headers)
         return response
 
-    monkeypatch.setattr(requests_downloader, "_save_resume_state", fake_save_state)
+    monkeypatch.setattr(requests_downloader._ResumeStateFile, "flush", fake_flush)
     monkeypatch.setitem(sys.modules, "requests", types.SimpleNamespace(head=fake_head, get=fake_get))
     monkeypatch.setitem(sys.modules, "tqdm", types.SimpleNamespace(tqdm=TrackingTqdm))
 
@@ -1730,7 +2075,7 @@ def test_requests_downloader_range_hash_mismatch_cleans_temp_files(monkeypatch,
         )
 
     assert not (tmp_path / "model.bin.tmp").exists()
-    assert not (tmp_path / "model.bin.tmp.state.json").exists()
+    assert not (tmp_path / "model.bin.tmp.state").exists()
 
 
 class FakeUrllibResponse:
@@ -0,0 +1,144 @@
+import json
+import os
+import pickle
+import struct
+import sys
+import types
+import zipfile
+
+import pytest
+
+from sd_webui_all_in_one.base_manager import base as base_module
+from sd_webui_all_in_one.model_downloader import model_fingerprint
+from sd_webui_all_in_one.model_downloader import model_inventory
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_inventory(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_inventory, "SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH", tmp_path / "model-inventory")
+
+
+def _write_safetensors(path, tensors, metadata=None, data=None):
+    header = dict(tensors)
+    if metadata is not None:
+        header["__metadata__"] = metadata
+    raw = json.dumps(header).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(struct.pack("<Q", len(raw)) + raw + (data if data is not None else b"\0" * 64))
+    return path
+
+
+def _tensor(shape, dtype="F16"):
+    return {"dtype": dtype, "shape": shape, "data_offsets": [0, 0]}
+
+
+def test_fingerprint_safetensors_lora_counts_parameters_and_is_stable(tmp_path):
+    tensors = {
+        "lora_te2_text_model_encoder_layers_0_mlp_fc1.lora_down.weight": _tensor([4, 1280]),
+        "lora_te2_text_model_encoder_layers_0_mlp_fc1.lora_up.weight": _tensor([5120, 4]),
+        "lora_te2_text_model_encoder_layers_0_mlp_fc1.alpha": _tensor([], "F32"),
+    }
+    first = _write_safetensors(tmp_path / "a.safetensors", tensors, {"ss_network_dim": "4"}, data=b"a" * 1024)
+    same = _write_safetensors(tmp_path / "b.safetensors", tensors, {"ss_network_dim": "4"}, data=b"a" * 1024)
+    other = _write_safetensors(tmp_path / "c.safetensors", tensors, {"ss_network_dim": "4"}, data=b"b" * 1024)
+
+    result = model_fingerprint.fingerprint_model(first)
+
+    assert result.format == "safetensors"
+    assert (result.architecture, result.component) == ("sdxl", "lora")
+    assert result.tensor_count == 3
+    assert result.parameter_count == 4 * 1280 + 5120 * 4 + 1
+    assert result.dtypes == ["F16", "F32"]
+    assert result.metadata == {"ss_network_dim": "4"}
+    assert result.fingerprint.startswith("v1:")
+    assert model_fingerprint.fingerprint_model(same).fingerprint == result.fingerprint
+    other_result = model_fingerprint.fingerprint_model(other)
+    assert other_result.structure_hash == result.structure_hash
+    assert other_result.fingerprint != result.fingerprint
+
+
+def test_fingerprint_pytorch_zip_reads_keys_without_unpickling(monkeypatch, tmp_path):
+    fake_torch = types.ModuleType("torch")
+
+    class HalfStorage:
+        pass
+
+    HalfStorage.__module__ = "torch"
+    HalfStorage.__qualname__ = "HalfStorage"
+    fake_torch.HalfStorage = HalfStorage
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    state_dict = {
+        "state_dict": {
+            "model.diffusion_model.input_blocks.0.0.weight": (HalfStorage, "0"),
+            "cond_stage_model.transformer.text_model.embeddings.position_ids": (HalfStorage, "1"),
+        }
+    }
+    path = tmp_path / "model.ckpt"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("archive/data.pkl", pickle.dumps(state_dict, protocol=2))
+        archive.writestr("archive/data/0", b"\0" * 8)
+        archive.writestr("archive/data/1", b"\0" * 4)
+    monkeypatch.delitem(sys.modules, "torch")
+
+    result = model_fingerprint.fingerprint_model(path)
+
+    assert result.format == "pytorch"
+    assert (result.architecture, result.component) == ("sd15", "checkpoint")
+    assert result.tensor_count == 2
+    assert result.parameter_count == 6
+    assert result.dtypes == ["HalfStorage"]
+    assert result.fingerprint is not None
+
+
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [
+        (["double_blocks.0.img_attn.qkv.weight", "single_blocks.0.linear1.weight"], ("flux", "diffusion_model")),
+        (["conditioner.embedders.1.model.ln_final.weight", "model.diffusion_model.label_emb.0.0.weight"], ("sdxl", "checkpoint")),
+        (["model.diffusion_model.joint_blocks.0.x_block.attn.qkv.weight", "first_stage_model.decoder.conv_in.weight"], ("sd3", "checkpoint")),
+        (["encoder.down.0.block.0.conv1.weight", "decoder.up.0.block.0.conv1.weight"], ("unknown", "vae")),
+        (["control_model.input_blocks.1.1.proj_in.weight", "control_model.input_hint_block.0.weight"], ("sd15", "controlnet")),
+        (["conv_first.weight", "body.0.rdb1.conv1.weight"], ("unknown", "upscaler")),
+        (["clip_l", "clip_g"], ("sdxl", "embedding")),
+        (["text_model.encoder.layers.0.mlp.fc1.weight"], ("unknown", "text_encoder")),
+        (["something.else"], ("unknown", "unknown")),
+    ],
+)
+def test_classify_tensor_keys(keys, expected):
+    assert model_fingerprint.classify_tensor_keys(keys) == expected
+
+
+def test_classify_tensor_keys_prefers_metadata():
+    keys = ["lora_unet_down_blocks_0_attentions_0_proj_in.lora_down.weight"]
+
+    assert model_fingerprint.classify_tensor_keys(keys) == ("sd15", "lora")
+    assert model_fingerprint.classify_tensor_keys(keys, {"ss_base_model_version": "sdxl_base_v1-0"}) == ("sdxl", "lora")
+
+
+def test_fingerprint_models_handles_unknown_and_missing_files(tmp_path):
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    text = tmp_path / "notes.pt"
+    text.write_bytes(b"not a model")
+
+    results = model_fingerprint.fingerprint_models([empty, text, tmp_path / "missing.pt"], workers=2)
+
+    assert [result.format if result else None for result in results] == ["unknown", "unknown", None]
+    assert results[1].fingerprint is None
+
+
+def test_check_downloaded_model_links_duplicates_and_suggests_save_dir(tmp_path, caplog):
+    tensors = {"lora_unet_down_blocks_0_attentions_0_proj_in.lora_down.weight": _tensor([4, 320])}
+    existing = _write_safetensors(tmp_path / "models" / "loras" / "style.safetensors", tensors, data=b"x" * 4096)
+    downloaded = _write_safetensors(tmp_path / "models" / "checkpoints" / "style-copy.safetensors", tensors, data=b"x" * 4096)
+
+    assert model_fingerprint.suggest_model_save_dir("comfyui", model_fingerprint.fingerprint_model(existing)) == "models/loras"
+
+    assert base_module.check_downloaded_model(tmp_path, "comfyui", tmp_path / "models", downloaded) == downloaded
+    assert not os.path.samefile(existing, downloaded)
+
+    result = base_module.check_downloaded_model(tmp_path, "comfyui", tmp_path / "models", downloaded, deduplicate=True)
+
+    assert result == downloaded
+    assert os.path.samefile(existing, downloaded)
+    assert "models/loras" in caplog.text
@@ -1,5 +1,7 @@
+import errno
 import hashlib
 import os
+import shutil
 import sys
 import types
 from pathlib import Path
@@ -7,11 +9,18 @@ from pathlib import Path
 import pytest
 
 from sd_webui_all_in_one.custom_exceptions import AggregateError
-from sd_webui_all_in_one.model_downloader import model_utils
+from sd_webui_all_in_one.model_downloader import model_inventory, model_utils
+from sd_webui_all_in_one.model_downloader.model_data import ModelCatalog
+from sd_webui_all_in_one.model_downloader.model_search import thaw_model_card, thaw_model_list
 from sd_webui_all_in_one.repo_manager import RepoManager
 from sd_webui_all_in_one import repo_manager as repo_module
 
 
+@pytest.fixture(autouse=True)
+def _isolated_model_inventory(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_inventory, "SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH", tmp_path / "model-inventory")
+
+
 MODEL_FIXTURES = [
     {
         "name": "alpha",
@@ -32,36 +41,44 @@ MODEL_FIXTURES = [
 ]
 
 
+def _use_model_fixtures(monkeypatch):
+    catalog = ModelCatalog(MODEL_FIXTURES)
+    monkeypatch.setattr(model_utils, "get_model_catalog", lambda: catalog)
+    monkeypatch.setattr(model_inventory, "get_model_catalog", lambda: catalog)
+
+
 def _sha256(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
 def test_model_library_export_query_search_and_download(monkeypatch, tmp_path, capsys):
-    monkeypatch.setattr(model_utils, "MODEL_DOWNLOAD_DICT", MODEL_FIXTURES)
+    _use_model_fixtures(monkeypatch)
 
     exported_models = model_utils.export_model_list("sd_webui")
     assert [m["name"] for m in exported_models] == ["alpha", "beta"]
-    assert exported_models[0] == MODEL_FIXTURES[0]
+    assert thaw_model_card(exported_models[0]) == MODEL_FIXTURES[0]
     assert exported_models[0] is not MODEL_FIXTURES[0]
-    assert exported_models[0]["url"] is not MODEL_FIXTURES[0]["url"]
-    exported_models[0]["url"]["huggingface"] = "changed"
-    exported_models[0]["supported_webui"].append("invokeai")
+    # 导出的是共享的只读视图, 不会为每次导出复制模型信息
+    assert model_utils.export_model_list("sd_webui")[0] is exported_models[0]
+    with pytest.raises(TypeError):
+        exported_models[0]["url"]["huggingface"] = "changed"
+    with pytest.raises(AttributeError):
+        exported_models[0]["supported_webui"].append("invokeai")
+    thawed = thaw_model_list(exported_models)
+    thawed[0]["url"]["huggingface"] = "changed"
     assert MODEL_FIXTURES[0]["url"]["huggingface"] == "https://hf.example/alpha"
-    assert MODEL_FIXTURES[0]["supported_webui"] == ["sd_webui", "comfyui"]
 
     assert [m["name"] for m in model_utils.export_model_list("comfyui")] == ["alpha"]
     with pytest.raises(ValueError):
         model_utils.export_model_list("unknown")
 
     queried_alpha = model_utils.query_model_info("sd_webui", model_name="alpha")
-    assert queried_alpha == [MODEL_FIXTURES[0]]
-    assert queried_alpha[0] is not MODEL_FIXTURES[0]
-    queried_alpha[0]["save_dir"]["sd_webui"] = "changed"
-    assert MODEL_FIXTURES[0]["save_dir"]["sd_webui"] == "models/Stable-diffusion"
-    assert model_utils.query_model_info("sd_webui", model_name="alpha", model_index=2) == [MODEL_FIXTURES[1]]
+    assert thaw_model_list(queried_alpha) == [MODEL_FIXTURES[0]]
+    with pytest.raises(TypeError):
+        queried_alpha[0]["save_dir"]["sd_webui"] = "changed"
+    assert thaw_model_list(model_utils.query_model_info("sd_webui", model_name="alpha", model_index=2)) == [MODEL_FIXTURES[1]]
     queried_all = model_utils.query_model_info("sd_webui", model_index=[1, 2])
-    assert queried_all == MODEL_FIXTURES
-    assert queried_all[0] is not MODEL_FIXTURES[0]
+    assert thaw_model_list(queried_all) == MODEL_FIXTURES
     with pytest.raises(FileNotFoundError):
         model_utils.query_model_info("sd_webui", model_name="missing")
     with pytest.raises(ValueError):
@@ -97,6 +114,148 @@ def test_model_library_export_query_search_and_download(monkeypatch, tmp_path, c
     assert "alpha" in str(exc.value)
 
 
+def test_download_model_reuses_files_from_model_store(monkeypatch, tmp_path):
+    _use_model_fixtures(monkeypatch)
+    store_path = tmp_path / "store"
+    calls = []
+
+    def fake_download_file(url, path, save_name, tool):
+        calls.append(url)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / save_name).write_bytes(b"alpha-weights")
+        return path / save_name
+
+    monkeypatch.setattr(model_utils, "download_file", fake_download_file)
+
+    sd_paths = model_utils.download_model("sd_webui", tmp_path / "sd", model_index=1, model_store_path=store_path)
+    comfy_paths = model_utils.download_model("comfyui", tmp_path / "comfy", model_index=1, model_store_path=store_path)
+
+    assert calls == ["https://modelscope.example/alpha"]
+    assert sd_paths == [tmp_path / "sd/models/Stable-diffusion/alpha.safetensors"]
+    assert comfy_paths == [tmp_path / "comfy/models/checkpoints/alpha.safetensors"]
+    assert comfy_paths[0].read_bytes() == b"alpha-weights"
+    blob = model_utils.ModelStore(store_path).blob_path(hashlib.sha256(b"alpha-weights").hexdigest())
+    assert blob.read_bytes() == b"alpha-weights"
+    assert model_utils.ModelStore(store_path).find("alpha.safetensors", "https://hf.example/alpha") is None
+
+
+def test_download_model_parallel_mode_uses_scheduler(monkeypatch, tmp_path):
+    _use_model_fixtures(monkeypatch)
+    runs = []
+
+    class FakeScheduler:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        def run(self, tasks):
+            runs.append((self.kwargs, tasks))
+            return [task.path / task.save_name for task in tasks]
+
+    monkeypatch.setattr(model_utils, "DownloadScheduler", FakeScheduler)
+    paths = model_utils.download_model("sd_webui", tmp_path, model_index=[1, 2], max_parallel_files=2, failure_policy="continue")
+
+    assert paths == [
+        tmp_path / "models/Stable-diffusion/alpha.safetensors",
+        tmp_path / "models/Stable-diffusion/beta.safetensors",
+    ]
+    kwargs, tasks = runs[0]
+    assert kwargs["max_parallel_files"] == 2
+    assert kwargs["failure_policy"] == "continue"
+    assert [task.url for task in tasks] == ["https://modelscope.example/alpha", "https://modelscope.example/beta"]
+
+
+def test_download_model_continue_policy_stores_partial_results(monkeypatch, tmp_path):
+    _use_model_fixtures(monkeypatch)
+    store_path = tmp_path / "store"
+    alpha = tmp_path / "models/Stable-diffusion/alpha.safetensors"
+
+    class FakeScheduler:
+        def __init__(self, **_kwargs):
+            pass
+
+        def run(self, tasks):
+            alpha.parent.mkdir(parents=True, exist_ok=True)
+            alpha.write_bytes(b"alpha-weights")
+            raise model_utils.DownloadSchedulerError("failed", [RuntimeError("beta failed")], [alpha, None])
+
+    monkeypatch.setattr(model_utils, "DownloadScheduler", FakeScheduler)
+
+    with pytest.raises(model_utils.ModelDownloadError) as exc:
+        model_utils.download_model("sd_webui", tmp_path, model_index=[1, 2], model_store_path=store_path, max_parallel_files=2, failure_policy="continue")
+
+    assert isinstance(exc.value, RuntimeError)
+    assert exc.value.save_paths == [alpha]
+    assert model_utils.ModelStore(store_path).find("alpha.safetensors", "https://modelscope.example/alpha") is not None
+
+
+def test_model_store_link_falls_back_to_copy(monkeypatch, tmp_path):
+    from sd_webui_all_in_one.model_downloader import model_store as model_store_module
+
+    store = model_store_module.ModelStore(tmp_path / "store")
+    source = tmp_path / "model.safetensors"
+    source.write_bytes(b"weights")
+    blob = store.add(source, url="https://example/model")
+
+    def fail(*_args, **_kwargs):
+        raise OSError("unsupported")
+
+    monkeypatch.setattr(model_store_module.os, "link", fail)
+    monkeypatch.setattr(model_store_module, "_reflink", fail)
+    monkeypatch.setattr(Path, "symlink_to", fail)
+
+    target = tmp_path / "webui" / "model.safetensors"
+    assert store.link(blob, target) == "copy"
+    assert target.read_bytes() == b"weights"
+    assert store.find("model.safetensors", "https://example/model") == blob
+
+
+def test_model_store_add_links_file_after_cross_device_copy(monkeypatch, tmp_path):
+    from sd_webui_all_in_one.model_downloader import model_store as model_store_module
+
+    def cross_device(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(model_store_module.os, "link", cross_device)
+    monkeypatch.setattr(model_store_module, "_reflink", cross_device)
+
+    store = model_store_module.ModelStore(tmp_path / "store")
+    source = tmp_path / "webui" / "model.safetensors"
+    source.parent.mkdir()
+    source.write_bytes(b"weights")
+    blob = store.add(source, url="https://example/model")
+
+    assert source.is_symlink()
+    assert source.resolve() == blob.resolve()
+    assert source.read_bytes() == b"weights"
+    assert store.add(source, url="https://example/model") == blob
+
+
+def test_model_store_add_skips_hashing_unchanged_files(monkeypatch, tmp_path):
+    from sd_webui_all_in_one.model_downloader import model_store as model_store_module
+
+    store = model_store_module.ModelStore(tmp_path / "store")
+    source = tmp_path / "webui" / "model.safetensors"
+    source.parent.mkdir()
+    source.write_bytes(b"weights")
+    blob = store.add(source, url="https://example/model")
+    copy = tmp_path / "other" / "model.safetensors"
+    copy.parent.mkdir()
+    shutil.copy2(blob, copy)
+
+    hashed = []
+    original = model_store_module._file_sha256
+    monkeypatch.setattr(model_store_module, "_file_sha256", lambda path: hashed.append(path) or original(path))
+
+    assert store.add(source, url="https://example/model") == blob
+    assert store.add(copy, url="https://example/model") == blob
+    assert hashed == []
+
+    copy.unlink()
+    copy.write_bytes(b"changed")
+    store.add(copy, url="https://example/model")
+    assert hashed == [copy.resolve()]
+
+
 def _repo_manager_with_apis():
     manager = RepoManager.__new__(RepoManager)
     manager.hf_token = None
@@ -934,3 +1093,187 @@ def test_repo_manager_mirror_repo_files_can_use_fast_download(monkeypatch):
     assert download_calls[0]["progress"] is False
     assert uploaded[0]["path_in_repo"] == "nested/file.bin"
     assert uploaded[0]["revision"] == "fast-rev"
+
+
+def _write_safetensors(path, header):
+    import json
+    import struct
+
+    raw = json.dumps(header).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(struct.pack("<Q", len(raw)) + raw + b"\0" * 8)
+
+
+def test_model_inventory_refreshes_incrementally_and_matches_library(monkeypatch, tmp_path):
+    _use_model_fixtures(monkeypatch)
+    models = tmp_path / "ComfyUI" / "models"
+    _write_safetensors(
+        models / "checkpoints" / "alpha.safetensors",
+        {"__metadata__": {"ss_base_model_version": "sdxl", "ss_tag_frequency": "x" * 10000}, "w": {"dtype": "F16", "shape": [1], "data_offsets": [0, 2]}},
+    )
+    (models / "checkpoints" / "notes.txt").write_text("ignored", encoding="utf-8")
+    (models / "loras" / "nested").mkdir(parents=True)
+    (models / "loras" / "nested" / "style.pt").write_bytes(b"lora")
+
+    with model_inventory.ModelInventory(models) as inventory:
+        changes = inventory.refresh()
+        assert (changes.added, changes.removed) == (2, 0)
+        entries = {entry["relpath"]: entry for entry in inventory.list_models()}
+        assert sorted(entries) == ["checkpoints/alpha.safetensors", "loras/nested/style.pt"]
+        alpha = entries["checkpoints/alpha.safetensors"]
+        assert alpha["model_name"] == "alpha"
+        assert alpha["safetensors"] == {"tensor_count": 1, "dtypes": ["F16"], "metadata": {"ss_base_model_version": "sdxl"}}
+        assert alpha["sha256"] is None
+
+        changes = inventory.refresh()
+        # 索引保存在缓存目录中, 目录未变化时不会重新读取
+        assert (changes.added, changes.updated, changes.removed, changes.scanned_dirs) == (0, 0, 0, 0)
+        assert changes.skipped_dirs == 4
+        assert inventory.is_up_to_date() is True
+        assert inventory.db_path == model_inventory.get_model_inventory_db_path(models)
+        assert not any(path.name.endswith(".sqlite3") for path in models.iterdir())
+
+        (models / "loras" / "nested" / "style.pt").unlink()
+        (models / "loras" / "new.pt").write_bytes(b"new")
+        assert inventory.is_up_to_date("checkpoints") is True
+        assert inventory.is_up_to_date("loras") is False
+        changes = inventory.refresh()
+        assert (changes.added, changes.removed, changes.scanned_dirs) == (1, 1, 2)
+        assert [entry["relpath"] for entry in inventory.list_models("loras")] == ["loras/new.pt"]
+        assert [entry["name"] for entry in inventory.search("ALPHA")] == ["alpha.safetensors"]
+        assert inventory.search("alpha", model_type="loras") == []
+        assert [entry["name"] for entry in inventory.find_by_name("NEW")] == ["new.pt"]
+        assert inventory.find_by_name("alpha", model_type="loras") == []
+
+    # 重新打开索引时直接使用已保存的记录
+    with model_inventory.ModelInventory(models) as inventory:
+        assert inventory.refresh().scanned_dirs == 0
+        assert len(inventory.list_models()) == 2
+
+
+def test_model_inventory_finds_duplicates_and_ignores_hardlinks(tmp_path):
+    from sd_webui_all_in_one.model_downloader.model_inventory import ModelInventory
+
+    models = tmp_path / "models"
+    (models / "a").mkdir(parents=True)
+    (models / "b").mkdir()
+    (models / "a" / "one.ckpt").write_bytes(b"same-weights")
+    (models / "b" / "two.ckpt").write_bytes(b"same-weights")
+    (models / "b" / "other.ckpt").write_bytes(b"diff-weights")
+    os.link(models / "a" / "one.ckpt", models / "a" / "linked.ckpt")
+
+    with ModelInventory(models) as inventory:
+        inventory.refresh()
+        groups = inventory.find_duplicates()
+        assert [sorted(entry["relpath"] for entry in group) for group in groups] == [["a/linked.ckpt", "a/one.ckpt", "b/two.ckpt"]]
+        assert groups[0][0]["sha256"] == hashlib.sha256(b"same-weights").hexdigest()
+        assert inventory.find_duplicates(model_type="b") == []
+
+        (models / "b" / "two.ckpt").unlink()
+        inventory.forget([models / "b" / "two.ckpt"])
+        assert inventory.find_duplicates() == []
+
+
+def test_model_inventory_refresh_dir_only_reads_one_directory(tmp_path):
+    from sd_webui_all_in_one.model_downloader.model_inventory import ModelInventory
+
+    models = tmp_path / "models"
+    (models / "a").mkdir(parents=True)
+    (models / "b").mkdir()
+    (models / "a" / "one.ckpt").write_bytes(b"one")
+
+    with ModelInventory(models) as inventory:
+        # 索引为空时执行完整刷新
+        assert inventory.refresh_dir(models / "a").added == 1
+        assert inventory.get(models / "a" / "one.ckpt")["relpath"] == "a/one.ckpt"
+        assert inventory.get(tmp_path / "outside.ckpt") is None
+
+        (models / "a" / "two.ckpt").write_bytes(b"two")
+        (models / "a" / "sub").mkdir()
+        (models / "a" / "sub" / "three.ckpt").write_bytes(b"three")
+        (models / "b" / "four.ckpt").write_bytes(b"four")
+        changes = inventory.refresh_dir(models / "a")
+        assert (changes.added, changes.scanned_dirs) == (1, 1)
+        assert inventory.get(models / "a" / "two.ckpt") is not None
+        assert inventory.get(models / "b" / "four.ckpt") is None
+
+        # refresh_dir 登记的新子目录会在下次完整刷新时读取
+        inventory.refresh()
+        assert inventory.get(models / "a" / "sub" / "three.ckpt") is not None
+        assert inventory.get(models / "b" / "four.ckpt") is not None
+
+
+def test_model_search_index_matches_linear_search_on_library():
+    from sd_webui_all_in_one.model_downloader.model_search import get_model_search_index
+
+    models = model_utils.export_model_list("comfyui")
+    index = get_model_search_index(models)
+    assert get_model_search_index(model_utils.export_model_list("comfyui")) is index
+
+    for query in ["flux", "fl", "sdxl vae", "check point", "sd 1.5", "models/loras", "controlnet canny", "-", "not-a-model-at-all"]:
+        expected = {i for i, model in enumerate(models) if model_utils.model_matches_search_query(model, query)}
+        assert set(index.search(query, fuzzy=False)) == expected, query
+
+
+def test_model_search_index_ranks_and_fuzzy_matches():
+    from sd_webui_all_in_one.model_downloader.model_search import ModelSearchIndex
+
+    models = MODEL_FIXTURES + [
+        {
+            "name": "alphabet-soup",
+            "filename": "alphabet-soup.safetensors",
+            "url": {},
+            "dtype": "lora",
+            "supported_webui": ["comfyui"],
+            "save_dir": {"comfyui": "models/loras"},
+        },
+    ]
+    index = ModelSearchIndex(models)
+
+    # 完整匹配词的模型排在只匹配词前缀的模型前面
+    assert index.search("alpha") == [0, 2]
+    assert index.search("alph") == [0, 2]
+    assert index.search("alpha", limit=1) == [0]
+    assert index.search("bta", fuzzy=False) == []
+    assert index.search("alpah") == [0]
+    assert index.search("") == []
+
+
+def test_model_catalog_lookup_tables_match_linear_filters():
+    from sd_webui_all_in_one.model_downloader import model_data
+
+    catalog = model_data.get_model_catalog()
+    assert model_data.get_model_catalog() is catalog
+    assert model_data.MODEL_DOWNLOAD_DICT is catalog.cards
+    assert len(catalog) == len(catalog.cards) > 0
+
+    for webui in ("sd_webui", "comfyui"):
+        assert [catalog.cards[i] for i in catalog.by_webui[webui]] == [m for m in catalog.cards if webui in m["supported_webui"]]
+    first = catalog.records[0]
+    assert first.name == catalog.cards[0]["name"]
+    assert catalog.select(name=first.name, webui=first.supported_webui[0])[0] is first
+    assert catalog.select(name=first.name, webui="missing") == []
+    assert [r.index for r in catalog.select(dtype=first.dtype)] == [i for i, m in enumerate(catalog.cards) if m["dtype"] == first.dtype]
+    with pytest.raises(AttributeError):
+        first.extra = "changed"
+    with pytest.raises(TypeError):
+        first.url["huggingface"] = "changed"
+
+    fixture_catalog = ModelCatalog(MODEL_FIXTURES)
+    assert [r.name for r in fixture_catalog.select(webui="sd_webui", dtype="checkpoint")] == ["alpha", "beta"]
+    assert [r.name for r in fixture_catalog.select(filename="beta.safetensors")] == ["beta"]
+    assert len(fixture_catalog.select()) == 2
+
+
+def test_model_data_is_loaded_on_first_access():
+    import subprocess
+
+    code = (
+        "import sys\n"
+        "from sd_webui_all_in_one.model_downloader import model_data\n"
+        "assert model_data.get_model_catalog.cache_info().currsize == 0\n"
+        "from sd_webui_all_in_one.model_downloader import MODEL_DOWNLOAD_DICT\n"
+        "assert model_data.get_model_catalog.cache_info().currsize == 1\n"
+        "assert MODEL_DOWNLOAD_DICT is model_data.MODEL_DOWNLOAD_DICT\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parents[1])
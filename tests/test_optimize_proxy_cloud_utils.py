@@ -146,6 +146,106 @@ def test_proxy_connectivity_uses_tcp_socket(monkeypatch):
     assert proxy.test_proxy_connectivity("socks://127.0.0.1:1080") is False
 
 
+def test_is_owned_by_current_user(monkeypatch, tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{}", encoding="utf-8")
+    st = path.stat()
+
+    assert utils.is_owned_by_current_user(st) is True
+    if hasattr(os, "getuid"):
+        monkeypatch.setattr(utils.os, "getuid", lambda: st.st_uid + 1)
+        assert utils.is_owned_by_current_user(st) is False
+    monkeypatch.delattr(utils.os, "getuid", raising=False)
+    assert utils.is_owned_by_current_user(st) is True
+
+
+def test_probe_system_proxy_caches_result_with_ttl(monkeypatch, tmp_path):
+    from sd_webui_all_in_one import bootstrap
+
+    calls = []
+    monkeypatch.setattr(proxy, "get_system_proxy_address", lambda: calls.append("detect") or "http://127.0.0.1:7890")
+    monkeypatch.setattr(proxy, "test_proxy_connectivity", lambda address: calls.append(address) or True)
+    cache_path = tmp_path / "proxy-cache.json"
+
+    first = bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60)
+    second = bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60)
+    assert (first.address, first.reachable, first.cached) == ("http://127.0.0.1:7890", True, False)
+    assert (second.address, second.reachable, second.cached) == ("http://127.0.0.1:7890", True, True)
+    assert calls == ["detect", "http://127.0.0.1:7890"]
+
+    # 过期或损坏的缓存会重新检测
+    monkeypatch.setattr(bootstrap.time, "time", lambda: first.checked_at + 120)
+    assert bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60).cached is False
+    cache_path.write_text("{broken", encoding="utf-8")
+    assert bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60).cached is False
+    assert len(calls) == 6
+
+    assert bootstrap.probe_system_proxy(cache_path=tmp_path / "unused.json", ttl=0).cached is False
+    assert not (tmp_path / "unused.json").exists()
+
+
+def test_probe_system_proxy_ignores_cache_owned_by_other_user(monkeypatch, tmp_path):
+    from sd_webui_all_in_one import bootstrap
+
+    monkeypatch.setattr(proxy, "get_system_proxy_address", lambda: None)
+    cache_path = tmp_path / "proxy-cache.json"
+    bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60)
+    cache_path.write_text(cache_path.read_text(encoding="utf-8").replace("null", '"http://attacker:8080"').replace("false", "true"), encoding="utf-8")
+    assert bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60).address == "http://attacker:8080"
+
+    monkeypatch.setattr(utils, "is_owned_by_current_user", lambda _st: False)
+    result = bootstrap.probe_system_proxy(cache_path=cache_path, ttl=60)
+    assert (result.address, result.reachable, result.cached) == (None, False, False)
+
+
+def test_environment_bootstrap_runs_once_and_applies_proxy(monkeypatch, tmp_path):
+    from sd_webui_all_in_one import bootstrap
+
+    probes = []
+
+    def fake_probe():
+        probes.append("probe")
+        return bootstrap.ProxyProbeResult(address="http://127.0.0.1:7890", reachable=True, checked_at=0.0)
+
+    # 记录测试中会被修改的环境变量, 测试结束后恢复
+    cache_env_keys = ["CACHE_HOME", "HF_HOME", "MATPLOTLIBRC", "MODELSCOPE_CACHE", "MS_CACHE_HOME", "SYCL_CACHE_DIR", "TORCH_HOME", "U2NET_HOME", "XDG_CACHE_HOME", "PIP_CACHE_DIR", "PYTHONPYCACHEPREFIX", "TORCHINDUCTOR_CACHE_DIR", "TRITON_CACHE_DIR", "UV_CACHE_DIR"]
+    for key in ["NO_PROXY", "HTTP_PROXY", "HTTPS_PROXY", *cache_env_keys, *(k for k, _ in bootstrap.DEFAULT_ENV_VARS)]:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(bootstrap, "probe_system_proxy", fake_probe)
+    monkeypatch.setattr(bootstrap, "SD_WEBUI_ALL_IN_ONE_LAUNCH_PATH", tmp_path)
+    monkeypatch.setattr(bootstrap, "SD_WEBUI_ALL_IN_ONE_PROXY", True)
+    monkeypatch.setattr(bootstrap, "SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH", True)
+    monkeypatch.setattr(bootstrap, "SD_WEBUI_ALL_IN_ONE_SET_CONFIG", True)
+    monkeypatch.setattr(bootstrap, "_bootstrap", None)
+
+    started = bootstrap.start_environment_bootstrap()
+    assert bootstrap.start_environment_bootstrap() is started
+    assert os.environ["NO_PROXY"] == "localhost,127.0.0.1,::1"
+    assert os.environ["HF_HOME"] == (tmp_path / "cache" / "huggingface").as_posix()
+    assert os.environ["PIP_YES"] == "1"
+
+    result = bootstrap.bootstrap_environment()
+    assert result is started.proxy_result
+    assert os.environ["HTTP_PROXY"] == "http://127.0.0.1:7890"
+    assert probes == ["probe"]
+
+
+def test_importing_package_has_no_side_effects():
+    code = (
+        "import os, sys\n"
+        "import sd_webui_all_in_one\n"
+        "from sd_webui_all_in_one import config, utils, file_manager\n"
+        "from sd_webui_all_in_one.model_downloader import model_utils\n"
+        "assert 'NO_PROXY' not in os.environ\n"
+        "assert 'HF_HOME' not in os.environ\n"
+        "assert 'HTTP_PROXY' not in os.environ\n"
+        "assert 'sd_webui_all_in_one.bootstrap' not in sys.modules\n"
+    )
+    env = {key: value for key, value in os.environ.items() if key not in ("NO_PROXY", "HF_HOME", "HTTP_PROXY", "HTTPS_PROXY")}
+    env.update(SD_WEBUI_ALL_IN_ONE_PROXY="1", SD_WEBUI_ALL_IN_ONE_SET_CACHE_PATH="1", SD_WEBUI_ALL_IN_ONE_SET_CONFIG="1")
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, cwd=Path(__file__).resolve().parents[1])
+
+
 def test_colab_and_kaggle_helpers_with_fake_modules(monkeypatch, tmp_path):
     monkeypatch.setattr(colab_tools, "Path", lambda _path: types.SimpleNamespace(exists=lambda: True))
     assert colab_tools.is_colab_environment() is True
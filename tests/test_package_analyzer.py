@@ -6,7 +6,11 @@
 
 import pytest
 
-from sd_webui_all_in_one.package_analyzer.py_ver_cmp import PyWhlVersionComparison
+from sd_webui_all_in_one.package_analyzer.py_ver_cmp import (
+    PyWhlVersionComparison,
+    parse_pywhl_version,
+    version_sort_key,
+)
 from sd_webui_all_in_one.package_analyzer.py_whl_parse import (
     RequirementParser,
     get_parse_bindings,
@@ -220,6 +224,62 @@ class TestPEP440VersionOrdering:
             assert result < 0, f"{versions[i]} should be < {versions[i + 1]}"
 
 
+class TestParsedVersionCache:
+    def test_same_string_returns_same_object(self):
+        assert parse_pywhl_version("2.3.0+cu118") is parse_pywhl_version("2.3.0+cu118")
+
+    def test_sort_key_matches_comparison(self):
+        versions = ["1.0", "1.0.0", "1.0+local1", "1.0+1", "1.0+abc", "1.0rc1", "1.0.post1", "1!0.1"]
+        cmp = PyWhlVersionComparison("1.0")
+        for left in versions:
+            for right in versions:
+                key_cmp = (parse_pywhl_version(left) > parse_pywhl_version(right)) - (parse_pywhl_version(left) < parse_pywhl_version(right))
+                expected = cmp.compare_version_objects(cmp.parse_version(left), cmp.parse_version(right))
+                assert key_cmp == (expected > 0) - (expected < 0), f"{left} <=> {right}"
+
+    def test_public_key_ignores_local(self):
+        assert parse_pywhl_version("2.1.0+cu121").public_key == parse_pywhl_version("2.1").public_key
+        assert parse_pywhl_version("2.1.0+cu121") > parse_pywhl_version("2.1")
+
+    def test_invalid_version_raises(self):
+        with pytest.raises(ValueError):
+            parse_pywhl_version("not a version")
+
+    def test_compare_versions_returns_sign_and_reuses_parsed_versions(self):
+        cmp = PyWhlVersionComparison("0")
+        assert cmp.compare_versions("1.10", "1.9") == 1
+        assert cmp.compare_versions("1.0", "1.0.0") == 0
+        assert cmp.compare_versions("1.0a1", "1.0") == -1
+
+        cmp.compare_versions("3.4.5rc1", "3.4.5")
+        misses = parse_pywhl_version.cache_info().misses
+        for _ in range(10):
+            assert cmp.compare_versions("3.4.5rc1", "3.4.5") == -1
+        assert parse_pywhl_version.cache_info().misses == misses
+
+    def test_version_sort_key_orders_shuffled_pep440_versions(self):
+        expected = [
+            "0.9",
+            "1.0.dev456",
+            "1.0a1",
+            "1.0a12",
+            "1.0b2.post345",
+            "1.0rc1",
+            "1.0",
+            "1.0+local1",
+            "1.0.post456",
+            "1.1.dev1",
+            "1.10",
+            "1!0.1",
+        ]
+        shuffled = list(reversed(expected[::2])) + expected[1::2]
+        assert sorted(shuffled, key=version_sort_key) == expected
+
+    def test_version_sort_key_puts_invalid_versions_first(self):
+        versions = ["1.0.post1", "junk", "1.0", "0.9", "1.0rc1"]
+        assert sorted(versions, key=version_sort_key) == ["junk", "0.9", "1.0rc1", "1.0", "1.0.post1"]
+
+
 # ============================================================================
 # PEP 440: == 操作符测试
 # ============================================================================
@@ -390,6 +450,13 @@ class TestPEP440ExclusiveComparison:
         assert cmp.exclusive_lt("1.7a1", "1.7rc1") is True
         assert cmp.exclusive_lt("1.7b1", "1.7rc1") is True
 
+    def test_lt_post_release_spec(self):
+        cmp = PyWhlVersionComparison("1.0")
+        assert cmp.exclusive_lt("1.7.post1.dev2", "1.7.post1") is False
+        assert cmp.exclusive_lt("1.7.post0.dev1", "1.7.post1") is True
+        assert cmp.exclusive_lt("1.7a1", "1.7.post1") is True
+        assert cmp.exclusive_lt("1.7", "1.7.post1") is True
+
 
 # ============================================================================
 # PEP 440: === 操作符测试
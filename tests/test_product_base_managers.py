@@ -5,6 +5,7 @@ from typing import Any, cast
 import pytest
 
 from sd_webui_all_in_one.custom_exceptions import AggregateError
+from sd_webui_all_in_one.base_manager import base as base_module
 from sd_webui_all_in_one.base_manager import comfyui_base
 from sd_webui_all_in_one.base_manager import fooocus_base
 from sd_webui_all_in_one.base_manager import invokeai_base
@@ -12,6 +13,12 @@ from sd_webui_all_in_one.base_manager import qwen_tts_webui_base
 from sd_webui_all_in_one.base_manager import sd_webui_base
 from sd_webui_all_in_one.base_manager.repository_inspector import RepositoryState
 from sd_webui_all_in_one.base_manager.version_manager import ManagedExtension
+from sd_webui_all_in_one.model_downloader import model_inventory
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_inventory(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_inventory, "SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH", tmp_path / "model-inventory")
 
 
 def _fake_repository_state(path: Path) -> RepositoryState:
@@ -504,6 +511,7 @@ def test_sd_webui_extension_lifecycle_and_model_uninstall(monkeypatch, tmp_path)
 
     removed = []
     monkeypatch.setattr(sd_webui_base, "remove_files", lambda path: removed.append(path))
+    monkeypatch.setattr(base_module, "remove_files", lambda path: removed.append(path))
     sd_webui_base.uninstall_sd_webui_extension(tmp_path, "enabled")
     sd_webui_base.uninstall_sd_webui_model(tmp_path, "demo", model_type="Stable-diffusion")
     assert removed == [extensions / "enabled", models / "demo.safetensors"]
@@ -6,6 +6,13 @@ from sd_webui_all_in_one.custom_exceptions import AggregateError
 from sd_webui_all_in_one.base_manager import fooocus_base
 from sd_webui_all_in_one.base_manager import sd_scripts_base
 from sd_webui_all_in_one.base_manager import sd_trainer_base
+from sd_webui_all_in_one.base_manager import base as base_module
+from sd_webui_all_in_one.model_downloader import model_inventory
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_inventory(monkeypatch, tmp_path):
+    monkeypatch.setattr(model_inventory, "SD_WEBUI_ALL_IN_ONE_MODEL_INVENTORY_PATH", tmp_path / "model-inventory")
 
 
 def test_sd_trainer_next_branch_metadata():
@@ -198,8 +205,11 @@ def test_product_model_install_and_uninstall_helpers(monkeypatch, tmp_path, modu
 
     monkeypatch.setattr(module, "install_webui_model_from_library", lambda **kwargs: calls.append(("library", kwargs)))
     monkeypatch.setattr(module, "download_file", lambda **kwargs: calls.append(("download", kwargs)))
-    monkeypatch.setattr(module, "get_file_list", lambda path: calls.append(("list", path)) or [model_file])
-    monkeypatch.setattr(module, "remove_files", lambda path: calls.append(("remove", path)))
+    other_file = tmp_path / model_root / "loras" / "demo-lora.safetensors"
+    other_file.parent.mkdir(parents=True)
+    other_file.write_text("lora", encoding="utf-8")
+    config_file = model_file.with_suffix(".yaml")
+    config_file.write_text("config", encoding="utf-8")
 
     getattr(module, library_func)(tmp_path, model_name="demo", downloader="urllib")
     getattr(module, url_func)(tmp_path, "https://example.test/model.safetensors", "checkpoints", downloader="requests")
@@ -219,9 +229,73 @@ def test_product_model_install_and_uninstall_helpers(monkeypatch, tmp_path, modu
         },
     )
     assert calls[1] == ("download", {"url": "https://example.test/model.safetensors", "path": tmp_path / model_root / "checkpoints", "tool": "requests"})
-    assert calls[2] == ("list", tmp_path / model_root / "checkpoints")
-    assert calls[3] == ("remove", model_file)
+    assert not model_file.exists()
+    assert not config_file.exists()
+    assert other_file.exists()
 
-    monkeypatch.setattr(module, "get_file_list", lambda _path: [])
     with pytest.raises(FileNotFoundError):
         getattr(module, uninstall_func)(tmp_path, "missing", model_type="checkpoints")
+
+
+def test_uninstall_webui_model_only_matches_file_names(monkeypatch, tmp_path):
+    models = tmp_path / "models"
+    (models / "checkpoints").mkdir(parents=True)
+    renamed = models / "checkpoints" / "renamed.safetensors"
+    renamed.write_text("model", encoding="utf-8")
+    with base_module.ModelInventory(models) as inventory:
+        inventory.refresh()
+    monkeypatch.setattr(base_module.ModelInventory, "search", lambda *_args, **_kwargs: pytest.fail("uninstall should not search the model library names"))
+
+    with pytest.raises(FileNotFoundError):
+        base_module.uninstall_webui_model(models, "model")
+
+    assert renamed.exists()
+    assert model_inventory.get_model_inventory_db_path(models).exists()
+    assert not any(path.suffix == ".sqlite3" for path in models.rglob("*"))
+
+
+def test_uninstall_webui_model_queries_up_to_date_inventory(monkeypatch, tmp_path):
+    models = tmp_path / "models"
+    (models / "loras" / "nested").mkdir(parents=True)
+    model = models / "loras" / "nested" / "Demo-Style.safetensors"
+    model.write_text("model", encoding="utf-8")
+    config = models / "loras" / "nested" / "demo-style.yaml"
+    config.write_text("config", encoding="utf-8")
+    other = models / "loras" / "other.safetensors"
+    other.write_text("other", encoding="utf-8")
+    with base_module.ModelInventory(models) as inventory:
+        inventory.refresh()
+
+    def fail_walk(*_args, **_kwargs):
+        pytest.fail("uninstall should query the up-to-date model inventory")
+
+    monkeypatch.setattr(base_module, "get_file_list", fail_walk)
+    base_module.uninstall_webui_model(models, "demo-style", model_type="loras")
+
+    assert not model.exists()
+    assert not config.exists()
+    assert other.exists()
+    with base_module.ModelInventory(models) as inventory:
+        assert inventory.get(model) is None
+
+
+def test_uninstall_webui_model_walks_directory_when_inventory_is_stale(monkeypatch, tmp_path):
+    models = tmp_path / "models"
+    (models / "checkpoints").mkdir(parents=True)
+    with base_module.ModelInventory(models) as inventory:
+        inventory.refresh()
+    # 索引刷新后新增的文件只能通过遍历目录找到
+    added = models / "checkpoints" / "added.ckpt"
+    added.write_text("model", encoding="utf-8")
+    walked = []
+    get_file_list = base_module.get_file_list
+
+    def recording_walk(path, *args, **kwargs):
+        walked.append(path)
+        return get_file_list(path, *args, **kwargs)
+
+    monkeypatch.setattr(base_module, "get_file_list", recording_walk)
+    base_module.uninstall_webui_model(models, "added")
+
+    assert walked == [models]
+    assert not added.exists()
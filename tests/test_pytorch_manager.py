@@ -6,6 +6,7 @@ import pytest
 from sd_webui_all_in_one.pytorch_manager import gpu_detector
 from sd_webui_all_in_one.pytorch_manager import mirror_selector
 from sd_webui_all_in_one.pytorch_manager import version_manager as torch_versions
+from sd_webui_all_in_one.pytorch_manager.version_data import PyTorchVersionCatalog
 
 
 def _gpu(name, vendor):
@@ -284,7 +285,8 @@ def test_get_pytorch_mirror_and_query_library(monkeypatch):
         {"name": "Torch CPU", "dtype": "cpu", "platform": ["linux"], "torch_ver": "torch==2.0.0"},
         {"name": "Torch CUDA", "dtype": "cu128", "platform": ["linux"], "torch_ver": "torch==2.8.0"},
     ]
-    monkeypatch.setattr(torch_versions, "PYTORCH_DOWNLOAD_DICT", data)
+    catalog = PyTorchVersionCatalog(data)
+    monkeypatch.setattr(torch_versions, "get_pytorch_version_catalog", lambda: catalog)
 
     cpu_info = torch_versions.query_pytorch_info_from_library(pytorch_name="Torch CPU")
     cuda_info = torch_versions.query_pytorch_info_from_library(pytorch_index=2)
@@ -2,6 +2,7 @@ import pytest
 
 from sd_webui_all_in_one.pytorch_manager import mirror_selector
 from sd_webui_all_in_one.pytorch_manager import version_manager
+from sd_webui_all_in_one.pytorch_manager.version_data import PyTorchVersionCatalog
 
 
 @pytest.mark.parametrize(
@@ -112,7 +113,8 @@ def test_export_and_find_latest_pytorch_info(monkeypatch):
         {"name": "CUDA win", "dtype": "cu128", "platform": ["win32"], "torch_ver": "torch==2.0.0"},
         {"name": "CUDA linux", "dtype": "cu128", "platform": ["linux"], "torch_ver": "torch==2.7.0"},
     ]
-    monkeypatch.setattr(version_manager, "PYTORCH_DOWNLOAD_DICT", data)
+    catalog = PyTorchVersionCatalog(data)
+    monkeypatch.setattr(version_manager, "get_pytorch_version_catalog", lambda: catalog)
     monkeypatch.setattr(version_manager.sys, "platform", "linux")
     monkeypatch.setattr(version_manager, "get_avaliable_pytorch_device_type", lambda: ["cu128"])
     monkeypatch.setattr(version_manager, "SD_WEBUI_ALL_IN_ONE_SKIP_TORCH_DEVICE_COMPATIBILITY", False)
@@ -176,7 +178,8 @@ def test_find_latest_pytorch_info_parses_pep440_torch_versions(monkeypatch, dtyp
             "torch_ver": "torch==2.12.0+cu132 torchvision==0.27.0+cu132",
         },
     ]
-    monkeypatch.setattr(version_manager, "PYTORCH_DOWNLOAD_DICT", data)
+    catalog = PyTorchVersionCatalog(data)
+    monkeypatch.setattr(version_manager, "get_pytorch_version_catalog", lambda: catalog)
     monkeypatch.setattr(version_manager.sys, "platform", "linux")
     monkeypatch.setattr(version_manager, "get_avaliable_pytorch_device_type", lambda: [dtype])
     monkeypatch.setattr(version_manager, "SD_WEBUI_ALL_IN_ONE_SKIP_TORCH_DEVICE_COMPATIBILITY", False)
@@ -189,7 +192,8 @@ def test_query_pytorch_info_index_boundaries(monkeypatch):
         {"name": "one", "dtype": "cpu", "platform": ["linux"], "torch_ver": "torch==1.0.0"},
         {"name": "two", "dtype": "cpu", "platform": ["linux"], "torch_ver": "torch==2.0.0"},
     ]
-    monkeypatch.setattr(version_manager, "PYTORCH_DOWNLOAD_DICT", data)
+    catalog = PyTorchVersionCatalog(data)
+    monkeypatch.setattr(version_manager, "get_pytorch_version_catalog", lambda: catalog)
 
     first = version_manager.query_pytorch_info_from_library(pytorch_index=1)
     second = version_manager.query_pytorch_info_from_library(pytorch_name="two")
@@ -203,3 +207,18 @@ def test_query_pytorch_info_index_boundaries(monkeypatch):
         version_manager.query_pytorch_info_from_library(pytorch_index=3)
     with pytest.raises(FileNotFoundError):
         version_manager.query_pytorch_info_from_library(pytorch_name="missing")
+
+
+def test_pytorch_version_catalog_is_lazy_and_indexed():
+    from sd_webui_all_in_one.pytorch_manager import version_data
+
+    catalog = version_data.get_pytorch_version_catalog()
+    assert version_data.get_pytorch_version_catalog() is catalog
+    assert version_data.PYTORCH_DOWNLOAD_DICT is catalog.versions
+    assert len(catalog) == len(catalog.versions) > 0
+    for dtype, indices in catalog.by_dtype.items():
+        assert list(indices) == [i for i, info in enumerate(catalog.versions) if info["dtype"] == dtype]
+    record = catalog.records[catalog.by_name["Torch"][0]]
+    assert record.dtype == "all"
+    assert "linux" in record.platform
+    assert record.index in catalog.by_platform["linux"]
@@ -0,0 +1,134 @@
+import hashlib
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmarks.range_server import RangeServer, RangeServerOptions, content_chunk, content_sha256
+from sd_webui_all_in_one.downloader import asyncio_downloader
+from sd_webui_all_in_one.downloader import requests_downloader
+
+
+@pytest.fixture(autouse=True)
+def _no_proxy(monkeypatch):
+    for name in ("http_proxy", "https_proxy", "all_proxy", "HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def _request(url, method="GET", headers=None):
+    request = urllib.request.Request(url, method=method, headers=headers or {})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.status, dict(response.headers), response.read()
+
+
+def _expected_content(size):
+    return b"".join(content_chunk(offset, min(65536, size - offset)) for offset in range(0, size, 65536))
+
+
+def test_range_server_serves_deterministic_ranges():
+    size = 200_000
+    expected = _expected_content(size)
+    assert hashlib.sha256(expected).hexdigest() == content_sha256(size)
+
+    with RangeServer() as server:
+        status, headers, body = _request(server.url(size), method="HEAD")
+        assert status == 200
+        assert headers["Content-Length"] == str(size)
+        assert headers["Accept-Ranges"] == "bytes"
+        assert body == b""
+
+        status, headers, body = _request(server.url(size), headers={"Range": "bytes=1000-70999"})
+        assert status == 206
+        assert headers["Content-Range"] == f"bytes 1000-70999/{size}"
+        assert body == expected[1000:71000]
+
+        status, _, body = _request(server.url(size), headers={"Range": "bytes=-10"})
+        assert status == 206
+        assert body == expected[-10:]
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _request(server.url(size), headers={"Range": f"bytes={size}-"})
+        assert exc_info.value.code == 416
+
+
+def test_range_server_simulates_missing_range_support_errors_and_filename():
+    options = RangeServerOptions(range_support=False, fail_every=2, content_disposition="模型 v1.safetensors")
+    with RangeServer(options) as server:
+        status, headers, body = _request(server.url(1024), headers={"Range": "bytes=0-9"})
+        assert status == 200
+        assert body == _expected_content(1024)
+        assert "Accept-Ranges" not in headers
+        assert headers["Content-Disposition"] == "attachment; filename*=UTF-8''%E6%A8%A1%E5%9E%8B%20v1.safetensors"
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _request(server.url(1024))
+        assert exc_info.value.code == 503
+
+
+def test_range_download_continues_pieces_after_dropped_connections(tmp_path):
+    size = 3 * 1024 * 1024 + 321
+    with RangeServer(RangeServerOptions(drop_after=700 * 1024)) as server:
+        result = asyncio_downloader.download_file_from_url_asyncio(
+            server.url(size, "model.bin"),
+            save_path=tmp_path,
+            progress=False,
+            split=3,
+            min_split_size=1024 * 1024,
+            max_tries=5,
+        )
+
+    # 每个连接都在分片中途断开, 重试从断开的位置继续, 拼接后的内容与服务器一致
+    assert result.read_bytes() == _expected_content(size)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["model.bin"]
+
+
+def test_range_download_falls_back_to_single_stream_without_range_support(tmp_path):
+    size = 2 * 1024 * 1024 + 7
+    with RangeServer(RangeServerOptions(range_support=False)) as server:
+        result = asyncio_downloader.download_file_from_url_asyncio(
+            server.url(size, "model.bin"),
+            save_path=tmp_path,
+            progress=False,
+            split=4,
+            min_split_size=1024 * 1024,
+        )
+
+    assert result.read_bytes() == _expected_content(size)
+
+
+def test_range_download_resume_only_fetches_missing_pieces(tmp_path):
+    size = 6 * 1024 * 1024 + 99
+    dropped_at = 3 * 1024 * 1024 + 1000
+    with RangeServer(RangeServerOptions(drop_after=dropped_at)) as server:
+        with pytest.raises(IOError):
+            asyncio_downloader.download_file_from_url_asyncio(
+                server.url(size, "model.bin"),
+                save_path=tmp_path,
+                progress=False,
+                split=1,
+                max_tries=1,
+            )
+
+    completed, _, _ = requests_downloader._read_resume_state(
+        tmp_path / "model.bin.tmp.state",
+        remote_info=requests_downloader._RemoteFileInfo(total_size=size, supports_range=True, etag=f'"{size}"', last_modified="Wed, 27 May 2026 00:00:00 GMT"),
+        piece_length=requests_downloader.DEFAULT_PIECE_LENGTH,
+        allow_piece_length_change=False,
+    )
+    completed_size = sum(completed) * requests_downloader.DEFAULT_PIECE_LENGTH
+    assert 0 < completed_size < size
+
+    reported = []
+    with RangeServer() as server:
+        result = asyncio_downloader.download_file_from_url_asyncio(
+            server.url(size, "model.bin"),
+            save_path=tmp_path,
+            progress=False,
+            split=1,
+            progress_callback=reported.append,
+        )
+
+    # 已完成的分片和中断分片中已写入的数据都不会重新下载, 续传后的内容与完整下载一致
+    assert sum(reported) == size - dropped_at
+    assert result.read_bytes() == _expected_content(size)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["model.bin"]
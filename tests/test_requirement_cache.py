@@ -0,0 +1,120 @@
+import json
+
+from sd_webui_all_in_one import utils
+from sd_webui_all_in_one.package_analyzer import requirement_cache
+from sd_webui_all_in_one.package_analyzer.requirement_cache import (
+    RequirementFileCache,
+    parse_requirement_file,
+)
+from sd_webui_all_in_one.package_analyzer.requirement_normalizer import parse_requirement_list
+from sd_webui_all_in_one.package_analyzer.requirement_parser import read_packages_from_requirements_file
+
+
+def _count_parses(monkeypatch):
+    parsed = []
+    original = requirement_cache.parse_requirement_list
+
+    def _parse(lines):
+        parsed.append(len(lines))
+        return original(lines)
+
+    monkeypatch.setattr(requirement_cache, "parse_requirement_list", _parse)
+    return parsed
+
+
+def test_parse_requirement_file_matches_uncached_pipeline(tmp_path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("torch==2.3.0  # comment\nNUMPY\nprotobuf<5,>=4.25.3\n--extra-index-url https://example.com\n-r base.txt\n", encoding="utf-8")
+
+    entry = parse_requirement_file(req)
+
+    assert list(entry.requires) == parse_requirement_list(read_packages_from_requirements_file(req))
+    assert entry.includes == (str(tmp_path / "base.txt"),)
+    assert parse_requirement_file(tmp_path / "missing.txt") is None
+
+
+def test_get_requirements_expands_includes_and_applies_constraints(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "requirements.txt").write_text("demo>=1.0\n-r common/base.txt\n--constraint=constraints.txt\n", encoding="utf-8")
+    (tmp_path / "common" / "base.txt").write_text("numpy\n-r ../requirements.txt\n", encoding="utf-8")
+    (tmp_path / "constraints.txt").write_text("numpy<2\nunused==1.0\n", encoding="utf-8")
+
+    cache = RequirementFileCache()
+
+    assert cache.get_requirements(tmp_path / "requirements.txt") == ["demo>=1.0", "numpy", "numpy<2"]
+
+
+def test_get_requirements_only_reparses_changed_files(monkeypatch, tmp_path):
+    parsed = _count_parses(monkeypatch)
+    (tmp_path / "requirements.txt").write_text("demo>=1.0\n-r base.txt\n", encoding="utf-8")
+    (tmp_path / "base.txt").write_text("numpy\n", encoding="utf-8")
+    cache = RequirementFileCache()
+
+    assert cache.get_requirements(tmp_path / "requirements.txt") == ["demo>=1.0", "numpy"]
+    assert cache.get_requirements(tmp_path / "requirements.txt") == ["demo>=1.0", "numpy"]
+    assert len(parsed) == 2
+
+    (tmp_path / "base.txt").write_text("numpy>=1.26\n", encoding="utf-8")
+    assert cache.get_requirements(tmp_path / "requirements.txt") == ["demo>=1.0", "numpy>=1.26"]
+    assert len(parsed) == 3
+
+
+def test_cache_file_is_reused_by_new_instances(monkeypatch, tmp_path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("demo>=1.0\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "requirements.json"
+
+    cache = RequirementFileCache(cache_path)
+    assert cache.get_requirements(req) == ["demo>=1.0"]
+    cache.save()
+    assert cache_path.exists()
+
+    parsed = _count_parses(monkeypatch)
+    assert RequirementFileCache(cache_path).get_requirements(req) == ["demo>=1.0"]
+    assert parsed == []
+
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    data["environment"]["python_version"] = "0.0"
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+    assert RequirementFileCache(cache_path).get_requirements(req) == ["demo>=1.0"]
+    assert parsed == [1]
+
+
+def test_cache_file_owned_by_other_user_is_ignored(monkeypatch, tmp_path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("demo>=1.0\n", encoding="utf-8")
+    cache_path = tmp_path / "requirements.json"
+    cache = RequirementFileCache(cache_path)
+    cache.get_requirements(req)
+    cache.save()
+
+    monkeypatch.setattr(utils, "is_owned_by_current_user", lambda _st: False)
+    parsed = _count_parses(monkeypatch)
+    assert RequirementFileCache(cache_path).get_requirements(req) == ["demo>=1.0"]
+    assert parsed == [1]
+
+
+def test_batched_files_match_uncached_pipeline_from_memory_and_disk(monkeypatch, tmp_path):
+    contents = [
+        "# extension\n--extra-index-url https://example.com/simple\npkg-1>=1.0\nPkg_2[extra]==2.1.0  # pinned\n",
+        "pkg-3<5,>=3.2\ngit+https://github.com/example/repo-4.git@main\n",
+        "pkg-5; python_version >= '3.8'\npkg-6~=6.4\n",
+    ]
+    paths = []
+    for index, content in enumerate(contents):
+        path = tmp_path / f"extension-{index}" / "requirements.txt"
+        path.parent.mkdir()
+        path.write_text(content, encoding="utf-8")
+        paths.append(path)
+    expected = [parse_requirement_list(read_packages_from_requirements_file(path)) for path in paths]
+    cache_path = tmp_path / "cache.json"
+
+    cache = RequirementFileCache(cache_path)
+    assert [cache.get_requirements(path) for path in paths] == expected
+    assert [cache.get_requirements(path) for path in paths] == expected
+    cache.save()
+
+    parsed = _count_parses(monkeypatch)
+    reloaded = RequirementFileCache(cache_path)
+    assert [reloaded.get_requirements(path) for path in paths] == expected
+    assert parsed == []
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from sd_webui_all_in_one.env_check.requirement_install_planner import (
+    RequirementInstallUnit,
+    build_requirement_install_unit,
+    install_with_bisection,
+    merge_install_args,
+    select_missing_requirement_lines,
+)
+
+
+def test_select_missing_requirement_lines_keeps_original_lines(tmp_path):
+    req = tmp_path / "requirements.txt"
+    req.write_text("# comment\nDemo[extra]>=1.0  # pinned\nnumpy\ntorch; python_version >= '3.8'\n", encoding="utf-8")
+
+    assert select_missing_requirement_lines(req, ["demo>=1.0", "torch"]) == ["Demo[extra]>=1.0", "torch; python_version >= '3.8'"]
+    assert select_missing_requirement_lines(req, []) is None
+    assert select_missing_requirement_lines(req, ["unknown"]) is None
+
+    req.write_text("--extra-index-url https://example.com/simple\nnumpy\n", encoding="utf-8")
+    assert select_missing_requirement_lines(req, ["numpy"]) is None
+
+    req.write_text("numpy>=1.0 --hash=sha256:abcd\nrequests\n", encoding="utf-8")
+    assert select_missing_requirement_lines(req, ["requests"]) is None
+
+
+def test_merge_install_args_dedupes_files_and_packages(tmp_path):
+    units = [
+        build_requirement_install_unit("a", tmp_path / "a" / "requirements.txt"),
+        RequirementInstallUnit("b", tmp_path / "b" / "requirements.txt", ["numpy", "torch"]),
+        RequirementInstallUnit("c", tmp_path / "c" / "requirements.txt", ["numpy"]),
+        build_requirement_install_unit("a", tmp_path / "a" / "requirements.txt"),
+    ]
+
+    assert units[0].install_args() == ["-r", (tmp_path / "a" / "requirements.txt").as_posix()]
+    assert units[1].cwd == tmp_path / "b"
+    assert merge_install_args(units) == ["-r", (tmp_path / "a" / "requirements.txt").as_posix(), "numpy", "torch"]
+
+
+def test_install_with_bisection_isolates_failing_unit():
+    units = [RequirementInstallUnit(name, Path(name) / "requirements.txt") for name in ["a", "b", "c", "d"]]
+    calls = []
+    failures = []
+
+    def install(batch):
+        names = [unit.name for unit in batch]
+        calls.append(names)
+        if "c" in names:
+            raise RuntimeError("bad")
+
+    install_with_bisection(units, install, lambda unit, e: failures.append((unit.name, str(e))))
+
+    assert calls == [["a", "b", "c", "d"], ["a", "b"], ["c", "d"], ["c"], ["d"]]
+    assert failures == [("c", "bad")]
+
+
+def test_install_with_bisection_retries_line_unit_with_whole_file():
+    unit = RequirementInstallUnit("a", Path("a") / "requirements.txt", ["numpy"])
+    calls = []
+    failures = []
+
+    def install(batch):
+        calls.append(batch[0].install_args())
+        if batch[0].packages:
+            raise RuntimeError("bad")
+
+    install_with_bisection([unit], install, lambda failed, e: failures.append(failed.name))
+
+    assert calls == [["numpy"], ["-r", (Path("a") / "requirements.txt").as_posix()]]
+    assert failures == []
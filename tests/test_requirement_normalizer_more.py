@@ -1,12 +1,20 @@
 import importlib.metadata
+import os
 
 import pytest
 
 from sd_webui_all_in_one.package_analyzer import dependency_categorizer
 from sd_webui_all_in_one.package_analyzer import installation_checker
+from sd_webui_all_in_one.package_analyzer import installed_index
+from sd_webui_all_in_one.package_analyzer import requirement_cache
 from sd_webui_all_in_one.package_analyzer.requirement_normalizer import parse_requirement_list
 
 
+@pytest.fixture(autouse=True)
+def _isolated_requirement_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(requirement_cache, "_cache", requirement_cache.RequirementFileCache(tmp_path / "requirement-cache.json"))
+
+
 def test_parse_requirement_list_handles_sources_constraints_and_skips():
     requirements = [
         "Torch==2.3.0",
@@ -54,7 +62,7 @@ def test_parse_requirement_list_extracts_repo_name_fallbacks():
 def test_dependency_categorizer_formats_and_groups_markers(monkeypatch):
     monkeypatch.setattr(
         dependency_categorizer,
-        "requires",
+        "get_installed_requires",
         lambda _name: [
             "core>=1.0",
             "gpu-extra>=2.0 ; extra == 'gpu'",
@@ -124,22 +132,10 @@ def test_metadata_dependency_validation_rejects_unknown_extra(monkeypatch):
 
 
 def test_installation_checker_package_versions_specs_and_validation(monkeypatch, tmp_path):
-    versions = {
-        "Demo_Pkg": None,
-        "demo_pkg": None,
-        "Demo-Pkg": "1.2.3",
-        "demo-pkg": "1.2.3",
-        "missing": None,
-    }
-
-    def fake_version(name):
-        value = versions.get(name)
-        if value is None:
-            raise importlib.metadata.PackageNotFoundError(name)
-        return value
-
-    monkeypatch.setattr(installation_checker.importlib.metadata, "version", fake_version)
+    index = installed_index.InstalledDistributionIndex([installed_index.InstalledDistribution("Demo-Pkg", "1.2.3")])
+    monkeypatch.setattr(installation_checker, "get_installed_distribution_index", lambda: index)
     assert installation_checker.get_package_version_from_library("Demo_Pkg") == "1.2.3"
+    assert installation_checker.get_package_version_from_library("demo.pkg") == "1.2.3"
     assert installation_checker.get_package_version_from_library("missing") is None
 
     assert installation_checker.parse_package_spec("demo>=1.0,<2.0") == ("demo", [(">=", "1.0"), ("<", "2.0")], False)
@@ -167,3 +163,92 @@ def test_installation_checker_package_versions_specs_and_validation(monkeypatch,
 
     req.write_text("ok~=1.4\nwild==2.1.*\n", encoding="utf-8")
     assert installation_checker.validate_requirements(req) is True
+
+
+def _write_dist_info(site, name, version, requires=(), extras=()):
+    dist_info = site / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir()
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    lines.extend(f"Provides-Extra: {extra}" for extra in extras)
+    lines.extend(f"Requires-Dist: {requirement}" for requirement in requires)
+    (dist_info / "METADATA").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_installed_distribution_index_reads_metadata_in_one_pass(tmp_path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _write_dist_info(first, "Demo_Pkg", "1.2.3", requires=["dep>=1.0", "gpu-dep ; extra == 'GPU'"], extras=["GPU", "Dev.Tools"])
+    _write_dist_info(first, "plain", "0.1")
+    _write_dist_info(second, "demo-pkg", "9.9.9")
+
+    index = installed_index.build_installed_distribution_index([str(first), str(second)])
+
+    assert len(index) == 2
+    assert "demo.pkg" in index
+    dist = index.get("DEMO-pkg")
+    assert (dist.name, dist.version) == ("Demo_Pkg", "1.2.3")
+    assert dist.extras == ("gpu", "dev-tools")
+    assert dist.requires == ("dep>=1.0", "gpu-dep ; extra == 'GPU'")
+    assert index.get("plain").requires is None
+    assert index.version("missing") is None
+
+
+def test_validate_requirements_matches_importlib_metadata_for_mixed_name_styles(monkeypatch, tmp_path):
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    _write_dist_info(site, "Bench_Pkg.0001", "1.1.0")
+    _write_dist_info(site, "Other-Pkg", "0.5.0")
+    monkeypatch.setattr(installed_index.sys, "path", [str(site)])
+    installed_index.invalidate_installed_distribution_index()
+    req = tmp_path / "requirements.txt"
+
+    try:
+        # 扩展中的依赖名写法不统一, 索引查找结果与 importlib.metadata 一致
+        for name in ("bench-pkg-0001", "BENCH_PKG_0001", "bench.pkg.0001", "other_pkg"):
+            assert installation_checker.get_package_version_from_library(name) == importlib.metadata.version(name)
+        assert installation_checker.get_package_version_from_library("missing-pkg") is None
+
+        req.write_text("bench-pkg-0001>=1.0\nother.pkg~=0.5\n", encoding="utf-8")
+        assert installation_checker.validate_requirements(req) is True
+        req.write_text("bench-pkg-0001>=1.0\nother_pkg>=1.0\n", encoding="utf-8")
+        assert installation_checker.validate_requirements(req) is False
+        req.write_text("bench-pkg-0001>=1.0\nmissing-pkg>=1.0\n", encoding="utf-8")
+        assert installation_checker.validate_requirements(req) is False
+    finally:
+        installed_index.invalidate_installed_distribution_index()
+
+
+def test_installed_distribution_index_is_shared_and_rebuilt_when_site_changes(monkeypatch, tmp_path):
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    _write_dist_info(site, "demo", "1.0", requires=["dep>=1.0"])
+    monkeypatch.setattr(installed_index.sys, "path", [str(site)])
+    installed_index.invalidate_installed_distribution_index()
+    builds = []
+    build = installed_index.build_installed_distribution_index
+
+    def counting_build(paths=None):
+        builds.append(paths)
+        return build(paths)
+
+    monkeypatch.setattr(installed_index, "build_installed_distribution_index", counting_build)
+
+    try:
+        assert installation_checker.is_package_installed("demo>=1.0") is True
+        assert installation_checker.is_package_installed("dep") is False
+        assert installed_index.get_installed_requires("demo") == ["dep>=1.0"]
+        with pytest.raises(importlib.metadata.PackageNotFoundError):
+            installed_index.get_installed_requires("dep")
+        assert len(builds) == 1
+
+        _write_dist_info(site, "dep", "1.5")
+        stat = site.stat()
+        os.utime(site, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert installation_checker.is_package_installed("dep>=1.0") is True
+        assert installation_checker.get_package_version_from_library("demo") == "1.0"
+        assert len(builds) == 2
+    finally:
+        installed_index.invalidate_installed_distribution_index()
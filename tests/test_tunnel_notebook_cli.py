@@ -1197,6 +1197,10 @@ def test_self_manager_archive_cli_parse_smoke(monkeypatch, tmp_path):
             "--output",
             str(tmp_path / "created.zip"),
             "--no-progress",
+            "--level",
+            "9",
+            "--threads",
+            "4",
         ]
     )
     args.func(args)
@@ -1216,6 +1220,8 @@ def test_self_manager_archive_cli_parse_smoke(monkeypatch, tmp_path):
                 "sources": [tmp_path / "source", tmp_path / "file.txt"],
                 "output": tmp_path / "created.zip",
                 "progress": False,
+                "level": 9,
+                "threads": 4,
             },
         ),
     ]